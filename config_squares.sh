@@ -1,2 +1,2 @@
 conda install -n squares -y -c r r-dplyr r-dbplyr r-tidyr r-stringr r-rsqlite rpy2
-pip install sexpdata z3-solver Click sqlparse
+pip install sexpdata z3-solver Click sqlparse pandas
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# File:	bench_ast_nodes.py
+# Description:	benchmark of the AST nodes of tyrell.dsl on the candidates of the lines enumerator: memory per candidate
+#		when every candidate is built by its own Builder and when a single Builder builds them all (as the lines
+#		enumerator does), and the cost of deep_hash (as paid by the memo table on every subprogram)
+# Usage:	python3 other-scripts/bench_ast_nodes.py input.in [loc] [number of programs]  (from the root of the repository)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import time
+import tracemalloc
+import sexpdata
+sys.path.insert(0, os.getcwd())
+import squaresEnumerator as squares
+import tyrell.spec as S
+import tyrell.dsl as D
+from tyrell.enumerator import LinesEnumerator
+
+repetitions = 5
+
+
+def collect_programs(spec, loc, num_programs):
+	enumerator = LinesEnumerator(spec, depth=loc+1, loc=loc, sym_breaker=False)
+	programs = []
+	prog = enumerator.next()
+	while prog is not None and len(programs) < num_programs:
+		programs.append(sexpdata.dumps(prog.to_sexp()))
+		enumerator.update()
+		prog = enumerator.next()
+	return programs
+
+
+def build(spec, programs, shared):
+	builder = D.Builder(spec)
+	tracemalloc.start()
+	start = tracemalloc.get_traced_memory()[0]
+	nodes = [(builder if shared else D.Builder(spec)).from_sexp_string(p) for p in programs]
+	size = tracemalloc.get_traced_memory()[0] - start
+	tracemalloc.stop()
+	return nodes, size
+
+
+def subtrees(node):
+	yield node
+	for c in node.children:
+		yield from subtrees(c)
+
+
+def hash_time(nodes):
+	all_subtrees = [n for prog in nodes for n in subtrees(prog)]
+	start = time.time()
+	for r in range(repetitions):
+		for n in all_subtrees:
+			n.deep_hash()
+	return (time.time() - start) / repetitions / len(all_subtrees) * 1e6
+
+
+if __name__ == '__main__':
+	if len(argv) < 2 or "-h" in argv:
+		exit("Usage: python3 other-scripts/bench_ast_nodes.py input.in [loc] [number of programs]")
+	loc = int(argv[2]) if len(argv) > 2 else 3
+	num_programs = int(argv[3]) if len(argv) > 3 else 2000
+	session = squares.SynthesisSession(['lines', argv[1]])
+	spec = S.parse(squares.DSL(session)[0])
+	programs = collect_programs(spec, loc, num_programs)
+	session.close()
+	print("{} programs with {} lines".format(len(programs), loc))
+	for name, shared in [("a builder per candidate", False), ("one builder", True)]:
+		nodes, size = build(spec, programs, shared)
+		print("{}: {:.0f} bytes per candidate, deep_hash {:.2f} us per subtree".format(
+			name, size / len(programs), hash_time(nodes)))
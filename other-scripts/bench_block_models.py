@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# File:	bench_block_models.py
+# Description:	micro-benchmark of the blocking clauses of the lines enumerator: blocked models per second
+#		when substituting the values in a template clause (the former implementation) and when the
+#		clause is built directly (LinesEnumerator.blockModelAux)
+# Usage:	python3 other-scripts/bench_block_models.py input.in [loc] [number of programs]  (from the root of the repository)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import time
+sys.path.insert(0, os.getcwd())
+from z3 import *
+import squaresEnumerator as squares
+import tyrell.spec as S
+from tyrell.enumerator import LinesEnumerator
+
+
+def collect_models(enumerator, num_programs):
+	# the models of the enumerated programs and of their symmetric programs, as blockModel would block them
+	models = []
+	prog = enumerator.next()
+	while prog is not None and len(models) < num_programs:
+		models.append(dict((x, enumerator.model[x]) for x in enumerator.variables))
+		if enumerator.loc > 2:
+			for mdl in enumerator.findSymmetries():
+				models.append(enumerator.fromSymmetries2Programs(mdl, dict(enumerator.cleanedModel)))
+		enumerator.update()
+		prog = enumerator.next()
+	return models
+
+
+def block_substitute(enumerator, models):
+	solver = Solver(ctx=enumerator.ctx)
+	template = Or([x != Int('val_'+str(x), enumerator.ctx) for x in enumerator.variables], enumerator.ctx)
+	start = time.time()
+	for model in models:
+		solver.add(substitute(template, [(Int('val_'+str(x), enumerator.ctx), model[x]) for x in enumerator.variables]))
+	return time.time() - start
+
+
+def block_direct(enumerator, models):
+	start = time.time()
+	for model in models:
+		enumerator.blockModelAux(model)
+	return time.time() - start
+
+
+if __name__ == '__main__':
+	if len(argv) < 2 or "-h" in argv:
+		exit("Usage: python3 other-scripts/bench_block_models.py input.in [loc] [number of programs]")
+	loc = int(argv[2]) if len(argv) > 2 else 3
+	num_programs = int(argv[3]) if len(argv) > 3 else 200
+	session = squares.SynthesisSession(['lines', argv[1]])
+	spec = S.parse(squares.DSL(session)[0])
+	enumerator = LinesEnumerator(spec, depth=loc+1, loc=loc)
+	models = collect_models(enumerator, num_programs)
+	session.close()
+	print("{} models of programs with {} lines, {} variables each".format(len(models), loc, len(enumerator.variables)))
+	for name, block in [("substitute", block_substitute), ("direct", block_direct)]:
+		elapsed = block(enumerator, models)
+		print("{}: {:.0f} blocked models/s".format(name, len(models) / elapsed if elapsed > 0 else float('inf')))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# File:	bench_decider.py
+# Description:	time spent by the decider per candidate program on a folder of problems, and candidates seen and rejected
+#		by each stage of the decider, from the statistics logged by squaresEnumerator.py at the end of every search
+# Usage:	python3 other-scripts/bench_decider.py tests-folder [timeout] [flags, e.g. -pd -stages=abstract,equal]  (from the root of the repository)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import re
+import glob
+import subprocess
+
+decider_re = re.compile(r'Decider: (\d+) candidates, ([0-9.]+) ms per candidate')
+stage_re = re.compile(r'Stage (\w+): (\d+) seen, (\d+) rejected in ([0-9.]+)s')
+
+
+def run(problem, flags, timeout):
+	try:
+		err = subprocess.run([sys.executable, "squaresEnumerator.py", "lines", "-d"] + flags + [problem],
+			stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout).stderr.decode(errors="replace")
+	except subprocess.TimeoutExpired:
+		return None
+	candidates, total = 0, 0
+	for n, ms in decider_re.findall(err):
+		candidates += int(n)
+		total += int(n) * float(ms)
+	return candidates, total, stage_re.findall(err)
+
+
+if __name__ == '__main__':
+	if len(argv) < 2 or "-h" in argv:
+		exit("Usage: python3 other-scripts/bench_decider.py tests-folder [timeout] [flags, e.g. -pd]")
+	timeout = int(argv[2]) if len(argv) > 2 and not argv[2].startswith("-") else 600
+	flags = [a for a in argv[2:] if a.startswith("-")]
+	problems = sorted(glob.glob(os.path.join(argv[1], "*.in")), key=lambda p: (len(p), p))
+	all_candidates, all_time = 0, 0
+	# name -> [seen, rejected, time], in the order of the stages
+	stages = {}
+	print("problem\tcandidates\tms per candidate")
+	for problem in problems:
+		res = run(problem, flags, timeout)
+		if res is None:
+			print("{}\ttimeout".format(os.path.basename(problem)))
+			continue
+		candidates, total, problem_stages = res
+		all_candidates += candidates
+		all_time += total
+		for name, seen, rejected, secs in problem_stages:
+			stage = stages.setdefault(name, [0, 0, 0])
+			stage[0] += int(seen)
+			stage[1] += int(rejected)
+			stage[2] += float(secs)
+		print("{}\t{}\t{:.3f}".format(os.path.basename(problem), candidates, total / max(1, candidates)))
+	print("total\t{}\t{:.3f}".format(all_candidates, all_time / max(1, all_candidates)))
+	if stages:
+		print("\nstage\tseen\trejected\ttime (s)\tms per candidate")
+		for name, (seen, rejected, secs) in stages.items():
+			print("{}\t{}\t{}\t{:.3f}\t{:.3f}".format(name, seen, rejected, secs, secs / max(1, seen) * 1000))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# File:	bench_lattice_load.py
+# Description:	load-time benchmark of the lattices of the lines enumerator: the former text loader (z3 variables for
+#		every model), the text parser, and the binary store (open, and decode of every lattice)
+# Usage:	python3 other-scripts/bench_lattice_load.py [loc ...]  (from the root of the repository, loc 3 to 6 by default)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import time
+sys.path.insert(0, os.getcwd())
+from z3 import *
+from tyrell.enumerator.lines import latticePath
+from tyrell.enumerator.lattice_store import LatticeStore, parseLatticeFile
+
+repetitions = 5
+
+
+def parse_z3(path, loc):
+	# the loader used before the binary store, which built a z3 variable for every entry of every model
+	lattices = dict()
+	with open(path, "r") as lats:
+		for l in lats.readlines():
+			lat, mods = l.split(":", 1)
+			models = []
+			if mods[:-1] != '':
+				mods = mods[:-1].replace(" ", "").split("|", loc*2)
+				for m in mods:
+					if m == "":
+						continue
+					model = dict()
+					m = m[1:-1].split(",")
+					if m == ['']:
+						break
+					for c in m:
+						c = c.split("=") if "=" in c else c.split(":")
+						model[Int(c[0])] = Int(c[1])
+					models.append(model)
+			if lat not in lattices:
+				lattices[lat] = models
+	return lattices
+
+
+def open_store(path, loc):
+	store = LatticeStore(path + ".bin")
+	store.matches(path)
+	return store
+
+
+def decode_store(path, loc):
+	store = open_store(path, loc)
+	for signature, models in store.items():
+		store.get(signature)
+	return store
+
+
+def timed(load, path, loc):
+	start = time.time()
+	for r in range(repetitions):
+		load(path, loc)
+	return (time.time() - start) / repetitions * 1000
+
+
+if __name__ == '__main__':
+	if "-h" in argv:
+		exit("Usage: python3 other-scripts/bench_lattice_load.py [loc ...]")
+	for loc in [int(a) for a in argv[1:]] or range(3, 7):
+		path = latticePath(loc)
+		if not os.path.exists(path + ".bin"):
+			print("loc {}: no binary store, run other-scripts/convert_lattices.py".format(loc))
+			continue
+		print("loc {}: {} lattices".format(loc, len(LatticeStore(path + ".bin"))))
+		for name, load in [("text with z3 variables", parse_z3), ("text", parseLatticeFile),
+				("binary store, open", open_store), ("binary store, decode all", decode_store)]:
+			print("  {}: {:.2f} ms".format(name, timed(load, path, loc)))
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# File:	bench_sym_breaking.py
+# Description:	compares the symmetry breaking modes of the lines enumerator (none, -off, -on and the static lex-leader
+#		constraints of -lex) on a folder of problems: problems solved and time of each mode
+# Usage:	python3 other-scripts/bench_sym_breaking.py tests-folder [timeout] [flags, e.g. -pd]  (from the root of the repository)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import glob
+import time
+import subprocess
+
+modes = [("none", []), ("off", ["-off"]), ("on", ["-on"]), ("lex", ["-lex"])]
+
+
+def run(problem, flags, timeout):
+	start = time.time()
+	try:
+		out = subprocess.run([sys.executable, "squaresEnumerator.py", "lines"] + flags + [problem],
+			stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=timeout).stdout.decode()
+	except subprocess.TimeoutExpired:
+		return False, timeout
+	return "SQL Solution" in out, time.time() - start
+
+
+if __name__ == '__main__':
+	if len(argv) < 2 or "-h" in argv:
+		exit("Usage: python3 other-scripts/bench_sym_breaking.py tests-folder [timeout] [flags, e.g. -pd]")
+	timeout = int(argv[2]) if len(argv) > 2 and not argv[2].startswith("-") else 600
+	flags = [a for a in argv[2:] if a.startswith("-")]
+	problems = sorted(glob.glob(os.path.join(argv[1], "*.in")), key=lambda p: (len(p), p))
+	totals = dict((name, [0, 0]) for name, _ in modes)
+	print("problem\t" + "\t".join(name for name, _ in modes))
+	for problem in problems:
+		row = []
+		for name, mode_flags in modes:
+			solved, elapsed = run(problem, mode_flags + flags, timeout)
+			totals[name][0] += solved
+			totals[name][1] += elapsed
+			row.append("{:.1f}{}".format(elapsed, "" if solved else "*"))
+		print(os.path.basename(problem) + "\t" + "\t".join(row))
+	print("solved\t" + "\t".join(str(totals[name][0]) for name, _ in modes))
+	print("total time\t" + "\t".join("{:.1f}".format(totals[name][1]) for name, _ in modes))
+	print("(* not solved within {}s)".format(timeout))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# File:	bench_visitors.py
+# Description:	micro-benchmark of the visitors of tyrell (subclasses of tyrell.visitor.GenericVisitor): visits per second of
+#		each visitor on a small integer DSL, i.e. the cost of the visit dispatch plus the work done by the visitor
+# Usage:	python3 other-scripts/bench_visitors.py [seconds per visitor]  (from the root of the repository)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import time
+import z3
+sys.path.insert(0, os.getcwd())
+import tyrell.spec as S
+from tyrell.spec.expr import ExprType
+from tyrell.dsl import Builder, NodeIndexer, dfs
+from tyrell.dsl.builder import ProductionVisitor
+from tyrell.interpreter import PostOrderInterpreter
+from tyrell.decider import Example
+from tyrell.decider.eval_expr import ExprVisitor
+from tyrell.decider.constraint_encoder import ConstraintEncoder
+from tyrell.decider import example_constraint, example_constraint_pruning
+from tyrell.visitor import GenericVisitor
+
+spec_str = r'''
+	enum SmallInt {
+		"1", "2"
+	}
+	value IntExpr {
+		pos: bool;
+		neg: bool;
+		val: int;
+	}
+
+	program Foo(IntExpr, IntExpr) -> IntExpr;
+	func plus: IntExpr r -> IntExpr a, SmallInt b {
+		pos(a) ==> pos(r);
+		val(r) == val(a) + 1 || val(r) == val(a) + 2;
+	}
+	func mult: IntExpr r -> IntExpr a, IntExpr b {
+		pos(a) && neg(b) ==> neg(r);
+		pos(a) && pos(b) ==> pos(r);
+	}
+	func div: IntExpr r -> IntExpr a, IntExpr b {
+		pos(a) && neg(b) ==> neg(r);
+		pos(b) && neg(a) ==> neg(r);
+	}
+'''
+prog_str = '(mult (div (plus (@param 0) (SmallInt 2)) (@param 1)) (mult (plus (@param 1) (SmallInt 1)) (div (@param 0) (@param 1))))'
+example = Example(input=[6, -2], output=-24)
+
+
+class FooInterpreter(PostOrderInterpreter):
+	def eval_SmallInt(self, v):
+		return int(v)
+
+	def eval_plus(self, node, args):
+		return args[0] + args[1]
+
+	def eval_mult(self, node, args):
+		return args[0] * args[1]
+
+	def eval_div(self, node, args):
+		return args[0] // args[1]
+
+	def apply_pos(self, arg):
+		return arg > 0
+
+	def apply_neg(self, arg):
+		return arg < 0
+
+	def apply_val(self, arg):
+		return arg
+
+
+def workloads(spec, prog):
+	interp = FooInterpreter()
+	constraints = [c for p in spec.get_function_productions() for c in p.constraints]
+	z3_vars = dict()
+
+	def encode_property(prop_expr):
+		key = (prop_expr.name, prop_expr.operand.index)
+		if key not in z3_vars:
+			make = z3.Int if prop_expr.type is ExprType.INT else z3.Bool
+			z3_vars[key] = make('{}_{}'.format(*key))
+		return z3_vars[key]
+
+	def production_visitor():
+		for node in dfs(prog):
+			ProductionVisitor(node.children).visit(node.production)
+
+	def expr_visitor():
+		for c in constraints:
+			ExprVisitor(interp, [3, -2], -6).visit(c)
+
+	def constraint_encoder():
+		for c in constraints:
+			ConstraintEncoder(encode_property).visit(c)
+
+	def z3_encoder():
+		example_constraint.Z3Encoder(interp, spec, NodeIndexer(prog), example).visit(prog)
+
+	example_solver = example_constraint_pruning.ExampleSolver(interp, spec, example)
+
+	def pruning_z3_encoder():
+		example_solver.push()
+		example_constraint_pruning.Z3Encoder(interp, spec, NodeIndexer(prog), example_solver).visit(prog)
+		example_solver.pop()
+
+	def constraint_interpreter():
+		example_solver.push()
+		encoder = example_constraint_pruning.Z3Encoder(interp, spec, NodeIndexer(prog), example_solver)
+		example_constraint_pruning.ConstraintInterpreter(interp, example.input, encoder).visit(prog)
+		example_solver.pop()
+
+	def post_order_interpreter():
+		interp.eval(prog, example.input)
+
+	return [
+		("ProductionVisitor", production_visitor),
+		("ExprVisitor", expr_visitor),
+		("ConstraintEncoder", constraint_encoder),
+		("Z3Encoder (example_constraint)", z3_encoder),
+		("Z3Encoder (example_constraint_pruning)", pruning_z3_encoder),
+		("ConstraintInterpreter", constraint_interpreter),
+		("PostOrderInterpreter", post_order_interpreter),
+	]
+
+
+def count_visits(workload):
+	visit = GenericVisitor.visit
+	count = [0]
+
+	def counting_visit(self, node):
+		count[0] += 1
+		return visit(self, node)
+	GenericVisitor.visit = counting_visit
+	try:
+		workload()
+	finally:
+		GenericVisitor.visit = visit
+	return count[0]
+
+
+def visits_per_second(workload, seconds):
+	visits = count_visits(workload)
+	runs, start = 0, time.time()
+	while time.time() - start < seconds:
+		for r in range(10):
+			workload()
+		runs += 10
+	elapsed = time.time() - start
+	return visits, visits * runs / elapsed, elapsed / runs * 1e6
+
+
+if __name__ == '__main__':
+	if "-h" in argv:
+		exit("Usage: python3 other-scripts/bench_visitors.py [seconds per visitor]")
+	seconds = float(argv[1]) if len(argv) > 1 else 2
+	spec = S.parse(spec_str)
+	prog = Builder(spec).from_sexp_string(prog_str)
+	for name, workload in workloads(spec, prog):
+		visits, rate, run_time = visits_per_second(workload, seconds)
+		print("{}: {} visits per run, {:.0f} visits/s, {:.1f} us per run".format(name, visits, rate, run_time))
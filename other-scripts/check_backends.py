@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# File:	check_backends.py
+# Description:	differential check of the R, pandas and SQLite evaluation backends: runs the candidates of every problem
+#		of a corpus, and a bind_rows of columns of different types, on the three backends and reports the candidates
+#		where they disagree (requires R and rpy2)
+# Usage:	python3 other-scripts/check_backends.py [corpus]  (from the root of the repository, tests-examples/55-tests by default)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import glob
+import shutil
+import tempfile
+from collections import Counter
+sys.path.insert(0, os.getcwd())
+import rpy2.robjects as robjects
+import squaresEnumerator as squares
+import tyrell.spec as S
+import tyrell.dsl as D
+from tyrell.enumerator import LinesEnumerator
+from tyrell.interpreter import InterpreterError
+
+max_loc = 3
+max_candidates = 50
+
+
+def r_columns(table):
+	names = list(robjects.r('colnames({t})'.format(t=table)))
+	cols = robjects.r('lapply({t}, as.character)'.format(t=table))
+	return names, [[None if v is robjects.NA_Character else str(v) for v in c] for c in cols]
+
+
+def pd_columns(df):
+	return list(df.columns), [squares.as_character_pd(df.iloc[:, i]) for i in range(len(df.columns))]
+
+
+def sql_rows(table):
+	names, rows = table.fetch()
+	return names, Counter(tuple(squares.as_character_r(v) for v in r) for r in rows)
+
+
+def run_backend(interpreter, prog, inputs):
+	try:
+		return interpreter.eval(prog, inputs)
+	except InterpreterError:
+		return None
+
+
+def sql_readable(table):
+	try:
+		table.fetch()
+		return True
+	except squares.sqlite3.Error:
+		return False
+
+
+# the backends that disagree with R on `prog`, or None if they all agree
+def compare(session, prog, r_res, pd_res, sql_res, pd_output):
+	if r_res is None:
+		# the SQLite tables are only computed when they are read
+		wrong = (["pandas"] if pd_res is not None else []) + (["sqlite"] if sql_res is not None and sql_readable(sql_res) else [])
+		return ",".join(wrong) or None
+	if pd_res is None:
+		return "pandas"
+	names, cols = r_columns(r_res)
+	fingerprint = squares.fingerprint_r(r_res)
+	wrong = []
+	if (names, cols) != pd_columns(pd_res) or squares.eq_r(r_res, session.expected_output) != squares.eq_pd(pd_res, pd_output) \
+			or fingerprint != squares.fingerprint_pd(pd_res):
+		wrong.append("pandas")
+	# SQL has bag semantics: same rows, in any order
+	if sql_res is None or (names, Counter(zip(*cols))) != sql_rows(sql_res) or fingerprint != squares.fingerprint_sql(sql_res):
+		wrong.append("sqlite")
+	return ",".join(wrong) or None
+
+
+def load(problem):
+	session = squares.SynthesisSession(['lines', problem])
+	dsl, input_tables, prog_out, loc, input_files, output_file = squares.DSL(session)
+	spec = S.parse(dsl)
+	pd_inputs = [squares.read_table_pd(i) for i in input_files]
+	pd_output = squares.read_table_pd(output_file)
+	conn, sql_inputs, sql_output = squares.connect_sql(input_files, output_file)
+	return session, spec, input_tables, pd_inputs, pd_output, sql_inputs
+
+
+def check(problem):
+	session, spec, input_tables, pd_inputs, pd_output, sql_inputs = load(problem)
+	r_interp, pd_interp, sql_interp = squares.SquaresInterpreter(session), squares.PandasInterpreter(session), squares.SQLiteInterpreter(session)
+
+	num_programs, errors = 0, 0
+	for loc in range(1, max_loc + 1):
+		enumerator = LinesEnumerator(spec, depth=loc+1, loc=loc, sym_breaker=False)
+		prog = enumerator.next()
+		count = 0
+		while prog is not None and count < max_candidates:
+			r_res = run_backend(r_interp, prog, input_tables)
+			pd_res = run_backend(pd_interp, prog, pd_inputs)
+			sql_res = run_backend(sql_interp, prog, sql_inputs)
+			wrong = compare(session, prog, r_res, pd_res, sql_res, pd_output)
+			if wrong is not None:
+				print("  {} differs from R on {}".format(wrong, prog))
+				errors += 1
+			r_interp.release()
+			enumerator.update()
+			prog = enumerator.next()
+			count += 1
+		num_programs += count
+	session.close()
+	print("{}: {} candidates, {} with different results".format(problem, num_programs, errors))
+	return errors
+
+
+# tables that R refuses to bind: column v is character in the first one and numeric in the second
+bind_tables = ["id,v\n1,a\n2,b\n", "id,v\n3,4\n5,6\n"]
+
+
+def check_bind_rows():
+	files_dir = tempfile.mkdtemp()
+	try:
+		inputs = []
+		for i, table in enumerate(bind_tables):
+			inputs.append(os.path.join(files_dir, "i{}".format(i)))
+			with open(inputs[-1], "w") as f:
+				f.write(table)
+		problem = os.path.join(files_dir, "bind_rows.in")
+		with open(problem, "w") as f:
+			f.write("inputs: {}\noutput: {}\nconst:\naggrs:\nattrs:\nbools:\nloc: 1\n".format(", ".join(inputs), inputs[0]))
+		session, spec, input_tables, pd_inputs, pd_output, sql_inputs = load(problem)
+		prog = D.Builder(spec).from_sexp_string('(bind_rows (@param 0) (@param 1))')
+		r_res = run_backend(squares.SquaresInterpreter(session), prog, input_tables)
+		pd_res = run_backend(squares.PandasInterpreter(session), prog, pd_inputs)
+		sql_res = run_backend(squares.SQLiteInterpreter(session), prog, sql_inputs)
+		wrong = compare(session, prog, r_res, pd_res, sql_res, pd_output)
+		session.close()
+	finally:
+		shutil.rmtree(files_dir)
+	print("bind_rows of a character and a numeric column: {}".format("R {}".format("fails" if r_res is None else "binds") if wrong is None else "{} differs from R".format(wrong)))
+	return 0 if wrong is None else 1
+
+
+if __name__ == '__main__':
+	if "-h" in argv:
+		exit("Usage: python3 other-scripts/check_backends.py [corpus]")
+	corpus = argv[1] if len(argv) > 1 else 'tests-examples/55-tests'
+	errors = check_bind_rows()
+	for problem in sorted(glob.glob(os.path.join(corpus, '*.in'))):
+		errors += check(problem)
+	exit(1 if errors else 0)
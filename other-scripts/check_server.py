@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# File:	check_server.py
+# Description:	checks that a request to the synthesis server that runs out of time with -portfolio is answered with a
+#		timeout and leaves no worker process behind, and that "inputs" requests solved at the same time each get the
+#		answer they get alone and leave no file behind (requires R and rpy2, Linux)
+# Usage:	python3 other-scripts/check_server.py [problem] [timeout]  (from the root of the repository,
+#		tests-examples/55-tests/9.in and 5 seconds by default)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import time
+import threading
+import glob
+import tempfile
+sys.path.insert(0, os.getcwd())
+import squaresServer as server
+
+
+def forks():
+	# processes forked from this one share its command line, the orphans of a killed request included
+	with open('/proc/self/cmdline', 'rb') as f:
+		cmdline = f.read()
+	pids = set()
+	for pid in os.listdir('/proc'):
+		if not pid.isdigit() or int(pid) == os.getpid():
+			continue
+		try:
+			with open('/proc/{}/cmdline'.format(pid), 'rb') as f:
+				if f.read() != cmdline:
+					continue
+			with open('/proc/{}/stat'.format(pid)) as f:
+				if f.read().rsplit(')', 1)[1].split()[0] == 'Z':
+					continue
+		except OSError:
+			continue
+		pids.add(int(pid))
+	return pids
+
+
+def check(problem, timeout):
+	with open(problem) as f:
+		request = {"problem": f.read(), "flags": ["-portfolio"], "timeout": timeout}
+	before = forks()
+	most, done = 0, threading.Event()
+
+	def watch():
+		nonlocal most
+		while not done.wait(0.1):
+			most = max(most, len(forks() - before))
+
+	watcher = threading.Thread(target=watch)
+	watcher.start()
+	status, answer = server.synthesize(request, [], timeout)
+	done.set()
+	watcher.join()
+	time.sleep(1)
+	survivors = forks() - before
+	print("{}: {} {}, {} processes while solving, {} left after".format(problem, status, answer, most, len(survivors)))
+	if status != 504 or most < 2:
+		print("  the request did not time out with portfolio workers running, try a harder problem or a longer timeout")
+		return 1
+	return 1 if survivors else 0
+
+
+def inputs_request(problem):
+	'''The request with the tables of a .in file, as the arguments of Squares.synthesize'''
+	fields = dict()
+	with open(problem) as f:
+		for line in f:
+			name, sep, value = line.partition(":")
+			if sep and name in ("inputs", "output", "const", "aggrs", "attrs", "loc"):
+				fields[name] = [v.strip().strip('"') for v in value.split(",") if v.strip()]
+
+	def read(path):
+		with open(path) as f:
+			return f.read()
+	return {"inputs": [read(path) for path in fields["inputs"]], "output": read(fields["output"][0]),
+		"const": ",".join(fields["const"]), "aggrs": ",".join(fields["aggrs"]), "attrs": ",".join(fields["attrs"]),
+		"loc": int(fields["loc"][0]) if fields["loc"] else 0}
+
+
+def check_concurrent(problems, timeout):
+	requests = [inputs_request(problem) for problem in problems]
+	alone = [server.synthesize(request, [], timeout) for request in requests]
+	before = set(glob.glob("users/*/*")) | set(glob.glob(os.path.join(tempfile.gettempdir(), "squares-*")))
+	together = [None] * len(requests)
+
+	def solve(i):
+		together[i] = server.synthesize(requests[i], [], timeout)
+
+	threads = [threading.Thread(target=solve, args=(i,)) for i in range(len(requests))]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	left = (set(glob.glob("users/*/*")) | set(glob.glob(os.path.join(tempfile.gettempdir(), "squares-*")))) - before
+	errors = 0
+	for problem, (status, answer), expected in zip(problems, together, alone):
+		print("{}: {} {}".format(problem, status, answer))
+		if status != 200 or (status, answer) != expected:
+			print("  expected {} {}".format(*expected))
+			errors += 1
+	if left:
+		print("  files left behind: {}".format(", ".join(sorted(left))))
+		errors += 1
+	return errors
+
+
+if __name__ == '__main__':
+	if "-h" in argv:
+		exit("Usage: python3 other-scripts/check_server.py [problem] [timeout]")
+	server.warm_up()
+	problem = argv[1] if len(argv) > 1 else "tests-examples/55-tests/9.in"
+	timeout = float(argv[2]) if len(argv) > 2 else 5
+	errors = check(problem, timeout)
+	errors += check_concurrent(["tests-examples/55-tests/11.in", "tests-examples/55-tests/13.in"], 60)
+	exit(1 if errors else 0)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# File:	check_sessions.py
+# Description:	checks that synthesis sessions prepared at the same time in threads of one process get the same spec and
+#		R program prefix as when each one is prepared alone (requires R and rpy2)
+# Usage:	python3 other-scripts/check_sessions.py [problem ...]  (from the root of the repository,
+#		tests-examples/55-tests/1.in and tests-examples/55-tests/7.in by default)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import threading
+sys.path.insert(0, os.getcwd())
+import squaresEnumerator as squares
+
+
+def prepared(problem):
+	'''The productions and the unprefixed R program prefix of a session prepared for `problem`'''
+	session = squares.SynthesisSession(["lines", problem])
+	try:
+		session.prepare()
+		return [str(p) for p in session.spec.productions()], session.unprefixed(session.prog_out)
+	finally:
+		session.close()
+
+
+def check(problems):
+	alone = [prepared(problem) for problem in problems]
+	together = [None] * len(problems)
+
+	def prepare(i):
+		together[i] = prepared(problems[i])
+
+	threads = [threading.Thread(target=prepare, args=(i,)) for i in range(len(problems))]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	errors = 0
+	for problem, result, expected in zip(problems, together, alone):
+		same = result == expected
+		print("{}: {}".format(problem, "same spec as alone" if same else "different spec from alone" if result else "failed"))
+		if not same:
+			errors += 1
+	return errors
+
+
+if __name__ == '__main__':
+	if "-h" in argv:
+		exit("Usage: python3 other-scripts/check_sessions.py [problem ...]")
+	exit(1 if check(argv[1:] or ["tests-examples/55-tests/1.in", "tests-examples/55-tests/7.in"]) else 0)
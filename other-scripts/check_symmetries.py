@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# File:	check_symmetries.py
+# Description:	checks that the symmetries generated as topological renumberings (SymmetryFinder.findRenumberings) are the
+#		models found by the solver (SymmetryFinder.findSymmetries) for every lattice, and the symmetries of the lattice
+#		stores, and compares the time of both
+# Usage:	python3 other-scripts/check_symmetries.py [loc ...]  (from the root of the repository, loc 3 to 6 by default)
+# Python version:	3.6.4
+
+import sys
+from sys import argv
+import os
+import time
+sys.path.insert(0, os.getcwd())
+from z3 import *
+from tyrell.enumerator.lines import readLattices
+from tyrell.enumerator.lattice_store import packSignature
+from tyrell.enumerator.gen_lattices import SymmetryFinder, enumerateLattices, latticeDigits, latticeTree
+
+
+def check(loc):
+	sym_finder = SymmetryFinder(loc)
+	stored = readLattices(loc)
+	num_lattices, num_stored, errors, solver_time, renumber_time = 0, 0, 0, 0, 0
+	for children in enumerateLattices(loc):
+		num_lattices += 1
+		start = time.time()
+		models = sym_finder.findSymmetries(latticeTree(children, loc))
+		solver = sorted(tuple(m[Int('x_'+str(x))].as_long() for x in range(1, loc)) for m in models)
+		solver_time += time.time() - start
+		start = time.time()
+		renumbered = sorted(sym_finder.findRenumberings(latticeTree(children, loc)))
+		renumber_time += time.time() - start
+		models = stored.get(packSignature(latticeDigits(children, loc)))
+		if models is not None:
+			num_stored += 1
+		if solver != renumbered or (models is not None and sorted(models) != renumbered):
+			errors += 1
+	print("loc {}: {} lattices ({} stored), {} with different symmetries".format(loc, num_lattices, num_stored, errors))
+	print("  solver: {:.3f}s, renumberings: {:.3f}s".format(solver_time, renumber_time))
+	return errors
+
+
+if __name__ == '__main__':
+	if "-h" in argv:
+		exit("Usage: python3 other-scripts/check_symmetries.py [loc ...]")
+	errors = 0
+	for loc in [int(a) for a in argv[1:]] or range(3, 7):
+		errors += check(loc)
+	exit(1 if errors else 0)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# File:	convert_lattices.py
+# Description:	builds the binary lattice stores read by the lines enumerator (loc-N.bin) from the text lattice files (loc-N)
+#		whose store is out of date (-force rebuilds every store from its text file)
+#		with -merge, the lattices found online by earlier runs (tyrell/enumerator/lattices/cache.db) are added to the stores
+# Usage:	python3 other-scripts/convert_lattices.py [-merge] [-force] [tyrell/enumerator/lattices/loc-N ...]  (from the root of the repository, all lattice files by default)
+# Python version:	3.6.4
+
+import sys
+import os
+import glob
+sys.path.insert(0, os.getcwd())
+from tyrell.enumerator.lattice_store import LatticeStore, convert, writeLatticeStore
+from tyrell.enumerator.lattice_cache import getLatticeCache
+from tyrell.enumerator.lines import latticeCachePath, readLattices
+
+
+def up_to_date(text_path):
+	try:
+		return LatticeStore(text_path + ".bin").matches(text_path)
+	except (OSError, ValueError):
+		return False
+
+
+def merge(text_path, loc):
+	lattices = dict(readLattices(loc).items())
+	new = dict((s, m) for s, m in getLatticeCache(latticeCachePath).items(loc) if s not in lattices)
+	lattices.update(new)
+	writeLatticeStore(text_path + ".bin", loc, lattices, text_path)
+	return len(new), len(lattices)
+
+
+if __name__ == '__main__':
+	if "-h" in sys.argv:
+		exit("Usage: python3 other-scripts/convert_lattices.py [-merge] [-force] [tyrell/enumerator/lattices/loc-N ...]")
+	files = [a for a in sys.argv[1:] if a not in ["-merge", "-force"]]
+	files = files or sorted(f for f in glob.glob("tyrell/enumerator/lattices/loc-*") if not f.endswith(".bin"))
+	for text_path in files:
+		loc = int(os.path.basename(text_path).split("-")[-1])
+		if "-force" in sys.argv or not up_to_date(text_path):
+			print("{}: {} lattices".format(text_path, convert(text_path)))
+		if "-merge" in sys.argv and os.path.exists(latticeCachePath):
+			merged, total = merge(text_path, loc)
+			print("{}: {} lattices merged from {}, {} lattices".format(text_path, merged, latticeCachePath, total))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# File:	gen_lattices_parallel.py
+# Description:	resumable, multi-process generator of the lattices (and their symmetries) of programs with loc lines
+#		The lattices are split into shards by the placement of the first lines (see enumerateLattices). Every shard is
+#		generated by a worker and saved as a small lattice store in the shard directory as soon as it is complete, so an
+#		interrupted run resumes from the shards that are missing. Once every shard is there, they are merged in shard
+#		order into tyrell/enumerator/lattices/loc-N.bin (and, with -text, into the text file loc-N).
+# Usage:	python3 other-scripts/gen_lattices_parallel.py loc [-workers=N] [-shards=DIR] [-text]  (from the root of the repository)
+# Python version:	3.6.4
+
+import sys
+import os
+import time
+import multiprocessing
+sys.path.insert(0, os.getcwd())
+from tyrell.enumerator.lines import latticePath
+from tyrell.enumerator.lattice_store import LatticeStore, packSignature, writeLatticeStore, writeLatticeFile
+from tyrell.enumerator.gen_lattices import SymmetryFinder, enumerateLattices, latticePrefixes, latticeDigits, latticeSymmetries
+
+# lines placed by the prefix of a shard: 105 shards for loc >= 5
+max_shard_depth = 4
+
+
+def get_flag(name, default):
+	for arg in sys.argv:
+		if arg.startswith(name + "="):
+			return arg[len(name) + 1:]
+	return default
+
+
+def shard_path(shards, index):
+	return os.path.join(shards, "shard-{:05d}.bin".format(index))
+
+
+def gen_shard(task):
+	loc, index, prefix, shards = task
+	start = time.time()
+	sym_finder = SymmetryFinder(loc)
+	lattices = dict()
+	for children in enumerateLattices(loc, prefix):
+		lattices[packSignature(latticeDigits(children, loc))] = latticeSymmetries(children, loc, sym_finder)
+	writeLatticeStore(shard_path(shards, index), loc, lattices)
+	return index, len(lattices), time.time() - start
+
+
+def merge_shards(loc, shards, num_shards, text):
+	lattices = dict()
+	for index in range(num_shards):
+		store = LatticeStore(shard_path(shards, index))
+		lattices.update(store.items())
+		store.close()
+	path = latticePath(loc)
+	if text:
+		writeLatticeFile(path, loc, lattices)
+	elif not os.path.exists(path):
+		open(path, "w").close()
+	# the store supersedes the current text file
+	writeLatticeStore(path + ".bin", loc, lattices, path)
+	return len(lattices)
+
+
+if __name__ == '__main__':
+	if len(sys.argv) < 2 or "-h" in sys.argv:
+		exit("Usage: python3 other-scripts/gen_lattices_parallel.py loc [-workers=N] [-shards=DIR] [-text]\n-workers=N : number of worker processes (default: number of CPUs)\n-shards=DIR : directory of the finished shards (default tyrell/enumerator/lattices/loc-N.shards)\n-text : also write the text lattice file")
+	loc = int(sys.argv[1])
+	workers = int(get_flag("-workers", multiprocessing.cpu_count()))
+	shards = get_flag("-shards", latticePath(loc) + ".shards")
+	os.makedirs(shards, exist_ok=True)
+
+	prefixes = latticePrefixes(loc, min(max_shard_depth, loc - 1))
+	pending = [(loc, i, p, shards) for i, p in enumerate(prefixes) if not os.path.exists(shard_path(shards, i))]
+	print("loc {}: {} shards, {} already generated".format(loc, len(prefixes), len(prefixes) - len(pending)))
+
+	start, done, num_lattices = time.time(), len(prefixes) - len(pending), 0
+	pool = multiprocessing.Pool(max(1, workers))
+	try:
+		for index, n, elapsed in pool.imap_unordered(gen_shard, pending):
+			done += 1
+			num_lattices += n
+			print("shard {} ({} lattices, {:.1f}s) - {}/{} shards, {:.2f} lattices/s".format(
+				index, n, elapsed, done, len(prefixes), num_lattices / (time.time() - start)))
+	finally:
+		pool.terminate()
+		pool.join()
+
+	total = merge_shards(loc, shards, len(prefixes), "-text" in sys.argv)
+	print("loc {}: {} lattices written to {}.bin in {:.1f}s".format(loc, total, latticePath(loc), time.time() - start))
@@ -8,11 +8,12 @@ install_dependencies = [
     'z3-solver',
     "rpy2",
     'sqlparse',
+    'pandas',
 ]
 develop_dependencies = [
     'mypy',  # for type checking
     'rpy2',  # for Morpheus. TODO: This should really belong to the client package
-    'lark-parser',  # for parsing
+    'lark-parser==0.6.5',  # for parsing: tyrell/spec/parser.py is generated by its standalone tool
     'sphinx',  # for documentation generation
     'sqlparse',
 ]
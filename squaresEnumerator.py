@@ -9,29 +9,43 @@
 from sys import argv
 from string import *
 import tyrell.spec as S
-from tyrell.interpreter import PostOrderInterpreter, GeneralError
+from tyrell.spec.expr import SET_WIDTH
+from tyrell.interpreter import PostOrderInterpreter, GeneralError, MemoTable
 from tyrell.enumerator import *
-from tyrell.decider import Example, ExampleConstraintDecider, ExampleConstraintPruningDecider
+from tyrell.decider import Example, ExampleConstraintDecider, ExampleConstraintPruningDecider, StagedDecider, FunctionStage, EquivalenceStage
 from tyrell.synthesizer import Synthesizer
 from tyrell.logger import get_logger
 import rpy2.robjects as robjects
+import z3
 from itertools import permutations
+from collections import Counter, deque
 import warnings
-from rpy2.rinterface import RRuntimeWarning
+from rpy2.rinterface import RRuntimeWarning, RRuntimeError
 import sqlparse as sp
+import pandas as pd
+import numpy as np
+import operator
+import sqlite3
+import math
+import hashlib
+import resource
+import multiprocessing
+import multiprocessing.connection
+import time
+import threading
+import itertools
 import re
 import sys
 import os
 warnings.filterwarnings("ignore", category=RRuntimeWarning)
 
 logger = get_logger('tyrell')
-counter_ = 0
-distinct = False
-getProgram = False
-final_program = ''
-_tables = dict()
-output_attrs = ""
-attributes = []
+default_memo_size = 10000
+# the stages of the decider, from the cheapest to the most expensive, except for the equivalence stage, whose
+# blames prune more programs when it comes before the abstract one (see SynthesisSession.make_stages)
+default_stages = ["shape", "provenance", "equivalence", "abstract", "fingerprint", "equal"]
+# the embedded R is shared by every synthesis session of the process
+r_lock = threading.RLock()
 robjects.r('''
 	library(dplyr)
 	library(dbplyr)
@@ -44,28 +58,17 @@ robjects.r('''
 def get_collist(sel):
 	return sel
 
-def get_fresh_name():
-	global counter_
-	counter_ = counter_ + 1
-
-	fresh_str = 'RET_DF' + str(counter_)
-	return fresh_str
-
-def get_fresh_col():
-	global counter_
-	counter_ = counter_ + 1
-
-	fresh_str = 'COL' + str(counter_)
-	return fresh_str
+def run_r(script):
+	with r_lock:
+		return robjects.r(script)
 
 def get_type(df, index):
 	_rscript = 'sapply({df_name}, class)[{pos}]'.format(df_name=df, pos=index)
-	ret_val = robjects.r(_rscript)
+	ret_val = run_r(_rscript)
 	return ret_val[0]
 
 # get the string format to be used in filter
-def getConst(cons):
-	global attributes
+def getConst(cons, attributes):
 	try:
 		if int(cons):
 			return str(cons)
@@ -81,11 +84,10 @@ def getColsPermutations(cols, num):
 	return [", ".join(a) for a in permutations(cols, num)] + getColsPermutations(cols,num-1)
 
 def eq_r(actual, expect):
-	global distinct
 	_rscript = 'all.equal(lapply({lhs}, as.character),lapply({rhs}, as.character))'.format(lhs=actual, rhs=expect)
 	# _rscript = 'all.equal(lapply({lhs}, FUN=function(x){{ data.frame(as.matrix(x))}}),lapply({rhs}, FUN=function(x){{ data.frame(as.matrix(x)) }} ))'.format(lhs=actual, rhs=expect)
 	try:
-		ret_val = robjects.r(_rscript)
+		ret_val = run_r(_rscript)
 	except:
 		return False
 	return True == ret_val[0]
@@ -102,7 +104,10 @@ def findConst(consts):
 
 
 class SquaresInterpreter(PostOrderInterpreter):
-	## Concrete interpreter
+	## Concrete interpreter, tables are R data frames named in the R namespace of the session
+	def __init__(self, session):
+		self.session = session
+
 	def eval_ColInt(self, v):
 		return v
 
@@ -113,59 +118,56 @@ class SquaresInterpreter(PostOrderInterpreter):
 		return args[0]
 
 	def eval_unused(self, node, args):
-		return get_fresh_name()
+		return self.session.get_fresh_name()
 
 	def eval_select(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 		_script = '{ret_df} <- {table} %>% ungroup() %>% select({cols})'.format(ret_df=ret_df_name, table=args[0], cols=get_collist(args[1]))
 		if args[2] == "distinct":
 			_script += ' %>% distinct()'
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting select...')
 			raise GeneralError()
 
 	def eval_filter(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 		if "str_detect" not in args[1]:
 			col, op, const = args[1].split(" ")
-			_script = '{ret_df} <- {table} %>% ungroup() %>% filter({col} {op} {const})'.format(ret_df=ret_df_name, table=args[0], op=op, col=col, const=getConst(const)) if const != "max(n)" else '{ret_df} <- filter({table}, {col} {op} {const})'.format(ret_df=ret_df_name, table=args[0], op=op, col=col, const="max(n)")
+			_script = '{ret_df} <- {table} %>% ungroup() %>% filter({col} {op} {const})'.format(ret_df=ret_df_name, table=args[0], op=op, col=col, const=getConst(const, self.session.attributes)) if const != "max(n)" else '{ret_df} <- filter({table}, {col} {op} {const})'.format(ret_df=ret_df_name, table=args[0], op=op, col=col, const="max(n)")
 		else:
 			col, string = args[1].split("|")
 			_script = '{ret_df} <- {table} %>% ungroup() %>% filter({col}, {const}))'.format(ret_df=ret_df_name, table=args[0], col=col, const="\""+string[:-1]+"\"")
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting filter...')
 			raise GeneralError()
 
 	def eval_filters(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 		if "str_detect" not in args[1]:
 			col, op, const = args[1].split(" ")
-			const = getConst(const) if const != "max(n)" else "max(n)"
+			const = getConst(const, self.session.attributes) if const != "max(n)" else "max(n)"
 			arg1 = col + " " + op + " " + const
 		else:
 			col, string = args[1].split("|")
 			arg1 = col+", "+"\""+string[:-1]+"\")"
 		if "str_detect" not in args[2]:
 			col, op, const = args[2].split(" ")
-			const = getConst(const) if const != "max(n)" else "max(n)"
+			const = getConst(const, self.session.attributes) if const != "max(n)" else "max(n)"
 			arg2 = col + " " + op + " " + const
 		else:
 			col, string = args[2].split("|")
@@ -173,192 +175,185 @@ class SquaresInterpreter(PostOrderInterpreter):
 
 		_script = '{ret_df} <- {table} %>% ungroup() %>% filter({arg1} {Operator} {arg2})'.format(ret_df=ret_df_name, table=args[0], arg1=arg1, arg2=arg2, Operator=args[3])
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting filters...')
 			raise GeneralError()
 
 	def eval_summariseGrouped(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 		if "paste" in args[1]:
 			args[1] = '{at} = paste({at}, collapse=:)'.format(at=args[1].split("|")[1])
 
 		_script = '{ret_df} <- {table} %>% group_by({cols}) %>% summarise({cond})'.format(ret_df=ret_df_name, table=args[0], cols=get_collist(args[2]), cond=args[1].replace(":", "\":\""))
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting summarise...')
 			raise GeneralError()
 
 	def eval_summarise(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 		if "paste" in args[1]:
 			args[1] = '{at} = paste({at}, collapse=\":\")'.format(at=args[1].split("|")[1])
 		_script = '{ret_df} <- {table} %>% summarise({cond})'.format(ret_df=ret_df_name, table=args[0], cond=args[1])
 
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting summarise...')
 			raise GeneralError()
 
 	def eval_inner_join(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- inner_join({t1}, {t2})'.format(
 				  ret_df=ret_df_name, t1=args[0], t2=args[1])
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin...')
 			raise GeneralError()
 
 	def eval_inner_join3(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- inner_join(inner_join({t1}, {t2}), {t3})'.format(
 				  ret_df=ret_df_name, t1=args[0], t2=args[1], t3=args[2])
 
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin3...')
 			raise GeneralError()
 
 	def eval_inner_join4(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- inner_join(inner_join(inner_join({t1}, {t2}), {t3}), {t4})'.format(
 				  ret_df=ret_df_name, t1=args[0], t2=args[1], t3=args[2], t4=args[3])
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin4...')
 			raise GeneralError()
 
 	def eval_anti_join(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- anti_join(select({t1},{col}), select({t2}, {col}))'.format(
 				  ret_df=ret_df_name, t1=args[0], t2=args[1], col=get_collist(args[2]))
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin...')
 			raise GeneralError()
 
 	def eval_left_join(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- left_join({t1}, {t2})'.format(
 				  ret_df=ret_df_name, t1=args[0], t2=args[1])
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin...')
 			raise GeneralError()
 
 	def eval_bind_rows(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- bind_rows({t1}, {t2})'.format(
 				  ret_df=ret_df_name, t1=args[0], t2=args[1])
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin...')
 			raise GeneralError()
 
 	def eval_intersect(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- intersect(select({t1},{col}), select({t2}, {col}))'.format(
 				  ret_df=ret_df_name, t1=args[0], t2=args[1], col=get_collist(args[2]))
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin...')
 			raise GeneralError()
 
 	def eval_unite(self, node, args):
-		global final_program, getProgram
-		ret_df_name = get_fresh_name()
-		_tables[ret_df_name] = counter_
+		ret_df_name = self.session.get_fresh_name()
+		self.session.tables[ret_df_name] = self.session.counter
 
 		_script = '{ret_df} <- unite({t1}, {col1}, which(colnames({t1})=="{col1}"), {col2}, which(colnames({t1})=="{col2}"), sep=":")'.format(
 				  ret_df=ret_df_name, t1=args[0], col1=get_collist(args[1]), col2=get_collist(args[2]))
 		# print(_script)
-		if getProgram:
-			final_program += _script + "\n"
+		if self.session.get_program:
+			self.session.final_program += _script + "\n"
 		try:
-			ret_val = robjects.r(_script)
+			ret_val = self.session.r(_script)
 			return ret_df_name
 		except:
 			#LOGGER 			logger.error('Error in interpreting innerjoin...')
 			raise GeneralError()
 
+	def release(self):
+		self.session.release_tables(self.memo.values() if self.memo is not None else ())
+
 	## Abstract interpreter
 	def apply_row(self, val):
 		df = val
 		if isinstance(val, str):
-			df = robjects.r(val)
+			df = self.session.r(val)
 		## df: rpy2.robjects.vectors.DataFrame
 
 		return df.nrow
@@ -366,12 +361,737 @@ class SquaresInterpreter(PostOrderInterpreter):
 	def apply_col(self, val):
 		df = val
 		if isinstance(val, str):
-			df = robjects.r(val)
+			df = self.session.r(val)
 
 		return df.ncol
 
+	def apply_cols(self, val):
+		df = val
+		if isinstance(val, str):
+			df = self.session.r(val)
+
+		return column_set(self.session.column_bits, df.colnames)
+
 	def apply_name(self, val):
-		return _tables[val]
+		return self.session.tables[val]
+
+## Native backend: the same operators evaluated in-process on pandas tables.
+## dplyr's grouping (kept after summarise) is tracked in df.attrs['groups'].
+pd_ops = {"==": operator.eq, "!=": operator.ne, ">": operator.gt, "<": operator.lt, ">=": operator.ge, "<=": operator.le}
+
+def get_groups(df):
+	return df.attrs.get('groups', [])
+
+def set_groups(df, groups):
+	df.attrs['groups'] = list(groups)
+	return df
+
+def read_table_pd(file):
+	# same conventions as read.table(file, sep=",", header=T)
+	df = pd.read_csv(file, sep=",", header=0, comment="#", na_values=["NA"], keep_default_na=False)
+	return set_groups(df.reset_index(drop=True), [])
+
+# string value of a cell as given by R's as.character (NA is None)
+def as_character_r(value):
+	if value is None:
+		return None
+	if isinstance(value, (bool, np.bool_)):
+		return "TRUE" if value else "FALSE"
+	if isinstance(value, (int, np.integer)):
+		return str(int(value))
+	if isinstance(value, (float, np.floating)):
+		if math.isnan(value):
+			return None
+		if math.isinf(value):
+			return "Inf" if value > 0 else "-Inf"
+		if value == 0:
+			return "0"
+		# 15 significant digits, fixed notation unless scientific is shorter
+		mantissa, exp = '{:.14e}'.format(value).split("e")
+		mantissa, exp = mantissa.rstrip("0").rstrip("."), int(exp)
+		sci = '{m}e{s}{e:02d}'.format(m=mantissa, s="+" if exp >= 0 else "-", e=abs(exp))
+		digits = len(mantissa.replace("-", "").replace(".", ""))
+		fixed = '{v:.{d}f}'.format(v=value, d=max(0, digits - 1 - exp))
+		return fixed if len(fixed) <= len(sci) else sci
+	return str(value)
+
+def as_character_pd(column):
+	return [as_character_r(v) for v in column.tolist()]
+
+def eq_pd(actual, expect):
+	if list(actual.columns) != list(expect.columns) or len(actual.index) != len(expect.index):
+		return False
+	for i in range(len(actual.columns)):
+		if as_character_pd(actual.iloc[:, i]) != as_character_pd(expect.iloc[:, i]):
+			return False
+	return True
+
+def is_numeric_pd(column):
+	return pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column)
+
+def compare_pd(lhs, op, rhs):
+	if isinstance(rhs, pd.Series) and is_numeric_pd(lhs) and is_numeric_pd(rhs):
+		return pd_ops[op](lhs, rhs) & lhs.notna() & rhs.notna()
+	if isinstance(rhs, int) and is_numeric_pd(lhs):
+		return pd_ops[op](lhs, rhs) & lhs.notna()
+	if isinstance(rhs, int) and op not in ["==", "!="]:
+		# ordering a factor against a number is NA in R
+		return pd.Series(False, index=lhs.index)
+	# everything else is compared as character vectors
+	lhs_str = as_character_pd(lhs)
+	rhs_str = as_character_pd(rhs) if isinstance(rhs, pd.Series) else [str(rhs)] * len(lhs_str)
+	return pd.Series([l is not None and r is not None and pd_ops[op](l, r) for l, r in zip(lhs_str, rhs_str)], index=lhs.index, dtype=bool)
+
+# the errors of condition_mask_pd on a condition that does not apply to a table: a missing column, a constant
+# that is not a number, values that cannot be compared or a pattern that is not a regular expression
+condition_errors_pd = (KeyError, ValueError, TypeError, re.error, GeneralError)
+
+# boolean mask of the rows of df where a FilterCondition holds
+def condition_mask_pd(df, cond, attributes, groups=[]):
+	if "str_detect" in cond:
+		col, string = cond.split("|")
+		col = col[len("str_detect("):]
+		found = [v is not None and re.search(string[:-1], v) is not None for v in as_character_pd(df[col])]
+		return pd.Series(found, index=df.index, dtype=bool)
+	col, op, const = cond.split(" ")
+	if const == "max(n)":
+		if groups:
+			rhs = df.groupby(groups, sort=False, dropna=False)["n"].transform("max")
+		else:
+			rhs = pd.Series(df["n"].max(), index=df.index)
+		return compare_pd(df[col], op, rhs)
+	const = getConst(const, attributes)
+	if const is None:
+		raise GeneralError()
+	if const.startswith("\""):
+		return compare_pd(df[col], op, const[1:-1])
+	if const in attributes:
+		return compare_pd(df[col], op, df[const])
+	return compare_pd(df[col], op, int(const))
+
+def select_pd(df, cols):
+	# like dplyr's select, grouping columns are kept on grouped tables
+	groups = get_groups(df)
+	cols = [g for g in groups if g not in cols] + cols
+	return set_groups(df[cols].copy(), groups)
+
+def summarise_pd(df, cond, groups):
+	if "paste" in cond:
+		at = cond.split("|")[1]
+		name, fn = at, lambda s: ":".join(["NA" if v is None else v for v in as_character_pd(s)])
+	else:
+		name, fn, arg = re.match(r'(\w+) = (\w+)\((\w*)\)', cond).groups()
+		if fn == "n":
+			fn, at = len, df.columns[0]
+		else:
+			fn, at = (lambda f: lambda s: getattr(s, f)(skipna=False))(fn), arg
+	if groups:
+		out = df.groupby(groups, sort=True, dropna=False)[at].agg(fn).reset_index(name=name)
+	else:
+		out = pd.DataFrame({name: [fn(df[at])]})
+	return set_groups(out, groups[:-1])
+
+def join_pd(t1, t2, how):
+	common = [c for c in t1.columns if c in t2.columns]
+	if common == []:
+		raise GeneralError()
+	return set_groups(t1.merge(t2, how=how, on=common), get_groups(t1))
+
+
+class PandasInterpreter(PostOrderInterpreter):
+	## Concrete interpreter, tables are pandas DataFrames
+	def __init__(self, session):
+		self.session = session
+		self.masks = None
+
+	def set_memo(self, memo):
+		super().set_memo(memo)
+		# the masks of the FilterConditions on the tables of the memoized subprograms, bounded like the tables themselves
+		self.masks = MemoTable(max_size=memo.max_size) if memo is not None else None
+
+	# boolean mask (a numpy array) of the rows of df, the table of node, where cond holds. Each mask is computed at
+	# most once per table: the masks on the inputs are computed with the spec (see DSL), the others when first used
+	def condition_mask(self, node, df, cond, groups=[]):
+		if node.is_param() and self.session.condition_masks is not None:
+			masks = self.session.condition_masks[node.index]
+		elif self.masks is None:
+			masks = {}
+		else:
+			found, masks = self.masks.lookup(node)
+			if not found:
+				masks = {}
+				self.masks.insert(node, masks)
+		key = (cond, tuple(groups))
+		if key not in masks:
+			try:
+				masks[key] = condition_mask_pd(df, cond, self.session.attributes, groups).values
+			except condition_errors_pd:
+				masks[key] = None
+		if masks[key] is None:
+			raise GeneralError()
+		return masks[key]
+
+	def eval_ColInt(self, v):
+		return v
+
+	def eval_ColList(self, v):
+		return v
+
+	def eval_const(self, node, args):
+		return args[0]
+
+	def eval_select(self, node, args):
+		try:
+			cols = [c.strip() for c in get_collist(args[1]).split(",")]
+			ret_df = set_groups(args[0][cols].copy(), [])
+			if args[2] == "distinct":
+				ret_df = set_groups(ret_df.drop_duplicates().reset_index(drop=True), [])
+			return ret_df
+		except:
+			raise GeneralError()
+
+	def eval_filter(self, node, args):
+		try:
+			# a filter on max(n) is the only one applied on the grouped table
+			groups = get_groups(args[0]) if "max(n)" in args[1] else []
+			mask = self.condition_mask(node.children[0], args[0], args[1], groups)
+			return set_groups(args[0][mask].reset_index(drop=True), groups)
+		except:
+			raise GeneralError()
+
+	def eval_filters(self, node, args):
+		try:
+			mask1 = self.condition_mask(node.children[0], args[0], args[1])
+			mask2 = self.condition_mask(node.children[0], args[0], args[2])
+			mask = mask1 & mask2 if args[3] == "&" else mask1 | mask2
+			return set_groups(args[0][mask].reset_index(drop=True), [])
+		except:
+			raise GeneralError()
+
+	def eval_summariseGrouped(self, node, args):
+		try:
+			return summarise_pd(args[0], args[1], [c.strip() for c in get_collist(args[2]).split(",")])
+		except:
+			raise GeneralError()
+
+	def eval_summarise(self, node, args):
+		try:
+			return summarise_pd(args[0], args[1], get_groups(args[0]))
+		except:
+			raise GeneralError()
+
+	def eval_inner_join(self, node, args):
+		try:
+			return join_pd(args[0], args[1], "inner")
+		except:
+			raise GeneralError()
+
+	def eval_inner_join3(self, node, args):
+		try:
+			return join_pd(join_pd(args[0], args[1], "inner"), args[2], "inner")
+		except:
+			raise GeneralError()
+
+	def eval_inner_join4(self, node, args):
+		try:
+			return join_pd(join_pd(join_pd(args[0], args[1], "inner"), args[2], "inner"), args[3], "inner")
+		except:
+			raise GeneralError()
+
+	def eval_anti_join(self, node, args):
+		try:
+			t1, t2 = select_pd(args[0], [args[2]]), select_pd(args[1], [args[2]])
+			common = [c for c in t1.columns if c in t2.columns]
+			ret_df = t1.merge(t2[common].drop_duplicates(), how="left", on=common, indicator=True)
+			ret_df = ret_df[ret_df["_merge"] == "left_only"].drop(columns="_merge")
+			return set_groups(ret_df.reset_index(drop=True), get_groups(t1))
+		except:
+			raise GeneralError()
+
+	def eval_left_join(self, node, args):
+		try:
+			return join_pd(args[0], args[1], "left")
+		except:
+			raise GeneralError()
+
+	def eval_bind_rows(self, node, args):
+		try:
+			for c in args[0].columns:
+				if c in args[1].columns and is_numeric_pd(args[0][c]) != is_numeric_pd(args[1][c]):
+					raise GeneralError()
+			ret_df = pd.concat([args[0], args[1]], ignore_index=True, sort=False)
+			return set_groups(ret_df, get_groups(args[0]))
+		except:
+			raise GeneralError()
+
+	def eval_intersect(self, node, args):
+		try:
+			t1, t2 = select_pd(args[0], [args[2]]), select_pd(args[1], [args[2]])
+			if set(t1.columns) != set(t2.columns):
+				raise GeneralError()
+			ret_df = t1.drop_duplicates().merge(t2[list(t1.columns)].drop_duplicates(), how="inner", on=list(t1.columns))
+			return set_groups(ret_df.reset_index(drop=True), get_groups(t1))
+		except:
+			raise GeneralError()
+
+	def eval_unite(self, node, args):
+		try:
+			df, col1, col2 = args[0], get_collist(args[1]), get_collist(args[2])
+			from_cols = [c for c in df.columns if c in [col1, col2]]
+			if col2 not in from_cols:
+				raise GeneralError()
+			united = [":".join(["NA" if v is None else v for v in vals]) for vals in zip(*[as_character_pd(df[c]) for c in from_cols])]
+			ret_df = df.drop(columns=from_cols)
+			ret_df.insert(list(df.columns).index(from_cols[0]), col1, united)
+			return set_groups(ret_df, get_groups(df))
+		except:
+			raise GeneralError()
+
+	## Abstract interpreter
+	def apply_row(self, val):
+		return val.shape[0]
+
+	def apply_col(self, val):
+		return val.shape[1]
+
+	def apply_cols(self, val):
+		return column_set(self.session.column_bits, val.columns)
+
+## Embedded SQLite backend: every candidate is compiled into a single SQL statement
+## over the input tables, loaded once into an in-memory database.
+sql_aggrs = {"n": "COUNT(*)", "max": "MAX", "min": "MIN", "mean": "AVG", "sum": "SUM"}
+
+def quote_id(name):
+	return '"{}"'.format(name.replace('"', '""'))
+
+def quote_str(value):
+	return "'{}'".format(value.replace("'", "''"))
+
+def sql_regexp(pattern, value):
+	return value is not None and re.search(pattern, str(value)) is not None
+
+def load_table_sql(conn, file, name):
+	df = read_table_pd(file)
+	df.to_sql(name, conn, index=False)
+	return SQLTable(conn, 'SELECT * FROM {t}'.format(t=quote_id(name)), list(df.columns))
+
+def connect_sql(input_files, output_file):
+	conn = sqlite3.connect(":memory:")
+	conn.create_function("REGEXP", 2, sql_regexp)
+	inputs = [load_table_sql(conn, input_files[i], 'input{cnt}'.format(cnt=i)) for i in range(len(input_files))]
+	return conn, inputs, load_table_sql(conn, output_file, 'expected_output')
+
+class SQLTable(object):
+	"""A compiled (sub)query, executed lazily on the in-memory database."""
+
+	def __init__(self, conn, sql, cols, groups=[], node=None):
+		self.conn = conn
+		self.sql = sql
+		self.cols = list(cols)
+		self.groups = list(groups)
+		self.node = node
+		self._nrow = None
+
+	def nrow(self):
+		if self._nrow is None:
+			self._nrow = self.conn.execute('SELECT COUNT(*) FROM ({sql})'.format(sql=self.sql)).fetchone()[0]
+		return self._nrow
+
+	def fetch(self):
+		cursor = self.conn.execute(self.sql)
+		return [d[0] for d in cursor.description], cursor.fetchall()
+
+	def kinds(self, cols):
+		# "text" or "numeric" for each column, as R reads it, or None for the columns with no values
+		flags = ", ".join(['MAX(typeof({c}) = \'text\'), MAX(typeof({c}) IN (\'integer\', \'real\'))'.format(c=quote_id(c)) for c in cols])
+		row = self.conn.execute('SELECT {flags} FROM ({sql})'.format(flags=flags, sql=self.sql)).fetchone()
+		return ["text" if row[2*i] else "numeric" if row[2*i+1] else None for i in range(len(cols))]
+
+	def __str__(self):
+		return self.sql
+
+# SQL results have no row order, so tables are compared as bags of rows
+def eq_sql(actual, expect):
+	try:
+		names, rows = actual.fetch()
+		expected_names, expected_rows = expect.fetch()
+	except sqlite3.Error:
+		return False
+	if names != expected_names or len(rows) != len(expected_rows):
+		return False
+	return Counter(tuple(as_character_r(v) for v in r) for r in rows) == Counter(tuple(as_character_r(v) for v in r) for r in expected_rows)
+
+# cross-check every SQLite verdict against the R interpreter
+def eq_sql_verified(session, input_tables, eq_full=eq_sql):
+	def eq(actual, expect):
+		res = eq_full(actual, expect)
+		try:
+			r_res = eq_r(SquaresInterpreter(session).eval(actual.node, input_tables), session.expected_output)
+		except GeneralError:
+			r_res = False
+		session.release_tables()
+		if res != r_res:
+			logger.warning('SQLite and R disagree on {}: {} vs {}'.format(actual.node, res, r_res))
+		return res
+	return eq
+
+def condition_sql(cond, cols, attributes):
+	if "str_detect" in cond:
+		col, string = cond.split("|")
+		col = col[len("str_detect("):]
+		if col not in cols:
+			raise GeneralError()
+		return '{col} REGEXP {const}'.format(col=quote_id(col), const=quote_str(string[:-1]))
+	col, op, const = cond.split(" ")
+	if col not in cols:
+		raise GeneralError()
+	if const == "max(n)":
+		# computed by with_max_n
+		const = quote_id("max(n)")
+	else:
+		const = getConst(const, attributes)
+		if const is None or (const in attributes and const not in cols):
+			raise GeneralError()
+		const = quote_str(const[1:-1]) if const.startswith("\"") else quote_id(const) if const in attributes else const
+	return '{col} {op} {const}'.format(col=quote_id(col), op=op, const=const)
+
+def with_max_n(table, groups):
+	# adds max(n) over the groups as an extra column, for the conditions on "n == max(n)"
+	if "n" not in table.cols:
+		raise GeneralError()
+	partition = 'PARTITION BY {cols}'.format(cols=", ".join([quote_id(g) for g in groups])) if groups else ''
+	return 'SELECT *, MAX("n") OVER ({partition}) AS "max(n)" FROM ({t})'.format(partition=partition, t=table.sql)
+
+
+class SQLiteInterpreter(PostOrderInterpreter):
+	## Concrete interpreter, every node is compiled into a SQL query over its children
+	def __init__(self, session):
+		self.session = session
+		self._alias = 0
+
+	def fresh_alias(self):
+		self._alias += 1
+		return 'T' + str(self._alias)
+
+	def select_cols(self, table, cols):
+		if any(c not in table.cols for c in cols):
+			raise GeneralError()
+		return ", ".join([quote_id(c) for c in cols])
+
+	def select_sql(self, table, cols):
+		# like dplyr's select, grouping columns are kept on grouped tables
+		cols = [g for g in table.groups if g not in cols] + cols
+		sql = 'SELECT {cols} FROM ({t})'.format(cols=self.select_cols(table, cols), t=table.sql)
+		return SQLTable(table.conn, sql, cols, table.groups)
+
+	def join_sql(self, t1, t2, how, node):
+		common = [c for c in t1.cols if c in t2.cols]
+		if common == []:
+			raise GeneralError()
+		l, r = self.fresh_alias(), self.fresh_alias()
+		cols = t1.cols + [c for c in t2.cols if c not in common]
+		sel = ['{l}.{c}'.format(l=l, c=quote_id(c)) for c in t1.cols] + ['{r}.{c}'.format(r=r, c=quote_id(c)) for c in t2.cols if c not in common]
+		on = " AND ".join(['{l}.{c} = {r}.{c}'.format(l=l, r=r, c=quote_id(c)) for c in common])
+		sql = 'SELECT {sel} FROM ({t1}) AS {l} {how} JOIN ({t2}) AS {r} ON {on}'.format(sel=", ".join(sel), t1=t1.sql, l=l, how=how, t2=t2.sql, r=r, on=on)
+		return SQLTable(t1.conn, sql, cols, t1.groups, node)
+
+	def summarise_sql(self, table, cond, groups, node):
+		if any(g not in table.cols for g in groups):
+			raise GeneralError()
+		if "paste" in cond:
+			name = at = cond.split("|")[1]
+			aggr = 'GROUP_CONCAT(CAST({at} AS TEXT), \':\')'.format(at=quote_id(at))
+		else:
+			name, fn, at = re.match(r'(\w+) = (\w+)\((\w*)\)', cond).groups()
+			if fn not in sql_aggrs:
+				raise GeneralError()
+			aggr = sql_aggrs[fn] if fn == "n" else '{fn}({at})'.format(fn=sql_aggrs[fn], at=quote_id(at))
+		if at != "" and at not in table.cols:
+			raise GeneralError()
+		sel = ", ".join([quote_id(g) for g in groups] + ['{aggr} AS {name}'.format(aggr=aggr, name=quote_id(name))])
+		sql = 'SELECT {sel} FROM ({t})'.format(sel=sel, t=table.sql)
+		if groups:
+			sql += ' GROUP BY {cols}'.format(cols=", ".join([quote_id(g) for g in groups]))
+		return SQLTable(table.conn, sql, groups + [name], groups[:-1], node)
+
+	def eval_ColInt(self, v):
+		return v
+
+	def eval_ColList(self, v):
+		return v
+
+	def eval_const(self, node, args):
+		return args[0]
+
+	def eval_select(self, node, args):
+		cols = [c.strip() for c in get_collist(args[1]).split(",")]
+		sql = 'SELECT {distinct}{cols} FROM ({t})'.format(distinct="DISTINCT " if args[2] == "distinct" else "", cols=self.select_cols(args[0], cols), t=args[0].sql)
+		return SQLTable(args[0].conn, sql, cols, [], node)
+
+	def eval_filter(self, node, args):
+		table = args[0]
+		if "max(n)" not in args[1]:
+			sql = 'SELECT * FROM ({t}) WHERE {cond}'.format(t=table.sql, cond=condition_sql(args[1], table.cols, self.session.attributes))
+			return SQLTable(table.conn, sql, table.cols, [], node)
+		# a filter on max(n) is the only one applied on the grouped table
+		sql = 'SELECT {cols} FROM ({t}) WHERE {cond}'.format(cols=self.select_cols(table, table.cols), t=with_max_n(table, table.groups),
+			  cond=condition_sql(args[1], table.cols + ["max(n)"], self.session.attributes))
+		return SQLTable(table.conn, sql, table.cols, table.groups, node)
+
+	def eval_filters(self, node, args):
+		table = args[0]
+		source = with_max_n(table, []) if "max(n)" in args[1] + args[2] else table.sql
+		cols = table.cols + ["max(n)"] if "max(n)" in args[1] + args[2] else table.cols
+		sql = 'SELECT {cols} FROM ({t}) WHERE ({cond1}) {Operator} ({cond2})'.format(cols=self.select_cols(table, table.cols), t=source,
+			  cond1=condition_sql(args[1], cols, self.session.attributes), cond2=condition_sql(args[2], cols, self.session.attributes), Operator="AND" if args[3] == "&" else "OR")
+		return SQLTable(table.conn, sql, table.cols, [], node)
+
+	def eval_summariseGrouped(self, node, args):
+		return self.summarise_sql(args[0], args[1], [c.strip() for c in get_collist(args[2]).split(",")], node)
+
+	def eval_summarise(self, node, args):
+		return self.summarise_sql(args[0], args[1], args[0].groups, node)
+
+	def eval_inner_join(self, node, args):
+		return self.join_sql(args[0], args[1], "INNER", node)
+
+	def eval_inner_join3(self, node, args):
+		return self.join_sql(self.join_sql(args[0], args[1], "INNER", node), args[2], "INNER", node)
+
+	def eval_inner_join4(self, node, args):
+		return self.join_sql(self.join_sql(self.join_sql(args[0], args[1], "INNER", node), args[2], "INNER", node), args[3], "INNER", node)
+
+	def eval_left_join(self, node, args):
+		return self.join_sql(args[0], args[1], "LEFT", node)
+
+	def eval_anti_join(self, node, args):
+		t1, t2 = self.select_sql(args[0], [args[2]]), self.select_sql(args[1], [args[2]])
+		common = [c for c in t1.cols if c in t2.cols]
+		l, r = self.fresh_alias(), self.fresh_alias()
+		on = " AND ".join(['{l}.{c} = {r}.{c}'.format(l=l, r=r, c=quote_id(c)) for c in common])
+		sql = 'SELECT * FROM ({t1}) AS {l} WHERE NOT EXISTS (SELECT 1 FROM ({t2}) AS {r} WHERE {on})'.format(t1=t1.sql, l=l, t2=t2.sql, r=r, on=on)
+		return SQLTable(t1.conn, sql, t1.cols, t1.groups, node)
+
+	def eval_intersect(self, node, args):
+		t1, t2 = self.select_sql(args[0], [args[2]]), self.select_sql(args[1], [args[2]])
+		if set(t1.cols) != set(t2.cols):
+			raise GeneralError()
+		sql = 'SELECT * FROM ({t1}) INTERSECT SELECT {cols} FROM ({t2})'.format(t1=t1.sql, cols=self.select_cols(t2, t1.cols), t2=t2.sql)
+		return SQLTable(t1.conn, sql, t1.cols, t1.groups, node)
+
+	def eval_bind_rows(self, node, args):
+		t1, t2 = args[0], args[1]
+		# like R, and the pandas backend, refuse to bind a numeric column to a character one
+		common = [c for c in t1.cols if c in t2.cols]
+		if common:
+			try:
+				kinds = zip(t1.kinds(common), t2.kinds(common))
+			except sqlite3.Error:
+				raise GeneralError()
+			if any(k1 is not None and k2 is not None and k1 != k2 for k1, k2 in kinds):
+				raise GeneralError()
+		cols = t1.cols + [c for c in t2.cols if c not in t1.cols]
+		sel1 = ", ".join([quote_id(c) if c in t1.cols else 'NULL AS {c}'.format(c=quote_id(c)) for c in cols])
+		sel2 = ", ".join([quote_id(c) if c in t2.cols else 'NULL AS {c}'.format(c=quote_id(c)) for c in cols])
+		sql = 'SELECT {sel1} FROM ({t1}) UNION ALL SELECT {sel2} FROM ({t2})'.format(sel1=sel1, t1=t1.sql, sel2=sel2, t2=t2.sql)
+		return SQLTable(t1.conn, sql, cols, t1.groups, node)
+
+	def eval_unite(self, node, args):
+		table, col1, col2 = args[0], get_collist(args[1]), get_collist(args[2])
+		from_cols = [c for c in table.cols if c in [col1, col2]]
+		if col2 not in from_cols:
+			raise GeneralError()
+		united = " || ':' || ".join(['COALESCE(CAST({c} AS TEXT), \'NA\')'.format(c=quote_id(c)) for c in from_cols])
+		cols = [c for c in table.cols if c not in from_cols]
+		cols.insert(table.cols.index(from_cols[0]), col1)
+		sel = ", ".join(['{u} AS {c}'.format(u=united, c=quote_id(c)) if c == col1 else quote_id(c) for c in cols])
+		sql = 'SELECT {sel} FROM ({t})'.format(sel=sel, t=table.sql)
+		return SQLTable(table.conn, sql, cols, table.groups, node)
+
+	## Abstract interpreter
+	def apply_row(self, val):
+		try:
+			return val.nrow()
+		except sqlite3.Error:
+			raise GeneralError()
+
+	def apply_col(self, val):
+		return len(val.cols)
+
+	def apply_cols(self, val):
+		return column_set(self.session.column_bits, val.cols)
+
+## Order-insensitive table fingerprints: a multiset hash of the rows, each row hashed over its
+## (column name, as.character value) pairs. Tables that are equal up to the order of their rows
+## and columns have equal fingerprints, so a mismatch rejects a candidate without comparing it.
+fingerprint_mask = (1 << 64) - 1
+
+def table_fingerprint(names, columns):
+	rows = zip(*columns) if columns else []
+	total, nrow = 0, 0
+	for row in rows:
+		total = (total + hash(tuple(sorted(zip(names, row), key=lambda p: p[0])))) & fingerprint_mask
+		nrow += 1
+	return tuple(sorted(names)), nrow, total
+
+def fingerprint_r(table):
+	cols = run_r('lapply({t}, as.character)'.format(t=table))
+	return table_fingerprint(list(cols.names), [[None if v is robjects.NA_Character else str(v) for v in c] for c in cols])
+
+def fingerprint_pd(df):
+	return table_fingerprint(list(df.columns), [as_character_pd(df.iloc[:, i]) for i in range(len(df.columns))])
+
+def fingerprint_sql(table):
+	names, rows = table.fetch()
+	return table_fingerprint(names, [[as_character_r(v) for v in c] for c in zip(*rows)])
+
+# compares the fingerprint of a candidate's output with the fingerprint of the expected output, computed once
+# when the comparator is made, the candidates that match are then fully compared by the equal stage of the decider.
+# As in eq_r and eq_sql, an output that the backend fails to read (one of `errors`) does not match
+def eq_fingerprint(fingerprint, expected_output, errors=()):
+	expected = fingerprint(expected_output)
+	def eq_fp(actual, expect):
+		try:
+			return fingerprint(actual) == expected
+		except errors:
+			return False
+	return eq_fp
+
+## The values of the tables of the lines of the candidates, in the equivalence stage of the decider. Unlike the
+## fingerprints, they keep the order of the rows and columns, the groups and the types of the columns, so that
+## tables with equal values give equal results in every function. A line is blamed when its value is equal to an
+## earlier line's, so the value is a SHA-256 digest of the cells rather than a hash that may collide.
+def table_value(names, groups, types, columns):
+	value = (tuple(names), tuple(groups), tuple(types), tuple(tuple(c) for c in columns))
+	return hashlib.sha256(repr(value).encode()).digest()
+
+def value_r(table):
+	cols = run_r('lapply({t}, as.character)'.format(t=table))
+	groups = run_r('group_vars({t})'.format(t=table))
+	types = run_r('vapply({t}, function(c) class(c)[1], "")'.format(t=table))
+	return table_value(list(cols.names), list(groups), list(types), [[None if v is robjects.NA_Character else str(v) for v in c] for c in cols])
+
+def value_pd(df):
+	columns = [df.iloc[:, i] for i in range(len(df.columns))]
+	return table_value(list(df.columns), get_groups(df), [c.dtype.kind for c in columns], [as_character_pd(c) for c in columns])
+
+def value_sql(table):
+	names, rows = table.fetch()
+	columns = list(zip(*rows)) if rows else [[] for n in names]
+	types = [tuple(sorted({type(v).__name__ for v in c if v is not None})) for c in columns]
+	return table_value(names, table.groups, types, [[as_character_r(v) for v in c] for c in columns])
+
+## Static checks of the candidates, before they are evaluated. The columns of every table of a candidate
+## are over-approximated from the columns of the inputs: joins and filters keep the columns of their
+## arguments, and a summarise keeps its groups and the column it makes. A candidate that reads a column
+## missing from its argument, or joins tables without common columns, fails on every backend.
+def columns_r(table):
+	return list(run_r('colnames({t})'.format(t=table)))
+
+def columns_pd(df):
+	return list(df.columns)
+
+def columns_sql(table):
+	return list(table.cols)
+
+def split_cols(cols):
+	return [c.strip() for c in get_collist(cols).split(",")]
+
+# columns read by a FilterCondition
+def condition_columns(cond, attributes):
+	if "str_detect" in cond:
+		return [cond.split("|")[0][len("str_detect("):]]
+	col, op, const = cond.split(" ")
+	if const == "max(n)":
+		return [col, "n"]
+	return [col, const] if getConst(const, attributes) in attributes else [col]
+
+# the column made by a SummariseCondition and the columns it reads
+def summarise_columns(cond):
+	if "paste" in cond:
+		at = cond.split("|")[1]
+		return at, [at]
+	name, fn, at = re.match(r'(\w+) = (\w+)\((\w*)\)', cond).groups()
+	return name, [at] if at else []
+
+# the columns of a table in the abstract domain (the cols property of the spec): a set of the columns of the inputs,
+# as a bitmask of SET_WIDTH bits. The columns a summarise makes are left out, so that the columns of every table of a
+# candidate are a subset of the columns of its arguments; tables with more columns are projected on the first ones
+def column_bits(input_columns, made_columns):
+	bits = {}
+	for cols in input_columns:
+		for c in cols:
+			if c not in bits and c not in made_columns and len(bits) < SET_WIDTH:
+				bits[c] = 1 << len(bits)
+	return bits
+
+def column_set(bits, cols):
+	return sum(bits.get(c, 0) for c in set(cols))
+
+class ColumnChecker(object):
+
+	def __init__(self, input_columns, output_columns, attributes):
+		self.input_columns = [set(cols) for cols in input_columns]
+		self.output_columns = set(output_columns)
+		self.attributes = attributes
+
+	# the columns of the tables of the candidate, by node
+	def table_columns(self, node, columns):
+		if node in columns:
+			return columns[node]
+		if node.is_param():
+			cols = self.input_columns[node.index]
+		elif not node.is_apply():
+			return None
+		else:
+			tables = [c for c in [self.table_columns(arg, columns) for arg in node.args] if c is not None]
+			if node.name == "summariseGrouped":
+				cols = set(split_cols(node.args[2].data)) | {summarise_columns(node.args[1].data)[0]}
+			elif node.name == "summarise":
+				cols = tables[0] | {summarise_columns(node.args[1].data)[0]}
+			elif node.name == "select":
+				cols = set(split_cols(node.args[1].data))
+			else:
+				cols = set().union(*tables)
+		columns[node] = cols
+		return cols
+
+	# the columns read by an apply node from its first argument, and whether its joins have common columns
+	def reads(self, node, columns):
+		args = [columns.get(arg) for arg in node.args]
+		if node.name == "filter":
+			return condition_columns(node.args[1].data, self.attributes), True
+		if node.name == "filters":
+			return condition_columns(node.args[1].data, self.attributes) + condition_columns(node.args[2].data, self.attributes), True
+		if node.name == "summariseGrouped":
+			return summarise_columns(node.args[1].data)[1] + split_cols(node.args[2].data), True
+		if node.name == "summarise":
+			return summarise_columns(node.args[1].data)[1], True
+		if node.name in ["anti_join", "intersect"]:
+			return [node.args[2].data], node.args[2].data in args[1]
+		if node.name in ["inner_join", "inner_join3", "inner_join4", "left_join"]:
+			joined = args[0]
+			for table in args[1:]:
+				if not joined & table:
+					return [], False
+				joined = joined | table
+		return [], True
+
+	def check_shape(self, prog):
+		columns = {}
+		self.table_columns(prog, columns)
+		for node in columns:
+			if node.is_apply() and node.name != "select":
+				reads, joinable = self.reads(node, columns)
+				if not joinable or any(c not in columns[node.args[0]] for c in reads):
+					return False
+		return True
+
+	# the output columns are made by the candidate
+	def check_provenance(self, prog):
+		if not prog.is_apply() or prog.name != "select":
+			return True
+		return self.output_columns <= self.table_columns(prog.args[0], {})
 
 def divide_int_str_constants(const):
 	str_const, int_const = [], []
@@ -493,7 +1213,6 @@ def find_summarise_conditions(int_attr, str_attr, aggrs, necessary_conditions):
 	return list(filter(lambda a: a != [], necessary_conditions)), new_int_attr, conditions
 
 def find_conditions(files, const, attrs, aggrs, bools):
-	global attributes
 	necessary_conditions = []
 	str_const, int_const  =divide_int_str_constants(const)
 	str_attr, int_attr = divide_int_str_attributes(files, attrs)
@@ -507,7 +1226,7 @@ def find_conditions(files, const, attrs, aggrs, bools):
 	filt_cond, necessary_conditions, happens_before = find_filter_conditions(str_const, int_const, str_attr, int_attr, new_int_attr, aggrs, files, necessary_conditions, sum_cond)
 	# exit()
 	attributes = int_attr + new_int_attr
-	return filt_cond, sum_cond, necessary_conditions, happens_before
+	return filt_cond, sum_cond, necessary_conditions, happens_before, attributes
 
 def find_necessary_conditions(conds):
 	predicates = ""
@@ -528,46 +1247,79 @@ def happensBefore(conds):
 		predicates += "\npredicate happens_before(\""+c[0]+"\",\""+c[1]+"\");"
 	return predicates
 
-def DSL():
-	global counter_
-	global _tables
-	global output_attrs
+# masks of the FilterConditions on every input table (None where a condition fails), keyed like in PandasInterpreter
+def input_condition_masks(tables, conditions, attributes):
+	masks = []
+	for df in tables:
+		masks.append({})
+		for c in conditions:
+			try:
+				masks[-1][(c, ())] = condition_mask_pd(df, c, attributes).values
+			except condition_errors_pd:
+				masks[-1][(c, ())] = None
+	return masks
+
+# A condition of a column against a constant holds on a cell depending only on its value, and the tables of a candidate
+# take the values of such a column from the inputs (a left join only adds NA cells, on which no condition holds). The
+# conditions on the same column and constant that select the same rows of every input select the same rows of every
+# table, so each of them is merged into the first one, which keeps the constant in the enum. Returns the merged ones.
+def merge_equivalent_conditions(tables, masks, conditions, attributes, made_columns):
+	classes, merged = {}, {}
+	for c in conditions:
+		cols = condition_columns(c, attributes)
+		if len(cols) != 1 or cols[0] in made_columns:
+			continue
+		col, const = cols[0], c.split("|")[1][:-1] if "str_detect" in c else c.split(" ")[2]
+		inputs = [i for i in range(len(tables)) if col in tables[i].columns]
+		if inputs == [] or len({is_numeric_pd(tables[i][col]) for i in inputs}) > 1:
+			continue
+		for rep in classes.setdefault((col, const), []):
+			if all(masks[i][(rep, ())] is not None and masks[i][(c, ())] is not None and np.array_equal(masks[i][(rep, ())], masks[i][(c, ())]) for i in inputs):
+				merged[c] = rep
+				break
+		else:
+			classes[(col, const)].append(c)
+	return merged
+
+def DSL(session):
 	prog_out = ""
 	Operators = ""
 	concat = ""
 	input_tables, ags, cns, ats, bls, db_columns = [], [], [], [], [], []
 
-	filtersOne = "\nfunc filter: Table r -> Table a, FilterCondition f {\n row(r) <= row(a);\n col(r) == col(a);\n}"
+	filtersOne = "\nfunc filter: Table r -> Table a, FilterCondition f {\n row(r) <= row(a);\n col(r) == col(a);\n cols(r) == cols(a);\n}"
 	filters = filtersOne
-	filterAndOr = "\nfunc filters: Table r -> Table a, FilterCondition f, FilterCondition g, Op o {\n row(r) <= row(a);\n col(r) == col(a);\n}"
+	filterAndOr = "\nfunc filters: Table r -> Table a, FilterCondition f, FilterCondition g, Op o {\n row(r) <= row(a);\n col(r) == col(a);\n cols(r) == cols(a);\n}"
 	filterPredicateOne = "\npredicate is_not_parent(inner_join3, filter, 100);\npredicate is_not_parent(inner_join4, filter, 100);\npredicate is_not_parent(filter, filter, 100);\npredicate distinct_inputs(filter);\n"
 	filterPredicate = filterPredicateOne
 	filterPredicateTwo = "predicate distinct_filters(filters, 1, 2);\npredicate is_not_parent(filters, filters, 100);\npredicate is_not_parent(inner_join, filters, 100);\npredicate is_not_parent(inner_join3, filters, 100);\npredicate is_not_parent(inner_join4, filters, 100);\npredicate distinct_inputs(filters);"
-	summarise = "\nfunc summariseGrouped: Table r -> Table a, SummariseCondition s, Cols b {\n row(r) <= row(a);\n col(r) <= 3;\n}\n\npredicate is_not_parent(inner_join4, summariseGrouped, 100);\npredicate is_not_parent(summariseGrouped, summariseGrouped, 100);"
+	summarise = "\nfunc summariseGrouped: Table r -> Table a, SummariseCondition s, Cols b {\n row(r) <= row(a);\n col(r) <= 3;\n cols(r) <= cols(a);\n}\n\npredicate is_not_parent(inner_join4, summariseGrouped, 100);\npredicate is_not_parent(summariseGrouped, summariseGrouped, 100);"
 	# \nfunc summarise: Table r -> Table a, SummariseCondition s {\n row(r) == 1;\n col(r) == 1;\n}\n\npredicate is_not_parent(summariseGrouped, summarise, 100);\npredicate is_not_parent(inner_join3, summarise, 100);\npredicate is_not_parent(inner_join4, summarise, 100);\npredicate is_not_parent(summarise, summariseGrouped, 100);\npredicate is_not_parent(summarise, summarise, 100);
 	# summarise = "\nfunc summariseGrouped: Table r -> Table a, SummariseCondition s, Cols b;\n\nfunc summarise: Table r -> Table a, SummariseCondition s;\n\npredicate is_not_parent(summariseGrouped, summarise, 100);\npredicate is_not_parent(inner_join3, summarise, 100);\npredicate is_not_parent(inner_join4, summarise, 100);\npredicate is_not_parent(inner_join4, summariseGrouped, 100);\npredicate is_not_parent(summarise, summariseGrouped, 100);\npredicate is_not_parent(summarise, summarise, 100);\npredicate is_not_parent(summariseGrouped, summariseGrouped, 100);"
 	# read the input and output files
-	f_in = open(argv[-1], 'r')
+	f_in = open(session.argv[-1], 'r')
 	inputs = f_in.readline()[:-1].split(":")[1].replace(" ","").split(",")
-	prog_out += "con <- DBI::dbConnect(RSQLite::SQLite(), \":memory:\")\n"
+	p = session.prefix
+	prog_out += "{p}con <- DBI::dbConnect(RSQLite::SQLite(), \":memory:\")\n".format(p=p)
 	for i in inputs:
-		_script = 'input{cnt} <- read.table("{file}", sep =",", header=T)\ninput{cnt}\n'.format(file=i, cnt=counter_)
+		_script = '{p}input{cnt} <- read.table("{file}", sep =",", header=T)\n{p}input{cnt}\n'.format(p=p, file=i, cnt=session.counter)
 		prog_out += _script
-		prog_out += 'input{cnt} <- copy_to(con,input{cnt})\n'.format(cnt=counter_)
-		benchmark1_input = robjects.r(_script)
-		input_tables.append('input{cnt}'.format(cnt=counter_))
-		_tables[input_tables[-1]] = counter_
-		counter_+=1
+		# the SQL tables keep their unprefixed names
+		prog_out += '{p}input{cnt} <- copy_to({p}con,{p}input{cnt}{name})\n'.format(p=p, cnt=session.counter, name=', name="input{}"'.format(session.counter) if p else '')
+		benchmark1_input = session.r(_script)
+		input_tables.append('{p}input{cnt}'.format(p=p, cnt=session.counter))
+		session.tables[input_tables[-1]] = session.counter
+		session.counter+=1
 		with open(i, 'r') as f:
 			db_columns = list(set(db_columns + f.readline()[:-1].split(",")))
 
 	output = f_in.readline()[:-1].split(":")[1].replace(" ","")
-	_script = 'expected_output <- read.table("{file}", sep =",", header=T)\nexpected_output\n'.format(file=output)
+	_script = '{t} <- read.table("{file}", sep =",", header=T)\n{t}\n'.format(t=session.expected_output, file=output)
 	prog_out += _script
 	# print(_script)
-	_tables['expected_output'] = counter_
-	counter_+=1
-	benchmark1_output = robjects.r(_script)
+	session.tables[session.expected_output] = session.counter
+	session.counter+=1
+	benchmark1_output = session.r(_script)
 	# read the list of constants from the input
 	consts = f_in.readline()[:-1].replace(" ","").split(":",1)
 	intConst = findConst(consts[1].replace(" ","").split(","))
@@ -629,7 +1381,24 @@ def DSL():
 	# print("attributes "+str(ats))
 	# print("aggrs "+str(ags))
 	# print("bools "+str(bls))
-	filterConditions, summariseConditions, necessary_conditions, happens_before = find_conditions(inputs, cns, ats, ags, bls)
+	filterConditions, summariseConditions, necessary_conditions, happens_before, session.attributes = find_conditions(inputs, cns, ats, ags, bls)
+	# with -pd, every FilterCondition is evaluated once on the inputs, and the equivalent ones are merged (not with
+	# unite, which makes new values in a column). The masks come from the tables read by pandas, whose types and
+	# missing values may differ from R's read.table, so the R and SQLite backends keep every condition
+	if "-pd" in session.argv:
+		tables = [read_table_pd(i) for i in inputs]
+		session.condition_masks = input_condition_masks(tables, filterConditions, session.attributes)
+		if concat == "":
+			made_columns = {summarise_columns(c)[0] for c in summariseConditions}
+			merged = merge_equivalent_conditions(tables, session.condition_masks, filterConditions, session.attributes, made_columns)
+			if merged:
+				logger.info('Merged {} equivalent filter conditions'.format(len(merged)))
+			filterConditions = [c for c in filterConditions if c not in merged]
+			for n in necessary_conditions:
+				reps = [merged.get(c, c) for c in n]
+				n[:] = [c for i, c in enumerate(reps) if c not in reps[:i]]
+			happens_before = [(merged.get(c, c), s) for c, s in happens_before]
+			happens_before = [h for i, h in enumerate(happens_before) if h not in happens_before[:i]]
 
 	if filters == "" and filterConditions != []:
 		filters = filtersOne
@@ -647,12 +1416,12 @@ def DSL():
 	with open(output, 'r') as f:
 		cols = f.readline()
 
-	output_attrs = cols[:-1]
+	session.output_attrs = cols[:-1]
 
 	cols = str(getColsPermutations(str(db_columns)[1:-1].replace("'","").replace(" ","").split(","), 2))[1:-1].replace("'", "\"")
 	oneColumn = str(getColsPermutations(str(db_columns)[1:-1].replace("'","").replace(" ","").split(","), 1))[1:-1].replace("'", "\"")
 	# try:
-	with open(dir+file_path, 'r') as f:
+	with open(session.dir+file_path, 'r') as f:
 		spec_str = f.read()
 	# except:
 	# 	with open('../example/squares.tyrell', 'r') as f:
@@ -663,7 +1432,7 @@ def DSL():
 	# print("final filter conditions "+ str(fil_conditions))
 	# print("final summarise conditions "+ str(sum_conditions))
 
-	return spec_str.format(cols=cols, Tables=str("Table, "*len(inputs))[:-2], summarise=summarise, filters=filters, filterPred=filterPredicate, FilterConditions=fil_conditions, SummariseConditions=sum_conditions, Op=Operators, necessaryConditions=necessary_conditions, SelectCols=str("\""+output_attrs+"\""), col=oneColumn, concat=concat), input_tables, prog_out, loc
+	return spec_str.format(cols=cols, Tables=str("Table, "*len(inputs))[:-2], summarise=summarise, filters=filters, filterPred=filterPredicate, FilterConditions=fil_conditions, SummariseConditions=sum_conditions, Op=Operators, necessaryConditions=necessary_conditions, SelectCols=str("\""+session.output_attrs+"\""), col=oneColumn, concat=concat), input_tables, prog_out, loc, inputs, output
 
 
 index_table_aux = 0
@@ -675,79 +1444,374 @@ def beautifier(sql):
 	return sp.format(sql, reindent=True, keyword_case='upper')
 	# print(sp.format(new_sql, reindent=True, keyword_case='upper'))
 
-def main(seed=None):
-	global getProgram, final_program
-	if not debug:
-		sys.stderr = open(dir+'output.err', 'w+')
-
-	# os.close(sys.stderr.fileno())
-	warnings.filterwarnings("ignore", category=RRuntimeWarning)
-	warnings.filterwarnings('ignore')
-	logger.info('Parsing Spec...')
-	dsl, input_tables, prog_out, loc = DSL()
-	# print(dsl)
-	spec =  S.parse(dsl)
-	logger.info('Parsing succeeded')
-	# loc += 1 #select
-	# logger.info("Lines of Code: "+str(loc))
-
-	logger.info('Building synthesizer...')
-	loc = 1
-	while (True):
-		logger.info("Lines of Code: "+str(loc))
-		if argv[1]=="tree":
-			enumerator = SmtEnumerator(spec, depth=loc+1, loc=loc)
+_session_ids = itertools.count(1)
+
+class SynthesisSession(object):
+	"""
+	State of one synthesis: its options, the R tables it creates and the program being rendered.
+	The R objects of a session are named with its own prefix and its solvers use their own z3 context,
+	so several sessions can run in the same process (the tree enumerator only uses the default context).
+	"""
+
+	def __init__(self, argv, dir="./", prefix=None):
+		super(SynthesisSession, self).__init__()
+		self.argv = list(argv)
+		self.dir = dir
+		self.prefix = prefix if prefix is not None else "S{}_".format(next(_session_ids))
+		self.expected_output = self.prefix + "expected_output"
+		# the command line session keeps z3's default context
+		self.z3_ctx = z3.Context() if self.prefix else None
+		self.counter = 0
+		self.tables = dict()
+		# RET_DF tables created in R since the last release, and memory high-water marks
+		self.scope = []
+		self.max_live_tables = 0
+		self.num_releases = 0
+		self.get_program = False
+		self.final_program = ''
+		self.output_attrs = ""
+		self.attributes = []
+		# the masks of the FilterConditions on the inputs, with -pd (see DSL)
+		self.condition_masks = None
+
+	def r(self, script):
+		return run_r(script)
+
+	def get_fresh_name(self):
+		self.counter = self.counter + 1
+
+		fresh_str = self.prefix + 'RET_DF' + str(self.counter)
+		self.scope.append(fresh_str)
+		return fresh_str
+
+	def get_fresh_col(self):
+		self.counter = self.counter + 1
+
+		fresh_str = 'COL' + str(self.counter)
+		return fresh_str
+
+	# remove from R the tables created since the last release, except those still in `keep`
+	# (e.g. memoized by the search interpreter)
+	def release_tables(self, keep=()):
+		self.max_live_tables = max(self.max_live_tables, len(self.tables))
+		keep = set(keep)
+		dead = [t for t in self.scope if t not in keep]
+		if dead:
+			self.r('suppressWarnings(rm(list=c({tables})))'.format(tables=", ".join('"{}"'.format(t) for t in dead)))
+			for t in dead:
+				self.tables.pop(t, None)
+		self.scope = []
+		self.num_releases += 1
+		if self.num_releases % 1000 == 0:
+			logger.debug('Memory: {}'.format(self.memory_stats()))
+
+	# a table evicted from the memo table is released together with the next candidate's tables
+	def evict_table(self, name):
+		self.scope.append(name)
+
+	def memory_stats(self):
+		return {"live_tables": len(self.tables), "max_live_tables": max(self.max_live_tables, len(self.tables)), "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+	# remove every R object of the session
+	def close(self):
+		names = list(self.tables.keys()) + self.scope + [self.prefix + "con"]
+		self.r('suppressWarnings(rm(list=c({names})))'.format(names=", ".join('"{}"'.format(t) for t in names)))
+		self.tables, self.scope = dict(), []
+
+	# the R script of the session without its name prefix
+	def unprefixed(self, script):
+		if not self.prefix:
+			return script
+		return re.sub(r'\b{}(?=(RET_DF\d+|input\d+|expected_output|con)\b)'.format(re.escape(self.prefix)), '', script)
+
+	def get_memo_size(self):
+		for arg in self.argv:
+			if arg.startswith("-memo="):
+				return int(arg[len("-memo="):])
+		return default_memo_size
+
+	def prepare(self):
+		# os.close(sys.stderr.fileno())
+		warnings.filterwarnings("ignore", category=RRuntimeWarning)
+		warnings.filterwarnings('ignore')
+		logger.info('Parsing Spec...')
+		dsl, self.input_tables, self.prog_out, loc, input_files, output_file = DSL(self)
+		# print(dsl)
+		self.spec =  S.parse(dsl)
+		logger.info('Parsing succeeded')
+
+		# the search evaluates candidates in R by default, natively on pandas tables with -pd,
+		# or as SQL statements on an in-memory SQLite database with -sqlite (-verify cross-checks them in R)
+		# R tables evicted from the memo table are removed from R as well
+		evict = None
+		# outputs are first compared by their fingerprints, and only fully compared when those match (see make_stages)
+		if "-pd" in self.argv:
+			self.search_interpreter, self.search_eq = PandasInterpreter(self), eq_pd
+			self.search_example = Example(input=[read_table_pd(i) for i in input_files], output=read_table_pd(output_file))
+			self.search_eq_fingerprint, columns = eq_fingerprint(fingerprint_pd, self.search_example.output), columns_pd
+			self.search_value = value_pd
+		elif "-sqlite" in self.argv:
+			conn, sql_inputs, sql_output = connect_sql(input_files, output_file)
+			self.search_interpreter = SQLiteInterpreter(self)
+			self.search_eq = eq_sql
+			if "-verify" in self.argv:
+				self.search_eq = eq_sql_verified(self, self.input_tables, self.search_eq)
+			self.search_example = Example(input=sql_inputs, output=sql_output)
+			self.search_eq_fingerprint, columns = eq_fingerprint(fingerprint_sql, sql_output, sqlite3.Error), columns_sql
+			self.search_value = value_sql
 		else:
-			if "-off" in argv:
-				enumerator = LinesEnumerator(spec, depth=loc+1, loc=loc)
-			elif "-on" in argv:
-				enumerator = LinesEnumerator(spec, depth=loc+1, loc=loc, break_sym_online=True)
-			else:
-				enumerator = LinesEnumerator(spec, depth=loc+1, loc=loc, sym_breaker=False)
-
-
+			self.search_interpreter, self.search_eq, evict = SquaresInterpreter(self), eq_r, self.evict_table
+			self.search_example = Example(input=self.input_tables, output=self.expected_output)
+			self.search_eq_fingerprint, columns = eq_fingerprint(fingerprint_r, self.expected_output, RRuntimeError), columns_r
+			self.search_value = value_r
+		input_columns = [columns(t) for t in self.search_example.input]
+		self.column_checker = ColumnChecker(input_columns, split_cols(self.output_attrs), self.attributes)
+		summarise_conditions = self.spec.get_type("SummariseCondition")
+		made_columns = {summarise_columns(c)[0] for c in summarise_conditions.domain if "paste" not in c} if summarise_conditions else set()
+		self.column_bits = column_bits(input_columns, made_columns)
+		# results of subprograms shared by consecutive candidates are memoized (-memo=N bounds the table, -memo=0 disables it)
+		memo_size = self.get_memo_size()
+		self.memo = MemoTable(max_size=memo_size, on_evict=evict) if memo_size else None
+		self.search_interpreter.set_memo(self.memo)
+		# the lines enumerator of the last search, which grows by one line when the next search needs it
+		self.enumerator = None
+
+	def make_enumerator(self, loc, config):
+		if config == "tree":
+			return SmtEnumerator(self.spec, depth=loc+1, loc=loc, ctx=self.z3_ctx)
+		if self.enumerator is not None and self.enumerator[0] == config and self.enumerator[1].loc == loc-1:
+			enumerator = self.enumerator[1]
+			enumerator.increaseLoc()
+		elif config == "lines-off":
+			enumerator = LinesEnumerator(self.spec, depth=loc+1, loc=loc, ctx=self.z3_ctx)
+		elif config == "lines-lex":
+			enumerator = LinesEnumerator(self.spec, depth=loc+1, loc=loc, sym_breaker=False, lex_leader=True, ctx=self.z3_ctx)
+		elif config == "lines-on":
+			enumerator = LinesEnumerator(self.spec, depth=loc+1, loc=loc, break_sym_online=True, sym_solver="-symz3" in self.argv, ctx=self.z3_ctx)
+		else:
+			enumerator = LinesEnumerator(self.spec, depth=loc+1, loc=loc, sym_breaker=False, ctx=self.z3_ctx)
+		self.enumerator = (config, enumerator)
+		return enumerator
+
+	# the enumerator chosen on the command line
+	def get_config(self):
+		if self.argv[1]=="tree":
+			return "tree"
+		elif "-off" in self.argv:
+			return "lines-off"
+		elif "-on" in self.argv:
+			return "lines-on"
+		elif "-lex" in self.argv:
+			return "lines-lex"
+		return "lines"
+
+	# the stages of the decider, in the order given by -stages=s1,s2,... (default_stages by default, without
+	# the fingerprint stage with -verify so that every evaluated candidate is cross-checked). The equivalence
+	# stage is left out unless the enumerator is "lines": the lines it blames are only replaced by equivalent
+	# ones in the programs the enumerator still produces when every numbering of their lines is enumerated
+	def make_stages(self, decider, config):
+		stages = {
+			"shape": lambda: FunctionStage("shape", self.column_checker.check_shape),
+			"provenance": lambda: FunctionStage("provenance", self.column_checker.check_provenance),
+			"abstract": lambda: decider.abstract_stage("abstract"),
+			"equivalence": lambda: EquivalenceStage("equivalence", self.spec, self.search_interpreter, [self.search_example], self.search_value, max_size=self.get_memo_size() or default_memo_size),
+			"fingerprint": lambda: decider.output_stage("fingerprint", self.search_eq_fingerprint),
+			"equal": lambda: decider.output_stage("equal", self.search_eq),
+		}
+		names = [s for s in default_stages if s != "fingerprint"] if "-verify" in self.argv else default_stages
+		for arg in self.argv:
+			if arg.startswith("-stages="):
+				names = arg[len("-stages="):].split(",")
+		if any(name not in stages for name in names):
+			raise ValueError('Unknown stages in {}, the stages are {}'.format(names, ",".join(default_stages)))
+		return [stages[name]() for name in names if name != "equivalence" or config == "lines"]
+
+	# search all the programs with `loc` lines, returns the solution (or None) and statistics of the search
+	def search(self, loc, config):
+		start = time.time()
+		logger.info("Lines of Code: "+str(loc))
+		enumerator = self.make_enumerator(loc, config)
+
+		# decider=ExampleConstraintDecider(
+		pruning_decider = ExampleConstraintPruningDecider(
+			spec=self.spec,
+			interpreter=self.search_interpreter,
+			examples=[
+				self.search_example,
+			],
+			equal_output=self.search_eq,
+			ctx=self.z3_ctx
+		)
 		synthesizer = Synthesizer(
 			#loc: # of function productions
 			enumerator=enumerator,
-			# decider=ExampleConstraintDecider(
-			decider=ExampleConstraintPruningDecider(
-				spec=spec,
-				interpreter=SquaresInterpreter(),
-				examples=[
-					Example(input=input_tables, output='expected_output'),
-				],
-				equal_output=eq_r
-			)
+			decider=StagedDecider(self.make_stages(pruning_decider, config))
 		)
 		logger.info('Synthesizing programs...')
 
 		prog = synthesizer.synthesize()
-		if prog is not None:
-			logger.info('Solution found: {}'.format(prog))
-			# print(prog_out+"select("+str(prog).replace("@param", "table")+","+output_attrs+")")
-			# print(prog_out+str(prog).replace("@param", "table"))
-			getProgram = True
-			interpreter=SquaresInterpreter()
-			evaluation = interpreter.eval(prog, input_tables)
-			if dir == "./":
-				print()
-				if "-nr" not in argv:
-					print("------------------------------------- R Solution ---------------------------------------\n")
-					print(prog_out)
-					print(final_program)
-					print();print()
-				print("+++++++++++++++++++++++++++++++++++++ SQL Solution +++++++++++++++++++++++++++++++++++++\n")
-			robjects.r('{rscript}'.format(rscript=prog_out+final_program))
-			sql_query = robjects.r('sql_render({result_table})'.format(result_table=evaluation))
-			if dir == "./":
-				print(beautifier(str(sql_query)[6:]))
-				print()
-			return final_program,beautifier(str(sql_query)[6:])
+		decider = synthesizer.decider
+		logger.info('Decider: {} candidates, {:.4f} ms per candidate'.format(
+			decider.num_analyzed, decider.analyze_time / max(1, decider.num_analyzed) * 1000))
+		for stage in decider.stages:
+			logger.info('Stage {}: {} seen, {} rejected in {:.3f}s'.format(stage.name, stage.num_seen, stage.num_rejected, stage.time))
+			if isinstance(stage, EquivalenceStage):
+				logger.info('Equivalent lines: {} values stored, {} lines blamed'.format(stage.num_stored, stage.num_blamed))
+		logger.info('Abstract checks: interval {interval_sat} sat, {interval_unsat} unsat, {interval_unknown} unknown in {interval_time:.3f}s; z3 {z3_sat} sat, {z3_unsat} unsat in {z3_time:.3f}s'.format(
+			**pruning_decider.check_stats))
+		if self.memo is not None:
+			logger.info('Memo table: {} hits, {} misses'.format(self.memo.hits, self.memo.misses))
+		logger.info('Memory: {}'.format(self.memory_stats()))
+		stats = {"loc": loc, "enumerator": config, "attempts": synthesizer.num_attempts, "time": time.time() - start}
+		return prog, stats
+
+	# evaluate the solution once more in R to render the R program and its SQL query
+	def render(self, prog):
+		logger.info('Solution found: {}'.format(prog))
+		# print(prog_out+"select("+str(prog).replace("@param", "table")+","+output_attrs+")")
+		# print(prog_out+str(prog).replace("@param", "table"))
+		self.get_program = True
+		interpreter=SquaresInterpreter(self)
+		evaluation = interpreter.eval(prog, self.input_tables)
+		self.r('{rscript}'.format(rscript=self.prog_out+self.final_program))
+		sql_query = self.r('sql_render({result_table})'.format(result_table=evaluation))
+		return self.unprefixed(self.final_program),beautifier(str(sql_query)[6:])
+
+	def print_solution(self, r_solution, sql_solution):
+		if self.dir == "./":
+			print()
+			if "-nr" not in self.argv:
+				print("------------------------------------- R Solution ---------------------------------------\n")
+				print(self.unprefixed(self.prog_out))
+				print(r_solution)
+				print();print()
+			print("+++++++++++++++++++++++++++++++++++++ SQL Solution +++++++++++++++++++++++++++++++++++++\n")
+			print(sql_solution)
+			print()
+
+	def synthesize(self):
+		self.prepare()
+		if "-portfolio" in self.argv or any(a.startswith("-portfolio=") for a in self.argv):
+			return self.synthesize_portfolio()
+
+		logger.info('Building synthesizer...')
+		config = self.get_config()
+		loc = 1
+		while (True):
+			prog, stats = self.search(loc, config)
+			if prog is not None:
+				r_solution, sql_solution = self.render(prog)
+				self.print_solution(r_solution, sql_solution)
+				return r_solution, sql_solution
 
-		else:
-			logger.info('No more queries to be tested. Solution not found!')
-			logger.info('Increasing the number of lines of code.')
-			loc = loc + 1
+			else:
+				logger.info('No more queries to be tested. Solution not found!')
+				logger.info('Increasing the number of lines of code.')
+				loc = loc + 1
+
+	## Portfolio: every (loc, enumerator) pair is searched by a process forked from the session, each
+	## with its own copy of R. The solution at the smallest loc wins: a solution at loc k is returned once
+	## every loc < k has been exhausted by some enumerator, and searches at larger locs are cancelled.
+	def get_portfolio(self):
+		configs, workers = ["lines", "lines-on", "lines-off"], multiprocessing.cpu_count()
+		for arg in self.argv:
+			if arg.startswith("-portfolio="):
+				configs = arg[len("-portfolio="):].split(",")
+			elif arg.startswith("-workers="):
+				workers = int(arg[len("-workers="):])
+		return configs, max(1, workers)
+
+	def portfolio_worker(self, loc, config, conn):
+		sys.stdout = open(os.devnull, 'w')
+		start = time.time()
+		try:
+			prog, stats = self.search(loc, config)
+			if prog is None:
+				conn.send(("exhausted", None, stats))
+			else:
+				conn.send(("solved", self.render(prog), stats))
+		except Exception as e:
+			logger.warning('Worker {} at loc {} failed: {}'.format(config, loc, repr(e)))
+			conn.send(("error", None, {"loc": loc, "enumerator": config, "time": time.time() - start}))
+
+	def synthesize_portfolio(self):
+		configs, workers = self.get_portfolio()
+		fork = multiprocessing.get_context('fork')
+		tasks, next_loc = deque(), 1
+		running = dict()
+		solutions, exhausted, errors = dict(), set(), Counter()
+		self.portfolio_stats = []
+		lowest_open = 1
+
+		def cancel(should_cancel):
+			for conn, (worker, loc, config, start) in list(running.items()):
+				if should_cancel(loc):
+					worker.terminate()
+					worker.join()
+					del running[conn]
+					self.portfolio_stats.append({"loc": loc, "enumerator": config, "outcome": "cancelled", "time": time.time() - start})
+
+		while lowest_open not in solutions:
+			# keep the pool busy with the next (loc, enumerator) pairs that can still improve the solution
+			while len(running) < workers:
+				if not tasks:
+					tasks.extend((next_loc, config) for config in configs)
+					next_loc += 1
+				loc, config = tasks[0]
+				if solutions and loc >= min(solutions):
+					break
+				tasks.popleft()
+				if loc in exhausted:
+					continue
+				recv_conn, send_conn = fork.Pipe(duplex=False)
+				worker = fork.Process(target=self.portfolio_worker, args=(loc, config, send_conn))
+				worker.start()
+				send_conn.close()
+				running[recv_conn] = (worker, loc, config, time.time())
+
+			for conn in multiprocessing.connection.wait(list(running.keys())):
+				if conn not in running:
+					continue
+				worker, loc, config, start = running.pop(conn)
+				try:
+					outcome, solution, stats = conn.recv()
+				except EOFError:
+					outcome, solution, stats = "error", None, {"loc": loc, "enumerator": config}
+				worker.join()
+				stats.update(outcome=outcome, time=time.time() - start)
+				self.portfolio_stats.append(stats)
+				logger.info('Worker {}'.format(stats))
+				if outcome == "solved":
+					solutions.setdefault(loc, solution)
+					cancel(lambda l: l > loc)
+				elif outcome == "exhausted":
+					exhausted.add(loc)
+					cancel(lambda l: l == loc)
+				else:
+					errors[loc] += 1
+					if errors[loc] == len(configs):
+						# no enumerator can search this loc, move on as the sequential search would not end
+						logger.warning('Every enumerator failed at loc {}'.format(loc))
+						exhausted.add(loc)
+			while lowest_open in exhausted:
+				lowest_open += 1
+
+		cancel(lambda l: True)
+		r_solution, sql_solution = solutions[lowest_open]
+		self.print_solution(r_solution, sql_solution)
+		if self.dir == "./":
+			print("==================================== Portfolio Workers ===================================\n")
+			for st in sorted(self.portfolio_stats, key=lambda st: (st["loc"], st["enumerator"])):
+				print('loc {loc} {enumerator}: {outcome} after {time:.2f}s, {attempts} candidates'.format(**dict({"attempts": "-"}, **st)))
+			print()
+		return r_solution, sql_solution
+
+
+def main(seed=None):
+	if not debug:
+		sys.stderr = open(dir+'output.err', 'w+')
+	# the command line keeps R's names unprefixed
+	return SynthesisSession(argv, dir=dir, prefix="").synthesize()
 
 
 debug=False
@@ -764,7 +1828,7 @@ if __name__ == '__main__':
 		logger.setLevel('CRITICAL')
 	seed = None
 	if "-h" in argv:
-		exit("Usage: python3 squaresEnumerator.py [tree|lines] [flags -h, ...] input.in\nflags:\n-on : computing symmetries online\n-off : computing symmetries offline\n-d : debug info\n\n-nr : only SQL solution\n\nDefault: lines enumerator and without symmetry breaking")
+		exit("Usage: python3 squaresEnumerator.py [tree|lines] [flags -h, ...] input.in\nflags:\n-on : computing symmetries online\n-symz3 : with -on, find the symmetries with the solver instead of as topological renumberings\n-off : computing symmetries offline\n-lex : breaking symmetries statically with lex-leader constraints\n-d : debug info\n-pd : evaluate candidates with pandas instead of R\n-sqlite : evaluate candidates as SQL on an in-memory SQLite database\n-verify : with -sqlite, cross-check every verdict with R\n-stages=s1,s2,... : stages of the decider, in order (default: {stages})\n-memo=N : memoize at most N subprogram results (default {}, 0 disables it)\n-portfolio[=c1,c2,...] : search several LOC and enumerator configurations (lines, lines-on, lines-off, lines-lex, tree) in parallel\n-workers=N : number of portfolio worker processes (default: number of CPUs)\n\n-nr : only SQL solution\n\nDefault: lines enumerator and without symmetry breaking".format(default_memo_size, stages=",".join(default_stages)))
 	if len(argv) > 1:
 		try:
 			seed = int(argv[1])
@@ -780,42 +1844,49 @@ class Squares(object):
 		super(Squares, self).__init__()
 		self.template = "inputs: {inputs}\noutput: {output}\nconst: {const}\naggrs: {aggrs}\nattrs: {attrs}\nbools:\nloc: {loc}\n"
 
-	def synthesize(self, inputs, output_ex, const="", aggrs="", attrs="", loc=0):
-		"""docstring for Squares."""
-		global argv, dir
+	def synthesize(self, inputs, output_ex, const="", aggrs="", attrs="", loc=0, flags=[], files_dir=None):
+		"""The R and SQL solutions of the problem with these tables.
+		The tables and the .in file are written to users/tables and users/files, or to `files_dir` if it is given
+		(a directory of their own, for problems solved at the same time)."""
 		dir = "../"
 		ins = list([])
 		temp = self.template
 
-		try:
-			path, dirs, files = next(os.walk("../users/files"))
-		except:
-			path, dirs, files = next(os.walk("users/files"))
-			dir="./"
-		file_count = str(len(files) +1)
+		if files_dir is not None:
+			tables_path = files_path = os.path.join(files_dir, "")
+			file_count = ""
+		else:
+			try:
+				path, dirs, files = next(os.walk("../users/files"))
+			except:
+				path, dirs, files = next(os.walk("users/files"))
+				dir="./"
+			file_count = str(len(files) +1)
+			tables_path, files_path = dir+"users/tables/", dir+"users/files/"
 
 		i_c = 0
 		for i in inputs:
-			input = open(dir+"users/tables/"+"i"+str(file_count)+str(i_c),"w+")
+			input = open(tables_path+"i"+str(file_count)+str(i_c),"w+")
 			input.write(i)
 			input.close()
-			ins.append(dir+"users/tables/"+"i"+str(file_count)+str(i_c))
+			ins.append(tables_path+"i"+str(file_count)+str(i_c))
 			i_c += 1
-		output = open(dir+"users/tables/"+"o"+str(file_count),"w+")
+		output = open(tables_path+"o"+str(file_count),"w+")
 		output.write(output_ex)
 		output.close()
-		output = dir+"users/tables/o"+str(file_count)
+		output = tables_path+"o"+str(file_count)
 
-		input_file_name = dir+"users/files/"+"f"+str(file_count)
+		input_file_name = files_path+"f"+str(file_count)
 		input_file = open(input_file_name, "w+")
 		inputs=str(ins).replace("\'","").replace("]","").replace("[","")
 		input_file.write(temp.format(inputs=inputs,output=output, const="\""+const.replace(",","\",\"").replace(" ","")+"\"", aggrs="\""+aggrs.replace(",","\",\"").replace(" ","")+"\"", attrs="\""+attrs.replace(",","\",\"").replace(" ","")+"\"", loc=str(loc)).replace("\"\"",""))
 		input_file.close()
 
-		argv = []
-		argv.append("lines")
-		argv.append(input_file_name)
-		return main()
+		session = SynthesisSession(["lines"] + list(flags) + [input_file_name], dir=dir)
+		try:
+			return session.synthesize()
+		finally:
+			session.close()
 
 
 
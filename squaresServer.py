@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# File:	squaresServer.py
+# Description: Long-running synthesis server that keeps R, dplyr, the spec parser and the lattices loaded
+# Usage:	python3 squaresServer.py [-port=N | -socket=PATH] [-timeout=S] [enumerator flags, e.g. -on -pd]
+# Python version:	3.6.4
+#
+# Requests are HTTP POSTs to /synthesize with a JSON body holding either
+#   {"problem": "<contents of a .in file>"}
+# or the arguments of Squares.synthesize
+#   {"inputs": ["<csv>", ...], "output": "<csv>", "const": "", "aggrs": "", "attrs": "", "loc": 0}
+# plus, optionally, "flags" (a list of enumerator flags) and "timeout" (seconds).
+# The answer is {"r": <R solution>, "sql": <SQL solution>}, or {"error": <reason>}.
+#
+# Every request is solved in a process forked from the warm server, so requests share
+# nothing and a request that runs out of time is simply killed.
+
+from sys import argv
+from http.server import HTTPServer, BaseHTTPRequestHandler
+import socketserver
+import multiprocessing
+import tempfile
+import json
+import os
+import shutil
+import signal
+import sys
+import squaresEnumerator as squares
+from tyrell.enumerator.lines import readLattices
+from tyrell.logger import get_logger
+
+logger = get_logger('squares.server')
+default_port = 8080
+default_timeout = 600
+
+
+def get_flag(name, default):
+	for arg in argv:
+		if arg.startswith(name + "="):
+			return arg[len(name) + 1:]
+	return default
+
+
+def warm_up():
+	# importing squaresEnumerator already loaded the R libraries and built the spec parser
+	for loc in range(3, 8):
+		try:
+			readLattices(loc)
+		except OSError:
+			pass
+
+
+def solve(request, flags, files_dir, conn):
+	# lead a process group of our own so that a timeout also kills the workers of -portfolio
+	os.setsid()
+	sys.stdout = open(os.devnull, 'w')
+	if not squares.debug:
+		sys.stderr = open(os.devnull, 'w')
+	try:
+		flags = flags + list(request.get("flags", []))
+		if "problem" in request:
+			problem = os.path.join(files_dir, "problem.in")
+			with open(problem, 'w') as f:
+				f.write(request["problem"])
+			r_solution, sql_solution = squares.SynthesisSession(["lines"] + flags + [problem]).synthesize()
+		else:
+			r_solution, sql_solution = squares.Squares().synthesize(request["inputs"], request["output"],
+				const=request.get("const", ""), aggrs=request.get("aggrs", ""), attrs=request.get("attrs", ""),
+				loc=request.get("loc", 0), flags=flags, files_dir=files_dir)
+		conn.send((200, {"r": r_solution, "sql": sql_solution}))
+	except Exception as e:
+		conn.send((500, {"error": repr(e)}))
+
+
+def kill_group(worker):
+	try:
+		os.killpg(worker.pid, signal.SIGTERM)
+	except ProcessLookupError:
+		# the worker has not called setsid yet, so it has no workers either
+		worker.terminate()
+
+
+def synthesize(request, flags, timeout):
+	if "problem" not in request and ("inputs" not in request or "output" not in request):
+		return 400, {"error": "a request needs either a problem or inputs and an output"}
+	# the files of the request, in a directory of its own that is removed even if the request is killed
+	files_dir = tempfile.mkdtemp(prefix="squares-")
+	try:
+		return run_worker(request, flags, timeout, files_dir)
+	finally:
+		shutil.rmtree(files_dir, ignore_errors=True)
+
+
+def run_worker(request, flags, timeout, files_dir):
+	recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+	worker = multiprocessing.get_context('fork').Process(target=solve, args=(request, flags, files_dir, send_conn))
+	worker.start()
+	send_conn.close()
+	if recv_conn.poll(float(request.get("timeout", timeout))):
+		try:
+			status, answer = recv_conn.recv()
+		except EOFError:
+			status, answer = 500, {"error": "synthesis process died"}
+	elif worker.is_alive():
+		status, answer = 504, {"error": "timeout"}
+	else:
+		status, answer = 500, {"error": "synthesis process died"}
+	# whatever the outcome, nothing the request started outlives it
+	kill_group(worker)
+	worker.join()
+	return status, answer
+
+
+class SquaresHandler(BaseHTTPRequestHandler):
+
+	def do_GET(self):
+		if self.path == "/status":
+			self.reply(200, {"status": "ready"})
+		else:
+			self.reply(404, {"error": "unknown path"})
+
+	def do_POST(self):
+		if self.path != "/synthesize":
+			self.reply(404, {"error": "unknown path"})
+			return
+		try:
+			length = int(self.headers.get("Content-Length", 0))
+			request = json.loads(self.rfile.read(length).decode("utf-8"))
+		except ValueError as e:
+			self.reply(400, {"error": "invalid JSON: {}".format(e)})
+			return
+		status, answer = synthesize(request, self.server.flags, self.server.timeout)
+		self.reply(status, answer)
+
+	def reply(self, status, answer):
+		body = json.dumps(answer).encode("utf-8")
+		self.send_response(status)
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def address_string(self):
+		# clients of a Unix socket have no address
+		return self.client_address[0] if self.client_address else "unix"
+
+	def log_message(self, format, *args):
+		logger.info(format % args)
+
+
+class SquaresServer(socketserver.ForkingMixIn, HTTPServer):
+	pass
+
+
+class SquaresUnixServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+	pass
+
+
+def make_server(flags, timeout):
+	socket_path = get_flag("-socket", None)
+	if socket_path is not None:
+		if os.path.exists(socket_path):
+			os.remove(socket_path)
+		server = SquaresUnixServer(socket_path, SquaresHandler)
+		logger.info('Listening on {}'.format(socket_path))
+	else:
+		port = int(get_flag("-port", default_port))
+		server = SquaresServer(("localhost", port), SquaresHandler)
+		logger.info('Listening on localhost:{}'.format(port))
+	server.flags, server.timeout = flags, timeout
+	return server
+
+
+if __name__ == '__main__':
+	if "-h" in argv:
+		exit("Usage: python3 squaresServer.py [flags -h, ...]\nflags:\n-port=N : listen on localhost:N (default {})\n-socket=PATH : listen on a Unix socket instead\n-timeout=S : default time limit of a request in seconds (default {})\n-d : debug info\nother flags (e.g. -on, -pd) are passed to the enumerator of every request".format(default_port, default_timeout))
+	logger.setLevel('DEBUG' if "-d" in argv else 'INFO')
+	squares.debug = "-d" in argv
+	flags = [a for a in argv[1:] if a.split("=")[0] not in ["-port", "-socket", "-timeout", "-d"]]
+	timeout = float(get_flag("-timeout", default_timeout))
+	warm_up()
+	server = make_server(flags, timeout)
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
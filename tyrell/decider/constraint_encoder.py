@@ -1,4 +1,4 @@
-from typing import Any, Callable, ClassVar, Dict
+from typing import Any, Callable, ClassVar, Dict, Optional
 import z3
 
 from ..spec.expr import *
@@ -7,6 +7,7 @@ from ..visitor import GenericVisitor
 
 class ConstraintEncoder(GenericVisitor):
     _encode_property: Callable[[PropertyExpr], z3.ExprRef]
+    _ctx: Optional[z3.Context]
 
     _unary_dispatch_table: ClassVar[Dict[UnaryOperator, Callable[[Any], Any]]] = {
         UnaryOperator.NOT: lambda x: z3.Not(x),
@@ -18,6 +19,8 @@ class ConstraintEncoder(GenericVisitor):
         BinaryOperator.MUL: lambda x, y: x * y,
         BinaryOperator.DIV: lambda x, y: x / y,
         BinaryOperator.MOD: lambda x, y: x % y,
+        BinaryOperator.UNION: lambda x, y: x | y,
+        BinaryOperator.INTERSECT: lambda x, y: x & y,
         BinaryOperator.EQ: lambda x, y: x == y,
         BinaryOperator.NE: lambda x, y: x != y,
         BinaryOperator.LT: lambda x, y: x < y,
@@ -28,12 +31,24 @@ class ConstraintEncoder(GenericVisitor):
         BinaryOperator.OR: lambda x, y: z3.Or(x, y),
         BinaryOperator.IMPLY: lambda x, y: z3.Implies(x, y)
     }
+    # sets are bit-vectors, ordered by inclusion
+    _set_dispatch_table: ClassVar[Dict[BinaryOperator, Callable[[Any, Any], Any]]] = {
+        BinaryOperator.LT: lambda x, y: z3.And(x & ~y == 0, x != y),
+        BinaryOperator.LE: lambda x, y: x & ~y == 0,
+        BinaryOperator.GT: lambda x, y: z3.And(y & ~x == 0, x != y),
+        BinaryOperator.GE: lambda x, y: y & ~x == 0,
+    }
 
-    def __init__(self, encode_property: Callable[[PropertyExpr], z3.ExprRef]):
+    def __init__(self, encode_property: Callable[[PropertyExpr], z3.ExprRef], ctx: Optional[z3.Context] = None):
         self._encode_property = encode_property
+        self._ctx = ctx
 
     def visit_const_expr(self, const_expr: ConstExpr):
-        return const_expr.value
+        # constants are z3 values, so that constant subterms are in the context of the encoding
+        if const_expr.type is ExprType.BOOL:
+            return z3.BoolVal(const_expr.value, self._ctx)
+        else:
+            return z3.IntVal(const_expr.value, self._ctx)
 
     def visit_property_expr(self, prop_expr: PropertyExpr):
         return self._encode_property(prop_expr)
@@ -45,6 +60,8 @@ class ConstraintEncoder(GenericVisitor):
     def visit_binary_expr(self, binary_expr: BinaryExpr):
         larg = self.visit(binary_expr.lhs)
         rarg = self.visit(binary_expr.rhs)
+        if binary_expr.lhs.type is ExprType.SET and binary_expr.operator in self._set_dispatch_table:
+            return self._set_dispatch_table[binary_expr.operator](larg, rarg)
         return self._binary_dispatch_table[binary_expr.operator](larg, rarg)
 
     def visit_cond_expr(self, cond_expr: CondExpr):
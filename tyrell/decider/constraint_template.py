@@ -0,0 +1,99 @@
+from typing import cast, Any, Callable, List, Optional, Tuple
+import z3
+
+from ..spec import TyrellSpec, FunctionProduction
+from ..spec.expr import *
+from .constraint_encoder import ConstraintEncoder
+from .eval_expr import CompiledExpr, compile_expr
+
+# (property name, property type, param index) of a property of the output (index 0) or of an argument of a production
+PropertyKey = Tuple[str, ExprType, int]
+
+
+class ConstraintTemplate:
+    '''
+    The constraints of a FunctionProduction, compiled once.
+    Every constraint is encoded into a z3 term over placeholder variables, one per property of the output and of the arguments it refers to, and into a Python function (see `compile_expr`).
+    Encoding the constraints for a node is a substitution of the z3 variables of the node and of its arguments for the placeholders.
+    '''
+    _prod: FunctionProduction
+    _properties: List[PropertyKey]
+    _placeholders: List[z3.ExprRef]
+    _placeholder_asts: Any  # a ctypes array of the placeholders' z3 ASTs
+    _clauses: List[z3.BoolRef]
+    _evaluators: List[CompiledExpr]
+
+    def __init__(self, prod: FunctionProduction, ctx: Optional[z3.Context] = None):
+        self._prod = prod
+        self._properties = []
+        self._placeholders = []
+        placeholder_map = dict()
+
+        def encode_property(prop_expr: PropertyExpr):
+            key = (prop_expr.name, prop_expr.type, cast(ParamExpr, prop_expr.operand).index)
+            if key not in placeholder_map:
+                var_name = '{}_p{}'.format(key[0], key[2])
+                if key[1] is ExprType.INT:
+                    placeholder = z3.Int(var_name, ctx)
+                elif key[1] is ExprType.BOOL:
+                    placeholder = z3.Bool(var_name, ctx)
+                elif key[1] is ExprType.SET:
+                    placeholder = z3.BitVec(var_name, SET_WIDTH, ctx)
+                else:
+                    raise RuntimeError('Unrecognized ExprType: {}'.format(key[1]))
+                placeholder_map[key] = placeholder
+                self._properties.append(key)
+                self._placeholders.append(placeholder)
+            return placeholder_map[key]
+        constraint_visitor = ConstraintEncoder(encode_property, ctx)
+        self._clauses = [constraint_visitor.visit(c) for c in prod.constraints]
+        self._placeholder_asts = (z3.Ast * len(self._placeholders))(*[p.as_ast() for p in self._placeholders])
+        self._evaluators = [compile_expr(c) for c in prod.constraints]
+
+    @property
+    def production(self) -> FunctionProduction:
+        return self._prod
+
+    @property
+    def properties(self) -> List[PropertyKey]:
+        '''The properties the constraints refer to, each once'''
+        return self._properties
+
+    @property
+    def evaluators(self) -> List[CompiledExpr]:
+        return self._evaluators
+
+    def instantiate(self, get_var: Callable[[str, ExprType, int], z3.ExprRef]) -> List[z3.BoolRef]:
+        '''
+        Encode the constraints for a node. `get_var(name, type, index)` is the z3 variable of property `name` of the node (index 0) or of its argument index - 1.
+        '''
+        num_vars = len(self._placeholders)
+        if num_vars == 0:
+            return list(self._clauses)
+        z3_vars = [get_var(*key) for key in self._properties]
+        # z3.substitute checks the sorts of every pair on every call, which costs more than the substitution itself
+        var_asts = (z3.Ast * num_vars)(*[v.as_ast() for v in z3_vars])
+        return [z3.BoolRef(z3.Z3_substitute(c.ctx_ref(), c.as_ast(), num_vars, self._placeholder_asts, var_asts), c.ctx)
+                for c in self._clauses]
+
+
+def get_constraint_template(spec: TyrellSpec, prod: FunctionProduction, ctx: Optional[z3.Context] = None) -> ConstraintTemplate:
+    '''
+    Return the compiled constraints of `prod` in the z3 context `ctx`, compiling them the first time and caching them on the spec.
+    '''
+    key = (prod.id, ctx)
+    template = spec.compiled_constraints.get(key)
+    if template is None:
+        template = spec.compiled_constraints[key] = ConstraintTemplate(prod, ctx)
+    return template
+
+
+def get_property_expr(spec: TyrellSpec, pname: str, pty: ExprType, index: int) -> PropertyExpr:
+    '''
+    Return the expression of property `pname` of the output (index 0) or of input index - 1, made once per spec so that its compiled form (see `eval_expr`) is reused.
+    '''
+    key = (pname, pty, index)
+    prop_expr = spec.compiled_constraints.get(key)
+    if prop_expr is None:
+        prop_expr = spec.compiled_constraints[key] = PropertyExpr(pname, pty, ParamExpr(index))
+    return prop_expr
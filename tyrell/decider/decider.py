@@ -24,3 +24,9 @@ class Decider(ABC):
         Take an interpreter error and return a data structure that can be used to update the enumerator.
         '''
         return None
+
+    def release(self) -> None:
+        '''
+        Called by the synthesizer once the analysis of the current AST is over, so that resources held for it can be freed.
+        '''
+        pass
@@ -0,0 +1,135 @@
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+from .blame import Blame
+from .example_base import Example
+from .result import Result, bad
+from .staged import Stage
+from ..dsl import Node
+from ..interpreter import Interpreter, InterpreterError
+from ..spec import TyrellSpec
+
+# the inputs, the constant_occurs predicates and the happens_before constants of each function node of a line
+Obligations = Tuple[FrozenSet[int], FrozenSet[int], Tuple[FrozenSet[str], ...]]
+
+
+class EquivalenceStage(Stage):
+    '''
+    Rejects the programs with a line whose values on the examples were already computed by an earlier line of the same shape (observational equivalence).
+    The first line that computes some values is kept in a store, keyed by the production and shape of the line and by the fingerprints of the values.
+    A later line with the same key is blamed, for every program that has it at the same positions, when the first line can take its place in all of them:
+    it uses every input the later line uses, it satisfies every constant_occurs predicate the later line satisfies, and its function nodes have the happens_before constants of the corresponding nodes of the later line.
+    The program with the first line in place of the later one then has the same value and is enumerated too, as long as the enumerator does not break symmetries.
+    Once the store holds `max_size` values, the lines of new values are no longer stored: a stored line is never replaced, so it is never blamed itself.
+    '''
+    _interp: Interpreter
+    _examples: List[Example]
+    _fingerprint: Callable[[Any], Hashable]
+    _occurs: Dict[str, Set[int]]
+    _ordered: Set[str]
+    _store: Dict[Hashable, Tuple[Node, Obligations]]
+    _max_size: Optional[int]
+    _num_blamed: int
+
+    def __init__(self, name: str, spec: TyrellSpec, interpreter: Interpreter, examples: List[Example], fingerprint: Callable[[Any], Hashable], max_size: Optional[int] = None):
+        '''
+        `fingerprint` maps a value of the interpreter to a hashable value, which must be equal for two values only if every function gives them the same results (the values themselves, or a strong digest of them, not a hash that may collide).
+        The store holds at most `max_size` values, or is unbounded if `max_size` is None.
+        '''
+        if max_size is not None and max_size <= 0:
+            raise ValueError(
+                'Store size must be positive: {}'.format(max_size))
+        super().__init__(name)
+        self._interp = interpreter
+        self._examples = examples
+        self._fingerprint = fingerprint
+        self._occurs = dict()
+        self._ordered = set()
+        occurs = [pred for pred in spec.predicates() if pred.name == 'constant_occurs']
+        for index, pred in enumerate(occurs):
+            values = list(pred.args)[0]
+            for value in values.split(','):
+                self._occurs.setdefault(value, set()).add(index)
+        for pred in spec.predicates():
+            if pred.name == 'happens_before':
+                self._ordered.update(list(pred.args)[:2])
+        self._store = dict()
+        self._max_size = max_size
+        self._num_blamed = 0
+
+    @property
+    def num_stored(self) -> int:
+        '''Number of distinct line values in the store'''
+        return len(self._store)
+
+    @property
+    def num_blamed(self) -> int:
+        return self._num_blamed
+
+    def analyze(self, prog: Node) -> Optional[Result]:
+        lines = _function_nodes(prog)
+        for line in lines[:-1]:
+            try:
+                values = tuple(self._fingerprint(self._interp.eval(line, example.input)) for example in self._examples)
+            except InterpreterError:
+                # the error is left to the stages that evaluate the whole program
+                return None
+            key = (line.production.id, _shape(line), values)
+            first = self._store.get(key)
+            if first is None:
+                if self._max_size is None or len(self._store) < self._max_size:
+                    self._store[key] = (line, self._obligations(line))
+            elif not first[0].deep_eq(line) and _discharges(first[1], self._obligations(line)):
+                self._num_blamed += 1
+                return bad(why=[[Blame(node=n, production=n.production) for n in _nodes(line)]])
+        return None
+
+    def _obligations(self, line: Node) -> Obligations:
+        params, occurs, ordered = set(), set(), []
+
+        # the function nodes are visited in post-order, so that the nodes of two lines of the same shape correspond
+        def visit(node):
+            for child in node.children:
+                if child.is_apply():
+                    visit(child)
+                elif child.is_param():
+                    params.add(child.index)
+                elif child.is_enum():
+                    occurs.update(self._occurs.get(child.data, ()))
+            ordered.append(frozenset(c.data for c in node.children if c.is_enum() and c.data in self._ordered))
+        visit(line)
+        return frozenset(params), frozenset(occurs), tuple(ordered)
+
+
+def _discharges(first: Obligations, later: Obligations) -> bool:
+    return first[0] >= later[0] and first[1] >= later[1] and first[2] == later[2]
+
+
+def _function_nodes(prog: Node) -> List[Node]:
+    '''The function nodes of `prog` in post-order, each once'''
+    nodes, seen = [], set()
+
+    def visit(node):
+        if node.is_apply() and id(node) not in seen:
+            seen.add(id(node))
+            for child in node.children:
+                visit(child)
+            nodes.append(node)
+    visit(prog)
+    return nodes
+
+
+def _nodes(prog: Node) -> List[Node]:
+    nodes, seen = [], set()
+
+    def visit(node):
+        if id(node) not in seen:
+            seen.add(id(node))
+            nodes.append(node)
+            for child in node.children:
+                visit(child)
+    visit(prog)
+    return nodes
+
+
+def _shape(node: Node) -> Tuple:
+    '''Where the function nodes are in a tree, regardless of their productions'''
+    return tuple(_shape(child) if child.is_apply() else None for child in node.children)
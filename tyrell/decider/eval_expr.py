@@ -1,4 +1,5 @@
-from typing import ClassVar, Callable, List, Dict, Any
+from typing import cast, ClassVar, Callable, List, Dict, Any
+from weakref import WeakKeyDictionary
 from ..spec.expr import *
 from ..interpreter import Interpreter
 from ..visitor import GenericVisitor
@@ -20,6 +21,8 @@ class ExprVisitor(GenericVisitor):
         # FIXME: Semantics of the following two operators may diverge in Python and Z3
         BinaryOperator.DIV: lambda x, y: x / y,
         BinaryOperator.MOD: lambda x, y: x % y,
+        BinaryOperator.UNION: lambda x, y: x | y,
+        BinaryOperator.INTERSECT: lambda x, y: x & y,
         BinaryOperator.EQ: lambda x, y: x == y,
         BinaryOperator.NE: lambda x, y: x != y,
         BinaryOperator.LT: lambda x, y: x < y,
@@ -30,6 +33,13 @@ class ExprVisitor(GenericVisitor):
         BinaryOperator.OR: lambda x, y: x or y,
         BinaryOperator.IMPLY: lambda x, y: (not x) or y
     }
+    # sets are bitmasks, ordered by inclusion
+    _set_dispatch_table: ClassVar[Dict[BinaryOperator, Callable[[Any, Any], Any]]] = {
+        BinaryOperator.LT: lambda x, y: x & ~y == 0 and x != y,
+        BinaryOperator.LE: lambda x, y: x & ~y == 0,
+        BinaryOperator.GT: lambda x, y: y & ~x == 0 and x != y,
+        BinaryOperator.GE: lambda x, y: y & ~x == 0,
+    }
 
     def __init__(self, interp: Interpreter, in_values: List[Any], out_value: Any):
         self._interp = interp
@@ -52,7 +62,7 @@ class ExprVisitor(GenericVisitor):
     def visit_binary_expr(self, binary_expr: BinaryExpr):
         larg = self.visit(binary_expr.lhs)
         rarg = self.visit(binary_expr.rhs)
-        return self._binary_dispatch_table[binary_expr.operator](larg, rarg)
+        return self._binary_operator(binary_expr)(larg, rarg)
 
     def visit_cond_expr(self, cond_expr: CondExpr):
         cond_arg = self.visit(cond_expr.condition)
@@ -70,10 +80,87 @@ class ExprVisitor(GenericVisitor):
                 'Cannot find the required apply method: {}'.format(method_name))
         return method(arg)
 
+    @classmethod
+    def _binary_operator(cls, binary_expr: BinaryExpr) -> Callable[[Any, Any], Any]:
+        if binary_expr.lhs.type is ExprType.SET and binary_expr.operator in cls._set_dispatch_table:
+            return cls._set_dispatch_table[binary_expr.operator]
+        return cls._binary_dispatch_table[binary_expr.operator]
+
     @staticmethod
     def _apply_method_name(name):
         return 'apply_' + name
 
 
+CompiledExpr = Callable[[Interpreter, List[Any], Any], Any]
+
+
+class ExprCompiler(GenericVisitor):
+    '''
+    Compiles an expression into a Python function of (interpreter, in_values, out_value) that computes the same value as `ExprVisitor`.
+    '''
+
+    def __init__(self):
+        pass
+
+    def visit_const_expr(self, const_expr: ConstExpr) -> CompiledExpr:
+        value = const_expr.value
+        return lambda interp, in_values, out_value: value
+
+    def visit_param_expr(self, param_expr: ParamExpr) -> CompiledExpr:
+        if param_expr.index == 0:
+            return lambda interp, in_values, out_value: out_value
+        else:
+            index = param_expr.index - 1
+            return lambda interp, in_values, out_value: in_values[index]
+
+    def visit_unary_expr(self, unary_expr: UnaryExpr) -> CompiledExpr:
+        arg = self.visit(unary_expr.operand)
+        op = ExprVisitor._unary_dispatch_table[unary_expr.operator]
+        return lambda interp, in_values, out_value: op(arg(interp, in_values, out_value))
+
+    def visit_binary_expr(self, binary_expr: BinaryExpr) -> CompiledExpr:
+        larg = self.visit(binary_expr.lhs)
+        rarg = self.visit(binary_expr.rhs)
+        op = ExprVisitor._binary_operator(binary_expr)
+        return lambda interp, in_values, out_value: op(
+            larg(interp, in_values, out_value), rarg(interp, in_values, out_value))
+
+    def visit_cond_expr(self, cond_expr: CondExpr) -> CompiledExpr:
+        cond_arg = self.visit(cond_expr.condition)
+        true_arg = self.visit(cond_expr.true_value)
+        false_arg = self.visit(cond_expr.false_value)
+
+        def cond(interp, in_values, out_value):
+            if cond_arg(interp, in_values, out_value):
+                return true_arg(interp, in_values, out_value)
+            else:
+                return false_arg(interp, in_values, out_value)
+        return cond
+
+    def visit_property_expr(self, prop_expr: PropertyExpr) -> CompiledExpr:
+        arg = self.visit(prop_expr.operand)
+        method_name = ExprVisitor._apply_method_name(prop_expr.name)
+
+        def apply(interp, in_values, out_value):
+            value = arg(interp, in_values, out_value)
+            method = getattr(interp, method_name, None)
+            if method is None:
+                raise ValueError(
+                    'Cannot find the required apply method: {}'.format(method_name))
+            return method(value)
+        return apply
+
+
+def compile_expr(expr: Expr) -> CompiledExpr:
+    return cast(CompiledExpr, ExprCompiler().visit(expr))
+
+
+# expressions are compared by identity, so the constraints of a spec are compiled once
+_compiled_exprs: 'WeakKeyDictionary[Expr, CompiledExpr]' = WeakKeyDictionary()
+
+
 def eval_expr(interpreter: Interpreter, in_values: List[Any], out_value: Any, expr: Expr):
-    return ExprVisitor(interpreter, in_values, out_value).visit(expr)
+    compiled = _compiled_exprs.get(expr)
+    if compiled is None:
+        compiled = _compiled_exprs[expr] = compile_expr(expr)
+    return compiled(interpreter, in_values, out_value)
@@ -36,6 +36,9 @@ class ExampleDecider(Decider):
     def equal_output(self):
         return self._equal_output
 
+    def release(self):
+        self._interpreter.release()
+
     def get_failed_examples(self, prog):
         '''
         Test the program on all examples provided.
@@ -16,7 +16,7 @@ from itertools import permutations
 import z3
 from ..interpreter import Interpreter, InterpreterError
 from ..dsl import Node, AtomNode, ParamNode, ApplyNode, NodeIndexer
-from ..spec import Production, ValueType, TyrellSpec
+from ..spec import Production, FunctionProduction, ValueType, TyrellSpec
 from ..spec.expr import *
 from ..logger import get_logger
 from ..visitor import GenericVisitor
@@ -25,6 +25,7 @@ from .blame import Blame
 from .assert_violation_handler import AssertionViolationHandler
 from .eval_expr import eval_expr
 from .constraint_encoder import ConstraintEncoder
+from .constraint_template import get_constraint_template, get_property_expr
 from .result import ok, bad
 
 logger = get_logger('tyrell.synthesizer.constraint')
@@ -34,13 +35,15 @@ MutableImplyMap = MutableMapping[Tuple[Production, Expr], List[Production]]
 
 class Z3Encoder(GenericVisitor):
     _interp: Interpreter
+    _spec: TyrellSpec
     _indexer: NodeIndexer
     _example: Example
     _unsat_map: Dict[str, Tuple[Node, int]]
     _solver: z3.Solver
 
-    def __init__(self, interp: Interpreter, indexer: NodeIndexer, example: Example):
+    def __init__(self, interp: Interpreter, spec: TyrellSpec, indexer: NodeIndexer, example: Example):
         self._interp = interp
+        self._spec = spec
         self._indexer = indexer
         self._example = example
         self._unsat_map = dict()
@@ -53,6 +56,8 @@ class Z3Encoder(GenericVisitor):
             return z3.Int(var_name)
         elif ptype is ExprType.BOOL:
             return z3.Bool(var_name)
+        elif ptype is ExprType.SET:
+            return z3.BitVec(var_name, SET_WIDTH)
         else:
             raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
 
@@ -67,7 +72,7 @@ class Z3Encoder(GenericVisitor):
                 'Unexpected program output type: {}'.format(ty))
         for pname, pty in ty.properties:
             actual = self.get_z3_var(node, pname, pty)
-            expected_expr = PropertyExpr(pname, pty, ParamExpr(index))
+            expected_expr = get_property_expr(self._spec, pname, pty, index)
             expected = eval_expr(
                 self._interp, self._example.input, self._example.output, expected_expr)
             self._solver.add(actual == expected)
@@ -85,19 +90,15 @@ class Z3Encoder(GenericVisitor):
         pass
 
     def visit_apply_node(self, apply_node: ApplyNode):
-        def encode_property(prop_expr):
-            param_expr = cast(ParamExpr, prop_expr.operand)
-            if param_expr.index == 0:
+        def get_var(pname, pty, param_index):
+            if param_index == 0:
                 node = apply_node
             else:
-                node = apply_node.args[param_expr.index - 1]
-            pname = prop_expr.name
-            pty = prop_expr.type
+                node = apply_node.args[param_index - 1]
             return self.get_z3_var(node, pname, pty)
-        constraint_visitor = ConstraintEncoder(encode_property)
-        for index, constraint in enumerate(apply_node.production.constraints):
+        template = get_constraint_template(self._spec, cast(FunctionProduction, apply_node.production))
+        for index, z3_clause in enumerate(template.instantiate(get_var)):
             cname = self._get_constraint_var(apply_node, index)
-            z3_clause = constraint_visitor.visit(constraint)
             self._unsat_map[cname] = (apply_node, index)
             self._solver.assert_and_track(z3_clause, cname)
         for arg in apply_node.args:
@@ -120,13 +121,15 @@ class Z3Encoder(GenericVisitor):
 
 class BlameFinder:
     _interp: Interpreter
+    _spec: TyrellSpec
     _imply_map: ImplyMap
     _prog: Node
     _indexer: NodeIndexer
     _blames_collection: Set[FrozenSet[Blame]]
 
-    def __init__(self, interp: Interpreter, imply_map: ImplyMap, prog: Node):
+    def __init__(self, interp: Interpreter, spec: TyrellSpec, imply_map: ImplyMap, prog: Node):
         self._interp = interp
+        self._spec = spec
         self._imply_map = imply_map
         self._prog = prog
         self._indexer = NodeIndexer(prog)
@@ -154,7 +157,7 @@ class BlameFinder:
             self.process_example(example)
 
     def process_example(self, example: Example):
-        z3_encoder = Z3Encoder(self._interp, self._indexer, example)
+        z3_encoder = Z3Encoder(self._interp, self._spec, self._indexer, example)
         z3_encoder.encode_output_alignment(self._prog)
         z3_encoder.visit(self._prog)
         blame_nodes = z3_encoder.get_blame_nodes()
@@ -169,6 +172,7 @@ class BlameFinder:
 
 
 class ExampleConstraintDecider(ExampleDecider):
+    _spec: TyrellSpec
     _imply_map: ImplyMap
     _assert_handler: AssertionViolationHandler
 
@@ -178,6 +182,7 @@ class ExampleConstraintDecider(ExampleDecider):
                  examples: List[Example],
                  equal_output: Callable[[Any, Any], bool]=lambda x, y: x == y):
         super().__init__(interpreter, examples, equal_output)
+        self._spec = spec
         self._imply_map = self._build_imply_map(spec)
         self._assert_handler = AssertionViolationHandler(spec, interpreter)
 
@@ -190,6 +195,8 @@ class ExampleConstraintDecider(ExampleDecider):
                 return z3.Int(var_name)
             elif ptype is ExprType.BOOL:
                 return z3.Bool(var_name)
+            elif ptype is ExprType.SET:
+                return z3.BitVec(var_name, SET_WIDTH)
             else:
                 raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
         constraint_visitor = ConstraintEncoder(encode_property)
@@ -223,7 +230,7 @@ class ExampleConstraintDecider(ExampleDecider):
         if len(failed_examples) == 0:
             return ok()
         else:
-            blame_finder = BlameFinder(self.interpreter, self._imply_map, prog)
+            blame_finder = BlameFinder(self.interpreter, self._spec, self._imply_map, prog)
             blame_finder.process_examples(failed_examples)
             blames = blame_finder.get_blames()
             if len(blames) == 0:
@@ -1,14 +1,17 @@
 from collections import defaultdict
-from typing import cast, Any, Callable, Dict, List, Tuple, Set, FrozenSet
+import time
+from typing import cast, Any, Callable, Dict, List, Optional, Tuple, Set, FrozenSet
 import z3
 
 from .assert_violation_handler import AssertionViolationHandler
 from .blame import Blame
-from .constraint_encoder import ConstraintEncoder
+from .constraint_template import ConstraintTemplate, get_constraint_template, get_property_expr
 from .example_base import Example, ExampleDecider
 from .eval_expr import eval_expr
-from .result import ok, bad
-from ..spec import TyrellSpec, ValueType
+from .interval_checker import IntervalChecker
+from .result import Result, ok, bad
+from .staged import Stage
+from ..spec import TyrellSpec, FunctionProduction, ValueType
 from ..dsl import Node, AtomNode, ParamNode, ApplyNode, NodeIndexer, dfs
 from ..interpreter import Interpreter, InterpreterError
 from ..logger import get_logger
@@ -18,29 +21,146 @@ from ..visitor import GenericVisitor
 logger = get_logger('tyrell.decider.example_constraint_pruning')
 
 
+check_stats_keys = ['interval_sat', 'interval_unsat', 'interval_unknown', 'interval_time', 'z3_sat', 'z3_unsat', 'z3_time']
+
+
+class ExampleSolver:
+    '''
+    The z3 solver of an example, reused by every candidate program.
+    The properties of the inputs and of the output of the example are computed once and asserted as facts on the variables `<property>_e<index>` (index 0 is the output, i the input i - 1).
+    The encoding of every candidate is scoped by `push`/`pop`, and checked by `check`, that calls the solver only when the interval checker cannot decide.
+    '''
+    _example: Example
+    _solver: z3.Solver
+    _property_vars: Dict[Tuple[str, int], Optional[Tuple[z3.ExprRef, Any]]]
+    _stats: Dict[str, float]
+
+    def __init__(self, interp: Interpreter, spec: TyrellSpec, example: Example, ctx: Optional[z3.Context] = None):
+        self._example = example
+        self._solver = z3.Solver(ctx=ctx)
+        self._property_vars = dict()
+        self._stats = dict.fromkeys(check_stats_keys, 0)
+        for index, ty in enumerate([spec.output] + spec.input):
+            for pname, pty in cast(ValueType, ty).properties:
+                expected_expr = get_property_expr(spec, pname, pty, index)
+                expected = eval_expr(interp, example.input, example.output, expected_expr)
+                if expected == -1:
+                    # the property is unknown: left unconstrained
+                    self._property_vars[(pname, index)] = None
+                    continue
+                var_name = '{}_e{}'.format(pname, index)
+                if pty is ExprType.INT:
+                    z3_var = z3.Int(var_name, ctx)
+                elif pty is ExprType.BOOL:
+                    z3_var = z3.Bool(var_name, ctx)
+                elif pty is ExprType.SET:
+                    z3_var = z3.BitVec(var_name, SET_WIDTH, ctx)
+                else:
+                    raise RuntimeError('Unrecognized ExprType: {}'.format(pty))
+                self._solver.add(z3_var == expected)
+                self._property_vars[(pname, index)] = (z3_var, expected)
+
+    @property
+    def example(self) -> Example:
+        return self._example
+
+    @property
+    def solver(self) -> z3.Solver:
+        return self._solver
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        '''Number of candidates decided by the interval checker and by the solver, and time spent in each (see `check_stats_keys`)'''
+        return self._stats
+
+    def has_property(self, pname: str, index: int) -> bool:
+        return (pname, index) in self._property_vars
+
+    def get_property_var(self, pname: str, index: int) -> Optional[Tuple[z3.ExprRef, Any]]:
+        '''
+        Return the variable and the value of property `pname` of the output (index 0) or of input index - 1, None if the property is unknown.
+        '''
+        return self._property_vars[(pname, index)]
+
+    def check(self, checker: IntervalChecker, need_core: bool = False) -> bool:
+        '''
+        Return whether the constraints of the current candidate, also added to `checker`, are unsatisfiable.
+        The solver is only called if the interval checker cannot decide, or if it decides unsat and `need_core` (the unsat core of the solver is needed for blame).
+        '''
+        stats = self._stats
+        start = time.time()
+        verdict = checker.check()
+        stats['interval_time'] += time.time() - start
+        if verdict is True:
+            stats['interval_sat'] += 1
+            return False
+        elif verdict is False:
+            stats['interval_unsat'] += 1
+            if not need_core:
+                return True
+        else:
+            stats['interval_unknown'] += 1
+        start = time.time()
+        unsat = self._solver.check() == z3.unsat
+        stats['z3_time'] += time.time() - start
+        stats['z3_unsat' if unsat else 'z3_sat'] += 1
+        return unsat
+
+    def push(self):
+        self._solver.push()
+
+    def pop(self):
+        self._solver.pop()
+
+
 class Z3Encoder(GenericVisitor):
     _interp: Interpreter
+    _spec: TyrellSpec
     _indexer: NodeIndexer
+    _example_solver: ExampleSolver
     _example: Example
     _unsat_map: Dict[str, Tuple[Node, int]]
     _solver: z3.Solver
-
-    def __init__(self, interp: Interpreter, indexer: NodeIndexer, example: Example):
+    _checker: IntervalChecker
+    _z3_vars: Dict[Tuple[Node, str], z3.ExprRef]
+    _encoded: Set[Node]
+    _ctx: Optional[z3.Context]
+
+    def __init__(self, interp: Interpreter, spec: TyrellSpec, indexer: NodeIndexer, example_solver: ExampleSolver, ctx: Optional[z3.Context] = None):
+        '''
+        The constraints are added to the solver of `example_solver`, in the scope opened for the candidate program by the caller.
+        '''
         self._interp = interp
+        self._spec = spec
         self._indexer = indexer
-        self._example = example
+        self._example_solver = example_solver
+        self._example = example_solver.example
         self._unsat_map = dict()
-        self._solver = z3.Solver()
+        self._ctx = ctx
+        self._solver = example_solver.solver
+        self._checker = IntervalChecker()
+        self._z3_vars = dict()
+        self._encoded = set()
 
     def get_z3_var(self, node: Node, pname: str, ptype: ExprType):
+        z3_var = self._z3_vars.get((node, pname))
+        if z3_var is not None:
+            return z3_var
         node_id = self._indexer.get_id(node)
         var_name = '{}_n{}'.format(pname, node_id)
         if ptype is ExprType.INT:
-            return z3.Int(var_name)
+            z3_var = z3.Int(var_name, self._ctx)
         elif ptype is ExprType.BOOL:
-            return z3.Bool(var_name)
+            z3_var = z3.Bool(var_name, self._ctx)
+        elif ptype is ExprType.SET:
+            z3_var = z3.BitVec(var_name, SET_WIDTH, self._ctx)
         else:
             raise RuntimeError('Unrecognized ExprType: {}'.format(ptype))
+        self._z3_vars[(node, pname)] = z3_var
+        return z3_var
+
+    def get_constraint_template(self, apply_node: ApplyNode) -> ConstraintTemplate:
+        return get_constraint_template(self._spec, cast(FunctionProduction, apply_node.production), self._ctx)
 
     def _get_constraint_var(self, node: Node, index: int):
         node_id = self._indexer.get_id(node)
@@ -55,12 +175,19 @@ class Z3Encoder(GenericVisitor):
         for pname, pty in ty.properties:
             #print(pname, pty)
             actual = self.get_z3_var(node, pname, pty)
-            expected_expr = PropertyExpr(pname, pty, ParamExpr(index))
-            expected = eval_expr(
-                self._interp, self._example.input, self._example.output, expected_expr)
-            if expected == -1:
-                expected = self.get_z3_var(node, pname + '_sym', pty)
+            if self._example_solver.has_property(pname, index):
+                property_var = self._example_solver.get_property_var(pname, index)
+                if property_var is None:
+                    continue
+                expected, value = property_var
+            else:
+                expected_expr = get_property_expr(self._spec, pname, pty, index)
+                expected = value = eval_expr(
+                    self._interp, self._example.input, self._example.output, expected_expr)
+                if expected == -1:
+                    continue
             self._solver.add(actual == expected)
+            self._checker.add_fact(node, pname, value)
             #print(expected_expr)
             #print(self._interp, self._example.input, self._example.output)
             #print(actual == expected)
@@ -78,21 +205,25 @@ class Z3Encoder(GenericVisitor):
         pass
 
     def visit_apply_node(self, apply_node: ApplyNode):
-        def encode_property(prop_expr):
-            param_expr = cast(ParamExpr, prop_expr.operand)
-            if param_expr.index == 0:
+        # a line of the program used by several others is one node, whose constraints are tracked once
+        if apply_node in self._encoded:
+            return
+        self._encoded.add(apply_node)
+
+        def get_var(pname, pty, param_index):
+            if param_index == 0:
                 node = apply_node
             else:
-                node = apply_node.args[param_expr.index - 1]
-            pname = prop_expr.name
-            pty = prop_expr.type
+                node = apply_node.args[param_index - 1]
             return self.get_z3_var(node, pname, pty)
-        constraint_visitor = ConstraintEncoder(encode_property)
-        for index, constraint in enumerate(apply_node.production.constraints):
+        template = self.get_constraint_template(apply_node)
+        z3_clauses = template.instantiate(get_var)
+        for index, z3_clause in enumerate(z3_clauses):
             cname = self._get_constraint_var(apply_node, index)
-            z3_clause = constraint_visitor.visit(constraint)
             self._unsat_map[cname] = (apply_node, index)
             self._solver.assert_and_track(z3_clause, cname)
+        self._checker.add_constraints(
+            [apply_node] + apply_node.args, apply_node.production.constraints, template.properties)
         for arg in apply_node.args:
             self.visit(arg)
 
@@ -100,8 +231,12 @@ class Z3Encoder(GenericVisitor):
         self._solver.add(z3_expr)
         #print(z3_expr)
 
-    def is_unsat(self) -> bool:
-        return self._solver.check() == z3.unsat
+    def add_property_value(self, node: Node, pname: str, ptype: ExprType, value: Any):
+        self._solver.add(self.get_z3_var(node, pname, ptype) == value)
+        self._checker.add_fact(node, pname, value)
+
+    def is_unsat(self, need_core: bool = False) -> bool:
+        return self._example_solver.check(self._checker, need_core)
 
     def get_blame_nodes(self):
         unsat_core = self._solver.unsat_core()
@@ -112,35 +247,22 @@ class Z3Encoder(GenericVisitor):
         for v in unsat_core:
             node, cidx = self._unsat_map[str(v)]
             unsat_dict[node].append(node.production.constraints[cidx])
+        # the properties of the inputs are not tracked in the core: the inputs the constraints refer to are blamed with them
+        for node, constraints in list(unsat_dict.items()):
+            for index in _param_indices(constraints):
+                if index > 0 and node.args[index - 1].is_param():
+                    unsat_dict.setdefault(node.args[index - 1], [])
         return unsat_dict
 
 
-class PropertyFinder(GenericVisitor):
-    _encode_property: Callable[[PropertyExpr], z3.ExprRef]
-
-    def __init__(self, encode_property: Callable[[PropertyExpr], z3.ExprRef]):
-        self._encode_property = encode_property
-        self._results = []
-
-    def visit_const_expr(self, const_expr: ConstExpr):
-        #print(const_expr)
-        # exit()
-        pass
-
-    def visit_property_expr(self, prop_expr: PropertyExpr):
-        self._encode_property(prop_expr)
-
-    def visit_unary_expr(self, unary_expr: UnaryExpr):
-        self.visit(unary_expr.operand)
-
-    def visit_binary_expr(self, binary_expr: BinaryExpr):
-        self.visit(binary_expr.lhs)
-        self.visit(binary_expr.rhs)
-
-    def visit_cond_expr(self, cond_expr: CondExpr):
-        self.visit(cond_expr.condition)
-        self.visit(cond_expr.true_value)
-        self.visit(cond_expr.false_value)
+def _param_indices(exprs: List[Expr]) -> Set[int]:
+    indices = set()
+    for expr in exprs:
+        if isinstance(expr, ParamExpr):
+            indices.add(expr.index)
+        else:
+            indices |= _param_indices(expr.operands)
+    return indices
 
 
 class PruningException(Exception):
@@ -173,28 +295,28 @@ class ConstraintInterpreter(GenericVisitor):
 
     def visit_apply_node(self, apply_node: ApplyNode):
         in_values = [self.visit(x) for x in apply_node.args]
-        method_name = self._eval_method_name(apply_node.name)
-        method = getattr(self._interp, method_name, None)
-        if method is None:
-            raise NotImplementedError(
-                'Cannot find the required eval method: {}'.format(method_name))
-        method_output = method(apply_node, in_values)
+        memo = self._interp.memo
+        found, method_output = memo.lookup(apply_node) if memo is not None else (False, None)
+        if not found:
+            method_name = self._eval_method_name(apply_node.name)
+            method = getattr(self._interp, method_name, None)
+            if method is None:
+                raise NotImplementedError(
+                    'Cannot find the required eval method: {}'.format(method_name))
+            method_output = method(apply_node, in_values)
+            if memo is not None:
+                memo.insert(apply_node, method_output)
         #print(method_output)
         #print(in_values)
         # Now that we get more info on the method output, we can use it to refine the constraints
-        def encode_property(prop_expr):
-            param_expr = cast(ParamExpr, prop_expr.operand)
-            if param_expr.index == 0:
+        def encode_property(pname, pty, param_index):
+            if param_index == 0:
                 node = apply_node
                 value = method_output
             else:
-                node = apply_node.args[param_expr.index - 1]
-                value = in_values[param_expr.index - 1]
-            pname = prop_expr.name
-            pty = prop_expr.type
-            z3_var = self._z3_encoder.get_z3_var(node, pname, pty)
-
-            method_name = self._apply_method_name(prop_expr.name)
+                node = apply_node.args[param_index - 1]
+                value = in_values[param_index - 1]
+            method_name = self._apply_method_name(pname)
             method = getattr(self._interp, method_name, None)
             if method is None:
                 raise ValueError(
@@ -203,13 +325,10 @@ class ConstraintInterpreter(GenericVisitor):
             #print(method_name, value, property_value, z3_var)
             # #print(method)
             #print()
-            self._z3_encoder.add(z3_var == property_value)
-        
-        property_finder = PropertyFinder(encode_property)
+            self._z3_encoder.add_property_value(node, pname, pty, property_value)
         
-        for constraint in apply_node.production.constraints:
-            #print(apply_node, constraint)
-            property_finder.visit(constraint)
+        for pname, pty, param_index in self._z3_encoder.get_constraint_template(apply_node).properties:
+            encode_property(pname, pty, param_index)
 
         if self._z3_encoder.is_unsat():
             #print("unsat", apply_node)
@@ -233,16 +352,36 @@ class ConstraintInterpreter(GenericVisitor):
 
 
 class BlameFinder:
+    '''
+    The analysis of a candidate program on every example: `encode` its abstract semantics, `check_abstract` it, `evaluate` it while checking the abstract semantics of every node, and `compare` its outputs.
+    The encoding stays in the solvers of the examples until `close`.
+    '''
     _interp: Interpreter
+    _spec: TyrellSpec
     _prog: Node
     _indexer: NodeIndexer
     _blames_collection: Set[FrozenSet[Blame]]
+    _ctx: Optional[z3.Context]
+    _example_solvers: List[ExampleSolver]
+    _z3_encoders: List[Z3Encoder]
+    _outputs: Optional[List[Any]]
+    _pruned: Optional[Result]
 
-    def __init__(self, interp: Interpreter, prog: Node):
+    def __init__(self, interp: Interpreter, spec: TyrellSpec, prog: Node, ctx: Optional[z3.Context] = None):
         self._interp = interp
+        self._spec = spec
         self._prog = prog
         self._indexer = NodeIndexer(prog)
         self._blames_collection = set()
+        self._ctx = ctx
+        self._example_solvers = []
+        self._z3_encoders = []
+        self._outputs = None
+        self._pruned = None
+
+    @property
+    def prog(self) -> Node:
+        return self._prog
 
     def _get_raw_blames(self) -> List[List[Blame]]:
         return [list(x) for x in self._blames_collection]
@@ -250,69 +389,212 @@ class BlameFinder:
     def _get_blames(self) -> List[List[Blame]]:
         return [list(x) for x in self._blames_collection]
 
-    def process_examples(self, examples: List[Example], equal_output: Callable[[Any, Any], bool]):
-        try:
-            all_ok = all([self.process_example(example, equal_output) for example in examples])
-            if all_ok:
-                return ok()
-            else:
-                blames = self._get_blames()
-                if len(blames) == 0:
-                    return bad()
-                else:
-                    return bad(why=blames)
-        except PruningException as e:
-            #print("except")
-            node = e.node
-            # Blame should include all children of node
-            blame_nodes = {child for child in dfs(node)}
-            # Blame should also include all non-children non-leaf nodes with constraints
-            for prog_node in dfs(self._prog):
-                if prog_node.is_param():
-                    blame_nodes.add(node)
-                elif prog_node.is_apply() and len(prog_node.production.constraints) > 0:
-                    blame_nodes.add(node)
-            return bad([[Blame(node, node.production) for node in blame_nodes]])
-
-    def process_example(self, example: Example, equal_output: Callable[[Any, Any], bool]):
-        #print("Z3 Encoder")
-        z3_encoder = Z3Encoder(self._interp, self._indexer, example)
-        z3_encoder.encode_output_alignment(self._prog)
-        z3_encoder.visit(self._prog)
-
-        if z3_encoder.is_unsat():
-            #print("is unsat")
-            # If abstract semantics cannot be satisfiable, perform blame analysis
-            blame_nodes = z3_encoder.get_blame_nodes()
-            if blame_nodes is not None:
-                base_nodes = list(blame_nodes.keys())
-                self._blames_collection.add(
-                    frozenset([(n, n.production) for n in base_nodes])
-                )
-            return False
+    def encode(self, example_solvers: List[ExampleSolver]):
+        for example_solver in example_solvers:
+            example_solver.push()
+            self._example_solvers.append(example_solver)
+            #print("Z3 Encoder")
+            z3_encoder = Z3Encoder(self._interp, self._spec, self._indexer, example_solver, self._ctx)
+            z3_encoder.encode_output_alignment(self._prog)
+            z3_encoder.visit(self._prog)
+            self._z3_encoders.append(z3_encoder)
+
+    def close(self):
+        for example_solver in self._example_solvers:
+            example_solver.pop()
+        self._example_solvers = []
+        self._z3_encoders = []
+
+    def check_abstract(self) -> Optional[Result]:
+        '''
+        Return None if the abstract semantics of the program is satisfiable on every example, a bad result with the blames of the unsatisfiable ones otherwise.
+        '''
+        all_sat = True
+        for z3_encoder in self._z3_encoders:
+            if z3_encoder.is_unsat(need_core=True):
+                #print("is unsat")
+                # If abstract semantics cannot be satisfiable, perform blame analysis
+                all_sat = False
+                blame_nodes = z3_encoder.get_blame_nodes()
+                if blame_nodes is not None:
+                    base_nodes = list(blame_nodes.keys())
+                    self._blames_collection.add(
+                        frozenset([(n, n.production) for n in base_nodes])
+                    )
+        if all_sat:
+            return None
+        blames = self._get_blames()
+        if len(blames) == 0:
+            return bad()
         else:
-            # If abstract semantics is satisfiable, start interpretation
-            constraint_interpreter = ConstraintInterpreter(self._interp, example.input, z3_encoder)
-            interpreter_output = constraint_interpreter.visit(self._prog)
-            #print(interpreter_output)
-            #print("Yeah i'm here")
-            return equal_output(interpreter_output, example.output)
+            return bad(why=blames)
+
+    def evaluate(self) -> Optional[Result]:
+        '''
+        Interpret the program on every example, once. Return None if it was interpreted, a bad result with the blames of the node whose abstract semantics became unsatisfiable otherwise.
+        '''
+        if self._outputs is None and self._pruned is None:
+            try:
+                self._outputs = [
+                    ConstraintInterpreter(self._interp, example_solver.example.input, z3_encoder).visit(self._prog)
+                    for example_solver, z3_encoder in zip(self._example_solvers, self._z3_encoders)]
+            except PruningException as e:
+                #print("except")
+                node = e.node
+                # Blame should include all children of node
+                blame_nodes = {child for child in dfs(node)}
+                # Blame should also include all non-children non-leaf nodes with constraints
+                for prog_node in dfs(self._prog):
+                    if prog_node.is_param():
+                        blame_nodes.add(node)
+                    elif prog_node.is_apply() and len(prog_node.production.constraints) > 0:
+                        blame_nodes.add(node)
+                self._pruned = bad([[Blame(node, node.production) for node in blame_nodes]])
+        return self._pruned
+
+    def compare(self, equal_output: Callable[[Any, Any], bool]) -> bool:
+        '''Whether the outputs of the program, interpreted by `evaluate`, are equal to the ones of the examples'''
+        if self._outputs is None:
+            # the program was not interpreted, or was pruned while interpreting it
+            return False
+        return all(equal_output(output, example_solver.example.output)
+                   for output, example_solver in zip(self._outputs, self._example_solvers))
+
+
+class AbstractStage(Stage):
+    '''
+    The check of the abstract semantics of a program by an ExampleConstraintPruningDecider, as a stage of a StagedDecider.
+    '''
+    _pruning_decider: 'ExampleConstraintPruningDecider'
+
+    def __init__(self, name: str, decider: 'ExampleConstraintPruningDecider'):
+        super().__init__(name, decider)
+        self._pruning_decider = decider
+
+    def analyze(self, prog: Node) -> Optional[Result]:
+        return self._pruning_decider.check_abstract(prog)
+
+
+class OutputStage(Stage):
+    '''
+    The comparison of the outputs of a program, interpreted by an ExampleConstraintPruningDecider, with `equal_output`, as a stage of a StagedDecider.
+    The program is interpreted once by all the output stages of the decider.
+    '''
+    _pruning_decider: 'ExampleConstraintPruningDecider'
+    _equal_output: Callable[[Any, Any], bool]
+
+    def __init__(self, name: str, decider: 'ExampleConstraintPruningDecider', equal_output: Callable[[Any, Any], bool]):
+        super().__init__(name, decider)
+        self._pruning_decider = decider
+        self._equal_output = equal_output
+
+    def analyze(self, prog: Node) -> Optional[Result]:
+        return self._pruning_decider.check_output(prog, self._equal_output)
 
 
 class ExampleConstraintPruningDecider(ExampleDecider):
     assert_handler: AssertionViolationHandler
+    _spec: TyrellSpec
+    _ctx: Optional[z3.Context]
+    _example_solvers: Optional[List[ExampleSolver]]
+    _blame_finder: Optional[BlameFinder]
+    _num_analyzed: int
+    _analyze_time: float
 
     def __init__(self,
                  spec: TyrellSpec,
                  interpreter: Interpreter,
                  examples: List[Example],
-                 equal_output: Callable[[Any, Any], bool]=lambda x, y: x == y):
+                 equal_output: Callable[[Any, Any], bool]=lambda x, y: x == y,
+                 ctx: Optional[z3.Context]=None):
+        '''
+        `ctx` is the Z3 context of the solvers used for pruning, the default one if None. Deciders that run in different threads need different contexts.
+        '''
         super().__init__(interpreter, examples, equal_output)
         self._assert_handler = AssertionViolationHandler(spec, interpreter)
+        self._spec = spec
+        self._ctx = ctx
+        # made by the first analysis, as computing the properties of the examples runs the interpreter
+        self._example_solvers = None
+        # the analysis of the current program, kept from one stage to the next
+        self._blame_finder = None
+        self._num_analyzed = 0
+        self._analyze_time = 0
+
+    @property
+    def num_analyzed(self) -> int:
+        '''Number of programs analyzed'''
+        return self._num_analyzed
+
+    @property
+    def analyze_time(self) -> float:
+        '''Time spent analyzing programs, in seconds'''
+        return self._analyze_time
+
+    @property
+    def check_stats(self) -> Dict[str, float]:
+        '''Statistics of the abstract checks of all the examples (see `ExampleSolver.stats`)'''
+        stats: Dict[str, float] = dict.fromkeys(check_stats_keys, 0)
+        for example_solver in self._example_solvers or []:
+            for key, value in example_solver.stats.items():
+                stats[key] += value
+        return stats
 
     def analyze_interpreter_error(self, error: InterpreterError):
         return self._assert_handler.handle_interpreter_error(error)
 
+    def abstract_stage(self, name: str = 'abstract') -> Stage:
+        '''The check of the abstract semantics, as a stage of a StagedDecider'''
+        return AbstractStage(name, self)
+
+    def output_stage(self, name: str, equal_output: Callable[[Any, Any], bool]) -> Stage:
+        '''The comparison of the outputs with `equal_output`, as a stage of a StagedDecider'''
+        return OutputStage(name, self, equal_output)
+
+    def _start(self, prog: Node) -> BlameFinder:
+        '''The analysis of `prog`, started by the first check of the program'''
+        if self._blame_finder is None or self._blame_finder.prog is not prog:
+            self._end()
+            if self._example_solvers is None:
+                self._example_solvers = [ExampleSolver(self.interpreter, self._spec, example, self._ctx)
+                                         for example in self.examples]
+            self._blame_finder = BlameFinder(self.interpreter, self._spec, prog, self._ctx)
+            self._blame_finder.encode(self._example_solvers)
+        return self._blame_finder
+
+    def _end(self):
+        if self._blame_finder is not None:
+            self._blame_finder.close()
+            self._blame_finder = None
+
+    def check_abstract(self, prog: Node) -> Optional[Result]:
+        '''
+        Return None if the abstract semantics of `prog` is satisfiable on every example, a bad result otherwise.
+        '''
+        return self._start(prog).check_abstract()
+
+    def check_output(self, prog: Node, equal_output: Callable[[Any, Any], bool]) -> Optional[Result]:
+        '''
+        Return None if the outputs of `prog` are equal to the ones of the examples according to `equal_output`, a bad result otherwise.
+        '''
+        blame_finder = self._start(prog)
+        res = blame_finder.evaluate()
+        if res is not None:
+            return res
+        return None if blame_finder.compare(equal_output) else bad()
+
     def analyze(self, prog):
-        blame_finder = BlameFinder(self.interpreter, prog)
-        return blame_finder.process_examples(self.examples, self.equal_output)
+        start = time.time()
+        try:
+            res = self.check_abstract(prog)
+            if res is None:
+                res = self.check_output(prog, self.equal_output)
+            return ok() if res is None else res
+        finally:
+            self._end()
+            self._num_analyzed += 1
+            self._analyze_time += time.time() - start
+
+    def release(self):
+        self._end()
+        super().release()
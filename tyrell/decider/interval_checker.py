@@ -0,0 +1,373 @@
+from numbers import Integral
+from typing import cast, Any, Dict, Hashable, List, Optional, Sequence, Tuple
+from ..dsl import Node
+from ..spec.expr import *
+
+# bounds are ints, or -inf/inf; booleans are the integers 0 and 1
+# sets are bounded by the bitmasks of the elements they must and may contain
+Interval = Tuple[Any, Any]
+
+_inf = float('inf')
+_top = (-_inf, _inf)
+_bool_top = (0, 1)
+_true = (1, 1)
+_false = (0, 0)
+_set_top = (0, (1 << SET_WIDTH) - 1)
+# bounded, as propagation through cycles of constraints converges one unit per round
+_max_rounds = 16
+
+
+class _Conflict(Exception):
+    pass
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _intersect(x: Interval, y: Interval) -> Interval:
+    lo = x[0] if x[0] >= y[0] else y[0]
+    hi = x[1] if x[1] <= y[1] else y[1]
+    if lo > hi:
+        raise _Conflict()
+    return lo, hi
+
+
+def _intersect_set(x: Interval, y: Interval) -> Interval:
+    lo = x[0] | y[0]
+    hi = x[1] & y[1]
+    if lo & ~hi:
+        raise _Conflict()
+    return lo, hi
+
+
+def _top_of(ty: ExprType) -> Interval:
+    if ty is ExprType.BOOL:
+        return _bool_top
+    elif ty is ExprType.SET:
+        return _set_top
+    return _top
+
+
+def _subset(x: Interval, y: Interval) -> Interval:
+    '''Whether every set within `x` is a subset of every set within `y`'''
+    if x[1] & ~y[0] == 0:
+        return _true
+    return _false if x[0] & ~y[1] else _bool_top
+
+
+def _eval_set(op: BinaryOperator, x: Interval, y: Interval) -> Interval:
+    if op is BinaryOperator.UNION:
+        return x[0] | y[0], x[1] | y[1]
+    elif op is BinaryOperator.INTERSECT:
+        return x[0] & y[0], x[1] & y[1]
+    elif op is BinaryOperator.EQ or op is BinaryOperator.NE:
+        if x[0] == x[1] == y[0] == y[1]:
+            equal = _true
+        else:
+            equal = _false if x[0] & ~y[1] or y[0] & ~x[1] else _bool_top
+        return equal if op is BinaryOperator.EQ else (1 - equal[1], 1 - equal[0])
+    elif op is BinaryOperator.LE:
+        return _subset(x, y)
+    elif op is BinaryOperator.GE:
+        return _subset(y, x)
+    # strict inclusion
+    if op is BinaryOperator.GT:
+        x, y = y, x
+    included = _subset(x, y)
+    if included == _false or x[0] == x[1] == y[0] == y[1]:
+        return _false
+    return _true if included == _true and y[0] & ~x[1] else _bool_top
+
+
+def _mul(x: Interval, y: Interval) -> Interval:
+    def mul(a, b):
+        # 0 * inf is 0, as the bound is the limit of 0 * n
+        return 0 if a == 0 or b == 0 else a * b
+    products = [mul(a, b) for a in x for b in y]
+    return min(products), max(products)
+
+
+class IntervalChecker:
+    '''
+    Decides the abstract semantics of a candidate program (the constraints of its nodes and the known values of their properties) with interval bound propagation.
+    Every property of a node is a variable, bounded by an interval that the constraints narrow until a fixpoint is reached.
+    `check` returns False if the constraints are unsatisfiable, True if they are satisfied by every value within the bounds or by the lower or upper bounds, and None if it cannot tell.
+    '''
+    _constraints: List[Tuple[Expr, Sequence[Node]]]
+    _variables: Dict[Hashable, ExprType]
+    _facts: Dict[Hashable, Any]
+    _conflict: bool
+    _complete: bool
+
+    def __init__(self):
+        self._constraints = []
+        self._variables = dict()
+        self._facts = dict()
+        self._conflict = False
+        self._complete = True
+
+    def add_constraints(self, nodes: Sequence[Node], constraints: List[Expr], properties: Sequence[Tuple[str, ExprType, int]]):
+        '''
+        Add the constraints of a production. `nodes[0]` is the node of the production, `nodes[i]` its argument i - 1.
+        `properties` are the properties the constraints refer to, as (name, type, index of the node).
+        '''
+        for constraint in constraints:
+            self._constraints.append((constraint, nodes))
+        for pname, pty, index in properties:
+            self._variables[(nodes[index], pname)] = pty
+
+    def add_fact(self, node: Node, pname: str, value: Any):
+        '''
+        Add the fact that property `pname` of `node` is `value`.
+        '''
+        if not isinstance(value, (bool, Integral)):
+            # a value the checker cannot reason about, that the solver still knows
+            self._complete = False
+            return
+        key = (node, pname)
+        value = int(value)
+        if self._facts.get(key, value) != value:
+            self._conflict = True
+        self._facts[key] = value
+
+    def check(self) -> Optional[bool]:
+        if self._conflict:
+            return False
+        domains = {key: (value, value) for key, value in self._facts.items()}
+        try:
+            for r in range(_max_rounds):
+                changed = False
+                for constraint, nodes in self._constraints:
+                    changed |= self._narrow(constraint, _true, nodes, domains)
+                if not changed:
+                    break
+            values = [self._eval(constraint, nodes, domains) for constraint, nodes in self._constraints]
+        except _Conflict:
+            return False
+        except _Unsupported:
+            return None
+        if any(v == _false for v in values):
+            return False
+        if not self._complete:
+            return None
+        if all(v == _true for v in values):
+            return True
+        # constraints relating two unknown properties (e.g. row(r) <= row(a)) hold for some values within the bounds
+        for upper in [False, True]:
+            witness = dict()
+            for key, pty in self._variables.items():
+                lo, hi = domains.get(key, _top_of(pty))
+                if pty is ExprType.SET:
+                    witness[key] = (hi, hi) if upper else (lo, lo)
+                    continue
+                value = (hi if hi != _inf else lo) if upper else (lo if lo != -_inf else hi)
+                value = 0 if value in (_inf, -_inf) else value
+                witness[key] = (value, value)
+            try:
+                if all(self._eval(constraint, nodes, witness) == _true for constraint, nodes in self._constraints):
+                    return True
+            except _Unsupported:
+                return None
+        return None
+
+    def _domain(self, prop_expr: PropertyExpr, nodes: Sequence[Node], domains: Dict[Hashable, Interval]) -> Interval:
+        key = (nodes[cast(ParamExpr, prop_expr.operand).index], prop_expr.name)
+        domain = domains.get(key)
+        if domain is None:
+            return _top_of(prop_expr.type)
+        return domain
+
+    def _eval(self, expr: Expr, nodes: Sequence[Node], domains: Dict[Hashable, Interval]) -> Interval:
+        '''The interval of the values of `expr` within the bounds'''
+        if isinstance(expr, PropertyExpr):
+            return self._domain(expr, nodes, domains)
+        elif isinstance(expr, ConstExpr):
+            return int(expr.value), int(expr.value)
+        elif isinstance(expr, UnaryExpr):
+            lo, hi = self._eval(expr.operand, nodes, domains)
+            if expr.operator is UnaryOperator.NEG:
+                return -hi, -lo
+            else:
+                return 1 - hi, 1 - lo
+        elif isinstance(expr, BinaryExpr):
+            op = expr.operator
+            x = self._eval(expr.lhs, nodes, domains)
+            y = self._eval(expr.rhs, nodes, domains)
+            if expr.lhs.type is ExprType.SET:
+                return _eval_set(op, x, y)
+            elif op is BinaryOperator.ADD:
+                return x[0] + y[0], x[1] + y[1]
+            elif op is BinaryOperator.SUB:
+                return x[0] - y[1], x[1] - y[0]
+            elif op is BinaryOperator.MUL:
+                return _mul(x, y)
+            elif op is BinaryOperator.DIV or op is BinaryOperator.MOD:
+                return _top
+            elif op is BinaryOperator.EQ:
+                if x[0] == x[1] == y[0] == y[1]:
+                    return _true
+                return _false if x[1] < y[0] or y[1] < x[0] else _bool_top
+            elif op is BinaryOperator.NE:
+                if x[0] == x[1] == y[0] == y[1]:
+                    return _false
+                return _true if x[1] < y[0] or y[1] < x[0] else _bool_top
+            elif op is BinaryOperator.LT:
+                return _true if x[1] < y[0] else _false if x[0] >= y[1] else _bool_top
+            elif op is BinaryOperator.LE:
+                return _true if x[1] <= y[0] else _false if x[0] > y[1] else _bool_top
+            elif op is BinaryOperator.GT:
+                return _true if x[0] > y[1] else _false if x[1] <= y[0] else _bool_top
+            elif op is BinaryOperator.GE:
+                return _true if x[0] >= y[1] else _false if x[1] < y[0] else _bool_top
+            elif op is BinaryOperator.AND:
+                return min(x[0], y[0]), min(x[1], y[1])
+            elif op is BinaryOperator.OR:
+                return max(x[0], y[0]), max(x[1], y[1])
+            else:
+                return max(1 - x[1], y[0]), max(1 - x[0], y[1])
+        elif isinstance(expr, CondExpr):
+            cond = self._eval(expr.condition, nodes, domains)
+            if cond == _true:
+                return self._eval(expr.true_value, nodes, domains)
+            elif cond == _false:
+                return self._eval(expr.false_value, nodes, domains)
+            x = self._eval(expr.true_value, nodes, domains)
+            y = self._eval(expr.false_value, nodes, domains)
+            if expr.type is ExprType.SET:
+                return x[0] & y[0], x[1] | y[1]
+            return min(x[0], y[0]), max(x[1], y[1])
+        raise _Unsupported()
+
+    def _narrow(self, expr: Expr, target: Interval, nodes: Sequence[Node], domains: Dict[Hashable, Interval]) -> bool:
+        '''
+        Narrow the bounds of the properties in `expr` to the values for which `expr` is within `target`.
+        Return whether a bound changed, raise _Conflict if there is no such value.
+        '''
+        if isinstance(expr, PropertyExpr):
+            domain = self._domain(expr, nodes, domains)
+            narrowed = _intersect_set(domain, target) if expr.type is ExprType.SET else _intersect(domain, target)
+            if narrowed != domain:
+                domains[(nodes[cast(ParamExpr, expr.operand).index], expr.name)] = narrowed
+                return True
+            return False
+        elif isinstance(expr, ConstExpr):
+            _intersect((int(expr.value), int(expr.value)), target)
+            return False
+        elif isinstance(expr, UnaryExpr):
+            return self._narrow(expr.operand, (-target[1], -target[0]) if expr.operator is UnaryOperator.NEG
+                                else (1 - target[1], 1 - target[0]), nodes, domains)
+        elif isinstance(expr, CondExpr):
+            cond = self._eval(expr.condition, nodes, domains)
+            if cond == _true:
+                return self._narrow(expr.true_value, target, nodes, domains)
+            elif cond == _false:
+                return self._narrow(expr.false_value, target, nodes, domains)
+            if expr.type is ExprType.SET:
+                _intersect_set(self._eval(expr, nodes, domains), target)
+            else:
+                _intersect(self._eval(expr, nodes, domains), target)
+            return False
+        elif not isinstance(expr, BinaryExpr):
+            raise _Unsupported()
+
+        op = expr.operator
+        x = self._eval(expr.lhs, nodes, domains)
+        y = self._eval(expr.rhs, nodes, domains)
+        if expr.lhs.type is ExprType.SET:
+            return self._narrow_set(expr, target, x, y, nodes, domains)
+        elif op is BinaryOperator.ADD:
+            return (self._narrow(expr.lhs, (target[0] - y[1], target[1] - y[0]), nodes, domains) |
+                    self._narrow(expr.rhs, (target[0] - x[1], target[1] - x[0]), nodes, domains))
+        elif op is BinaryOperator.SUB:
+            return (self._narrow(expr.lhs, (target[0] + y[0], target[1] + y[1]), nodes, domains) |
+                    self._narrow(expr.rhs, (x[0] - target[1], x[1] - target[0]), nodes, domains))
+
+        _intersect(self._eval(expr, nodes, domains), target)
+        if target != _true and target != _false:
+            return False
+        # comparisons and connectives that must be true (or false, as their negation)
+        positive = target == _true
+        if op is BinaryOperator.NE:
+            op, positive = BinaryOperator.EQ, not positive
+        elif not positive and op in _negated:
+            op, positive = _negated[op], True
+        if op is BinaryOperator.EQ:
+            if positive and expr.lhs.type is not ExprType.VALUE:
+                both = _intersect(x, y)
+                return self._narrow(expr.lhs, both, nodes, domains) | self._narrow(expr.rhs, both, nodes, domains)
+        elif op is BinaryOperator.LT:
+            return (self._narrow(expr.lhs, (-_inf, y[1] - 1), nodes, domains) |
+                    self._narrow(expr.rhs, (x[0] + 1, _inf), nodes, domains))
+        elif op is BinaryOperator.LE:
+            return (self._narrow(expr.lhs, (-_inf, y[1]), nodes, domains) |
+                    self._narrow(expr.rhs, (x[0], _inf), nodes, domains))
+        elif op is BinaryOperator.GT:
+            return (self._narrow(expr.lhs, (y[0] + 1, _inf), nodes, domains) |
+                    self._narrow(expr.rhs, (-_inf, x[1] - 1), nodes, domains))
+        elif op is BinaryOperator.GE:
+            return (self._narrow(expr.lhs, (y[0], _inf), nodes, domains) |
+                    self._narrow(expr.rhs, (-_inf, x[1]), nodes, domains))
+        elif op is BinaryOperator.AND and positive:
+            return self._narrow(expr.lhs, _true, nodes, domains) | self._narrow(expr.rhs, _true, nodes, domains)
+        elif op is BinaryOperator.OR:
+            if positive:
+                # one of the sides is false: the other one is true
+                if x == _false:
+                    return self._narrow(expr.rhs, _true, nodes, domains)
+                if y == _false:
+                    return self._narrow(expr.lhs, _true, nodes, domains)
+            else:
+                return self._narrow(expr.lhs, _false, nodes, domains) | self._narrow(expr.rhs, _false, nodes, domains)
+        elif op is BinaryOperator.AND:
+            if x == _true:
+                return self._narrow(expr.rhs, _false, nodes, domains)
+            if y == _true:
+                return self._narrow(expr.lhs, _false, nodes, domains)
+        elif op is BinaryOperator.IMPLY:
+            if not positive:
+                return self._narrow(expr.lhs, _true, nodes, domains) | self._narrow(expr.rhs, _false, nodes, domains)
+            if x == _true:
+                return self._narrow(expr.rhs, _true, nodes, domains)
+            if y == _false:
+                return self._narrow(expr.lhs, _false, nodes, domains)
+        return False
+
+    def _narrow_set(self, expr: BinaryExpr, target: Interval, x: Interval, y: Interval,
+                    nodes: Sequence[Node], domains: Dict[Hashable, Interval]) -> bool:
+        op = expr.operator
+        full = _set_top[1]
+        if op is BinaryOperator.UNION:
+            # the elements that must be in the union and cannot be in one side are in the other one
+            _intersect_set(_eval_set(op, x, y), target)
+            return (self._narrow(expr.lhs, (target[0] & ~y[1], target[1]), nodes, domains) |
+                    self._narrow(expr.rhs, (target[0] & ~x[1], target[1]), nodes, domains))
+        elif op is BinaryOperator.INTERSECT:
+            # the elements that cannot be in the intersection and must be in one side are not in the other one
+            _intersect_set(_eval_set(op, x, y), target)
+            return (self._narrow(expr.lhs, (target[0], full & ~(y[0] & ~target[1])), nodes, domains) |
+                    self._narrow(expr.rhs, (target[0], full & ~(x[0] & ~target[1])), nodes, domains))
+
+        _intersect(_eval_set(op, x, y), target)
+        # the negation of an inclusion is not an inclusion: only the comparisons that must be true narrow the sets
+        if target != _true:
+            return False
+        if op is BinaryOperator.EQ:
+            both = _intersect_set(x, y)
+            return self._narrow(expr.lhs, both, nodes, domains) | self._narrow(expr.rhs, both, nodes, domains)
+        elif op is BinaryOperator.LE or op is BinaryOperator.LT:
+            return (self._narrow(expr.lhs, (0, y[1]), nodes, domains) |
+                    self._narrow(expr.rhs, (x[0], full), nodes, domains))
+        elif op is BinaryOperator.GE or op is BinaryOperator.GT:
+            return (self._narrow(expr.lhs, (y[0], full), nodes, domains) |
+                    self._narrow(expr.rhs, (0, x[1]), nodes, domains))
+        return False
+
+
+# a comparison that must be false is its negation that must be true
+_negated = {
+    BinaryOperator.LT: BinaryOperator.GE,
+    BinaryOperator.LE: BinaryOperator.GT,
+    BinaryOperator.GT: BinaryOperator.LE,
+    BinaryOperator.GE: BinaryOperator.LT,
+}
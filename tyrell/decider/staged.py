@@ -0,0 +1,146 @@
+from abc import ABC, abstractmethod
+import time
+from typing import Any, Callable, List, Optional
+from .decider import Decider
+from .result import Result, ok, bad
+from ..dsl import Node
+from ..interpreter import InterpreterError
+
+
+class Stage(ABC):
+    '''
+    One check of a StagedDecider, with counters of the programs it saw and rejected and of the time it spent on them.
+    '''
+    _name: str
+    _decider: Optional[Decider]
+    _num_seen: int
+    _num_rejected: int
+    _time: float
+
+    def __init__(self, name: str, decider: Optional[Decider] = None):
+        '''
+        `decider` is the decider the stage is part of, if any. It decides the interpreter errors raised by the stage, and is released by the StagedDecider once per program.
+        '''
+        self._name = name
+        self._decider = decider
+        self._num_seen = 0
+        self._num_rejected = 0
+        self._time = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def decider(self) -> Optional[Decider]:
+        return self._decider
+
+    @property
+    def num_seen(self) -> int:
+        return self._num_seen
+
+    @property
+    def num_rejected(self) -> int:
+        '''Number of programs rejected, by a bad result or an interpreter error'''
+        return self._num_rejected
+
+    @property
+    def time(self) -> float:
+        '''Time spent analyzing programs, in seconds'''
+        return self._time
+
+    @abstractmethod
+    def analyze(self, prog: Node) -> Optional[Result]:
+        '''
+        Return None if `prog` passes the check, to be analyzed by the next stage, or the result of the decider otherwise.
+        '''
+        raise NotImplementedError
+
+    def analyze_interpreter_error(self, error: InterpreterError) -> Any:
+        if self._decider is None:
+            return None
+        return self._decider.analyze_interpreter_error(error)
+
+
+class FunctionStage(Stage):
+    '''
+    A stage that rejects the programs for which `check` returns False.
+    '''
+    _check: Callable[[Node], bool]
+
+    def __init__(self, name: str, check: Callable[[Node], bool]):
+        super().__init__(name)
+        self._check = check
+
+    def analyze(self, prog: Node) -> Optional[Result]:
+        return None if self._check(prog) else bad()
+
+
+class StagedDecider(Decider):
+    '''
+    Runs a chain of stages, ordered from the cheapest check to the most expensive one, until one of them decides the program.
+    A program that passes every stage is accepted.
+    '''
+    _stages: List[Stage]
+    _current: Optional[Stage]
+    _num_analyzed: int
+    _analyze_time: float
+
+    def __init__(self, stages: List[Stage]):
+        if len(stages) == 0:
+            raise ValueError('StagedDecider cannot take an empty list of stages')
+        self._stages = stages
+        self._current = None
+        self._num_analyzed = 0
+        self._analyze_time = 0
+
+    @property
+    def stages(self) -> List[Stage]:
+        return self._stages
+
+    @property
+    def num_analyzed(self) -> int:
+        '''Number of programs analyzed'''
+        return self._num_analyzed
+
+    @property
+    def analyze_time(self) -> float:
+        '''Time spent analyzing programs, in seconds'''
+        return self._analyze_time
+
+    def analyze(self, prog: Node) -> Result:
+        start = time.time()
+        try:
+            for stage in self._stages:
+                self._current = stage
+                stage._num_seen += 1
+                stage_start = time.time()
+                try:
+                    res = stage.analyze(prog)
+                except InterpreterError:
+                    stage._num_rejected += 1
+                    raise
+                finally:
+                    stage._time += time.time() - stage_start
+                if res is not None:
+                    if res.is_bad():
+                        stage._num_rejected += 1
+                    return res
+            return ok()
+        finally:
+            self._num_analyzed += 1
+            self._analyze_time += time.time() - start
+
+    def analyze_interpreter_error(self, error: InterpreterError) -> Any:
+        '''The interpreter error is decided by the stage that raised it'''
+        if self._current is None:
+            return None
+        return self._current.analyze_interpreter_error(error)
+
+    def release(self) -> None:
+        released: List[Decider] = []
+        for stage in self._stages:
+            decider = stage.decider
+            if decider is not None and all(decider is not d for d in released):
+                decider.release()
+                released.append(decider)
@@ -0,0 +1,61 @@
+import unittest
+import z3
+from ..spec.expr import ExprType, SET_WIDTH
+from .constraint_encoder import ConstraintEncoder
+from .constraint_template import get_constraint_template
+from .eval_expr import eval_expr
+from .test_eval_expr import spec, FooInterpreter
+
+
+def get_var(pname, pty, param_index):
+    var_name = '{}_n{}'.format(pname, param_index)
+    if pty is ExprType.SET:
+        return z3.BitVec(var_name, SET_WIDTH)
+    return z3.Int(var_name) if pty is ExprType.INT else z3.Bool(var_name)
+
+
+class TestConstraintTemplate(unittest.TestCase):
+
+    def test_instantiate(self):
+        prod = spec.get_function_production_or_raise('foo')
+        template = get_constraint_template(spec, prod)
+        self.assertIs(get_constraint_template(spec, prod), template)
+        self.assertSetEqual(set(template.properties), {
+            ('bprop', ExprType.BOOL, 0), ('bprop', ExprType.BOOL, 1), ('bprop', ExprType.BOOL, 2),
+            ('iprop', ExprType.INT, 1), ('iprop', ExprType.INT, 2)})
+        self.assertEqual(len(template.evaluators), len(prod.constraints))
+
+        encoder = ConstraintEncoder(
+            lambda prop_expr: get_var(prop_expr.name, prop_expr.type, prop_expr.operand.index))
+        clauses = template.instantiate(get_var)
+        self.assertEqual(len(clauses), len(prod.constraints))
+        for constraint, clause in zip(prod.constraints, clauses):
+            solver = z3.Solver()
+            solver.add(clause != encoder.visit(constraint))
+            self.assertEqual(solver.check(), z3.unsat)
+
+    def test_sets(self):
+        # the bit-vector encoding of the set constraints agrees with their evaluation on bitmasks
+        prod = spec.get_function_production_or_raise('bar')
+        clauses = get_constraint_template(spec, prod).instantiate(get_var)
+        for values in [[5, 3, 7], [1, 3, 1], [0, 0, 1 << (SET_WIDTH - 1)], [6, 2, 2]]:
+            out_value, in_values = values[0], values[1:]
+            for constraint, clause in zip(prod.constraints, clauses):
+                expect = eval_expr(FooInterpreter(), in_values, out_value, constraint)
+                solver = z3.Solver()
+                solver.add([get_var('sprop', ExprType.SET, index) == value for index, value in enumerate(values)])
+                solver.add(clause)
+                self.assertEqual(solver.check(), z3.sat if expect else z3.unsat)
+
+    def test_context(self):
+        prod = spec.get_function_production_or_raise('foo')
+        ctx = z3.Context()
+        template = get_constraint_template(spec, prod, ctx)
+        self.assertIsNot(get_constraint_template(spec, prod), template)
+        for clause in template.instantiate(lambda pname, pty, param_index: z3.Const(
+                '{}_n{}'.format(pname, param_index), z3.IntSort(ctx) if pty is ExprType.INT else z3.BoolSort(ctx))):
+            self.assertIs(clause.ctx, ctx)
+
+
+if __name__ == '__main__':
+    unittest.main()
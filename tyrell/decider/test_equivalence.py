@@ -0,0 +1,90 @@
+import unittest
+from ..spec import parse
+from ..dsl import Builder
+from ..interpreter import PostOrderInterpreter
+from .example_base import Example
+from .equivalence import EquivalenceStage
+
+spec_str = r'''
+    enum Const {
+        "1", "2", "3"
+    }
+    value IntExpr;
+
+    program Foo(IntExpr, IntExpr) -> IntExpr;
+    func mult: IntExpr r -> IntExpr a, IntExpr b;
+    func add: IntExpr r -> IntExpr a, Const c;
+    func pick: IntExpr r -> IntExpr a, Const c;
+
+    predicate constant_occurs("3");
+'''
+spec = parse(spec_str)
+builder = Builder(spec)
+
+
+class FooInterpreter(PostOrderInterpreter):
+    def eval_Const(self, v):
+        return int(v)
+
+    def eval_mult(self, node, args):
+        return args[0] * args[1]
+
+    def eval_add(self, node, args):
+        return args[0] + args[1]
+
+    def eval_pick(self, node, args):
+        return args[0]
+
+
+class TestEquivalenceStage(unittest.TestCase):
+
+    @staticmethod
+    def make_stage():
+        return EquivalenceStage('equivalence', spec, FooInterpreter(), [Example(input=[2, 3], output=0)], lambda v: v)
+
+    def test_equivalent_lines(self):
+        stage = self.make_stage()
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (mult (@param 0) (@param 1)) (@param 0))')))
+        # the output line is not stored
+        self.assertEqual(stage.num_stored, 1)
+        # the same line is not blamed
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(add (mult (@param 0) (@param 1)) (Const 1))')))
+
+        prog = builder.from_sexp_string('(add (mult (@param 1) (@param 0)) (Const 2))')
+        res = stage.analyze(prog)
+        self.assertTrue(res.is_bad())
+        line = prog.children[0]
+        self.assertEqual([set(core) for core in res.why()],
+                         [{(n, n.production) for n in [line] + line.children}])
+        self.assertEqual(stage.num_blamed, 1)
+
+        # lines of another production are kept, even with the same value
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (add (@param 1) (Const 3)) (@param 0))')))
+        self.assertEqual(stage.num_stored, 2)
+
+    def test_obligations(self):
+        # a line is only blamed if the first one uses the same inputs and constants
+        stage = self.make_stage()
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (add (@param 1) (Const 1)) (@param 0))')))
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (add (@param 0) (Const 2)) (@param 1))')))
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (pick (@param 0) (Const 1)) (@param 1))')))
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (pick (@param 0) (Const 3)) (@param 1))')))
+
+        stage = self.make_stage()
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (pick (@param 0) (Const 3)) (@param 1))')))
+        self.assertTrue(stage.analyze(builder.from_sexp_string('(mult (pick (@param 0) (Const 1)) (@param 1))')).is_bad())
+
+    def test_max_size(self):
+        # once the store is full, the lines of new values are neither stored nor blamed
+        stage = EquivalenceStage('equivalence', spec, FooInterpreter(), [Example(input=[2, 3], output=0)], lambda v: v, max_size=1)
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (mult (@param 0) (@param 1)) (@param 0))')))
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (add (@param 0) (Const 1)) (@param 1))')))
+        self.assertIsNone(stage.analyze(builder.from_sexp_string('(mult (add (@param 1) (Const 3)) (@param 0))')))
+        self.assertEqual(stage.num_stored, 1)
+        self.assertTrue(stage.analyze(builder.from_sexp_string('(mult (mult (@param 1) (@param 0)) (@param 0))')).is_bad())
+        with self.assertRaises(ValueError):
+            EquivalenceStage('equivalence', spec, FooInterpreter(), [], lambda v: v, max_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
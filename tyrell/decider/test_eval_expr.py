@@ -1,12 +1,13 @@
 import unittest
 from ..spec import parse
 from ..interpreter import PostOrderInterpreter
-from .eval_expr import eval_expr
+from .eval_expr import eval_expr, ExprVisitor
 
 spec_str = r'''
     value IntExpr {
         bprop: bool;
         iprop: int;
+        sprop: set;
     }
 
     program Foo(IntExpr, IntExpr) -> IntExpr;
@@ -35,6 +36,16 @@ spec_str = r'''
         # Parens are necessary to avoid ambiguities
         1 == (if bprop(r) then iprop(a) else iprop(b));
     }
+    func bar: IntExpr r -> IntExpr a, IntExpr b {
+        sprop(a) | sprop(b) == sprop(r);
+        sprop(a) & sprop(b) == sprop(r);
+        sprop(a) <= sprop(r);
+        sprop(b) <= sprop(a);
+        sprop(a) & sprop(b) < sprop(b);
+        sprop(a) < sprop(a) | sprop(a);
+        sprop(r) >= sprop(b);
+        sprop(r) > sprop(a) | sprop(b);
+    }
 '''
 spec = parse(spec_str)
 
@@ -49,6 +60,9 @@ class FooInterpreter(PostOrderInterpreter):
     def apply_iprop(self, arg):
         return arg
 
+    def apply_sprop(self, arg):
+        return arg
+
 
 class TestEvalExpr(unittest.TestCase):
     def test_eval_expr(self):
@@ -87,6 +101,34 @@ class TestEvalExpr(unittest.TestCase):
         for constraint, expect in zip(constraints, expect_outs):
             actual = eval_expr(interp, in_values, out_value, constraint)
             self.assertEqual(actual, expect)
+            actual = ExprVisitor(interp, in_values, out_value).visit(constraint)
+            self.assertEqual(actual, expect)
+
+    def test_eval_set_expr(self):
+        prod = spec.get_function_production_or_raise('bar')
+        constraints = prod.constraints
+
+        # sets are bitmasks: {0, 2} and {0, 1}, and {0, 1, 2}
+        in_values = [5, 3]
+        out_value = 7
+        expect_outs = [
+            True,  # sprop(a) | sprop(b) == sprop(r);
+            False,  # sprop(a) & sprop(b) == sprop(r);
+            True,  # sprop(a) <= sprop(r);
+            False,  # sprop(b) <= sprop(a);
+            True,  # sprop(a) & sprop(b) < sprop(b);
+            False,  # sprop(a) < sprop(a) | sprop(a);
+            True,  # sprop(r) >= sprop(b);
+            False,  # sprop(r) > sprop(a) | sprop(b);
+        ]
+        self.assertEqual(len(constraints), len(expect_outs))
+
+        interp = FooInterpreter()
+        for constraint, expect in zip(constraints, expect_outs):
+            actual = eval_expr(interp, in_values, out_value, constraint)
+            self.assertEqual(actual, expect)
+            actual = ExprVisitor(interp, in_values, out_value).visit(constraint)
+            self.assertEqual(actual, expect)
 
 
 if __name__ == '__main__':
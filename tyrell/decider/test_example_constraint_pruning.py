@@ -0,0 +1,44 @@
+import unittest
+from .example_base import Example
+from .example_constraint_pruning import ExampleConstraintPruningDecider
+from .test_example_constraint import spec, builder, FooInterpreter
+
+
+class TestExampleConstraintPruning(unittest.TestCase):
+
+    def test_reused_solver(self):
+        decider = ExampleConstraintPruningDecider(
+            spec=spec,
+            interpreter=FooInterpreter(),
+            examples=[Example(input=[1, -1], output=2)]
+        )
+        mult = builder.from_sexp_string('(mult (@param 0) (@param 1))')
+        div = builder.from_sexp_string('(div (@param 0) (@param 1))')
+        mult_swapped = builder.from_sexp_string('(mult (@param 1) (@param 0))')
+
+        # pos(a) && neg(b) ==> neg(r), but the output is positive: the inputs are blamed with the node
+        res = decider.analyze(mult)
+        self.assertTrue(res.is_bad())
+        self.assertIn({(node, node.production) for node in [mult] + mult.args}, [set(blame) for blame in res.why()])
+        # pruned while interpreted, as the result is negative
+        res = decider.analyze(mult_swapped)
+        self.assertTrue(res.is_bad())
+        self.assertIsNotNone(res.why())
+        # the constraints of the candidates were popped
+        self.assertEqual(decider._example_solvers[0].solver.num_scopes(), 0)
+
+        decider = ExampleConstraintPruningDecider(
+            spec=spec,
+            interpreter=FooInterpreter(),
+            examples=[Example(input=[2, 3], output=6)]
+        )
+        res = decider.analyze(div)
+        self.assertTrue(res.is_bad())
+        self.assertIsNone(res.why())
+        self.assertTrue(decider.analyze(mult).is_ok())
+        self.assertTrue(decider.analyze(mult_swapped).is_ok())
+        self.assertEqual(decider.num_analyzed, 3)
+        self.assertEqual(decider._example_solvers[0].solver.num_scopes(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from ..spec import parse
+from .constraint_template import get_constraint_template
+from .interval_checker import IntervalChecker
+
+spec = parse(r'''
+    value Table {
+        col: int;
+        row: int;
+        cols: set;
+    }
+    program P(Table, Table) -> Table;
+    func select: Table r -> Table a {
+        row(r) == row(a);
+        col(r) <= col(a);
+    }
+    func join: Table r -> Table a, Table b {
+        col(r) < col(a) + col(b);
+    }
+    func filter: Table r -> Table a {
+        row(r) <= row(a);
+        col(r) == col(a);
+    }
+    func project: Table r -> Table a, Table b {
+        cols(r) <= cols(a) | cols(b);
+    }
+''')
+
+
+def add_production(checker, name, nodes):
+    prod = spec.get_function_production_or_raise(name)
+    checker.add_constraints(nodes, prod.constraints, get_constraint_template(spec, prod).properties)
+
+
+class TestIntervalChecker(unittest.TestCase):
+
+    def test_facts(self):
+        checker = IntervalChecker()
+        add_production(checker, 'select', ['r', 'a'])
+        checker.add_fact('r', 'row', 3)
+        checker.add_fact('a', 'row', 3)
+        checker.add_fact('r', 'col', 2)
+        checker.add_fact('a', 'col', 4)
+        self.assertIs(checker.check(), True)
+
+        checker.add_fact('a', 'col', 1)
+        self.assertIs(checker.check(), False)
+
+    def test_propagation(self):
+        # col(r) == col(f) <= col(s) and col(s) < col(r) + col(p), with col(r) = 2 and col(p) = 0
+        checker = IntervalChecker()
+        add_production(checker, 'filter', ['r', 'f'])
+        add_production(checker, 'select', ['f', 's'])
+        add_production(checker, 'join', ['s', 'r', 'p'])
+        checker.add_fact('p', 'col', 0)
+        checker.add_fact('r', 'col', 2)
+        self.assertIs(checker.check(), False)
+
+    def test_witness(self):
+        # row(r) <= row(f) <= row(a) holds for some rows of f, but not for all of them
+        checker = IntervalChecker()
+        add_production(checker, 'filter', ['r', 'f'])
+        add_production(checker, 'filter', ['f', 'a'])
+        checker.add_fact('r', 'row', 2)
+        checker.add_fact('a', 'row', 13)
+        self.assertIs(checker.check(), True)
+
+        checker.add_fact('a', 'row', 13)
+        checker.add_fact('f', 'row', 1)
+        self.assertIs(checker.check(), False)
+
+    def test_sets(self):
+        # cols(r) <= cols(p) | cols(b) and cols(p) <= cols(a): the columns of r come from a or b
+        checker = IntervalChecker()
+        add_production(checker, 'project', ['r', 'p', 'b'])
+        add_production(checker, 'project', ['p', 'a', 'a'])
+        checker.add_fact('r', 'cols', 0b101)
+        checker.add_fact('a', 'cols', 0b011)
+        checker.add_fact('b', 'cols', 0b100)
+        self.assertIs(checker.check(), True)
+
+        checker.add_fact('b', 'cols', 0b100)
+        checker.add_fact('p', 'cols', 0b010)
+        self.assertIs(checker.check(), False)
+
+        checker = IntervalChecker()
+        add_production(checker, 'project', ['r', 'p', 'b'])
+        add_production(checker, 'project', ['p', 'a', 'a'])
+        checker.add_fact('r', 'cols', 0b101)
+        checker.add_fact('a', 'cols', 0b011)
+        checker.add_fact('b', 'cols', 0b010)
+        self.assertIs(checker.check(), False)
+
+    def test_unknown(self):
+        checker = IntervalChecker()
+        add_production(checker, 'select', ['r', 'a'])
+        checker.add_fact('r', 'row', 'many')
+        self.assertIsNone(checker.check())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from ..interpreter import GeneralError
+from .example_base import Example
+from .example_constraint_pruning import ExampleConstraintPruningDecider
+from .result import ok
+from .staged import Stage, FunctionStage, StagedDecider
+from .test_example_constraint import spec, builder, FooInterpreter
+
+
+class RaisingStage(Stage):
+    def analyze(self, prog):
+        raise GeneralError()
+
+
+class TestStagedDecider(unittest.TestCase):
+
+    def test_counters(self):
+        mult = builder.from_sexp_string('(mult (@param 0) (@param 1))')
+        div = builder.from_sexp_string('(div (@param 0) (@param 1))')
+        decider = StagedDecider([
+            FunctionStage('no_div', lambda prog: prog.name != 'div'),
+            FunctionStage('all', lambda prog: True),
+        ])
+        self.assertTrue(decider.analyze(mult).is_ok())
+        self.assertTrue(decider.analyze(div).is_bad())
+        self.assertEqual(decider.num_analyzed, 2)
+        self.assertEqual([(s.name, s.num_seen, s.num_rejected) for s in decider.stages],
+                         [('no_div', 2, 1), ('all', 1, 0)])
+
+        decider = StagedDecider([RaisingStage('raise')])
+        with self.assertRaises(GeneralError):
+            decider.analyze(mult)
+        self.assertEqual(decider.stages[0].num_rejected, 1)
+        self.assertIsNone(decider.analyze_interpreter_error(GeneralError()))
+
+    def test_pruning_stages(self):
+        pruning_decider = ExampleConstraintPruningDecider(
+            spec=spec,
+            interpreter=FooInterpreter(),
+            examples=[Example(input=[2, -3], output=-6)]
+        )
+        equal = []
+
+        def equal_output(actual, expected):
+            equal.append(actual)
+            return actual == expected
+        decider = StagedDecider([
+            pruning_decider.abstract_stage(),
+            pruning_decider.output_stage('sign', lambda x, y: (x < 0) == (y < 0)),
+            pruning_decider.output_stage('equal', equal_output),
+        ])
+        mult = builder.from_sexp_string('(mult (@param 0) (@param 1))')
+        mult_swapped = builder.from_sexp_string('(mult (@param 1) (@param 0))')
+        div = builder.from_sexp_string('(div (@param 0) (@param 1))')
+
+        self.assertTrue(decider.analyze(mult).is_ok())
+        decider.release()
+        self.assertTrue(decider.analyze(mult_swapped).is_ok())
+        decider.release()
+        res = decider.analyze(div)
+        decider.release()
+        self.assertTrue(res.is_bad())
+        self.assertEqual([(s.name, s.num_seen, s.num_rejected) for s in decider.stages],
+                         [('abstract', 3, 0), ('sign', 3, 0), ('equal', 3, 1)])
+        # every program is interpreted once by all the output stages
+        self.assertEqual(equal, [-6, -6, 2 / -3])
+        self.assertEqual(pruning_decider._example_solvers[0].solver.num_scopes(), 0)
+
+        # stages can be left out: without the abstract stage, the program is still encoded for the interpreter
+        decider = StagedDecider([pruning_decider.output_stage('equal', equal_output)])
+        self.assertTrue(decider.analyze(mult).is_ok())
+        decider.release()
+        self.assertEqual(pruning_decider._example_solvers[0].solver.num_scopes(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
-from typing import Union
+from typing import Union, Tuple
+from weakref import WeakValueDictionary
 import sexpdata
 from .node import *
 from ..spec import TyrellSpec, Production, EnumType
@@ -22,15 +23,26 @@ class ProductionVisitor(GenericVisitor):
 
 
 class Builder:
-    '''A factory class to build AST node'''
+    '''
+    A factory class to build AST node.
+    Nodes are hash-consed: making a node that is structurally identical to a live node made by the same builder returns that node, so identical subtrees are shared.
+    '''
 
     _spec: TyrellSpec
+    _nodes: 'WeakValueDictionary[Tuple[int, ...], Node]'
 
     def __init__(self, spec: TyrellSpec):
         self._spec = spec
+        self._nodes = WeakValueDictionary()
 
     def _make_node(self, prod: Production, children: List[Node] = []) -> Node:
-        return ProductionVisitor(children).visit(prod)
+        # a live node keeps its children alive, so their ids identify them
+        key = (prod.id,) + tuple([id(x) for x in children])
+        node = self._nodes.get(key)
+        if node is None:
+            node = ProductionVisitor(children).visit(prod)
+            self._nodes[key] = node
+        return node
 
     def make_node(self, src: Union[int, Production], children: List[Node] = []) -> Node:
         '''
@@ -20,9 +20,10 @@ class NodeIndexer:
     def __init__(self, prog: Node):
         self._node_map = dict()
         self._index_map = list()
-        # Assign ID to nodes in BFS order
+        # Assign ID to nodes in BFS order (a subtree shared by several parents gets one ID)
         for node in bfs(prog):
-            self._add_node(node)
+            if node not in self._node_map:
+                self._add_node(node)
 
     def get_id(self, node: Node) -> Optional[int]:
         '''Get the ID of the node, or None if the node is not indexed.'''
@@ -5,9 +5,14 @@ from ..spec import Type, Production, EnumProduction, ParamProduction, FunctionPr
 
 
 class Node(ABC):
-    '''Generic and abstract AST Node'''
+    '''
+    Generic and abstract AST Node.
+    Nodes are immutable: their structural hash is computed once, when they are created, and nodes built by a `Builder` are shared between structurally identical subtrees.
+    '''
+    __slots__ = ('_prod', '_hash', '__weakref__')
 
     _prod: Production
+    _hash: int
 
     @abstractmethod
     def __init__(self, prod: Production):
@@ -46,9 +51,19 @@ class Node(ABC):
     def to_sexp(self):
         raise NotImplementedError
 
+    @abstractmethod
+    def deep_eq(self, other) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def deep_hash(self) -> int:
+        raise NotImplementedError
+
 
 class LeafNode(Node):
     '''Generic and abstract class for AST nodes that have no children'''
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, prod: Production):
         super().__init__(prod)
@@ -65,12 +80,14 @@ class LeafNode(Node):
 
 class AtomNode(LeafNode):
     '''Leaf AST node that holds string data'''
+    __slots__ = ()
 
     def __init__(self, prod: Production):
         if not prod.is_enum():
             raise ValueError(
                 'Cannot construct an AST atom node from a non-enum production')
         super().__init__(prod)
+        self._hash = hash((self.type, str(self.data)))
 
     @property
     def data(self) -> Any:
@@ -94,6 +111,8 @@ class AtomNode(LeafNode):
         '''
         Test whether this node is the same with ``other``. This function performs deep comparison rather than just comparing the object identity.
         '''
+        if self is other:
+            return True
         if isinstance(other, AtomNode):
             return self.type == other.type and self.data == other.data
         return False
@@ -102,7 +121,7 @@ class AtomNode(LeafNode):
         '''
         This function performs deep hash rather than just hashing the object identity.
         '''
-        return hash((self.type, str(self.data)))
+        return self._hash
 
     def __repr__(self) -> str:
         return 'AtomNode({})'.format(self.data)
@@ -113,12 +132,14 @@ class AtomNode(LeafNode):
 
 class ParamNode(LeafNode):
     '''Leaf AST node that holds a param'''
+    __slots__ = ()
 
     def __init__(self, prod: Production):
         if not prod.is_param():
             raise ValueError(
                 'Cannot construct an AST param node from a non-param production')
         super().__init__(prod)
+        self._hash = hash(self.index)
 
     @property
     def index(self) -> int:
@@ -142,6 +163,8 @@ class ParamNode(LeafNode):
         '''
         Test whether this node is the same with ``other``. This function performs deep comparison rather than just comparing the object identity.
         '''
+        if self is other:
+            return True
         if isinstance(other, ParamNode):
             return self.index == other.index
         return False
@@ -150,7 +173,7 @@ class ParamNode(LeafNode):
         '''
         This function performs deep hash rather than just hashing the object identity.
         '''
-        return hash(self.index)
+        return self._hash
 
     def __repr__(self) -> str:
         return 'ParamNode({})'.format(self.index)
@@ -161,6 +184,8 @@ class ParamNode(LeafNode):
 
 class ApplyNode(Node):
     '''Internal AST node that represent function application'''
+    __slots__ = ('_args',)
+
     _args: List[Node]
 
     def __init__(self, prod: Production, args: List[Node]):
@@ -179,6 +204,7 @@ class ApplyNode(Node):
                     index, decl_ty, actual_ty)
                 raise ValueError(msg)
         self._args = args
+        self._hash = hash((self.name, tuple([x._hash for x in args])))
 
     @property
     def name(self) -> str:
@@ -212,8 +238,11 @@ class ApplyNode(Node):
         '''
         Test whether this node is the same with ``other``. This function performs deep comparison rather than just comparing the object identity.
         '''
+        if self is other:
+            return True
         if isinstance(other, ApplyNode):
-            return self.name == other.name and \
+            return self._hash == other._hash and \
+                self.name == other.name and \
                 len(self.args) == len(other.args) and \
                 all(x.deep_eq(y)
                     for x, y in zip(self.args, other.args))
@@ -223,7 +252,7 @@ class ApplyNode(Node):
         '''
         This function performs deep hash rather than just hashing the object identity.
         '''
-        return hash((self.name, tuple([x.deep_hash() for x in self.args])))
+        return self._hash
 
     def __repr__(self) -> str:
         return 'ApplyNode({}, {})'.format(self.name, self._args)
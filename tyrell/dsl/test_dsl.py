@@ -99,6 +99,29 @@ class TestDSL(unittest.TestCase):
         with self.assertRaises(ValueError):
             builder.make_apply('f', [])
 
+    def test_builder_hash_consing(self):
+        builder = Builder(self._spec)
+        node0 = builder.make_enum('EType0', 'e0')
+        node1 = builder.make_param(0)
+        node2 = builder.make_apply('f', [node0, node1])
+        node3 = builder.make_apply('g', [node2, builder.make_enum('EType0', 'e1')])
+
+        self.assertIs(builder.make_enum('EType0', 'e0'), node0)
+        self.assertIs(builder.make_param(0), node1)
+        node2_dup = builder.make_apply(
+            'f', [builder.make_enum('EType0', 'e0'), builder.make_param(0)])
+        self.assertIs(node2_dup, node2)
+        self.assertIs(builder.make_apply('g', [node2_dup, builder.make_enum('EType0', 'e1')]), node3)
+        self.assertIsNot(builder.make_enum('EType0', 'e1'), node0)
+        self.assertIsNot(Builder(self._spec).make_param(0), node1)
+
+        node3_dup = ApplyNode(self._prod3, [ApplyNode(self._prod2, [AtomNode(
+            self._prod0), ParamNode(self._prod1)]), builder.make_enum('EType0', 'e1')])
+        self.assertTrue(node3.deep_eq(node3_dup))
+        self.assertEqual(node3.deep_hash(), node3_dup.deep_hash())
+        with self.assertRaises(AttributeError):
+            node3.extra = None
+
     def test_iterator(self):
         builder = Builder(self._spec)
         node0 = builder.make_enum('EType0', 'e0')
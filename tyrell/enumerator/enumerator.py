@@ -25,4 +25,8 @@ class Enumerator(ABC):
         pass
 
     def closeLattices(self):
+        '''
+        Called when the synthesis is over, so that the enumerator can save what it learned (e.g. lattices found online).
+        By default, it does nothing.
+        '''
         pass
@@ -56,8 +56,9 @@ def writeLattice(node):
     
 class SymmetryFinder(object):
 
-	def __init__(self, loc):
+	def __init__(self, loc, ctx=None):
 		self.loc = loc
+		self.ctx = ctx
 		
 	def getChildrenNonZero(self, children):
 		cnt = 0
@@ -70,7 +71,7 @@ class SymmetryFinder(object):
 		if node.nb == 0:
 			return [], [], []
 		name = 'x_' +str(node.nb)
-		node.var = Int(name)
+		node.var = Int(name, self.ctx)
 		if node.children != []:
 			res, vars, cur_val = [And(self.getChildrenNonZero(node.children) < node.var, node.var < pid)], [node.var], [node.var!=node.nb]
 
@@ -107,7 +108,7 @@ class SymmetryFinder(object):
 		# print(constraints)
 		# print(current_values)
 		
-		sym_solver = Solver()
+		sym_solver = Solver(ctx=self.ctx)
 		sym_solver.add(Or(current_values))
 		sym_solver.add(constraints)
 		# for const in constraints:
@@ -119,6 +120,49 @@ class SymmetryFinder(object):
 		# print(And(self.allDiff(all_vars)))
 		return getModels(sym_solver, all_vars)
 
+	def findRenumberings(self, last_line):
+		"""
+		The symmetries of a lattice as tuples (x_1, ..., x_{loc-1}), without a solver. They are the same as the
+		models of findSymmetries: every renumbering of the lines, other than the identity, where each line is
+		still smaller than its parent, i.e. the topological orders of the tree, generated from line 1 upwards.
+		"""
+		parent, pending = dict(), dict()
+		stack = [last_line]
+		while stack:
+			node = stack.pop()
+			for c in node.children:
+				if c.nb == 0:
+					continue
+				if c.nb in parent:
+					# a line with two parents cannot be renumbered (findSymmetries finds no model either)
+					return []
+				parent[c.nb] = node.nb
+				pending[c.nb] = self.getChildrenNonZero(c.children)
+				stack.append(c)
+		lines = range(1, self.loc)
+		identity = tuple(lines)
+		labels = dict()
+		models = []
+		def place(label, ready):
+			if not ready:
+				model = tuple(labels[x] for x in lines)
+				if model != identity:
+					models.append(model)
+				return
+			for i, line in enumerate(ready):
+				labels[line] = label
+				p = parent[line]
+				rest = ready[:i] + ready[i+1:]
+				if p in pending:
+					pending[p] -= 1
+					if pending[p] == 0:
+						rest.append(p)
+				place(label + 1, rest)
+				if p in pending:
+					pending[p] += 1
+		place(1, [l for l in sorted(pending) if pending[l] == 0])
+		return models
+
 class LatticeBuilder(object):
 	"""docstring for LatticeBuilder"""
 	def __init__(self, loc):
@@ -232,6 +276,69 @@ class LatticeBuilder(object):
 			print(writeLattice(last_line)+":"+printModels(models))
 
 
+
+## Lattices without a solver: a lattice is an ordered tree whose nodes are the lines 1..loc, rooted at the
+## last line, where every line is a child of a later line. Placing the lines loc-1, ..., 1 in turn, each
+## as a new child (at any position) of a line already placed, builds every lattice exactly once.
+
+def latticeChoices(children):
+	# the (parent, position) pairs where the next line can be placed
+	return [(p, i) for p in sorted(children, reverse=True) for i in range(len(children[p]) + 1)]
+
+def latticePrefixes(loc, depth):
+	# every sequence of choices that places the lines loc-1, ..., loc-depth
+	prefixes = [()]
+	for k in range(depth):
+		prefixes = [p + (c,) for p in prefixes for c in range(2 * k + 1)]
+	return prefixes
+
+def enumerateLattices(loc, prefix=()):
+	"""Generates the lattices of `loc` lines (dicts from a line to its children) that start with the choices in `prefix`"""
+	children = {loc: []}
+	for line, choice in zip(range(loc - 1, 0, -1), prefix):
+		p, i = latticeChoices(children)[choice]
+		children[p].insert(i, line)
+		children[line] = []
+	def place(line):
+		if line == 0:
+			yield children
+			return
+		for p, i in latticeChoices(children):
+			children[p].insert(i, line)
+			children[line] = []
+			yield from place(line - 1)
+			del children[line]
+			children[p].pop(i)
+	yield from place(loc - 1 - len(prefix))
+
+def latticeDigits(children, loc):
+	"""The (position, line) pairs of a lattice in the string written by writeLattice, in order"""
+	# a node at height h of the tree of the lattice strings roots a subtree of sizes[h] nodes
+	sizes = [0] * (loc + 2)
+	for h in range(loc, 0, -1):
+		sizes[h] = 1 + ((loc - 1) * sizes[h + 1] if h < loc else 0)
+	digits = []
+	def visit(line, position, h):
+		digits.append((position, line))
+		for c, child in enumerate(children[line]):
+			visit(child, position + 1 + c * sizes[h + 1], h + 1)
+	visit(loc, 0, 1)
+	return digits
+
+def latticeTree(children, line, h=0):
+	# the lattice as the tree of Nodes read by SymmetryFinder
+	# (imported here, as lines imports this module before defining Node)
+	from .lines import Node
+	node = Node(line)
+	node.h = h
+	node.children = [latticeTree(children, c, h + 1) for c in children[line]]
+	return node
+
+def latticeSymmetries(children, loc, sym_finder):
+	"""The symmetries of a lattice as tuples (x_1, ..., x_{loc-1}), in a canonical order"""
+	return sorted(sym_finder.findRenumberings(latticeTree(children, loc)))
+
+
 if __name__ == '__main__':
 	if len(argv)!= 2:
 		exit("Usage: python3 gen_lattices.py loc")
@@ -0,0 +1,138 @@
+'''
+Lattices found online by the lines enumerator, shared by every process through a sqlite database.
+
+Lattices are only ever inserted (a lattice always has the same models), so concurrent writers cannot
+corrupt each other's work: sqlite serializes the insertions and a lattice that is found twice is kept once.
+Insertions are handed to a background thread, so the enumerator never waits for the disk; `flush` waits
+until every insertion of the process has been committed. Cached lattices are folded into the lattice
+files by other-scripts/convert_lattices.py.
+'''
+
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+from typing import Dict
+from ..logger import get_logger
+
+logger = get_logger('tyrell.enumerator.lattice_cache')
+
+# seconds to wait for the lock of the database held by another process
+_timeout = 60
+
+_schema = 'CREATE TABLE IF NOT EXISTS lattices (loc INTEGER, signature BLOB, models BLOB, PRIMARY KEY (loc, signature))'
+
+
+def _signatureKey(loc, signature):
+    return signature.to_bytes(loc * 4, 'big')
+
+
+def _encodeModels(models):
+    return b''.join(bytes(m) for m in models)
+
+
+def _decodeModels(loc, data):
+    n = loc - 1
+    return [tuple(data[i:i + n]) for i in range(0, len(data), n)]
+
+
+class LatticeCache(object):
+
+    def __init__(self, path):
+        self.path = path
+        self._pid = None
+        self._disabled = False
+
+    def _start(self):
+        # connections and threads do not survive a fork, so every process opens its own
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write, name='lattice-cache-writer', daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=_timeout)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(_schema)
+            conn.commit()
+            self._local.conn = conn
+        return conn
+
+    def _disable(self, e):
+        if not self._disabled:
+            logger.warning('Lattice cache {} is not available: {}'.format(self.path, e))
+        self._disabled = True
+
+    def _write(self):
+        while True:
+            rows = [self._queue.get()]
+            # the lattices queued in the meantime are inserted in the same transaction
+            while True:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if not self._disabled:
+                    conn = self._connect()
+                    with conn:
+                        conn.executemany('INSERT OR IGNORE INTO lattices VALUES (?, ?, ?)', rows)
+            except sqlite3.Error as e:
+                self._disable(e)
+            finally:
+                for r in rows:
+                    self._queue.task_done()
+
+    def get(self, loc, signature):
+        '''The models of a cached lattice, or None if no process has found it yet'''
+        if self._disabled:
+            return None
+        self._start()
+        try:
+            row = self._connect().execute('SELECT models FROM lattices WHERE loc = ? AND signature = ?',
+                                          (loc, _signatureKey(loc, signature))).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+        return _decodeModels(loc, row[0]) if row is not None else None
+
+    def put(self, loc, signature, models):
+        '''Caches a lattice in the background'''
+        if self._disabled:
+            return
+        self._start()
+        self._queue.put((loc, _signatureKey(loc, signature), _encodeModels(models)))
+
+    def flush(self):
+        '''Waits until every lattice put by this process is in the database'''
+        if self._pid == os.getpid():
+            self._queue.join()
+
+    def items(self, loc):
+        '''Every cached lattice for `loc` lines of code, as (signature, models) pairs'''
+        self.flush()
+        self._start()
+        for signature, models in self._connect().execute('SELECT signature, models FROM lattices WHERE loc = ?', (loc,)):
+            yield int.from_bytes(signature, 'big'), _decodeModels(loc, models)
+
+
+_caches: Dict[str, LatticeCache] = dict()
+
+
+def getLatticeCache(path):
+    '''The cache of the process for the database `path`'''
+    if path not in _caches:
+        _caches[path] = LatticeCache(path)
+    return _caches[path]
+
+
+@atexit.register
+def _flushCaches():
+    for cache in _caches.values():
+        cache.flush()
@@ -0,0 +1,196 @@
+'''
+Binary store of the lattices of the lines enumerator.
+
+A lattice file `loc-N` has one line per lattice, `<lattice>:<model>|<model>|...`, where the lattice is the
+string of digits written by `writeLattice` and every model is a symmetry `[x_1 = 2, x_2 = 1, ...]` that moves
+line i of the program to line x_i. The store `loc-N.bin` holds the same lattices in a file that is mapped in
+memory and only decoded for the lattices that are looked up:
+
+    header      magic, loc, signature width, number of lattices, size and crc32 of the text file it was built
+                from (or that it supersedes, when it holds lattices generated or cached since)
+    index       one entry per lattice, sorted by signature: signature, offset and number of its models
+    models      every model as loc-1 bytes, x_1 ... x_{loc-1}
+
+A lattice has exactly loc non-zero digits (one per line of the program), so it is identified by the integer
+signature that packs the position and the value of each of them (see `latticeSignature`).
+'''
+
+import mmap
+import os
+import struct
+import zlib
+
+_magic = b'SQLATTC1'
+_header = struct.Struct('<8sHHIII')
+_entry = struct.Struct('<II')
+
+# bits of the position of a digit in the lattice string, and of the digit itself, in a signature
+_position_bits = 28
+_digit_bits = 4
+
+
+def packSignature(digits):
+    '''The signature of the (position, digit) pairs of the non-zero digits of a lattice, in the order of the lattice string'''
+    signature = 0
+    for position, digit in digits:
+        signature = (signature << _position_bits | position) << _digit_bits | digit
+    return signature
+
+
+def latticeSignature(lattice):
+    '''The integer signature of a lattice string'''
+    return packSignature((i, int(c)) for i, c in enumerate(lattice) if c != '0')
+
+
+def signatureDigits(signature):
+    '''The (position, digit) pairs of a signature, in the order of the lattice string'''
+    digits = []
+    while signature:
+        digits.append((signature >> _digit_bits & (1 << _position_bits) - 1, signature & (1 << _digit_bits) - 1))
+        signature >>= _position_bits + _digit_bits
+    return digits[::-1]
+
+
+def latticeLength(loc):
+    '''The number of digits of the lattices of programs with `loc` lines'''
+    return sum((loc - 1) ** h for h in range(loc))
+
+
+def latticeString(signature, length):
+    '''The lattice string of `length` digits with the given signature'''
+    lattice = ['0'] * length
+    for position, digit in signatureDigits(signature):
+        lattice[position] = str(digit)
+    return ''.join(lattice)
+
+
+def parseModel(model, loc):
+    '''Parses a model `[x_2 = 1, x_1 = 2]` into the tuple (x_1, ..., x_{loc-1})'''
+    values = [0] * (loc - 1)
+    for assignment in model.strip()[1:-1].split(','):
+        var, value = assignment.split('=') if '=' in assignment else assignment.split(':')
+        values[int(var.strip().split('_')[1]) - 1] = int(value)
+    return tuple(values)
+
+
+def writeModel(model):
+    '''Writes a model in the format of the lattice files'''
+    return '[' + ', '.join('x_{} = {}'.format(i + 1, v) for i, v in enumerate(model)) + ']'
+
+
+def parseLatticeFile(path, loc):
+    '''Parses a text lattice file into a dict from lattice signatures to their lists of models'''
+    lattices = dict()
+    with open(path, 'r') as lats:
+        for l in lats:
+            lat, mods = l.rstrip('\n').split(':', 1)
+            models = [parseModel(m, loc) for m in mods.split('|') if m.strip() not in ('', '[]')]
+            lattices.setdefault(latticeSignature(lat), models)
+    return lattices
+
+
+def writeLatticeFile(path, loc, lattices):
+    '''Writes lattices (a dict from signatures to lists of models) to the text lattice file `path`, ordered by signature'''
+    length = latticeLength(loc)
+    with open(path, 'w') as lats:
+        for signature in sorted(lattices):
+            models = lattices[signature]
+            lats.write(latticeString(signature, length) + ':' + ('|'.join(writeModel(m) for m in models) or '[]') + '\n')
+
+
+def _textChecksum(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return len(data), zlib.crc32(data)
+
+
+def writeLatticeStore(path, loc, lattices, text_path=None):
+    '''
+    Writes the lattices (a dict from signatures to lists of models) of programs with `loc` lines to the binary store `path`.
+    If `text_path` is given, the store records its size and checksum, so that the store is ignored once the text file is modified.
+    '''
+    text_size, text_crc = _textChecksum(text_path) if text_path is not None else (0, 0)
+    width = loc * (_position_bits + _digit_bits) // 8
+    index, models = [], bytearray()
+    for signature in sorted(lattices):
+        index.append(signature.to_bytes(width, 'big') + _entry.pack(len(models), len(lattices[signature])))
+        for model in lattices[signature]:
+            models += bytes(model)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_header.pack(_magic, loc, width, len(index), text_size, text_crc))
+        f.write(b''.join(index))
+        f.write(models)
+    os.replace(tmp_path, path)
+
+
+class LatticeStore(object):
+    '''
+    A binary lattice store mapped in memory. `get` finds a lattice by binary search over the index
+    and decodes only its models, so opening a store costs the same for any number of lattices.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.loc, self._width, self._size, self.text_size, self.text_crc = _header.unpack_from(self._map, 0)
+        if magic != _magic:
+            self._map.close()
+            raise ValueError('Not a lattice store: {}'.format(path))
+        self._entry_size = self._width + _entry.size
+        self._models = _header.size + self._size * self._entry_size
+
+    def _signature(self, i):
+        start = _header.size + i * self._entry_size
+        return self._map[start:start + self._width]
+
+    def _models_at(self, i):
+        offset, count = _entry.unpack_from(self._map, _header.size + i * self._entry_size + self._width)
+        n = self.loc - 1
+        start = self._models + offset
+        data = self._map[start:start + count * n]
+        return [tuple(data[m * n:(m + 1) * n]) for m in range(count)]
+
+    def get(self, signature, default=None):
+        '''The models of the lattice with the given signature, or `default` if it is not in the store'''
+        if signature >= 1 << self._width * 8:
+            return default
+        key = signature.to_bytes(self._width, 'big')
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._signature(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._size and self._signature(lo) == key:
+            return self._models_at(lo)
+        return default
+
+    def __contains__(self, signature):
+        return self.get(signature) is not None
+
+    def __len__(self):
+        return self._size
+
+    def items(self):
+        for i in range(self._size):
+            yield int.from_bytes(self._signature(i), 'big'), self._models_at(i)
+
+    def matches(self, text_path):
+        '''True if the store was written from the current contents of `text_path`'''
+        return (self.text_size, self.text_crc) == _textChecksum(text_path)
+
+    def close(self):
+        self._map.close()
+
+
+def convert(text_path, loc=None, path=None):
+    '''Converts the text lattice file `text_path` (loc-N) into the binary store `path` (loc-N.bin by default)'''
+    if loc is None:
+        loc = int(os.path.basename(text_path).split('-')[-1])
+    lattices = parseLatticeFile(text_path, loc)
+    writeLatticeStore(path or text_path + '.bin', loc, lattices, text_path)
+    return len(lattices)
+
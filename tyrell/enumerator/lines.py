@@ -1,11 +1,14 @@
 from z3 import *
 from collections import deque
+from typing import Any, Dict, Optional, Tuple
 from .enumerator import Enumerator
 from .gen_lattices import SymmetryFinder
+from .lattice_store import LatticeStore, packSignature, parseLatticeFile
+from .lattice_cache import getLatticeCache
 from .. import dsl as D
 from ..logger import get_logger
-from copy import deepcopy
 import time
+import os
 
 logger = get_logger('tyrell.enumerator.smt')
 
@@ -56,6 +59,42 @@ def writeLattice(node, pos):
         string += writeLattice(c, pos)
     return string
 
+# lattice files that were already read: loc -> (modification times, lattices)
+_lattice_files: Dict[int, Tuple[Tuple[float, Optional[float]], Any]] = dict()
+
+def latticePath(loc):
+    return "tyrell/enumerator/lattices/loc-"+str(loc)
+
+# lattices found online, for the locs without a complete lattice file
+latticeCachePath = "tyrell/enumerator/lattices/cache.db"
+
+def readLattices(loc):
+    '''
+    The lattices for `loc` lines of code, as a mapping from lattice signatures to lists of models.
+    They come from the binary store loc-N.bin when it was written from the current text file loc-N, and from the text file otherwise.
+    Lattices are kept in memory and only read again once one of the files is modified.
+    '''
+    path = latticePath(loc)
+    store_path = path + ".bin"
+    mtimes = (os.stat(path).st_mtime, os.stat(store_path).st_mtime if os.path.exists(store_path) else None)
+    if loc in _lattice_files and _lattice_files[loc][0] == mtimes:
+        return _lattice_files[loc][1]
+    lattices = None
+    if mtimes[1] is not None:
+        try:
+            lattices = LatticeStore(store_path)
+        except (OSError, ValueError) as e:
+            logger.warning('Ignoring lattice store {}: {}'.format(store_path, e))
+        else:
+            if lattices.loc != loc or not lattices.matches(path):
+                logger.warning('Lattice store {} is out of date, reading {}'.format(store_path, path))
+                lattices.close()
+                lattices = None
+    if lattices is None:
+        lattices = parseLatticeFile(path, loc)
+    _lattice_files[loc] = (mtimes, lattices)
+    return lattices
+
 class LinesEnumerator(Enumerator):
     # z3 solver
     z3_solver = Solver()
@@ -65,7 +104,7 @@ class LinesEnumerator(Enumerator):
 
     line_productions = []
 
-    # for learning
+    # for learning: the variables of the positions of each node of the program
     program2tree = {}
 
     # z3 variables for each production node
@@ -77,15 +116,16 @@ class LinesEnumerator(Enumerator):
             if not p.is_function() or str(p).find('Empty') != -1:
                 self.leaf_productions.append(p)
 
-    def initLineProductions(self):
-        for l in range(1,self.loc):
-            line_productions = []
-            for t in self.types:
-                self.num_prods += 1
-                line_productions.append(LineProduction(self.num_prods, self.spec.get_type(t)))
-                #ENCODING print("NEW PROD "+str(self.num_prods))
+    def initLineProductions(self, line):
+        '''Creates the productions that stand for the result of `line` in the following lines'''
+        line_productions = []
+        for t in self.types:
+            self.num_prods += 1
+            line_productions.append(LineProduction(self.num_prods, self.spec.get_type(t)))
+            self.productionLines[self.num_prods] = line - 1
+            #ENCODING print("NEW PROD "+str(self.num_prods))
 
-            self.line_productions.append(line_productions)
+        self.line_productions.append(line_productions)
 
     def findTypes(self):
         types = []
@@ -104,35 +144,29 @@ class LinesEnumerator(Enumerator):
         self.types = types
         self.num_types = len(self.types)
 
-    def buildTrees(self):
-        '''Builds a loc trees, each tree will be a line of the program'''
-        nodes = []
-        nb = 1
-        leafs = []
-        for i in range(1,self.loc+1):
-            n = Root(i, nb, self.max_children)
-            n.var = self.createRootVariables(nb)
-            children = []
-            for x in range(self.max_children):
-                nb += 1
-                child = Leaf(nb, n)
-                child.lines = self.createLinesVariables(nb, n.id)
-                # print(child.lines)
-                child.var = self.createLeafVariables(nb, n.id)
-                children.append(child)
-                leafs.append(child)
-            self.propagateEmpty(children)
-            n.children = children
-            n.type = self.createTypeVariables(n.id)
-            nodes.append(n)
+    def buildTree(self, i):
+        '''Builds the tree of line i of the program'''
+        nb = (i - 1) * (self.max_children + 1) + 1
+        n = Root(i, nb, self.max_children)
+        n.var = self.createRootVariables(nb)
+        children = []
+        for x in range(self.max_children):
             nb += 1
-        return nodes, leafs
+            child = Leaf(nb, n)
+            child.lines = self.createLinesVariables(nb, n.id)
+            # print(child.lines)
+            child.var = self.createLeafVariables(nb, n.id)
+            children.append(child)
+        self.propagateEmpty(children)
+        n.children = children
+        n.type = self.createTypeVariables(n.id)
+        return n, children
 
     def createLinesVariables(self, nb, parent):
         lines = []
         for x in range(1,parent):
             name = 'l' +str(nb)+"_"+ str(x)
-            v = Int(name)
+            v = Int(name, self.ctx)
             # print(v)
             self.linesVars.append(v)
             # self.variables.append(v)
@@ -145,7 +179,7 @@ class LinesEnumerator(Enumerator):
 
     def createTypeVariables(self, nb):
         name = 't'+str(nb)
-        v = Int(name)
+        v = Int(name, self.ctx)
         # self.variables.append(v)
         # variable range constraints
         self.typeVars.append(v)
@@ -156,7 +190,7 @@ class LinesEnumerator(Enumerator):
 
     def createRootVariables(self, nb):
         name = 'n' + str(nb)
-        v = Int(name)
+        v = Int(name, self.ctx)
         self.variables.append(v)
         ctr = []
 
@@ -164,14 +198,14 @@ class LinesEnumerator(Enumerator):
             if p not in self.leaf_productions:
                 ctr.append(v == p.id)
 
-        #ENCODING print(Or(ctr))
-        self.z3_solver.add(Or(ctr))
+        #ENCODING print(Or(ctr, self.ctx))
+        self.z3_solver.add(Or(ctr, self.ctx))
         self.num_constraints += 1
         return v
 
     def createLeafVariables(self, nb, parent):
         name = 'n' + str(nb)
-        v = Int(name)
+        v = Int(name, self.ctx)
         self.variables.append(v)
         ctr = []
 
@@ -179,8 +213,8 @@ class LinesEnumerator(Enumerator):
         for p in values:
             ctr.append(v == p.id)
 
-        #ENCODING print(Or(ctr))
-        self.z3_solver.add(Or(ctr))
+        #ENCODING print(Or(ctr, self.ctx))
+        self.z3_solver.add(Or(ctr, self.ctx))
         self.num_constraints += 1
         self.parentId[nb] = parent
         return v
@@ -198,10 +232,10 @@ class LinesEnumerator(Enumerator):
         for p in self.spec.get_productions_with_lhs(self.spec.output):
             ctr.append(var == p.id)
             for r in range(len(self.roots)-1):
-                self.z3_solver.add(self.roots[r].var != p.id)
-        self.z3_solver.add(Or(ctr))
+                self.addScoped(self.roots[r].var != p.id)
+        self.addScoped(Or(ctr, self.ctx))
         self.num_constraints += 1
-        # ENCODING print(Or(ctr))
+        # ENCODING print(Or(ctr, self.ctx))
 
     def createLinesConstraints(self):
         '''Each line is used exactly once in the program'''
@@ -215,7 +249,7 @@ class LinesEnumerator(Enumerator):
                         else:
                             ctr += v
             ctr_fun = ctr == 1
-            self.z3_solver.add(ctr_fun)
+            self.addScoped(ctr_fun)
             self.num_constraints += 1
             #ENCODING print(ctr_fun)
 
@@ -226,65 +260,86 @@ class LinesEnumerator(Enumerator):
             ctr = []
             for y in self.leafs:
                 ctr.append(y.var == input_productions[x].id)
-            self.z3_solver.add(Or(ctr))
+            self.addScoped(Or(ctr, self.ctx))
             self.num_constraints += 1
-            #ENCODING print(Or(ctr))
+            #ENCODING print(Or(ctr, self.ctx))
+
+    def lexLeq(self, xs, ys):
+        '''xs is not larger than ys in lexicographic order'''
+        ctr = BoolVal(True, self.ctx)
+        for x, y in reversed(list(zip(xs, ys))):
+            ctr = Or(x < y, And(x == y, ctr))
+        return ctr
+
+    def createLexLeaderConstraints(self):
+        '''
+        Swapping two consecutive lines where the second does not use the first gives a symmetric program, so only
+        the order where the first line is not larger than the second (production, then children) is allowed.
+        These constraints hold for every loc, as the new line may be the second of such a pair once there are more lines.
+        '''
+        first, second = self.roots[-2], self.roots[-1]
+        swappable = [c.lines[first.id-1] == 0 for c in second.children]
+        # the swap breaks happens_before if the first line has the constant that must come before the one of the second
+        for pos, pre in self.happensBeforeIds():
+            swappable.append(Not(And(Or([c.var == pre for c in first.children]), Or([c.var == pos for c in second.children]))))
+        first_line = [first.var] + [c.var for c in first.children]
+        second_line = [second.var] + [c.var for c in second.children]
+        self.z3_solver.add(Implies(And(swappable), self.lexLeq(first_line, second_line)))
+        self.num_constraints += 1
 
-    def createTypeConstraints(self):
+    def createTypeConstraints(self, r):
         '''If a production is used in a node, then the nodes' type is equal to the production's type'''
-        for r in self.roots:
-            for t in range(len(self.types)):
-                ctr = []
-                if self.types[t] == 'Empty':
-                    continue
-                for p in self.spec.productions():
-                    if p.is_function() and p.lhs.name[:] == self.types[t]:
-                        self.z3_solver.add(Implies(r.var==p.id,r.type==t))
-                        self.num_constraints += 1
-                        #ENCODING print(Implies(r.var==p.id,r.type==t))
-
-    def createChildrenConstraints(self):
-        for r in self.roots:
+        for t in range(len(self.types)):
+            ctr = []
+            if self.types[t] == 'Empty':
+                continue
             for p in self.spec.productions():
-                if not p.is_function() or p.lhs.name[:] == 'Empty':
-                    continue
-                aux = r.var == p.id
-                for c in range(len(r.children)):
-                    ctr = []
-                    if len(p.rhs) == c:
-                        ctr.append(r.children[c].var==self.leaf_productions[0].id)
-                        self.num_constraints += 1
-                        if len(ctr) > 1:
-                            self.z3_solver.add(Implies(aux, Or(ctr)))
-                            #ENCODING print(Implies(aux, Or(ctr)))
-                        else:
-                            self.z3_solver.add(Implies(aux, ctr[0]))
-                            #ENCODING print(Implies(aux, ctr[0]))
-                        break
-
-                    for t in self.leaf_productions:
-                        if t.lhs.name[:] == p.rhs[c].name[:]:
-                            ctr.append(r.children[c].var==t.id)
-
-                    for l in range(r.id-1):
-                        for t in self.line_productions[l]:
-                            if t.lhs.name[:] == p.rhs[c].name[:]:
-                                ctr.append(r.children[c].var==t.id)
-                                # if a previous line is used, then its flag must be true
-                                line_var = r.children[c].lines[l]
-                                self.z3_solver.add(Implies(line_var==1, r.children[c].var==t.id))
-                                self.z3_solver.add(Implies(r.children[c].var==t.id, line_var==1))
-                                self.num_constraints += 2
-                                #ENCODING print(Implies(line_var==1, r.children[c].var==t.id))
-                                #ENCODING print(Implies(r.children[c].var==t.id, line_var==1))
+                if p.is_function() and p.lhs.name[:] == self.types[t]:
+                    self.z3_solver.add(Implies(r.var==p.id,r.type==t))
+                    self.num_constraints += 1
+                    #ENCODING print(Implies(r.var==p.id,r.type==t))
 
+    def createChildrenConstraints(self, r):
+        for p in self.spec.productions():
+            if not p.is_function() or p.lhs.name[:] == 'Empty':
+                continue
+            aux = r.var == p.id
+            for c in range(len(r.children)):
+                ctr = []
+                if len(p.rhs) == c:
+                    ctr.append(r.children[c].var==self.leaf_productions[0].id)
                     self.num_constraints += 1
                     if len(ctr) > 1:
-                        self.z3_solver.add(Implies(aux, Or(ctr)))
-                        #ENCODING print(Implies(aux, Or(ctr)))
+                        self.z3_solver.add(Implies(aux, Or(ctr, self.ctx)))
+                        #ENCODING print(Implies(aux, Or(ctr, self.ctx)))
                     else:
                         self.z3_solver.add(Implies(aux, ctr[0]))
                         #ENCODING print(Implies(aux, ctr[0]))
+                    break
+
+                for t in self.leaf_productions:
+                    if t.lhs.name[:] == p.rhs[c].name[:]:
+                        ctr.append(r.children[c].var==t.id)
+
+                for l in range(r.id-1):
+                    for t in self.line_productions[l]:
+                        if t.lhs.name[:] == p.rhs[c].name[:]:
+                            ctr.append(r.children[c].var==t.id)
+                            # if a previous line is used, then its flag must be true
+                            line_var = r.children[c].lines[l]
+                            self.z3_solver.add(Implies(line_var==1, r.children[c].var==t.id))
+                            self.z3_solver.add(Implies(r.children[c].var==t.id, line_var==1))
+                            self.num_constraints += 2
+                            #ENCODING print(Implies(line_var==1, r.children[c].var==t.id))
+                            #ENCODING print(Implies(r.children[c].var==t.id, line_var==1))
+
+                self.num_constraints += 1
+                if len(ctr) > 1:
+                    self.z3_solver.add(Implies(aux, Or(ctr, self.ctx)))
+                    #ENCODING print(Implies(aux, Or(ctr, self.ctx)))
+                else:
+                    self.z3_solver.add(Implies(aux, ctr[0]))
+                    #ENCODING print(Implies(aux, ctr[0]))
 
     def maxChildren(self) -> int:
         '''Finds the maximum number of children in the productions'''
@@ -306,37 +361,34 @@ class LinesEnumerator(Enumerator):
                     index, pred.name)
                 raise ValueError(msg)
 
-    def _resolve_is_not_parent_predicate(self, pred):
+    def _resolve_is_not_parent_predicate(self, pred, r):
         # return
         self._check_arg_types(pred, [str, str, (int, float)])
         prod0 = self.spec.get_function_production_or_raise(pred.args[0])
         prod1 = self.spec.get_function_production_or_raise(pred.args[1])
 
-        for r in self.roots:
-            for s in range(len(r.children[0].lines)):
-                children = []
-                for c in r.children:
-                    children.append(c.lines[s]==1)
-                self.z3_solver.add(Implies(And(Or(children), self.roots[s].var==prod1.id), r.var!=prod0.id))
+        for s in range(len(r.children[0].lines)):
+            children = []
+            for c in r.children:
+                children.append(c.lines[s]==1)
+            self.z3_solver.add(Implies(And(Or(children), self.roots[s].var==prod1.id), r.var!=prod0.id))
 
-    def _resolve_distinct_inputs_predicate(self, pred):
+    def _resolve_distinct_inputs_predicate(self, pred, r):
         self._check_arg_types(pred, [str])
         prod0 = self.spec.get_function_production_or_raise(pred.args[0])
-        for r in self.roots:
-            for c_1 in range(len(r.children)):
-                child_1 = r.children[c_1]
-                for c_2 in range(c_1+1,len(r.children)):
-                    child_2 = r.children[c_2]
-                    # this works because even a inner_join between two filters, the children will have different values for the variables because of the lines produtions
-                    self.z3_solver.add(Implies(r.var==prod0.id, Or(child_1.var != child_2.var, And(child_1.var == 0, child_2.var == 0))))
-                    # print(Implies(r.var==prod0.id, Or(child_1.var != child_2.var, And(child_1.var == 0, child_2.var == 0))))
-
-    def _resolve_distinct_filters_predicate(self, pred):
+        for c_1 in range(len(r.children)):
+            child_1 = r.children[c_1]
+            for c_2 in range(c_1+1,len(r.children)):
+                child_2 = r.children[c_2]
+                # this works because even a inner_join between two filters, the children will have different values for the variables because of the lines produtions
+                self.z3_solver.add(Implies(r.var==prod0.id, Or(child_1.var != child_2.var, And(child_1.var == 0, child_2.var == 0))))
+                # print(Implies(r.var==prod0.id, Or(child_1.var != child_2.var, And(child_1.var == 0, child_2.var == 0))))
+
+    def _resolve_distinct_filters_predicate(self, pred, r):
         self._check_arg_types(pred, [str])
         prod0 = self.spec.get_function_production_or_raise(pred.args[0])
-        for r in self.roots:
-            self.z3_solver.add(Implies(r.var==prod0.id, r.children[int(pred.args[1])].var != r.children[int(pred.args[2])].var))
-            # print(Implies(r.var==prod0.id, r.children[int(pred.args[1])].var != r.children[int(pred.args[2])].var))
+        self.z3_solver.add(Implies(r.var==prod0.id, r.children[int(pred.args[1])].var != r.children[int(pred.args[2])].var))
+        # print(Implies(r.var==prod0.id, r.children[int(pred.args[1])].var != r.children[int(pred.args[2])].var))
 
 
     def _resolve_constant_occurs_predicate(self, pred):
@@ -348,47 +400,63 @@ class LinesEnumerator(Enumerator):
                     for l in self.leafs:
                         lst.append(l.var==p.id)
 
-        self.z3_solver.add(Or(lst))
+        self.addScoped(Or(lst, self.ctx))
 
 
-    def _resolve_happens_before_predicate(self, pred):
+    def _happens_before_ids(self, pred):
         pos = pre = 0
         for p in self.spec.productions():
             if p.is_enum() and p.rhs[0] == pred.args[0]:
                 pos = p.id
             if p.is_enum() and p.rhs[0] == pred.args[1]:
                 pre = p.id
+        return pos, pre
+
+    def happensBeforeIds(self):
+        '''The (constant, constant that must appear in an earlier line) production ids of the happens_before predicates'''
+        return [self._happens_before_ids(pred) for pred in self.spec.predicates() if pred.name == 'happens_before']
+
+    def _resolve_happens_before_predicate(self, pred, r):
+        pos, pre = self._happens_before_ids(pred)
 
-        for r_i in range(len(self.roots)):
-            previous_roots = []
-            for r_ia in range(r_i):
-                for c in self.roots[r_ia].children:
-                    previous_roots.append(c.var==pre)
+        previous_roots = []
+        for r_ia in range(r.id-1):
+            for c in self.roots[r_ia].children:
+                previous_roots.append(c.var==pre)
 
-            self.z3_solver.add(Implies(Or([c.var==pos for c in self.roots[r_i].children]), Or(previous_roots)))
+        self.z3_solver.add(Implies(Or([c.var==pos for c in r.children]), Or(previous_roots, self.ctx)))
 
 
-    def resolve_predicates(self):
+    def resolve_predicates(self, r=None):
+        '''
+        Encodes the predicates of the spec that constrain line `r` with respect to the lines before it,
+        or, if `r` is None, the predicates over the whole program (these only hold for the current loc).
+        '''
         try:
             for pred in self.spec.predicates():
-                if pred.name == 'is_not_parent':
-                    self._resolve_is_not_parent_predicate(pred)
+                if pred.name == 'constant_occurs':
+                    if r is None:
+                        self._resolve_constant_occurs_predicate(pred)
+                elif r is None:
+                    continue
+                elif pred.name == 'is_not_parent':
+                    self._resolve_is_not_parent_predicate(pred, r)
                 elif pred.name == 'distinct_inputs':
-                    self._resolve_distinct_inputs_predicate(pred)
-                elif pred.name == 'constant_occurs':
-                    self._resolve_constant_occurs_predicate(pred)
+                    self._resolve_distinct_inputs_predicate(pred, r)
                 elif pred.name == 'happens_before':
-                    self._resolve_happens_before_predicate(pred)
+                    self._resolve_happens_before_predicate(pred, r)
                 elif pred.name == 'distinct_filters':
-                    self._resolve_distinct_filters_predicate(pred)
-                else:
+                    self._resolve_distinct_filters_predicate(pred, r)
+                elif r.id == 1:
                     logger.warning('Predicate not handled: {}'.format(pred))
         except (KeyError, ValueError) as e:
             msg = 'Failed to resolve predicates. {}'.format(e)
             raise RuntimeError(msg) from None
 
-    def __init__(self, spec, depth=None, loc=None, sym_breaker=True, break_sym_online=False):
-        self.z3_solver = Solver()
+    def __init__(self, spec, depth=None, loc=None, sym_breaker=True, break_sym_online=False, sym_solver=False, lex_leader=False, ctx=None):
+        # enumerators that run in different threads need different z3 contexts
+        self.ctx = ctx if ctx is not None else main_ctx()
+        self.z3_solver = Solver(ctx=self.ctx)
 
         # productions that are leaves
         self.leaf_productions = []
@@ -397,14 +465,23 @@ class LinesEnumerator(Enumerator):
 
         # for learning
         self.program2tree = {}
+        # for learning: the (parent line, argument variable, value) of the arguments that use each line of the program
+        self.lineUses = {}
 
-        # z3 variables for each production node
+        # z3 variables for each production node, and their declarations
         self.variables = []
+        self.variableDecls = []
+        # (variable index, value id) -> variable != value, shared by the blocking clauses
+        self.blockingLiterals = dict()
         self.spec = spec
         self.num_constraints = 0
         self.num_variables = 0
         self.sym_breaker = sym_breaker
         self.break_sym_online = break_sym_online
+        # symmetries found online are the topological renumberings of the lattice, unless the solver is asked to find them
+        self.sym_solver = sym_solver
+        # symmetries broken statically, by only allowing the lexicographically smallest order of independent lines
+        self.lex_leader = lex_leader
         if depth <= 0:
             raise ValueError(
                 'Depth cannot be non-positive: {}'.format(depth))
@@ -413,32 +490,21 @@ class LinesEnumerator(Enumerator):
             raise ValueError(
                 'LOC cannot be non-positive: {}'.format(loc))
         self.start_time = time.time()
-        self.loc = loc
 
         self.parentId = dict()
-        if self.sym_breaker:
-            if self.loc > 2:
-                root = Node(1)
-                root.h = 1
-                id, tree = self.createCleanTree(1, root)
-                tree.insert(0, root)
-                self.cleanedTree = tree
-                self.symFinder = SymmetryFinder(self.loc)
-
-            self.lattices = dict()
-            if self.loc > 2 and not self.break_sym_online:
-                self.findLattices()
-
-        self.cleanedModel = dict()
         self.num_prods = self.spec.num_productions()
         self.max_children = self.maxChildren()
         self.diff_models = []
         self.findTypes()
         self.initLeafProductions()
-        self.initLineProductions()
+        # decoding table of the node variables: the production of each value (None for empty children), and
+        # the line (index in self.roots) that each line production refers to
+        self.nodeProductions = dict((p.id, None if str(p).find('Empty') != -1 else p) for p in self.spec.productions())
+        self.productionLines = dict()
+        self.builder = D.Builder(self.spec)
         self.linesVars = []
         self.typeVars = []
-        self.roots, self.leafs = self.buildTrees()
+        self.roots, self.leafs = [], []
         self.model = None
         # Times
         self.symTime = 0
@@ -446,6 +512,7 @@ class LinesEnumerator(Enumerator):
         self.blockingTime = 0
         self.blockModelsTime = 0
         self.solverTime = 0
+        self.encodingTime = 0
         self.time1 = 0
         self.time2 = 0
         self.time3 = 0
@@ -454,25 +521,89 @@ class LinesEnumerator(Enumerator):
         self.totalBlockedModels = 0
         self.blockCicle = 0
         self.addModel = 0
+        self.constructionTime = 0
+        self.numPrograms = 0
+
+        self.loc = 0
+        # constraints that only hold for the current loc are guarded by this literal, which is assumed by every check
+        self.locLiteral = None
+        for l in range(loc):
+            self.addLine()
+        self.encodeLoc()
+
+    def addLine(self):
+        '''Adds a new line to the program, with the variables and constraints that do not depend on the lines after it'''
+        self.loc += 1
+        if self.loc > 1:
+            self.initLineProductions(self.loc - 1)
+        root, children = self.buildTree(self.loc)
+        self.roots.append(root)
+        self.leafs += children
+        self.createTypeConstraints(root)
+        self.createChildrenConstraints(root)
+        self.resolve_predicates(root)
+        if self.lex_leader and self.loc > 1:
+            self.createLexLeaderConstraints()
+
+    def addScoped(self, ctr):
+        '''Adds a constraint that only holds while the program has `self.loc` lines'''
+        self.z3_solver.add(Implies(self.locLiteral, ctr))
+
+    def encodeLoc(self):
+        '''Encodes the constraints over the whole program of `self.loc` lines and finds its first model'''
+        self.locLiteral = Bool('loc_'+str(self.loc), self.ctx)
+        if self.sym_breaker:
+            if self.loc > 2:
+                root = Node(1)
+                root.h = 1
+                id, tree = self.createCleanTree(1, root)
+                tree.insert(0, root)
+                self.cleanedTree = tree
+                # position of every node of the tree in the lattice string written by writeLattice
+                self.latticePositions = dict()
+                self.indexLattice(root)
+                self.symFinder = SymmetryFinder(self.loc, self.ctx)
+
+            # lattices that were looked up or found online, and the lattices of the lattice file
+            self.lattices = dict()
+            self.latticeStore = dict()
+            if self.loc > 2 and not self.break_sym_online:
+                self.findLattices()
 
-        self.modelConstraint = 0
+        self.cleanedModel = dict()
+        # blocking clauses are satisfied by this literal once the enumerator moves on to the next loc
+        self.locGuard = Not(self.locLiteral)
         self.createInputConstraints()
         self.createOutputConstraints()
         self.createLinesConstraints()
-        self.createTypeConstraints()
-        self.createChildrenConstraints()
         self.resolve_predicates()
+        self.encodingTime = time.time() - self.start_time
         logger.error('Number of Nodes: {} '.format(len(self.roots+self.leafs)))
         logger.error('Number of Variables: {}'.format(len(self.variables+self.typeVars+self.linesVars)))
         logger.error('Number of Constraints: {}'.format(self.num_constraints))
-        logger.error('Time spent encoding: {}'.format(time.time() - self.start_time))
-        res = self.z3_solver.check()
+        logger.error('Time spent encoding: {}'.format(self.encodingTime))
+        self.model = None
+        start_time = time.time()
+        res = self.z3_solver.check(self.locLiteral)
+        self.solverTime += time.time() - start_time
         if res != sat:
             # UNSAT
             logger.error("UNSAT : There is no solution for current depth (loc="+str(self.loc-1)+"), try to increase it (e.g. loc="+str(self.loc)+").")
             return
         self.model = self.z3_solver.model()
-        self.getModelConstraint()
+        self.getCleanedModel()
+
+    def increaseLoc(self):
+        '''
+        Moves on to the programs with one more line, reusing the solver: only the variables and constraints of the new line are added,
+        the constraints of the previous loc (output line, blocked models and blamed programs) are retracted.
+        '''
+        logger.error('LOC {}: encoding time {}, cumulative solver time {}'.format(self.loc, self.encodingTime, self.solverTime))
+        self.start_time = time.time()
+        self.z3_solver.add(Not(self.locLiteral))
+        self.depth += 1
+        self.addLine()
+        self.encodeLoc()
 
     def getParentId(self, nb_child):
         return self.parentId[nb_child]
@@ -487,57 +618,26 @@ class LinesEnumerator(Enumerator):
         return len(node.children)-1
 
     def findLattices(self):
-        # lattices = dict()
-        # try:
-        lats = open("tyrell/enumerator/lattices/loc-"+str(self.loc), "r+")
-        lats = lats.readlines()
-        for l in lats:
-            # print(l)
-            lat, mods = l.split(":",1)
-            models = []
-            if mods[:-1] != '':
-                mods = mods[:-1].replace(" ","").split("|", self.loc*2)
-                for m in mods:
-                    if m == "":
-                        continue
-                    model = dict()
-                    m = m[1:-1].split(",")
-                    if m == ['']:
-                        break
-                    for c in m:
-                        c = c.split("=") if "=" in c else c.split(":")
-                        # print(c)
-                        model[Int(c[0])] = Int(c[1])
-                    # print(model)
-                    models.append(model)
-            if lat not in self.lattices:
-                self.lattices[lat] = models
-        # print(lattices)
-        # return lattices
-        # except:
-        #     print(lattices)
-        #     return lattices
+        self.latticeStore = readLattices(self.loc)
+
+    def indexLattice(self, node):
+        self.latticePositions[node.nb] = len(self.latticePositions)
+        for c in node.children:
+            self.indexLattice(c)
+
+    def getLatticeSignature(self, pos):
+        '''The signature of the lattice with the lines in `pos`, without writing its string'''
+        return packSignature(sorted((self.latticePositions[nb], line) for nb, line in pos.items()))
 
     def closeLattices(self):
         logger.error('Total Solver Time: {}'.format(self.solverTime))
         logger.error('Total Time Symmetries: {}'.format(self.totalSymTime))
         logger.error('Total Blocked Models: {}'.format(self.totalBlockedModels))
+        logger.error('Program Construction: {} programs, {:.4f} ms per program'.format(
+            self.numPrograms, self.constructionTime * 1000 / max(1, self.numPrograms)))
         if self.loc < 6 or self.break_sym_online or not self.sym_breaker:
             return
-
-        lats = open("tyrell/enumerator/lattices/loc-"+str(self.loc), "w+")
-
-        for l, mdls in self.lattices.items():
-            st = l + ":"
-            if mdls != []:
-                for m in mdls:
-                    st += str(m) + "|"
-
-                lats.write(st[:-1]+"\n")
-            else:
-                lats.write(st+"[]\n")
-
-        lats.close()
+        getLatticeCache(latticeCachePath).flush()
 
     def createCleanTree(self, id, node):
         j = id
@@ -587,36 +687,45 @@ class LinesEnumerator(Enumerator):
                     self.createLattice(node_child, l_ind+1, dic)
                     break
 
+    def getLattice(self, signature):
+        '''The models of a lattice, or None if the lattice is unknown'''
+        models = self.lattices.get(signature)
+        if models is None:
+            models = self.latticeStore.get(signature)
+            if models is not None:
+                self.lattices[signature] = models
+        return models
+
     def findSymmetries(self):
         pos = dict()
         pos[1] = self.loc
         root = self.cleanedTree[0]
         self.createLattice(root, self.loc, pos)
+        lat = self.getLatticeSignature(pos)
+        models = self.getLattice(lat)
+        if models is not None:
+            return models
         if not self.break_sym_online and self.loc < 6:
             # print("offline")
-            try:
-                return self.lattices[writeLattice(root, pos)]
-            except:
-                return []
-        else:
+            return []
+        # lattices of loc > 5 found online are shared with other runs through the lattice cache
+        cache = getLatticeCache(latticeCachePath) if not self.break_sym_online else None
+        models = cache.get(self.loc, lat) if cache is not None else None
+        if models is None:
             # print("online")
-            lat = writeLattice(root, pos)
-            try:
-                # print(self.lattices[lat])
-                return self.lattices[lat]
-            except:
-                last_line = Node(self.loc)
-                last_line.h = 0
-                self.createCompleteLattice(last_line)
-                models = self.symFinder.findSymmetries(last_line)
-                self.lattices[lat] = models
-                # print(lat,":",models)
-                if self.loc > 5 and not self.break_sym_online:
-                    self.findLattices()
-                    self.closeLattices()
-                # print("updated")
-                # exit()
-                return models
+            last_line = Node(self.loc)
+            last_line.h = 0
+            self.createCompleteLattice(last_line)
+            if self.sym_solver:
+                models = [tuple(m[Int('x_'+str(x), self.ctx)].as_long() for x in range(1, self.loc))
+                          for m in self.symFinder.findSymmetries(last_line)]
+            else:
+                models = self.symFinder.findRenumberings(last_line)
+            # print(lat,":",models)
+            if cache is not None:
+                cache.put(self.loc, lat, models)
+        self.lattices[lat] = models
+        return models
 
     def changeNode(self, node_pos, new_node_pos, new_model, model):
         root, new_root = self.roots[node_pos-1], self.roots[int(str(new_node_pos))-1]
@@ -634,13 +743,14 @@ class LinesEnumerator(Enumerator):
         new_model[new_root.type] = model[root.type]
 
     def fromSymmetries2Programs(self, model, m_aux):
+        # model[i-1] is the line that line i moves to
         time_3 = time.time()
         for t in range(len(self.typeVars)-1):
             k = self.typeVars[t]
             m_aux[k] = self.model[k] # NEW
             root_num = t+1
             type = int(str(self.model[k]))
-            new_node = int(str(model[Int('x_'+str(root_num))]))
+            new_node = model[root_num-1]
             old_prod = self.line_productions[root_num-1][type].id
             new_prod = self.line_productions[new_node-1][type].id
             start = root_num*self.max_children
@@ -648,16 +758,14 @@ class LinesEnumerator(Enumerator):
                 n = self.leafs[i]
                 if self.model[n.var] == old_prod:
                     #DEBUG print("type var:", n, old_prod, "--->", new_prod)
-                    m_aux[n.var] = IntVal(new_prod)
+                    m_aux[n.var] = IntVal(new_prod, self.ctx)
                     break
         m_aux[self.typeVars[-1]] = self.model[self.typeVars[-1]]
         #TIME self.time3 += time.time() - time_3
 
         #TIME time_4 = time.time()
         n_model = dict(m_aux)
-        for v in model:
-            var, new_node_pos = v, int(str(model[v]))
-            node_pos = int(str(var).split("_")[1])
+        for node_pos, new_node_pos in enumerate(model, 1):
             #DEBUG print("num root:",node_pos, "--->", new_node_pos)
             n_model[self.roots[new_node_pos-1].var] = self.model[self.roots[node_pos-1].var]
             #DEBUG print("root:", Int('n'+str(node_nb)), "--->", Int('n'+str(new_node_nb)))
@@ -674,19 +782,26 @@ class LinesEnumerator(Enumerator):
         #DEBUG print(),print(),print()
         return n_model
 
-    def getModelConstraint(self):
-        block = []
-        for x in self.variables:
-            block.append(x != Int('val_'+str(x)))
-        self.modelConstraint = Or(block)
-
+    def getCleanedModel(self):
         for m in self.model:
-            self.cleanedModel[m()] = IntVal(0)
+            self.cleanedModel[m()] = IntVal(0, self.ctx)
 
     def blockModelAux(self, model):
         # block the model using only the variables that correspond to productions (nodes = leafs + roots)
+        # the clause is assembled from cached (variable != value) literals through the C API, as building
+        # every literal with the python API (or substituting the values in a template) dominates the cost
         #TIME cicle_time = time.time()
-        const = substitute(self.modelConstraint, [(Int('val_'+str(x)), model[x]) for x in self.variables])
+        block = (Ast * (len(self.variables) + 1))()
+        block[0] = self.locGuard.as_ast()
+        for i, x in enumerate(self.variables):
+            value = model[x]
+            # values are numerals, which z3 shares, so their ids identify them while the cached literal keeps them alive
+            key = (i, value.get_id())
+            literal = self.blockingLiterals.get(key)
+            if literal is None:
+                literal = self.blockingLiterals[key] = x != value
+            block[i + 1] = literal.as_ast()
+        const = BoolRef(Z3_mk_or(self.ctx.ref(), len(block), block), self.ctx)
         #TIME  self.blockCicle += time.time() - cicle_time
 
         #TIME  add_time = time.time()
@@ -725,9 +840,13 @@ class LinesEnumerator(Enumerator):
         if info is not None and not isinstance(info, str):
             for core in info:
                 ctr = []
+                blamed = [constraint[0] for constraint in core]
                 for constraint in core:
-                    ctr.append(self.program2tree[constraint[0]] != constraint[1].id)
-                self.z3_solver.add(Or(ctr))
+                    # a node shared by several positions of the program is blamed in all of them
+                    ctr += [x != constraint[1].id for x in self.program2tree[constraint[0]]]
+                    # a line blamed with the line that uses it is blamed in the argument where it is used
+                    ctr += [x != value for parent, x, value in self.lineUses.get(constraint[0], ()) if any(parent is n for n in blamed)]
+                self.addScoped(Or(ctr, self.ctx))
         else:
             self.blockedModels = 0
             self.blockModel()
@@ -737,55 +856,48 @@ class LinesEnumerator(Enumerator):
                 logger.error('Total Time Symmetries: {}'.format(self.totalSymTime))
 
 
-    def makeNode(self, c, builder_nodes, builder):
-        if str(c.production).find('Empty') == -1:
-            if c.children is None:
-                builder_nodes[c.nb-1] = builder.make_node(c.production.id, [])
-                self.program2tree[builder_nodes[c.nb-1]] = c.var
-            else:
-                children = []
-                for r_c in c.children:
-                    if builder_nodes[r_c.nb-1] is None:
-                        self.makeNode(r_c, builder_nodes, builder)
-
-                    children.append(builder_nodes[r_c.nb-1])
-                    self.program2tree[builder_nodes[r_c.nb-1]] = r_c.var
-
-                builder_nodes[c.nb-1] = builder.make_node(c.production.id, [c for c in children if c is not None])
-                self.program2tree[builder_nodes[c.nb-1]] = c.var
+    def modelValues(self):
+        '''The values of self.variables in the current model, read through the C API (the python API costs ~10x more)'''
+        for x in self.variables[len(self.variableDecls):]:
+            self.variableDecls.append(x.decl())
+        ctx, model = self.ctx.ref(), self.model.model
+        return [int(Z3_get_numeral_string(ctx, Z3_model_get_const_interp(ctx, model, d.ast))) for d in self.variableDecls]
 
     def constructProgram(self):
-        model = self.model
-        roots = deepcopy(self.roots)
+        '''
+        Builds the program of the current model. The values of the node variables (in self.variables, node nb
+        is at nb-1) are decoded with the decoding table, and a child that refers to an earlier line reuses its node.
+        '''
+        start_time = time.time()
+        values = self.modelValues()
         self.program2tree.clear()
+        self.lineUses.clear()
 
-        for r in roots:
-            r.production = self.spec.get_production(int(str(model[r.var])))
-            root = k = None
+        lines = []
+        for r in self.roots:
+            children, uses = [], []
             for c in r.children:
-                c.production = self.spec.get_production(int(str(model[c.var])))
-                if c.production is None:
-                    for l in c.lines:
-                        if model[l] == 1:
-                            s = "line_"+str(l).split("_")[1]
-                            c.production = s
-                            break
-            #DEBUG print(line[:-1]+")")
-            # logger.info(line[:-1]+")")
-
-        builder = D.Builder(self.spec)
-        num_nodes = self.roots+self.leafs
-        builder_nodes = [None] * len(num_nodes)
-
-        for r in roots:
-            for c in range(len(r.children)):
-                if "line_" in str(r.children[c].production):
-                    root = int(r.children[c].production.split("_")[1]) - 1
-                    r.children[c] = roots[root]
-            self.makeNode(r, builder_nodes, builder)
+                value = values[c.nb-1]
+                line = self.productionLines.get(value)
+                if line is not None:
+                    node = lines[line]
+                    uses.append((node, c.var, value))
+                else:
+                    production = self.nodeProductions[value]
+                    if production is None:
+                        continue
+                    node = self.builder.make_node(value)
+                    self.program2tree.setdefault(node, []).append(c.var)
+                children.append(node)
+            node = self.builder.make_node(values[r.nb-1], children)
+            self.program2tree.setdefault(node, []).append(r.var)
+            for child, var, value in uses:
+                self.lineUses.setdefault(child, []).append((node, var, value))
+            lines.append(node)
 
-        # print(builder_nodes[roots[-1].nb-1])
-        return builder_nodes[roots[-1].nb-1]
+        self.constructionTime += time.time() - start_time
+        self.numPrograms += 1
+        return lines[-1]
 
 
     # use to count number of models enumerated
@@ -832,7 +944,7 @@ class LinesEnumerator(Enumerator):
     def next(self):
         while True:
             start_time = time.time()
-            res = self.z3_solver.check()
+            res = self.z3_solver.check(self.locLiteral)
             # logger.error('Solver Check Time: {}'.format(time.time()-start_time))
             self.solverTime += time.time()-start_time
             if res != sat:
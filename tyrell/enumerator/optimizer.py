@@ -5,18 +5,22 @@ from .. import dsl as D
 class Optimizer:
 
     # additional variables to track if a production occurs or not in a program
-    var_occurs = []
+    var_occurs = None
 
     # relaxation variables
-    relax_vars = []
+    relax_vars = None
 
     # keeps track of the current assumptions
-    assumptions = []
+    assumptions = None
 
     # keeps track of the cost of each relaxation variable
-    cost_relax_vars = {}
+    cost_relax_vars = None
 
     def __init__(self, solver, spec, variables, func_vars, nodes):
+        self.var_occurs = []
+        self.relax_vars = []
+        self.assumptions = []
+        self.cost_relax_vars = {}
         self.bound = 0
         self.ub = 0
         self.solver = solver
@@ -31,7 +35,7 @@ class Optimizer:
     def createVariablesOccurrence(self):
         for x in range(0, self.spec.num_productions()):
             name = 'occ' + str(x)
-            v = Int(name)
+            v = Int(name, self.solver.ctx)
             self.var_occurs.append(v)
             self.solver.add(And(v >= 0, v <= 1))
 
@@ -63,7 +67,7 @@ class Optimizer:
                 if weight != 100:
                     # FIXME: reduce duplication of code
                     name = 'relax' + str(self.id)
-                    v = Int(name)
+                    v = Int(name, self.solver.ctx)
                     self.cost_relax_vars[v] = weight
                     self.relax_vars.append(v)
                     self.objective.append(Product(weight, v))
@@ -78,12 +82,12 @@ class Optimizer:
                             self.variables[n.children[p].id - 1] == child.id)
 
                     self.solver.add(
-                        Or(Implies(Or(ctr_children), self.variables[n.id - 1] != parent.id), v == 1))
+                        Or(Implies(Or(ctr_children, self.solver.ctx), self.variables[n.id - 1] != parent.id), v == 1))
                     # relation between relaxation variables and constraint
                     self.solver.add(Implies(v == 1, Or(
-                        self.variables[n.id - 1] == parent.id, Not(Or(ctr_children)))))
+                        self.variables[n.id - 1] == parent.id, Not(Or(ctr_children, self.solver.ctx)))))
                     self.solver.add(
-                        Implies(And(self.variables[n.id - 1] != parent.id, Or(ctr_children)), v == 0))
+                        Implies(And(self.variables[n.id - 1] != parent.id, Or(ctr_children, self.solver.ctx)), v == 0))
                     self.id = self.id + 1
                 else:
                     ctr_children = []
@@ -92,7 +96,7 @@ class Optimizer:
                             self.variables[n.children[p].id - 1] == child.id)
 
                     self.solver.add(
-                        Implies(Or(ctr_children), self.variables[n.id - 1] != parent.id))
+                        Implies(Or(ctr_children, self.solver.ctx), self.variables[n.id - 1] != parent.id))
 
     # FIXME: dissociate the creation of variables with the creation of constraints?
     def mk_is_parent(self, parent, child, weight=None):
@@ -110,7 +114,7 @@ class Optimizer:
                 if weight != None:
                     # FIXME: reduce duplication of code
                     name = 'relax' + str(self.id)
-                    v = Int(name)
+                    v = Int(name, self.solver.ctx)
                     self.cost_relax_vars[v] = weight
                     self.relax_vars.append(v)
                     self.objective.append(Product(weight, v))
@@ -125,12 +129,12 @@ class Optimizer:
                             self.variables[n.children[p].id - 1] == child.id)
 
                     self.solver.add(
-                        Or(Implies(self.variables[n.id - 1] == parent.id, Or(ctr_children)), v == 1))
+                        Or(Implies(self.variables[n.id - 1] == parent.id, Or(ctr_children, self.solver.ctx)), v == 1))
                     # relation between relaxation variables and constraint
                     self.solver.add(Implies(v == 1, Or(
-                        self.variables[n.id - 1] != parent.id, Not(Or(ctr_children)))))
+                        self.variables[n.id - 1] != parent.id, Not(Or(ctr_children, self.solver.ctx)))))
                     self.solver.add(
-                        Implies(And(self.variables[n.id - 1] == parent.id, Or(ctr_children)), v == 0))
+                        Implies(And(self.variables[n.id - 1] == parent.id, Or(ctr_children, self.solver.ctx)), v == 0))
                     self.id = self.id + 1
                 else:
                     ctr_children = []
@@ -139,7 +143,7 @@ class Optimizer:
                             self.variables[n.children[p].id - 1] == child.id)
 
                     self.solver.add(
-                        Implies(self.variables[n.id - 1] == parent.id, Or(ctr_children)))
+                        Implies(self.variables[n.id - 1] == parent.id, Or(ctr_children, self.solver.ctx)))
 
     def mk_at_most_k(self, prod, k):
         return
@@ -169,7 +173,7 @@ class Optimizer:
             for p in prod:
                 eqls.append(self.variables[n.id-1]==p)
         # print(Or(eqls))
-        self.solver.add(Or(eqls))
+        self.solver.add(Or(eqls, self.solver.ctx))
 
     def mk_happens_before(self, pos, pre):
         # return
@@ -178,8 +182,8 @@ class Optimizer:
             pre_cond = []
             for p in range(n+1,len(self.nodes)):
                 pre_cond.append(self.variables[self.nodes[p].id - 1]==pre)
-            # print(Implies(self.variables[self.nodes[n].id - 1] == pos, Or(pre_cond)))
-            self.solver.add(Implies(self.variables[self.nodes[n].id - 1] == pos, Or(pre_cond)))
+            # print(Implies(self.variables[self.nodes[n].id - 1] == pos, Or(pre_cond, self.solver.ctx)))
+            self.solver.add(Implies(self.variables[self.nodes[n].id - 1] == pos, Or(pre_cond, self.solver.ctx)))
 
 
     def mk_not_occurs(self, production, weight=None):
@@ -189,7 +193,7 @@ class Optimizer:
 
         if weight != None:
             name = 'relax' + str(self.id)
-            v = Int(name)
+            v = Int(name, self.solver.ctx)
             self.cost_relax_vars[v] = weight
             self.relax_vars.append(v)
             self.objective.append(Product(weight, v))
@@ -216,7 +220,7 @@ class Optimizer:
 
         if weight != 100:
             name = 'relax' + str(self.id)
-            v = Int(name)
+            v = Int(name, self.solver.ctx)
             self.cost_relax_vars[v] = weight
             self.relax_vars.append(v)
             self.objective.append(Product(weight, v))
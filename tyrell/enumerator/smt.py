@@ -25,20 +25,23 @@ class ASTNode:
 
 # FIXME: Currently this enumerator requires an "Empty" production to function properly
 class SmtEnumerator(Enumerator):
+    # z3 context of the solver and its variables
+    ctx = None
+
     # z3 solver
-    z3_solver = Solver()
+    z3_solver = None
 
     # productions that are leaf
-    leaf_productions = []
+    leaf_productions = None
 
     # z3 variables for each production node
-    variables = []
+    variables = None
 
     # z3 variables to denote if a node is a function or not
-    variables_fun = []
+    variables_fun = None
 
     # map from internal k-tree to nodes of program
-    program2tree = {}
+    program2tree = None
 
     def initLeafProductions(self):
         for p in self.spec.productions():
@@ -49,13 +52,13 @@ class SmtEnumerator(Enumerator):
     def createVariables(self, solver):
         for x in range(0, len(self.nodes)):
             name = 'n' + str(x + 1)
-            v = Int(name)
+            v = Int(name, self.ctx)
             self.variables.append(v)
             # variable range constraints
             solver.add(And(v >= 0, v < self.spec.num_productions()))
             self.num_constraints += 1
             hname = 'h' + str(x + 1)
-            h = Int(hname)
+            h = Int(hname, self.ctx)
             self.variables_fun.append(h)
             # high variables range constraints
             solver.add(And(h >= 0, h <= 1))
@@ -281,8 +284,17 @@ class SmtEnumerator(Enumerator):
             msg = 'Failed to resolve predicates. {}'.format(e)
             raise RuntimeError(msg) from None
 
-    def __init__(self, spec, depth=None, loc=None):
+    def __init__(self, spec, depth=None, loc=None, ctx=None):
+        '''
+        The encoding is built in the z3 context `ctx` (the global one by default), which must not be used by other threads.
+        '''
         self.spec = spec
+        self.ctx = ctx if ctx is not None else main_ctx()
+        self.z3_solver = Solver(ctx=self.ctx)
+        self.leaf_productions = []
+        self.variables = []
+        self.variables_fun = []
+        self.program2tree = {}
         self.num_constraints = 0
         if depth <= 0:
             raise ValueError(
@@ -322,7 +334,7 @@ class SmtEnumerator(Enumerator):
         # block the model using only the variables that correspond to productions
         for x in self.variables:
             block.append(x != self.model[x])
-        ctr = Or(block)
+        ctr = Or(block, self.ctx)
         self.z3_solver.add(ctr)
 
     def update(self, info=None):
@@ -330,15 +342,10 @@ class SmtEnumerator(Enumerator):
         # self.blockModel() # do I need to block the model anyway?
         if info is not None and not isinstance(info, str):
             for core in info:
-                ctr = None
-                for constraint in core:
-                    if ctr is None:
-                        ctr = self.variables[self.program2tree[constraint[0]
-                                                               ].id - 1] != constraint[1].id
-                    else:
-                        ctr = Or(
-                            ctr, self.variables[self.program2tree[constraint[0]].id - 1] != constraint[1].id)
-                self.z3_solver.add(ctr)
+                # a node shared by several positions of the program is blamed in all of them
+                ctr = [self.variables[n.id - 1] != constraint[1].id
+                       for constraint in core for n in self.program2tree[constraint[0]]]
+                self.z3_solver.add(Or(ctr, self.ctx))
         else:
             self.blockModel()
 
@@ -371,7 +378,7 @@ class SmtEnumerator(Enumerator):
                             children.append(builder_nodes[c.id - 1])
                 n = code[self.nodes[y].id - 1].id
                 builder_nodes[y] = builder.make_node(n, children)
-                self.program2tree[builder_nodes[y]] = self.nodes[y]
+                self.program2tree.setdefault(builder_nodes[y], []).append(self.nodes[y])
 
         assert(builder_nodes[0] is not None)
         # print(builder_nodes[0])
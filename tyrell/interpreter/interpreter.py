@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, List, Any
+from typing import Callable, Iterable, List, Any, Optional
 from ..dsl import Node
 from .error import AssertionViolation
+from .memo import MemoTable
 
 
 class Interpreter(ABC):
+    _memo: Optional[MemoTable] = None
 
     @abstractmethod
     def eval(self, prog: Node, inputs: List[Any]) -> Any:
@@ -14,6 +16,24 @@ class Interpreter(ABC):
         '''
         raise NotImplementedError
 
+    @property
+    def memo(self) -> Optional[MemoTable]:
+        return self._memo
+
+    def set_memo(self, memo: Optional[MemoTable]) -> None:
+        '''
+        Share `memo` between all evaluations done through this interpreter, or stop memoizing if `memo` is None.
+        Memoized values are reused as they are, so `eval_XXX` methods must not mutate their arguments.
+        '''
+        self._memo = memo
+
+    def release(self) -> None:
+        '''
+        Called once the current candidate program has been decided. Interpreters whose values live outside of Python (e.g. tables in an external runtime) can free the ones that are no longer needed here.
+        By default, do nothing.
+        '''
+        pass
+
     def assertArg(
             self,
             node: Node,
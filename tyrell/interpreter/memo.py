@@ -0,0 +1,100 @@
+from typing import Any, Callable, Iterator, Optional, Tuple
+from collections import OrderedDict
+from ..dsl import Node
+
+
+class _SubtreeKey:
+    '''Wraps an AST node so that it is hashed and compared structurally'''
+    _node: Node
+    _hash: int
+
+    def __init__(self, node: Node):
+        self._node = node
+        self._hash = node.deep_hash()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _SubtreeKey) and \
+            self._hash == other._hash and \
+            self._node.deep_eq(other._node)
+
+
+class MemoTable:
+    '''
+    A LRU table that maps AST subtrees to their already-evaluated values.
+    Subtrees are compared structurally, so the value computed for a subtree of one candidate program is reused by every later candidate that contains the same subtree.
+    A table must only be shared by evaluations on the same inputs.
+    '''
+    _table: 'OrderedDict[_SubtreeKey, Any]'
+    _max_size: Optional[int]
+    _on_evict: Optional[Callable[[Any], None]]
+    _hits: int
+    _misses: int
+
+    def __init__(self, max_size: Optional[int] = None, on_evict: Optional[Callable[[Any], None]] = None):
+        '''
+        Create an empty table holding at most `max_size` values, or an unbounded one if `max_size` is None.
+        `on_evict`, if given, is called with every value that leaves the table.
+        '''
+        if max_size is not None and max_size <= 0:
+            raise ValueError(
+                'Memo table size must be positive: {}'.format(max_size))
+        self._table = OrderedDict()
+        self._max_size = max_size
+        self._on_evict = on_evict
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, node: Node) -> Tuple[bool, Any]:
+        '''
+        Return a pair `(found, value)`. `value` is the memoized value of `node` if `found` is True, and None otherwise.
+        '''
+        key = _SubtreeKey(node)
+        if key in self._table:
+            self._table.move_to_end(key)
+            self._hits += 1
+            return True, self._table[key]
+        self._misses += 1
+        return False, None
+
+    def insert(self, node: Node, value: Any) -> None:
+        '''
+        Memoize `value` as the value of `node`, evicting the least recently used entry if the table is full.
+        '''
+        key = _SubtreeKey(node)
+        self._table[key] = value
+        self._table.move_to_end(key)
+        if self._max_size is not None and len(self._table) > self._max_size:
+            _, evicted = self._table.popitem(last=False)
+            if self._on_evict is not None:
+                self._on_evict(evicted)
+
+    def clear(self) -> None:
+        if self._on_evict is not None:
+            for value in self._table.values():
+                self._on_evict(value)
+        self._table.clear()
+
+    def values(self) -> Iterator[Any]:
+        return iter(self._table.values())
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        return 'MemoTable(size={}, max_size={}, hits={}, misses={})'.format(
+            len(self._table), self._max_size, self._hits, self._misses)
@@ -4,6 +4,7 @@ from .. import spec as S
 from .. import dsl as D
 from .post_order import PostOrderInterpreter
 from .error import GeneralError
+from .memo import MemoTable
 
 
 class BoolInterpreter(PostOrderInterpreter):
@@ -35,6 +36,19 @@ class BoolInterpreter(PostOrderInterpreter):
         return True
 
 
+class CountingBoolInterpreter(BoolInterpreter):
+    def __init__(self):
+        self.num_evals = 0
+
+    def eval_and(self, node, args):
+        self.num_evals += 1
+        return super().eval_and(node, args)
+
+    def eval_not(self, node, args):
+        self.num_evals += 1
+        return super().eval_not(node, args)
+
+
 spec_str = '''
     enum BoolLit {
       "false", "true"
@@ -112,6 +126,51 @@ class TestSimpleInterpreter(unittest.TestCase):
                 ctx.observed, [p, nacap0, acap0, c, lit, ap0, p0])
             self.assertListEqual(ctx.evaluated, [lit, c, p0])
 
+    def test_memo(self):
+        interp = CountingBoolInterpreter()
+        memo = MemoTable()
+        interp.set_memo(memo)
+        p0 = self._builder.from_sexp_string(
+            '(and (not (@param 0)) (@param 1))')
+        # A structurally identical program built from different nodes:
+        # the builder shares identical subtrees, so another builder is used
+        p1 = D.Builder(spec).from_sexp_string(
+            '(and (not (@param 0)) (@param 1))')
+        self.assertIsNot(p1, p0)
+        p2 = self._builder.from_sexp_string('(not (not (@param 0)))')
+
+        self.assertEqual(interp.eval(p0, [False, True]), True)
+        self.assertEqual(interp.num_evals, 2)
+        self.assertEqual(interp.eval(p1, [False, True]), True)
+        self.assertEqual(interp.num_evals, 2)
+        self.assertEqual(interp.eval(p2, [False, True]), False)
+        self.assertEqual(interp.num_evals, 3)
+        self.assertEqual(memo.hits, 2)
+        self.assertEqual(memo.misses, 3)
+        self.assertEqual(len(memo), 3)
+
+    def test_memo_lru(self):
+        b = self._builder
+        evicted = []
+        memo = MemoTable(max_size=2, on_evict=evicted.append)
+        n0 = b.from_sexp_string('(not (@param 0))')
+        n1 = b.from_sexp_string('(not (@param 1))')
+        n2 = b.from_sexp_string('(and (@param 0) (@param 1))')
+        memo.insert(n0, 0)
+        memo.insert(n1, 1)
+        self.assertEqual(memo.lookup(n0), (True, 0))
+        memo.insert(n2, 2)
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.lookup(n1), (False, None))
+        self.assertEqual(memo.lookup(n0), (True, 0))
+        self.assertEqual(memo.lookup(n2), (True, 2))
+        self.assertEqual(evicted, [1])
+        self.assertEqual(sorted(memo.values()), [0, 2])
+        memo.clear()
+        self.assertEqual(sorted(evicted), [0, 1, 2])
+        with self.assertRaises(ValueError):
+            MemoTable(max_size=0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -41,6 +41,8 @@ class TypeCollector(Visitor_Recursive):
                 ptype = ExprType.BOOL
             elif ptype_name == 'expr_int':
                 ptype = ExprType.INT
+            elif ptype_name == 'expr_set':
+                ptype = ExprType.SET
             else:
                 msg = 'Unknown property type: {}'.format(ptype_name)
                 raise ParseTreeProcessingError(msg)
@@ -158,6 +160,8 @@ class ProductionCollecotr(Visitor_Recursive):
                 operator = BinaryOperator.DIV
             elif operator == 'expr_mod':
                 operator = BinaryOperator.MOD
+            elif operator == 'expr_intersect':
+                operator = BinaryOperator.INTERSECT
             else:
                 raise ValueError(
                     'Unrecognized binary operator: {}'.format(operator))
@@ -170,6 +174,8 @@ class ProductionCollecotr(Visitor_Recursive):
                 operator = BinaryOperator.ADD
             elif operator == 'expr_sub':
                 operator = BinaryOperator.SUB
+            elif operator == 'expr_union':
+                operator = BinaryOperator.UNION
             else:
                 raise ValueError(
                     'Unrecognized binary operator: {}'.format(operator))
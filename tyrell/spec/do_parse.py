@@ -1,9 +1,13 @@
+import threading
 from .parser import Lark_StandAlone
 from .desugar import desugar
 
 # This has to be global since Lark_StandAlone() is not re-entrant.
 # See https://github.com/lark-parser/lark/issues/299
 parser = Lark_StandAlone()
+# For the same reason, specs parsed in different threads are parsed one at a time:
+# the contextual lexer keeps the state of the parse on the shared parser.
+parser_lock = threading.Lock()
 
 
 def parse(input_str):
@@ -11,7 +15,8 @@ def parse(input_str):
     Parse Tyrell spec from an input string.
     May raise either ``ParseError`` or ``ParseTreeProcessingError``.
     '''
-    parse_tree = parser.parse(input_str)
+    with parser_lock:
+        parse_tree = parser.parse(input_str)
     return desugar(parse_tree)
 
 
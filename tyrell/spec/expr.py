@@ -8,6 +8,10 @@ class ExprType(Enum):
     VALUE = "value"  # We don't track the exact user-defined type here
     BOOL = "bool"
     INT = "int"
+    SET = "set"  # A set of small integers, as a bitmask of SET_WIDTH bits
+
+
+SET_WIDTH = 64
 
 
 @unique
@@ -37,6 +41,8 @@ class BinaryOperator(Enum):
     MUL = "*"
     DIV = "/"
     MOD = "%"
+    UNION = "|"
+    INTERSECT = "&"
 
     EQ = "=="
     NE = "!="
@@ -56,6 +62,8 @@ _binary_param_sig: Dict[BinaryOperator, ExprType] = {
     BinaryOperator.MUL: ExprType.INT,
     BinaryOperator.DIV: ExprType.INT,
     BinaryOperator.MOD: ExprType.INT,
+    BinaryOperator.UNION: ExprType.SET,
+    BinaryOperator.INTERSECT: ExprType.SET,
     BinaryOperator.LT: ExprType.INT,
     BinaryOperator.LE: ExprType.INT,
     BinaryOperator.GT: ExprType.INT,
@@ -76,6 +84,8 @@ binary_return_sig: Dict[BinaryOperator, ExprType] = {
     BinaryOperator.MUL: ExprType.INT,
     BinaryOperator.DIV: ExprType.INT,
     BinaryOperator.MOD: ExprType.INT,
+    BinaryOperator.UNION: ExprType.SET,
+    BinaryOperator.INTERSECT: ExprType.SET,
     BinaryOperator.EQ: ExprType.BOOL,
     BinaryOperator.NE: ExprType.BOOL,
     BinaryOperator.LT: ExprType.BOOL,
@@ -92,6 +102,9 @@ def binary_return_type(op: BinaryOperator):
     return binary_return_sig[op]
 
 
+_ordered_operators = frozenset([BinaryOperator.LT, BinaryOperator.LE, BinaryOperator.GT, BinaryOperator.GE])
+
+
 class Expr(ABC):
 
     @abstractmethod
@@ -224,6 +237,11 @@ class BinaryExpr(Expr):
             if lhs.type is not rhs.type:
                 raise ValueError(
                     'Expression must have the same type: {} and {}'.format(lhs, rhs))
+        elif operator in _ordered_operators and lhs.type is ExprType.SET:
+            # Sets are ordered by inclusion
+            if rhs.type is not ExprType.SET:
+                raise ValueError(
+                    'Expression is expected to have type {}: {}'.format(ExprType.SET, rhs))
         else:
             expect_ty = binary_param_type(operator)
             if lhs.type is not expect_ty:
@@ -939,12 +939,8 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[0] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
-  '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
-  '\r\n'
-  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
-  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
+[('(?P<COMMENT>(?:\\#.*\\\n|\\(\\*(.|\n)+\\*\\)))|(?P<WS>(?:[ \t\x0c\r\n])+)',
+  {1: 'COMMENT', 3: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1083,8 +1079,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[9] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n|\\(\\*(.|\n)+\\*\\)))|(?P<WS>(?:[ \t\x0c\r\n])+)',
-  {1: 'COMMENT', 3: 'WS'})]
+[('(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
+  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1095,12 +1095,8 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[10] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
-  '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
-  '\r\n'
-  '])+)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'LBRACE', 5: 'SEMICOLON'})]
+[('(?P<COMMENT>(?:\\#.*\\\n|\\(\\*(.|\n)+\\*\\)))|(?P<WS>(?:[ \t\x0c\r\n])+)',
+  {1: 'COMMENT', 3: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1111,20 +1107,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[11] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<__ANON_0>\\->)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<LSQB>\\[)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
-  {1: 'NAME',
-   2: 'COMMENT',
-   4: 'WS',
-   5: '__ANON_0',
-   6: 'COMMA',
-   7: 'LBRACE',
-   8: 'LSQB',
-   9: 'RPAR',
-   10: 'SEMICOLON'})]
+  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
+  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1155,8 +1143,16 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<__ANON_0>\\->)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<LSQB>\\[)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: '__ANON_0',
+   6: 'COMMA',
+   7: 'LBRACE',
+   8: 'LSQB',
+   9: 'RPAR',
+   10: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1171,8 +1167,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
+  '])+)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'LBRACE', 5: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1183,12 +1179,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[15] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
-  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1203,8 +1199,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<LSQB>\\[)',
-  {1: 'COMMENT', 3: 'WS', 4: 'LSQB'})]
+  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1215,8 +1211,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[17] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n|\\(\\*(.|\n)+\\*\\)))|(?P<WS>(?:[ \t\x0c\r\n])+)',
-  {1: 'COMMENT', 3: 'WS'})]
+[('(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<LSQB>\\[)',
+  {1: 'COMMENT', 3: 'WS', 4: 'LSQB'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1275,12 +1275,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[21] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
-  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1307,12 +1307,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[23] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
+  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1371,12 +1371,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[27] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1387,12 +1387,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[28] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1407,8 +1407,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
+  '])+)|(?P<PREDICATE>predicate)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1579,12 +1579,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[40] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1611,12 +1611,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[42] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<PREDICATE>predicate)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1657,10 +1657,10 @@ LEXERS[45] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'COMMENT', 3: 'STRLIT', 4: 'WS'})]
+  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
+  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1689,10 +1689,10 @@ LEXERS[47] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ENUMSET>enumset)|(?P<PROGRAM>program)|(?P<VALUE>value)|(?P<ENUM>enum)',
-  {1: 'COMMENT', 3: 'WS', 4: 'ENUMSET', 5: 'PROGRAM', 6: 'VALUE', 7: 'ENUM'})]
+  '])+)',
+  {1: 'COMMENT', 3: 'STRLIT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1755,8 +1755,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<BOOL>bool)|(?P<__ANON_8>int)',
-  {1: 'COMMENT', 3: 'WS', 4: 'BOOL', 5: '__ANON_8'})]
+  '])+)|(?P<BOOL>bool)|(?P<SET>set)|(?P<__ANON_8>int)',
+  {1: 'COMMENT', 3: 'WS', 4: 'BOOL', 5: 'SET', 6: '__ANON_8'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1771,8 +1771,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'RPAR'})]
+  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1787,8 +1787,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
+  '])+)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1819,8 +1819,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE'})]
+  '])+)|(?P<LPAR>\\()',
+  {1: 'COMMENT', 3: 'WS', 4: 'LPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1835,8 +1835,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<LPAR>\\()',
-  {1: 'COMMENT', 3: 'WS', 4: 'LPAR'})]
+  '])+)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1851,8 +1851,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
+  '])+)|(?P<PREDICATE>predicate)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1881,10 +1881,10 @@ LEXERS[59] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<RBRACE>\\})',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RBRACE'})]
+  '])+)',
+  {1: 'COMMENT', 3: 'STRLIT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1897,10 +1897,10 @@ LEXERS[60] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'COMMENT', 3: 'STRLIT', 4: 'WS'})]
+  '])+)|(?P<COMMA>,)|(?P<RBRACE>\\})',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RBRACE'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1979,8 +1979,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<__ANON_0>\\->)',
-  {1: 'COMMENT', 3: 'WS', 4: '__ANON_0'})]
+  '])+)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -1991,12 +1991,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[66] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2007,12 +2007,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[67] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2023,18 +2023,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[68] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<__ANON_0>\\->)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'NAME',
-   2: 'COMMENT',
-   4: 'WS',
-   5: '__ANON_0',
-   6: 'COMMA',
-   7: 'LBRACE',
-   8: 'SEMICOLON'})]
+  '])+)|(?P<__ANON_0>\\->)',
+  {1: 'COMMENT', 3: 'WS', 4: '__ANON_0'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2049,8 +2043,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<__ANON_0>\\->)',
-  {1: 'COMMENT', 3: 'WS', 4: '__ANON_0'})]
+  '])+)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'LBRACE', 5: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2061,6 +2055,28 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[70] = (lexer_regexps)
 MRES = (
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<__ANON_0>\\->)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: '__ANON_0',
+   6: 'COMMA',
+   7: 'LBRACE',
+   8: 'SEMICOLON'})]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[71] = (lexer_regexps)
+MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
@@ -2075,14 +2091,14 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[71] = (lexer_regexps)
+LEXERS[72] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'LBRACE', 5: 'SEMICOLON'})]
+  '])+)|(?P<__ANON_0>\\->)',
+  {1: 'COMMENT', 3: 'WS', 4: '__ANON_0'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2091,7 +2107,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[72] = (lexer_regexps)
+LEXERS[73] = (lexer_regexps)
 MRES = (
 [('(?P<SNUMBER>(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+))|(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2107,7 +2123,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[73] = (lexer_regexps)
+LEXERS[74] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2123,7 +2139,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[74] = (lexer_regexps)
+LEXERS[75] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2139,7 +2155,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[75] = (lexer_regexps)
+LEXERS[76] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2155,7 +2171,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[76] = (lexer_regexps)
+LEXERS[77] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2171,7 +2187,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[77] = (lexer_regexps)
+LEXERS[78] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2187,7 +2203,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[78] = (lexer_regexps)
+LEXERS[79] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2203,7 +2219,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[79] = (lexer_regexps)
+LEXERS[80] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -2219,19 +2235,14 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[80] = (lexer_regexps)
+LEXERS[81] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<__ANON_0>\\->)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: '__ANON_0',
-   5: 'COMMA',
-   6: 'LBRACE',
-   7: 'SEMICOLON'})]
+  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2240,52 +2251,14 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[81] = (lexer_regexps)
+LEXERS[82] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_0>\\->)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_0',
-   8: '__ANON_2',
-   9: '__ANON_3',
-   10: '__ANON_4',
-   11: '__ANON_5',
-   12: '__ANON_6',
-   13: '__ANON_7',
-   14: 'COMMA',
-   15: 'LBRACE',
-   16: 'LESSTHAN',
-   17: 'MINUS',
-   18: 'MORETHAN',
-   19: 'PERCENT',
-   20: 'PLUS',
-   21: 'RPAR',
-   22: 'SEMICOLON',
-   23: 'SLASH',
-   24: 'STAR'})]
-)
-LEXER_CALLBACK = (
-{}
-)
-lexer_regexps = LexerRegexps()
-lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
-lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
-                          for n, mres in LEXER_CALLBACK.items()}
-LEXERS[82] = (lexer_regexps)
-MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
-  '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
-  '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2296,15 +2269,22 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[83] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: 'INT',
+   6: 'BANG',
+   7: 'LPAR',
+   8: 'MINUS'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
+           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -2316,8 +2296,13 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
+  '])+)|(?P<__ANON_0>\\->)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: '__ANON_0',
+   5: 'COMMA',
+   6: 'LBRACE',
+   7: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2328,22 +2313,39 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[85] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
-  {1: 'NAME',
-   2: 'COMMENT',
-   4: 'WS',
-   5: 'INT',
-   6: 'BANG',
-   7: 'LPAR',
-   8: 'MINUS'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_0>\\->)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_0',
+   8: '__ANON_2',
+   9: '__ANON_3',
+   10: '__ANON_4',
+   11: '__ANON_5',
+   12: '__ANON_6',
+   13: '__ANON_7',
+   14: 'AMPERSAND',
+   15: 'COMMA',
+   16: 'LBRACE',
+   17: 'LESSTHAN',
+   18: 'MINUS',
+   19: 'MORETHAN',
+   20: 'PERCENT',
+   21: 'PLUS',
+   22: 'RPAR',
+   23: 'SEMICOLON',
+   24: 'SLASH',
+   25: 'STAR',
+   26: 'VBAR'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
-           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -2351,12 +2353,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[86] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2435,8 +2437,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'RPAR'})]
+  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2467,8 +2469,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
+  '])+)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2499,8 +2501,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
+  '])+)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2515,8 +2517,29 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'LBRACE', 5: 'SEMICOLON'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2531,8 +2554,29 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2547,8 +2591,16 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: 'RPAR',
+   10: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2563,22 +2615,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MORETHAN>>)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MORETHAN',
-   15: 'RPAR',
-   16: 'SEMICOLON'})]
+  '])+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'RPAR', 5: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2593,15 +2631,22 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MORETHAN>>)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
    5: 'THEN',
    6: '__ANON_1',
    7: '__ANON_2',
-   8: 'RPAR',
-   9: 'SEMICOLON'})]
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'LESSTHAN',
+   14: 'MORETHAN',
+   15: 'RPAR',
+   16: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2635,15 +2680,23 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[102] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'RPAR', 5: 'SEMICOLON'})]
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<RBRACE>\\})',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: 'INT',
+   6: 'BANG',
+   7: 'LPAR',
+   8: 'MINUS',
+   9: 'RBRACE'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
+           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -2655,7 +2708,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -2667,15 +2720,17 @@ MRES = (
    10: '__ANON_5',
    11: '__ANON_6',
    12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2690,16 +2745,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: 'RPAR',
-   10: 'SEMICOLON'})]
+  '])+)|(?P<LPAR>\\()',
+  {1: 'COMMENT', 3: 'WS', 4: 'LPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2714,32 +2761,29 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_0>\\->)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<COLON>:)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<LESSTHAN><)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
    5: 'THEN',
    6: '__ANON_1',
-   7: '__ANON_0',
-   8: '__ANON_2',
-   9: '__ANON_3',
-   10: '__ANON_4',
-   11: '__ANON_5',
-   12: '__ANON_6',
-   13: '__ANON_7',
-   14: 'COLON',
-   15: 'COMMA',
-   16: 'LBRACE',
-   17: 'LESSTHAN',
-   18: 'LPAR',
-   19: 'MINUS',
-   20: 'MORETHAN',
-   21: 'PERCENT',
-   22: 'PLUS',
-   23: 'RPAR',
-   24: 'SEMICOLON',
-   25: 'SLASH',
-   26: 'STAR'})]
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2750,15 +2794,21 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[106] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<LPAR>\\()',
-  {1: 'COMMENT', 3: 'WS', 4: 'LPAR'})]
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: 'INT',
+   6: 'BANG',
+   7: 'LPAR',
+   8: 'MINUS'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -2766,23 +2816,22 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[107] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<RBRACE>\\})',
-  {1: 'NAME',
-   2: 'COMMENT',
-   4: 'WS',
-   5: 'INT',
-   6: 'BANG',
-   7: 'LPAR',
-   8: 'MINUS',
-   9: 'RBRACE'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: 'RPAR',
+   9: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
-           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -2790,15 +2839,36 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[108] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<LPAR>\\()',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS', 5: 'INT', 6: 'LPAR'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -2810,7 +2880,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -2827,7 +2897,8 @@ MRES = (
    15: 'MORETHAN',
    16: 'PLUS',
    17: 'RPAR',
-   18: 'SEMICOLON'})]
+   18: 'SEMICOLON',
+   19: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2838,21 +2909,36 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[110] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
-  {1: 'NAME',
-   2: 'COMMENT',
-   4: 'WS',
-   5: 'INT',
-   6: 'BANG',
-   7: 'LPAR',
-   8: 'MINUS'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -2880,62 +2966,24 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+  '])+)|(?P<RBRACE>\\})',
+  {1: 'COMMENT', 3: 'WS', 4: 'RBRACE'})]
 )
 LEXER_CALLBACK = (
-{}
-)
-lexer_regexps = LexerRegexps()
-lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
-lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
-                          for n, mres in LEXER_CALLBACK.items()}
-LEXERS[113] = (lexer_regexps)
-MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
-  '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
-  '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[113] = (lexer_regexps)
+MRES = (
+[('(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2950,7 +2998,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -2962,15 +3010,17 @@ MRES = (
    10: '__ANON_5',
    11: '__ANON_6',
    12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -2985,8 +3035,34 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<RBRACE>\\})',
-  {1: 'COMMENT', 3: 'WS', 4: 'RBRACE'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_0>\\->)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<COLON>:)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<LESSTHAN><)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_0',
+   8: '__ANON_2',
+   9: '__ANON_3',
+   10: '__ANON_4',
+   11: '__ANON_5',
+   12: '__ANON_6',
+   13: '__ANON_7',
+   14: 'AMPERSAND',
+   15: 'COLON',
+   16: 'COMMA',
+   17: 'LBRACE',
+   18: 'LESSTHAN',
+   19: 'LPAR',
+   20: 'MINUS',
+   21: 'MORETHAN',
+   22: 'PERCENT',
+   23: 'PLUS',
+   24: 'RPAR',
+   25: 'SEMICOLON',
+   26: 'SLASH',
+   27: 'STAR',
+   28: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3001,7 +3077,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -3013,15 +3089,17 @@ MRES = (
    10: '__ANON_5',
    11: '__ANON_6',
    12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3032,34 +3110,15 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[117] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<LPAR>\\()',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS', 5: 'INT', 6: 'LPAR'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3071,8 +3130,29 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'RPAR', 5: 'SEMICOLON'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3103,27 +3183,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+  '])+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'RPAR', 5: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3138,7 +3199,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -3150,15 +3211,17 @@ MRES = (
    10: '__ANON_5',
    11: '__ANON_6',
    12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3173,27 +3236,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3208,27 +3252,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3239,15 +3264,15 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[124] = (lexer_regexps)
 MRES = (
-[('(?P<SNUMBER>(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+))|(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'SNUMBER', 2: 'NAME', 3: 'COMMENT', 5: 'STRLIT', 6: 'WS'})]
+  '])+)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'LBRACE', 5: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3255,15 +3280,15 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[125] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<SNUMBER>(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+))|(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
+  '])+)',
+  {1: 'SNUMBER', 2: 'NAME', 3: 'COMMENT', 5: 'STRLIT', 6: 'WS'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3275,8 +3300,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
+  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3291,8 +3316,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
+  '])+)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3307,8 +3332,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
+  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3323,11 +3348,17 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: 'INT',
+   6: 'BANG',
+   7: 'LPAR',
+   8: 'MINUS'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3339,19 +3370,17 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<RBRACE>\\})',
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
   {1: 'NAME',
    2: 'COMMENT',
    4: 'WS',
    5: 'INT',
    6: 'BANG',
    7: 'LPAR',
-   8: 'MINUS',
-   9: 'RBRACE'})]
+   8: 'MINUS'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
-           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3557,15 +3586,21 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[140] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'RPAR'})]
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: 'INT',
+   6: 'BANG',
+   7: 'LPAR',
+   8: 'MINUS'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3595,12 +3630,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[142] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
+  '])+)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3659,31 +3694,12 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[145] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3694,21 +3710,15 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[146] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
-  {1: 'NAME',
-   2: 'COMMENT',
-   4: 'WS',
-   5: 'INT',
-   6: 'BANG',
-   7: 'LPAR',
-   8: 'MINUS'})]
+  '])+)|(?P<THEN>then)',
+  {1: 'COMMENT', 3: 'WS', 4: 'THEN'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3748,49 +3758,17 @@ MRES = (
    4: 'WS',
    5: 'INT',
    6: 'BANG',
-   7: 'LPAR',
-   8: 'MINUS'})]
-)
-LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
-)
-lexer_regexps = LexerRegexps()
-lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
-lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
-                          for n, mres in LEXER_CALLBACK.items()}
-LEXERS[149] = (lexer_regexps)
-MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
-  '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
-  '\r\n'
-  '])+)|(?P<THEN>then)',
-  {1: 'COMMENT', 3: 'WS', 4: 'THEN'})]
-)
-LEXER_CALLBACK = (
-{}
-)
-lexer_regexps = LexerRegexps()
-lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
-lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
-                          for n, mres in LEXER_CALLBACK.items()}
-LEXERS[150] = (lexer_regexps)
-MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
-  '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
-  '\r\n'
-  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
-  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
+   7: 'LPAR',
+   8: 'MINUS'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[151] = (lexer_regexps)
+LEXERS[149] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -3812,7 +3790,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[152] = (lexer_regexps)
+LEXERS[150] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -3834,7 +3812,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[153] = (lexer_regexps)
+LEXERS[151] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -3856,7 +3834,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[154] = (lexer_regexps)
+LEXERS[152] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -3878,33 +3856,94 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[155] = (lexer_regexps)
+LEXERS[153] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[154] = (lexer_regexps)
+MRES = (
+[('(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<PREDICATE>predicate)|(?P<FUNC>func)',
+  {1: 'COMMENT', 3: 'WS', 4: 'PREDICATE', 5: 'FUNC'})]
 )
 LEXER_CALLBACK = (
 {}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[155] = (lexer_regexps)
+MRES = (
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<RBRACE>\\})',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: 'INT',
+   6: 'BANG',
+   7: 'LPAR',
+   8: 'MINUS',
+   9: 'RBRACE'})]
+)
+LEXER_CALLBACK = (
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
+           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[156] = (lexer_regexps)
 MRES = (
-[('(?P<SNUMBER>(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+))|(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)',
-  {1: 'SNUMBER', 2: 'NAME', 3: 'COMMENT', 5: 'STRLIT', 6: 'WS'})]
+  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3932,8 +3971,8 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
+  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -3944,31 +3983,15 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[159] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<SNUMBER>(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+))|(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
-  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  ')+\\*\\)))|(?P<STRLIT>"(?:(?:\\\\"|[^"]))*")|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
-  {1: 'COMMENT',
-   3: 'WS',
-   4: 'ELSE',
-   5: 'THEN',
-   6: '__ANON_1',
-   7: '__ANON_2',
-   8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PLUS',
-   17: 'RPAR',
-   18: 'SEMICOLON'})]
+  '])+)',
+  {1: 'SNUMBER', 2: 'NAME', 3: 'COMMENT', 5: 'STRLIT', 6: 'WS'})]
 )
 LEXER_CALLBACK = (
-{}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
@@ -3980,7 +4003,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -3988,8 +4011,21 @@ MRES = (
    6: '__ANON_1',
    7: '__ANON_2',
    8: '__ANON_3',
-   9: 'RPAR',
-   10: 'SEMICOLON'})]
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4004,8 +4040,22 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
-  {1: 'COMMENT', 3: 'WS', 4: 'ELSE', 5: 'THEN', 6: 'RPAR', 7: 'SEMICOLON'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MORETHAN>>)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  {1: 'COMMENT',
+   3: 'WS',
+   4: 'ELSE',
+   5: 'THEN',
+   6: '__ANON_1',
+   7: '__ANON_2',
+   8: '__ANON_3',
+   9: '__ANON_4',
+   10: '__ANON_5',
+   11: '__ANON_6',
+   12: '__ANON_7',
+   13: 'LESSTHAN',
+   14: 'MORETHAN',
+   15: 'RPAR',
+   16: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4020,7 +4070,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -4035,12 +4085,10 @@ MRES = (
    13: 'LESSTHAN',
    14: 'MINUS',
    15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   16: 'PLUS',
+   17: 'RPAR',
+   18: 'SEMICOLON',
+   19: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4055,7 +4103,7 @@ MRES = (
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MORETHAN>>)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -4067,10 +4115,17 @@ MRES = (
    10: '__ANON_5',
    11: '__ANON_6',
    12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MORETHAN',
-   15: 'RPAR',
-   16: 'SEMICOLON'})]
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4081,6 +4136,30 @@ lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres
                           for n, mres in LEXER_CALLBACK.items()}
 LEXERS[164] = (lexer_regexps)
 MRES = (
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<RBRACE>\\})',
+  {1: 'NAME',
+   2: 'COMMENT',
+   4: 'WS',
+   5: 'INT',
+   6: 'BANG',
+   7: 'LPAR',
+   8: 'MINUS',
+   9: 'RBRACE'})]
+)
+LEXER_CALLBACK = (
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
+           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[165] = (lexer_regexps)
+MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
@@ -4095,37 +4174,35 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[165] = (lexer_regexps)
+LEXERS[166] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)|(?P<RBRACE>\\})',
+  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
   {1: 'NAME',
    2: 'COMMENT',
    4: 'WS',
    5: 'INT',
    6: 'BANG',
    7: 'LPAR',
-   8: 'MINUS',
-   9: 'RBRACE'})]
+   8: 'MINUS'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)|(?P<IF>if$)',
-           {1: 'FALSE', 2: 'TRUE', 3: 'IF'})]}
+{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[166] = (lexer_regexps)
+LEXERS[167] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -4133,19 +4210,8 @@ MRES = (
    6: '__ANON_1',
    7: '__ANON_2',
    8: '__ANON_3',
-   9: '__ANON_4',
-   10: '__ANON_5',
-   11: '__ANON_6',
-   12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   9: 'RPAR',
+   10: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4154,35 +4220,29 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[167] = (lexer_regexps)
+LEXERS[168] = (lexer_regexps)
 MRES = (
-[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<INT>(?:[0-9])+)|(?P<BANG>!)|(?P<LPAR>\\()|(?P<MINUS>\\-)',
-  {1: 'NAME',
-   2: 'COMMENT',
-   4: 'WS',
-   5: 'INT',
-   6: 'BANG',
-   7: 'LPAR',
-   8: 'MINUS'})]
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<RPAR>\\))|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'ELSE', 5: 'THEN', 6: 'RPAR', 7: 'SEMICOLON'})]
 )
 LEXER_CALLBACK = (
-{'NAME': [('(?P<FALSE>false$)|(?P<TRUE>true$)', {1: 'FALSE', 2: 'TRUE'})]}
+{}
 )
 lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[168] = (lexer_regexps)
+LEXERS[169] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -4194,15 +4254,17 @@ MRES = (
    10: '__ANON_5',
    11: '__ANON_6',
    12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4211,14 +4273,14 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[169] = (lexer_regexps)
+LEXERS[170] = (lexer_regexps)
 MRES = (
-[('(?P<COMMENT>(?:\\#.*\\\n'
+[('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
-  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
+  '])+)',
+  {1: 'NAME', 2: 'COMMENT', 4: 'WS'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4227,7 +4289,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[170] = (lexer_regexps)
+LEXERS[171] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -4243,13 +4305,29 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[171] = (lexer_regexps)
+LEXERS[172] = (lexer_regexps)
+MRES = (
+[('(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<COMMA>,)|(?P<RPAR>\\))',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'RPAR'})]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[173] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
   ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
   '\r\n'
-  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)',
+  '])+)|(?P<ELSE>else)|(?P<THEN>then)|(?P<__ANON_1>==>)|(?P<__ANON_2>\\|\\|)|(?P<__ANON_3>\\&\\&)|(?P<__ANON_4>==)|(?P<__ANON_5>!=)|(?P<__ANON_6><=)|(?P<__ANON_7>>=)|(?P<AMPERSAND>\\&)|(?P<LESSTHAN><)|(?P<MINUS>\\-)|(?P<MORETHAN>>)|(?P<PERCENT>%)|(?P<PLUS>\\+)|(?P<RPAR>\\))|(?P<SEMICOLON>;)|(?P<SLASH>/)|(?P<STAR>\\*)|(?P<VBAR>\\|)',
   {1: 'COMMENT',
    3: 'WS',
    4: 'ELSE',
@@ -4261,15 +4339,17 @@ MRES = (
    10: '__ANON_5',
    11: '__ANON_6',
    12: '__ANON_7',
-   13: 'LESSTHAN',
-   14: 'MINUS',
-   15: 'MORETHAN',
-   16: 'PERCENT',
-   17: 'PLUS',
-   18: 'RPAR',
-   19: 'SEMICOLON',
-   20: 'SLASH',
-   21: 'STAR'})]
+   13: 'AMPERSAND',
+   14: 'LESSTHAN',
+   15: 'MINUS',
+   16: 'MORETHAN',
+   17: 'PERCENT',
+   18: 'PLUS',
+   19: 'RPAR',
+   20: 'SEMICOLON',
+   21: 'SLASH',
+   22: 'STAR',
+   23: 'VBAR'})]
 )
 LEXER_CALLBACK = (
 {}
@@ -4278,7 +4358,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[172] = (lexer_regexps)
+LEXERS[174] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -4294,7 +4374,23 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[173] = (lexer_regexps)
+LEXERS[175] = (lexer_regexps)
+MRES = (
+[('(?P<COMMENT>(?:\\#.*\\\n'
+  '|\\(\\*(.|\n'
+  ')+\\*\\)))|(?P<WS>(?:[ \t\x0c'
+  '\r\n'
+  '])+)|(?P<COMMA>,)|(?P<LBRACE>\\{)|(?P<SEMICOLON>;)',
+  {1: 'COMMENT', 3: 'WS', 4: 'COMMA', 5: 'LBRACE', 6: 'SEMICOLON'})]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[176] = (lexer_regexps)
 MRES = (
 [('(?P<NAME>(?:_|(?:[A-Z]|[a-z]))(?:(?:(?:_|(?:[A-Z]|[a-z]))|[0-9]))*)|(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -4316,7 +4412,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[174] = (lexer_regexps)
+LEXERS[177] = (lexer_regexps)
 MRES = (
 [('(?P<COMMENT>(?:\\#.*\\\n'
   '|\\(\\*(.|\n'
@@ -4332,7 +4428,7 @@ lexer_regexps = LexerRegexps()
 lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
 lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
                           for n, mres in LEXER_CALLBACK.items()}
-LEXERS[175] = (lexer_regexps)
+LEXERS[178] = (lexer_regexps)
 class ContextualLexer:
     def __init__(self):
         self.lexers = LEXERS
@@ -4353,26 +4449,26 @@ def lex(stream):
     return CON_LEXER.lex(stream)
 RULES = {
   0: Rule(NonTerminal('start'), [NonTerminal('type_decls'), NonTerminal('program_decl'), NonTerminal('func_decls'), NonTerminal('global_preds')], None, RuleOptions(False, False, None)),
-  1: Rule(NonTerminal('type_decls'), [], None, RuleOptions(False, False, None)),
-  2: Rule(NonTerminal('type_decls'), [NonTerminal('__anon_star_0')], None, RuleOptions(False, False, None)),
-  3: Rule(NonTerminal('type_decl'), [NonTerminal('value_decl')], None, RuleOptions(False, True, None)),
-  4: Rule(NonTerminal('type_decl'), [NonTerminal('enum_decl')], None, RuleOptions(False, True, None)),
+  1: Rule(NonTerminal('type_decls'), [NonTerminal('__anon_star_0')], None, RuleOptions(False, False, None)),
+  2: Rule(NonTerminal('type_decls'), [], None, RuleOptions(False, False, None)),
+  3: Rule(NonTerminal('type_decl'), [NonTerminal('enum_decl')], None, RuleOptions(False, True, None)),
+  4: Rule(NonTerminal('type_decl'), [NonTerminal('value_decl')], None, RuleOptions(False, True, None)),
   5: Rule(NonTerminal('type_decl'), [NonTerminal('enum_set_decl')], None, RuleOptions(False, True, None)),
   6: Rule(NonTerminal('enum_decl'), [Terminal('ENUM', True), NonTerminal('type_name'), NonTerminal('enum_body')], None, RuleOptions(False, False, None)),
   7: Rule(NonTerminal('enum_set_decl'), [Terminal('ENUMSET', True), NonTerminal('type_name'), Terminal('LSQB', True), Terminal('INT', False), Terminal('RSQB', True), NonTerminal('enum_body')], None, RuleOptions(False, False, None)),
-  8: Rule(NonTerminal('enum_body'), [Terminal('SEMICOLON', True)], None, RuleOptions(False, True, None)),
-  9: Rule(NonTerminal('enum_body'), [Terminal('LBRACE', True), NonTerminal('enum_items'), Terminal('RBRACE', True)], None, RuleOptions(False, True, None)),
+  8: Rule(NonTerminal('enum_body'), [Terminal('LBRACE', True), NonTerminal('enum_items'), Terminal('RBRACE', True)], None, RuleOptions(False, True, None)),
+  9: Rule(NonTerminal('enum_body'), [Terminal('SEMICOLON', True)], None, RuleOptions(False, True, None)),
   10: Rule(NonTerminal('enum_items'), [NonTerminal('enum_item')], None, RuleOptions(False, False, None)),
   11: Rule(NonTerminal('enum_items'), [NonTerminal('enum_item'), NonTerminal('__anon_star_1')], None, RuleOptions(False, False, None)),
   12: Rule(NonTerminal('value_decl'), [Terminal('VALUE', True), NonTerminal('type_name'), NonTerminal('value_body')], None, RuleOptions(False, False, None)),
-  13: Rule(NonTerminal('value_body'), [Terminal('SEMICOLON', True)], None, RuleOptions(False, True, None)),
-  14: Rule(NonTerminal('value_body'), [Terminal('LBRACE', True), NonTerminal('value_items'), Terminal('RBRACE', True)], None, RuleOptions(False, True, None)),
+  13: Rule(NonTerminal('value_body'), [Terminal('LBRACE', True), NonTerminal('value_items'), Terminal('RBRACE', True)], None, RuleOptions(False, True, None)),
+  14: Rule(NonTerminal('value_body'), [Terminal('SEMICOLON', True)], None, RuleOptions(False, True, None)),
   15: Rule(NonTerminal('value_items'), [NonTerminal('value_item')], None, RuleOptions(False, False, None)),
   16: Rule(NonTerminal('value_items'), [NonTerminal('value_item'), NonTerminal('__anon_star_2')], None, RuleOptions(False, False, None)),
   17: Rule(NonTerminal('value_item'), [NonTerminal('func_name'), Terminal('COLON', True), NonTerminal('expr_type_name'), Terminal('SEMICOLON', True)], None, RuleOptions(False, False, None)),
   18: Rule(NonTerminal('program_decl'), [Terminal('PROGRAM', True), NonTerminal('func_name'), Terminal('LPAR', True), NonTerminal('type_names'), Terminal('RPAR', True), Terminal('__ANON_0', True), NonTerminal('type_name'), Terminal('SEMICOLON', True)], None, RuleOptions(False, False, None)),
-  19: Rule(NonTerminal('func_decls'), [NonTerminal('__anon_star_3')], None, RuleOptions(False, False, None)),
-  20: Rule(NonTerminal('func_decls'), [], None, RuleOptions(False, False, None)),
+  19: Rule(NonTerminal('func_decls'), [], None, RuleOptions(False, False, None)),
+  20: Rule(NonTerminal('func_decls'), [NonTerminal('__anon_star_3')], None, RuleOptions(False, False, None)),
   21: Rule(NonTerminal('func_decl'), [Terminal('FUNC', True), NonTerminal('func_name'), Terminal('COLON', True), NonTerminal('func_body'), NonTerminal('func_constraints')], None, RuleOptions(False, False, None)),
   22: Rule(NonTerminal('func_body'), [NonTerminal('func_lhs'), Terminal('__ANON_0', True), NonTerminal('func_rhss')], None, RuleOptions(False, False, None)),
   23: Rule(NonTerminal('func_lhs'), [NonTerminal('opt_arg')], None, RuleOptions(False, True, None)),
@@ -4386,305 +4482,311 @@ RULES = {
   31: Rule(NonTerminal('func_constraint_items'), [NonTerminal('func_constraint_item')], None, RuleOptions(False, False, None)),
   32: Rule(NonTerminal('func_constraint_items'), [NonTerminal('func_constraint_item'), NonTerminal('__anon_star_5')], None, RuleOptions(False, False, None)),
   33: Rule(NonTerminal('func_constraint_item'), [NonTerminal('expr'), Terminal('SEMICOLON', True)], None, RuleOptions(False, True, None)),
-  34: Rule(NonTerminal('expr'), [NonTerminal('imply_expr')], None, RuleOptions(False, True, None)),
-  35: Rule(NonTerminal('expr'), [NonTerminal('cond_expr')], None, RuleOptions(False, True, None)),
-  36: Rule(NonTerminal('imply_expr'), [NonTerminal('or_expr')], None, RuleOptions(False, True, None)),
-  37: Rule(NonTerminal('imply_expr'), [NonTerminal('or_expr'), Terminal('__ANON_1', True), NonTerminal('imply_expr')], None, RuleOptions(False, True, None)),
+  34: Rule(NonTerminal('expr'), [NonTerminal('cond_expr')], None, RuleOptions(False, True, None)),
+  35: Rule(NonTerminal('expr'), [NonTerminal('imply_expr')], None, RuleOptions(False, True, None)),
+  36: Rule(NonTerminal('imply_expr'), [NonTerminal('or_expr'), Terminal('__ANON_1', True), NonTerminal('imply_expr')], None, RuleOptions(False, True, None)),
+  37: Rule(NonTerminal('imply_expr'), [NonTerminal('or_expr')], None, RuleOptions(False, True, None)),
   38: Rule(NonTerminal('or_expr'), [NonTerminal('and_expr')], None, RuleOptions(False, True, None)),
   39: Rule(NonTerminal('or_expr'), [NonTerminal('or_expr'), Terminal('__ANON_2', True), NonTerminal('and_expr')], None, RuleOptions(False, True, None)),
   40: Rule(NonTerminal('and_expr'), [NonTerminal('cmp_expr')], None, RuleOptions(False, True, None)),
   41: Rule(NonTerminal('and_expr'), [NonTerminal('and_expr'), Terminal('__ANON_3', True), NonTerminal('cmp_expr')], None, RuleOptions(False, True, None)),
   42: Rule(NonTerminal('cmp_expr'), [NonTerminal('cmp_expr'), NonTerminal('cmp_op'), NonTerminal('term_expr')], None, RuleOptions(False, True, None)),
   43: Rule(NonTerminal('cmp_expr'), [NonTerminal('term_expr')], None, RuleOptions(False, True, None)),
-  44: Rule(NonTerminal('cmp_op'), [Terminal('MORETHAN', True)], 'expr_gt', RuleOptions(False, True, None)),
-  45: Rule(NonTerminal('cmp_op'), [Terminal('LESSTHAN', True)], 'expr_lt', RuleOptions(False, True, None)),
-  46: Rule(NonTerminal('cmp_op'), [Terminal('__ANON_7', True)], 'expr_ge', RuleOptions(False, True, None)),
+  44: Rule(NonTerminal('cmp_op'), [Terminal('LESSTHAN', True)], 'expr_lt', RuleOptions(False, True, None)),
+  45: Rule(NonTerminal('cmp_op'), [Terminal('MORETHAN', True)], 'expr_gt', RuleOptions(False, True, None)),
+  46: Rule(NonTerminal('cmp_op'), [Terminal('__ANON_5', True)], 'expr_ne', RuleOptions(False, True, None)),
   47: Rule(NonTerminal('cmp_op'), [Terminal('__ANON_4', True)], 'expr_eq', RuleOptions(False, True, None)),
-  48: Rule(NonTerminal('cmp_op'), [Terminal('__ANON_6', True)], 'expr_le', RuleOptions(False, True, None)),
-  49: Rule(NonTerminal('cmp_op'), [Terminal('__ANON_5', True)], 'expr_ne', RuleOptions(False, True, None)),
+  48: Rule(NonTerminal('cmp_op'), [Terminal('__ANON_7', True)], 'expr_ge', RuleOptions(False, True, None)),
+  49: Rule(NonTerminal('cmp_op'), [Terminal('__ANON_6', True)], 'expr_le', RuleOptions(False, True, None)),
   50: Rule(NonTerminal('term_expr'), [NonTerminal('term_expr'), NonTerminal('term_op'), NonTerminal('factor_expr')], None, RuleOptions(False, True, None)),
   51: Rule(NonTerminal('term_expr'), [NonTerminal('factor_expr')], None, RuleOptions(False, True, None)),
-  52: Rule(NonTerminal('term_op'), [Terminal('MINUS', True)], 'expr_sub', RuleOptions(False, True, None)),
-  53: Rule(NonTerminal('term_op'), [Terminal('PLUS', True)], 'expr_add', RuleOptions(False, True, None)),
-  54: Rule(NonTerminal('factor_expr'), [NonTerminal('unary_expr')], None, RuleOptions(False, True, None)),
+  52: Rule(NonTerminal('term_op'), [Terminal('PLUS', True)], 'expr_add', RuleOptions(False, True, None)),
+  53: Rule(NonTerminal('term_op'), [Terminal('VBAR', True)], 'expr_union', RuleOptions(False, True, None)),
+  54: Rule(NonTerminal('term_op'), [Terminal('MINUS', True)], 'expr_sub', RuleOptions(False, True, None)),
   55: Rule(NonTerminal('factor_expr'), [NonTerminal('factor_expr'), NonTerminal('factor_op'), NonTerminal('unary_expr')], None, RuleOptions(False, True, None)),
-  56: Rule(NonTerminal('factor_op'), [Terminal('STAR', True)], 'expr_mul', RuleOptions(False, True, None)),
-  57: Rule(NonTerminal('factor_op'), [Terminal('PERCENT', True)], 'expr_mod', RuleOptions(False, True, None)),
-  58: Rule(NonTerminal('factor_op'), [Terminal('SLASH', True)], 'expr_div', RuleOptions(False, True, None)),
-  59: Rule(NonTerminal('unary_expr'), [NonTerminal('unary_op'), NonTerminal('atom_expr')], None, RuleOptions(False, True, None)),
-  60: Rule(NonTerminal('unary_expr'), [NonTerminal('atom_expr')], None, RuleOptions(False, True, None)),
-  61: Rule(NonTerminal('unary_op'), [Terminal('BANG', True)], 'expr_not', RuleOptions(False, True, None)),
-  62: Rule(NonTerminal('unary_op'), [Terminal('MINUS', True)], 'expr_neg', RuleOptions(False, True, None)),
-  63: Rule(NonTerminal('atom_expr'), [NonTerminal('const_expr')], None, RuleOptions(False, True, None)),
-  64: Rule(NonTerminal('atom_expr'), [NonTerminal('var_expr')], None, RuleOptions(False, True, None)),
-  65: Rule(NonTerminal('atom_expr'), [Terminal('LPAR', True), NonTerminal('expr'), Terminal('RPAR', True)], None, RuleOptions(False, True, None)),
-  66: Rule(NonTerminal('atom_expr'), [NonTerminal('property_expr')], None, RuleOptions(False, True, None)),
-  67: Rule(NonTerminal('const_expr'), [Terminal('INT', False)], 'expr_intlit', RuleOptions(False, True, None)),
-  68: Rule(NonTerminal('const_expr'), [Terminal('TRUE', True)], 'expr_true', RuleOptions(False, True, None)),
+  56: Rule(NonTerminal('factor_expr'), [NonTerminal('unary_expr')], None, RuleOptions(False, True, None)),
+  57: Rule(NonTerminal('factor_op'), [Terminal('STAR', True)], 'expr_mul', RuleOptions(False, True, None)),
+  58: Rule(NonTerminal('factor_op'), [Terminal('AMPERSAND', True)], 'expr_intersect', RuleOptions(False, True, None)),
+  59: Rule(NonTerminal('factor_op'), [Terminal('SLASH', True)], 'expr_div', RuleOptions(False, True, None)),
+  60: Rule(NonTerminal('factor_op'), [Terminal('PERCENT', True)], 'expr_mod', RuleOptions(False, True, None)),
+  61: Rule(NonTerminal('unary_expr'), [NonTerminal('unary_op'), NonTerminal('atom_expr')], None, RuleOptions(False, True, None)),
+  62: Rule(NonTerminal('unary_expr'), [NonTerminal('atom_expr')], None, RuleOptions(False, True, None)),
+  63: Rule(NonTerminal('unary_op'), [Terminal('MINUS', True)], 'expr_neg', RuleOptions(False, True, None)),
+  64: Rule(NonTerminal('unary_op'), [Terminal('BANG', True)], 'expr_not', RuleOptions(False, True, None)),
+  65: Rule(NonTerminal('atom_expr'), [NonTerminal('var_expr')], None, RuleOptions(False, True, None)),
+  66: Rule(NonTerminal('atom_expr'), [Terminal('LPAR', True), NonTerminal('expr'), Terminal('RPAR', True)], None, RuleOptions(False, True, None)),
+  67: Rule(NonTerminal('atom_expr'), [NonTerminal('const_expr')], None, RuleOptions(False, True, None)),
+  68: Rule(NonTerminal('atom_expr'), [NonTerminal('property_expr')], None, RuleOptions(False, True, None)),
   69: Rule(NonTerminal('const_expr'), [Terminal('FALSE', True)], 'expr_false', RuleOptions(False, True, None)),
-  70: Rule(NonTerminal('var_expr'), [NonTerminal('var_name')], 'expr_var', RuleOptions(False, True, None)),
-  71: Rule(NonTerminal('cond_expr'), [Terminal('IF', True), NonTerminal('imply_expr'), Terminal('THEN', True), NonTerminal('imply_expr'), Terminal('ELSE', True), NonTerminal('imply_expr')], None, RuleOptions(False, True, None)),
-  72: Rule(NonTerminal('property_expr'), [NonTerminal('func_name'), Terminal('LPAR', True), NonTerminal('var_expr'), Terminal('RPAR', True)], None, RuleOptions(False, True, None)),
-  73: Rule(NonTerminal('type_names'), [NonTerminal('type_name')], None, RuleOptions(False, False, None)),
-  74: Rule(NonTerminal('type_names'), [], None, RuleOptions(False, False, None)),
+  70: Rule(NonTerminal('const_expr'), [Terminal('TRUE', True)], 'expr_true', RuleOptions(False, True, None)),
+  71: Rule(NonTerminal('const_expr'), [Terminal('INT', False)], 'expr_intlit', RuleOptions(False, True, None)),
+  72: Rule(NonTerminal('var_expr'), [NonTerminal('var_name')], 'expr_var', RuleOptions(False, True, None)),
+  73: Rule(NonTerminal('cond_expr'), [Terminal('IF', True), NonTerminal('imply_expr'), Terminal('THEN', True), NonTerminal('imply_expr'), Terminal('ELSE', True), NonTerminal('imply_expr')], None, RuleOptions(False, True, None)),
+  74: Rule(NonTerminal('property_expr'), [NonTerminal('func_name'), Terminal('LPAR', True), NonTerminal('var_expr'), Terminal('RPAR', True)], None, RuleOptions(False, True, None)),
   75: Rule(NonTerminal('type_names'), [NonTerminal('type_name'), NonTerminal('__anon_star_6')], None, RuleOptions(False, False, None)),
-  76: Rule(NonTerminal('global_preds'), [], None, RuleOptions(False, False, None)),
-  77: Rule(NonTerminal('global_preds'), [NonTerminal('__anon_star_7')], None, RuleOptions(False, False, None)),
-  78: Rule(NonTerminal('global_pred'), [Terminal('PREDICATE', True), NonTerminal('pred_body'), Terminal('SEMICOLON', True)], None, RuleOptions(False, True, None)),
-  79: Rule(NonTerminal('pred_body'), [NonTerminal('func_name'), Terminal('LPAR', True), NonTerminal('pred_args'), Terminal('RPAR', True)], None, RuleOptions(False, False, None)),
-  80: Rule(NonTerminal('pred_args'), [NonTerminal('pred_arg'), NonTerminal('__anon_star_8')], None, RuleOptions(False, False, None)),
-  81: Rule(NonTerminal('pred_args'), [NonTerminal('pred_arg')], None, RuleOptions(False, False, None)),
-  82: Rule(NonTerminal('pred_args'), [], None, RuleOptions(False, False, None)),
-  83: Rule(NonTerminal('pred_arg'), [NonTerminal('var_name')], 'pred_var', RuleOptions(False, False, None)),
-  84: Rule(NonTerminal('pred_arg'), [Terminal('TRUE', True)], 'pred_true', RuleOptions(False, False, None)),
-  85: Rule(NonTerminal('pred_arg'), [Terminal('SNUMBER', False)], 'pred_num', RuleOptions(False, False, None)),
-  86: Rule(NonTerminal('pred_arg'), [Terminal('FALSE', True)], 'pred_false', RuleOptions(False, False, None)),
-  87: Rule(NonTerminal('pred_arg'), [Terminal('STRLIT', False)], 'pred_str', RuleOptions(False, False, None)),
-  88: Rule(NonTerminal('enum_item'), [Terminal('STRLIT', False)], None, RuleOptions(False, True, None)),
-  89: Rule(NonTerminal('expr_type_name'), [Terminal('__ANON_8', True)], 'expr_int', RuleOptions(False, True, None)),
-  90: Rule(NonTerminal('expr_type_name'), [Terminal('BOOL', True)], 'expr_bool', RuleOptions(False, True, None)),
-  91: Rule(NonTerminal('type_name'), [Terminal('NAME', False)], None, RuleOptions(False, True, None)),
-  92: Rule(NonTerminal('var_name'), [Terminal('NAME', False)], None, RuleOptions(False, True, None)),
-  93: Rule(NonTerminal('func_name'), [Terminal('NAME', False)], None, RuleOptions(False, True, None)),
-  94: Rule(NonTerminal('__anon_star_0'), [NonTerminal('type_decl')], None, None),
-  95: Rule(NonTerminal('__anon_star_0'), [NonTerminal('__anon_star_0'), NonTerminal('type_decl')], None, None),
-  96: Rule(NonTerminal('__anon_star_1'), [Terminal('COMMA', True), NonTerminal('enum_item')], None, None),
-  97: Rule(NonTerminal('__anon_star_1'), [NonTerminal('__anon_star_1'), Terminal('COMMA', True), NonTerminal('enum_item')], None, None),
-  98: Rule(NonTerminal('__anon_star_2'), [NonTerminal('value_item')], None, None),
-  99: Rule(NonTerminal('__anon_star_2'), [NonTerminal('__anon_star_2'), NonTerminal('value_item')], None, None),
-  100: Rule(NonTerminal('__anon_star_3'), [NonTerminal('__anon_star_3'), NonTerminal('func_decl')], None, None),
-  101: Rule(NonTerminal('__anon_star_3'), [NonTerminal('func_decl')], None, None),
-  102: Rule(NonTerminal('__anon_star_4'), [NonTerminal('__anon_star_4'), Terminal('COMMA', True), NonTerminal('func_rhs')], None, None),
-  103: Rule(NonTerminal('__anon_star_4'), [Terminal('COMMA', True), NonTerminal('func_rhs')], None, None),
-  104: Rule(NonTerminal('__anon_star_5'), [NonTerminal('func_constraint_item')], None, None),
-  105: Rule(NonTerminal('__anon_star_5'), [NonTerminal('__anon_star_5'), NonTerminal('func_constraint_item')], None, None),
-  106: Rule(NonTerminal('__anon_star_6'), [Terminal('COMMA', True), NonTerminal('type_name')], None, None),
-  107: Rule(NonTerminal('__anon_star_6'), [NonTerminal('__anon_star_6'), Terminal('COMMA', True), NonTerminal('type_name')], None, None),
-  108: Rule(NonTerminal('__anon_star_7'), [NonTerminal('global_pred')], None, None),
-  109: Rule(NonTerminal('__anon_star_7'), [NonTerminal('__anon_star_7'), NonTerminal('global_pred')], None, None),
-  110: Rule(NonTerminal('__anon_star_8'), [Terminal('COMMA', True), NonTerminal('pred_arg')], None, None),
-  111: Rule(NonTerminal('__anon_star_8'), [NonTerminal('__anon_star_8'), Terminal('COMMA', True), NonTerminal('pred_arg')], None, None),
+  76: Rule(NonTerminal('type_names'), [], None, RuleOptions(False, False, None)),
+  77: Rule(NonTerminal('type_names'), [NonTerminal('type_name')], None, RuleOptions(False, False, None)),
+  78: Rule(NonTerminal('global_preds'), [], None, RuleOptions(False, False, None)),
+  79: Rule(NonTerminal('global_preds'), [NonTerminal('__anon_star_7')], None, RuleOptions(False, False, None)),
+  80: Rule(NonTerminal('global_pred'), [Terminal('PREDICATE', True), NonTerminal('pred_body'), Terminal('SEMICOLON', True)], None, RuleOptions(False, True, None)),
+  81: Rule(NonTerminal('pred_body'), [NonTerminal('func_name'), Terminal('LPAR', True), NonTerminal('pred_args'), Terminal('RPAR', True)], None, RuleOptions(False, False, None)),
+  82: Rule(NonTerminal('pred_args'), [NonTerminal('pred_arg')], None, RuleOptions(False, False, None)),
+  83: Rule(NonTerminal('pred_args'), [NonTerminal('pred_arg'), NonTerminal('__anon_star_8')], None, RuleOptions(False, False, None)),
+  84: Rule(NonTerminal('pred_args'), [], None, RuleOptions(False, False, None)),
+  85: Rule(NonTerminal('pred_arg'), [Terminal('FALSE', True)], 'pred_false', RuleOptions(False, False, None)),
+  86: Rule(NonTerminal('pred_arg'), [NonTerminal('var_name')], 'pred_var', RuleOptions(False, False, None)),
+  87: Rule(NonTerminal('pred_arg'), [Terminal('TRUE', True)], 'pred_true', RuleOptions(False, False, None)),
+  88: Rule(NonTerminal('pred_arg'), [Terminal('STRLIT', False)], 'pred_str', RuleOptions(False, False, None)),
+  89: Rule(NonTerminal('pred_arg'), [Terminal('SNUMBER', False)], 'pred_num', RuleOptions(False, False, None)),
+  90: Rule(NonTerminal('enum_item'), [Terminal('STRLIT', False)], None, RuleOptions(False, True, None)),
+  91: Rule(NonTerminal('expr_type_name'), [Terminal('BOOL', True)], 'expr_bool', RuleOptions(False, True, None)),
+  92: Rule(NonTerminal('expr_type_name'), [Terminal('SET', True)], 'expr_set', RuleOptions(False, True, None)),
+  93: Rule(NonTerminal('expr_type_name'), [Terminal('__ANON_8', True)], 'expr_int', RuleOptions(False, True, None)),
+  94: Rule(NonTerminal('type_name'), [Terminal('NAME', False)], None, RuleOptions(False, True, None)),
+  95: Rule(NonTerminal('var_name'), [Terminal('NAME', False)], None, RuleOptions(False, True, None)),
+  96: Rule(NonTerminal('func_name'), [Terminal('NAME', False)], None, RuleOptions(False, True, None)),
+  97: Rule(NonTerminal('__anon_star_0'), [NonTerminal('type_decl')], None, None),
+  98: Rule(NonTerminal('__anon_star_0'), [NonTerminal('__anon_star_0'), NonTerminal('type_decl')], None, None),
+  99: Rule(NonTerminal('__anon_star_1'), [NonTerminal('__anon_star_1'), Terminal('COMMA', True), NonTerminal('enum_item')], None, None),
+  100: Rule(NonTerminal('__anon_star_1'), [Terminal('COMMA', True), NonTerminal('enum_item')], None, None),
+  101: Rule(NonTerminal('__anon_star_2'), [NonTerminal('value_item')], None, None),
+  102: Rule(NonTerminal('__anon_star_2'), [NonTerminal('__anon_star_2'), NonTerminal('value_item')], None, None),
+  103: Rule(NonTerminal('__anon_star_3'), [NonTerminal('__anon_star_3'), NonTerminal('func_decl')], None, None),
+  104: Rule(NonTerminal('__anon_star_3'), [NonTerminal('func_decl')], None, None),
+  105: Rule(NonTerminal('__anon_star_4'), [Terminal('COMMA', True), NonTerminal('func_rhs')], None, None),
+  106: Rule(NonTerminal('__anon_star_4'), [NonTerminal('__anon_star_4'), Terminal('COMMA', True), NonTerminal('func_rhs')], None, None),
+  107: Rule(NonTerminal('__anon_star_5'), [NonTerminal('__anon_star_5'), NonTerminal('func_constraint_item')], None, None),
+  108: Rule(NonTerminal('__anon_star_5'), [NonTerminal('func_constraint_item')], None, None),
+  109: Rule(NonTerminal('__anon_star_6'), [NonTerminal('__anon_star_6'), Terminal('COMMA', True), NonTerminal('type_name')], None, None),
+  110: Rule(NonTerminal('__anon_star_6'), [Terminal('COMMA', True), NonTerminal('type_name')], None, None),
+  111: Rule(NonTerminal('__anon_star_7'), [NonTerminal('global_pred')], None, None),
+  112: Rule(NonTerminal('__anon_star_7'), [NonTerminal('__anon_star_7'), NonTerminal('global_pred')], None, None),
+  113: Rule(NonTerminal('__anon_star_8'), [NonTerminal('__anon_star_8'), Terminal('COMMA', True), NonTerminal('pred_arg')], None, None),
+  114: Rule(NonTerminal('__anon_star_8'), [Terminal('COMMA', True), NonTerminal('pred_arg')], None, None),
 }
 parse_tree_builder = ParseTreeBuilder(RULES.values(), Tree)
 class ParseTable: pass
 parse_table = ParseTable()
 STATES = {
-  0: {0: (1, 1), 1: (0, 1), 2: (0, 2), 3: (0, 3), 4: (0, 4), 5: (0, 5), 6: (0, 6), 7: (0, 7), 8: (0, 8), 9: (0, 9), 10: (0, 10)},
-  1: {4: (1, 94), 5: (1, 94), 8: (1, 94), 0: (1, 94)},
-  2: {4: (1, 4), 5: (1, 4), 8: (1, 4), 0: (1, 4)},
-  3: {4: (1, 5), 5: (1, 5), 8: (1, 5), 0: (1, 5)},
-  4: {11: (0, 11), 12: (0, 12)},
-  5: {11: (0, 13), 12: (0, 12)},
-  6: {0: (0, 14), 13: (0, 15)},
-  7: {0: (1, 2), 2: (0, 2), 4: (0, 4), 5: (0, 5), 1: (0, 16), 3: (0, 3), 8: (0, 8), 9: (0, 9)},
-  8: {11: (0, 17), 12: (0, 12)},
-  9: {4: (1, 3), 5: (1, 3), 8: (1, 3), 0: (1, 3)},
-  10: {14: (0, 18)},
-  11: {15: (0, 19), 16: (0, 20), 17: (0, 21)},
-  12: {12: (1, 91), 18: (1, 91), 19: (1, 91), 20: (1, 91), 17: (1, 91), 16: (1, 91), 21: (1, 91)},
-  13: {22: (0, 22), 17: (0, 23), 16: (0, 24)},
-  14: {23: (0, 25), 12: (0, 26)},
-  15: {24: (1, 20), 14: (1, 20), 25: (0, 27), 26: (0, 28), 27: (0, 29), 28: (0, 30)},
-  16: {4: (1, 95), 5: (1, 95), 8: (1, 95), 0: (1, 95)},
-  17: {21: (0, 31)},
-  18: {},
-  19: {5: (1, 6), 0: (1, 6), 4: (1, 6), 8: (1, 6)},
+  0: {0: (1, 2), 1: (0, 1), 2: (0, 2), 3: (0, 3), 4: (0, 4), 5: (0, 5), 6: (0, 6), 7: (0, 7), 8: (0, 8), 9: (0, 9), 10: (0, 10)},
+  1: {11: (0, 11)},
+  2: {0: (1, 1), 9: (0, 12), 3: (0, 3), 4: (0, 4), 8: (0, 8), 7: (0, 7), 5: (0, 5), 10: (0, 10)},
+  3: {0: (1, 5), 4: (1, 5), 8: (1, 5), 5: (1, 5)},
+  4: {12: (0, 13), 13: (0, 14)},
+  5: {12: (0, 15), 13: (0, 14)},
+  6: {0: (0, 16), 14: (0, 17)},
+  7: {0: (1, 4), 4: (1, 4), 8: (1, 4), 5: (1, 4)},
+  8: {12: (0, 18), 13: (0, 14)},
+  9: {0: (1, 97), 4: (1, 97), 8: (1, 97), 5: (1, 97)},
+  10: {0: (1, 3), 4: (1, 3), 8: (1, 3), 5: (1, 3)},
+  11: {},
+  12: {0: (1, 98), 4: (1, 98), 8: (1, 98), 5: (1, 98)},
+  13: {15: (0, 19), 16: (0, 20), 17: (0, 21)},
+  14: {18: (1, 94), 13: (1, 94), 16: (1, 94), 17: (1, 94), 19: (1, 94), 20: (1, 94), 21: (1, 94)},
+  15: {16: (0, 22), 22: (0, 23), 17: (0, 24)},
+  16: {23: (0, 25), 13: (0, 26)},
+  17: {24: (1, 19), 11: (1, 19), 25: (0, 27), 26: (0, 28), 27: (0, 29), 28: (0, 30)},
+  18: {21: (0, 31)},
+  19: {4: (1, 6), 8: (1, 6), 0: (1, 6), 5: (1, 6)},
   20: {29: (0, 32), 30: (0, 33), 31: (0, 34)},
-  21: {5: (1, 8), 0: (1, 8), 4: (1, 8), 8: (1, 8)},
-  22: {5: (1, 12), 0: (1, 12), 4: (1, 12), 8: (1, 12)},
-  23: {5: (1, 13), 0: (1, 13), 4: (1, 13), 8: (1, 13)},
-  24: {32: (0, 35), 33: (0, 36), 12: (0, 26), 23: (0, 37)},
+  21: {4: (1, 9), 8: (1, 9), 0: (1, 9), 5: (1, 9)},
+  22: {13: (0, 26), 32: (0, 35), 33: (0, 36), 23: (0, 37)},
+  23: {4: (1, 12), 8: (1, 12), 0: (1, 12), 5: (1, 12)},
+  24: {4: (1, 14), 8: (1, 14), 0: (1, 14), 5: (1, 14)},
   25: {34: (0, 38)},
-  26: {35: (1, 93), 34: (1, 93)},
-  27: {24: (1, 19), 14: (1, 19), 28: (0, 39), 26: (0, 28)},
-  28: {23: (0, 40), 12: (0, 26)},
-  29: {14: (1, 76), 36: (0, 41), 37: (0, 42), 24: (0, 43), 38: (0, 44)},
-  30: {24: (1, 101), 26: (1, 101), 14: (1, 101)},
+  26: {35: (1, 96), 34: (1, 96)},
+  27: {24: (1, 20), 11: (1, 20), 26: (0, 39), 27: (0, 29)},
+  28: {24: (1, 104), 27: (1, 104), 11: (1, 104)},
+  29: {13: (0, 26), 23: (0, 40)},
+  30: {11: (1, 78), 24: (0, 41), 36: (0, 42), 37: (0, 43), 38: (0, 44)},
   31: {39: (0, 45)},
-  32: {40: (1, 10), 20: (0, 46), 41: (0, 47)},
-  33: {40: (0, 48)},
-  34: {40: (1, 88), 20: (1, 88)},
-  35: {40: (1, 15), 42: (0, 49), 12: (0, 26), 23: (0, 37), 32: (0, 50)},
+  32: {40: (1, 90), 19: (1, 90)},
+  33: {40: (0, 46)},
+  34: {40: (1, 10), 41: (0, 47), 19: (0, 48)},
+  35: {40: (1, 15), 13: (0, 26), 42: (0, 49), 32: (0, 50), 23: (0, 37)},
   36: {40: (0, 51)},
   37: {35: (0, 52)},
-  38: {19: (1, 74), 12: (0, 12), 43: (0, 53), 11: (0, 54)},
-  39: {24: (1, 100), 26: (1, 100), 14: (1, 100)},
+  38: {20: (1, 76), 12: (0, 53), 13: (0, 14), 43: (0, 54)},
+  39: {24: (1, 103), 27: (1, 103), 11: (1, 103)},
   40: {35: (0, 55)},
-  41: {24: (1, 108), 14: (1, 108)},
-  42: {14: (1, 77), 24: (0, 43), 36: (0, 56)},
-  43: {23: (0, 57), 12: (0, 26), 44: (0, 58)},
-  44: {14: (1, 0)},
+  41: {23: (0, 56), 44: (0, 57), 13: (0, 26)},
+  42: {11: (1, 79), 24: (0, 41), 37: (0, 58)},
+  43: {24: (1, 111), 11: (1, 111)},
+  44: {11: (1, 0)},
   45: {45: (0, 59)},
-  46: {29: (0, 60), 31: (0, 34)},
-  47: {40: (1, 11), 20: (0, 61)},
-  48: {5: (1, 9), 0: (1, 9), 4: (1, 9), 8: (1, 9)},
-  49: {40: (1, 16), 32: (0, 62), 23: (0, 37), 12: (0, 26)},
-  50: {12: (1, 98), 40: (1, 98)},
-  51: {5: (1, 14), 0: (1, 14), 4: (1, 14), 8: (1, 14)},
-  52: {46: (0, 63), 47: (0, 64), 48: (0, 65)},
-  53: {19: (0, 66)},
-  54: {19: (1, 73), 20: (0, 67), 49: (0, 68)},
-  55: {11: (0, 69), 12: (0, 12), 50: (0, 70), 51: (0, 71), 52: (0, 72)},
-  56: {24: (1, 109), 14: (1, 109)},
-  57: {34: (0, 73)},
-  58: {17: (0, 74)},
-  59: {17: (0, 21), 16: (0, 20), 15: (0, 75)},
-  60: {40: (1, 96), 20: (1, 96)},
-  61: {29: (0, 76), 31: (0, 34)},
-  62: {12: (1, 99), 40: (1, 99)},
-  63: {17: (0, 77)},
-  64: {17: (1, 89)},
-  65: {17: (1, 90)},
-  66: {18: (0, 78)},
-  67: {12: (0, 12), 11: (0, 79)},
-  68: {19: (1, 75), 20: (0, 80)},
-  69: {18: (1, 28), 17: (1, 28), 20: (1, 28), 16: (1, 28), 53: (0, 81), 12: (0, 82)},
-  70: {18: (0, 83)},
-  71: {18: (1, 23)},
-  72: {54: (0, 84), 17: (0, 85), 16: (0, 86)},
-  73: {19: (1, 82), 55: (0, 87), 56: (0, 88), 12: (0, 82), 53: (0, 89), 57: (0, 90), 58: (0, 91), 59: (0, 92), 31: (0, 93)},
-  74: {24: (1, 78), 14: (1, 78)},
-  75: {5: (1, 7), 0: (1, 7), 4: (1, 7), 8: (1, 7)},
-  76: {40: (1, 97), 20: (1, 97)},
-  77: {12: (1, 17), 40: (1, 17)},
-  78: {11: (0, 94), 12: (0, 12)},
-  79: {19: (1, 106), 20: (1, 106)},
-  80: {11: (0, 95), 12: (0, 12)},
-  81: {18: (1, 27), 17: (1, 27), 20: (1, 27), 16: (1, 27)},
-  82: {18: (1, 92), 60: (1, 92), 61: (1, 92), 62: (1, 92), 63: (1, 92), 64: (1, 92), 19: (1, 92), 20: (1, 92), 65: (1, 92), 66: (1, 92), 67: (1, 92), 68: (1, 92), 69: (1, 92), 17: (1, 92), 70: (1, 92), 16: (1, 92), 71: (1, 92), 72: (1, 92), 73: (1, 92), 74: (1, 92), 75: (1, 92)},
-  83: {51: (0, 96), 11: (0, 69), 76: (0, 97), 12: (0, 12), 77: (0, 98)},
-  84: {24: (1, 21), 26: (1, 21), 14: (1, 21)},
-  85: {24: (1, 29), 26: (1, 29), 14: (1, 29)},
-  86: {78: (0, 99), 79: (0, 100), 80: (0, 101), 34: (0, 102), 81: (0, 103), 55: (0, 104), 82: (0, 105), 12: (0, 106), 23: (0, 107), 83: (0, 108), 84: (0, 109), 85: (0, 110), 86: (0, 111), 87: (0, 112), 88: (0, 113), 58: (0, 114), 89: (0, 115), 90: (0, 116), 91: (0, 117), 92: (0, 118), 93: (0, 119), 69: (0, 120), 39: (0, 121), 94: (0, 122), 95: (0, 123), 53: (0, 124)},
-  87: {19: (1, 84), 20: (1, 84)},
-  88: {19: (1, 81), 20: (0, 125), 96: (0, 126)},
-  89: {19: (1, 83), 20: (1, 83)},
-  90: {19: (1, 85), 20: (1, 85)},
-  91: {19: (1, 86), 20: (1, 86)},
-  92: {19: (0, 127)},
-  93: {19: (1, 87), 20: (1, 87)},
-  94: {17: (0, 128)},
-  95: {19: (1, 107), 20: (1, 107)},
-  96: {17: (1, 26), 20: (1, 26), 16: (1, 26)},
-  97: {17: (1, 22), 16: (1, 22)},
-  98: {17: (1, 24), 16: (1, 24), 97: (0, 129), 20: (0, 130)},
-  99: {17: (0, 131)},
-  100: {72: (1, 40), 62: (1, 40), 19: (1, 40), 17: (1, 40), 73: (1, 40), 66: (1, 40), 71: (1, 40), 98: (0, 132), 74: (0, 133), 64: (0, 134), 60: (0, 135), 68: (0, 136), 70: (0, 137), 65: (0, 138)},
-  101: {17: (1, 36), 72: (1, 36), 66: (1, 36), 19: (1, 36), 71: (0, 139), 73: (0, 140)},
-  102: {79: (0, 100), 80: (0, 101), 58: (0, 114), 34: (0, 102), 89: (0, 115), 81: (0, 103), 91: (0, 117), 55: (0, 104), 92: (0, 118), 82: (0, 105), 12: (0, 106), 23: (0, 107), 93: (0, 119), 69: (0, 120), 84: (0, 109), 39: (0, 121), 78: (0, 141), 85: (0, 110), 94: (0, 122), 86: (0, 111), 95: (0, 123), 87: (0, 112), 53: (0, 124), 88: (0, 113)},
-  103: {17: (1, 35), 19: (1, 35)},
-  104: {60: (1, 68), 61: (1, 68), 62: (1, 68), 63: (1, 68), 64: (1, 68), 19: (1, 68), 65: (1, 68), 66: (1, 68), 67: (1, 68), 68: (1, 68), 69: (1, 68), 17: (1, 68), 70: (1, 68), 71: (1, 68), 72: (1, 68), 73: (1, 68), 74: (1, 68), 75: (1, 68)},
-  105: {72: (1, 38), 19: (1, 38), 17: (1, 38), 73: (1, 38), 66: (1, 38), 71: (1, 38), 62: (0, 142)},
-  106: {18: (1, 92), 60: (1, 92), 61: (1, 92), 62: (1, 92), 63: (1, 92), 64: (1, 92), 19: (1, 92), 20: (1, 92), 65: (1, 92), 66: (1, 92), 67: (1, 92), 68: (1, 92), 69: (1, 92), 17: (1, 92), 70: (1, 92), 16: (1, 92), 71: (1, 92), 72: (1, 92), 73: (1, 92), 74: (1, 92), 75: (1, 92), 35: (1, 93), 34: (1, 93)},
-  107: {34: (0, 143)},
-  108: {40: (1, 31), 78: (0, 99), 79: (0, 100), 80: (0, 101), 34: (0, 102), 81: (0, 103), 55: (0, 104), 82: (0, 105), 12: (0, 106), 23: (0, 107), 84: (0, 109), 83: (0, 144), 85: (0, 110), 86: (0, 111), 87: (0, 112), 99: (0, 145), 88: (0, 113), 58: (0, 114), 89: (0, 115), 91: (0, 117), 92: (0, 118), 93: (0, 119), 69: (0, 120), 39: (0, 121), 94: (0, 122), 95: (0, 123), 53: (0, 124)},
-  109: {39: (0, 121), 88: (0, 113), 94: (0, 122), 91: (0, 146), 58: (0, 114), 12: (0, 106), 34: (0, 102), 55: (0, 104), 92: (0, 118), 53: (0, 124), 23: (0, 107)},
-  110: {60: (1, 43), 68: (1, 43), 62: (1, 43), 17: (1, 43), 70: (1, 43), 64: (1, 43), 71: (1, 43), 72: (1, 43), 19: (1, 43), 65: (1, 43), 73: (1, 43), 74: (1, 43), 66: (1, 43), 100: (0, 147), 69: (0, 148), 61: (0, 149)},
-  111: {79: (0, 100), 93: (0, 150), 80: (0, 101), 58: (0, 114), 34: (0, 102), 89: (0, 115), 91: (0, 117), 55: (0, 104), 92: (0, 118), 82: (0, 105), 12: (0, 106), 23: (0, 107), 69: (0, 120), 84: (0, 109), 39: (0, 121), 85: (0, 110), 94: (0, 122), 95: (0, 123), 87: (0, 112), 53: (0, 124), 88: (0, 113)},
-  112: {12: (1, 61), 34: (1, 61), 58: (1, 61), 55: (1, 61), 39: (1, 61)},
-  113: {60: (1, 66), 67: (1, 66), 61: (1, 66), 68: (1, 66), 62: (1, 66), 69: (1, 66), 17: (1, 66), 70: (1, 66), 63: (1, 66), 64: (1, 66), 71: (1, 66), 72: (1, 66), 19: (1, 66), 65: (1, 66), 73: (1, 66), 74: (1, 66), 66: (1, 66), 75: (1, 66)},
-  114: {60: (1, 69), 61: (1, 69), 62: (1, 69), 63: (1, 69), 64: (1, 69), 19: (1, 69), 65: (1, 69), 66: (1, 69), 67: (1, 69), 68: (1, 69), 69: (1, 69), 17: (1, 69), 70: (1, 69), 71: (1, 69), 72: (1, 69), 73: (1, 69), 74: (1, 69), 75: (1, 69)},
-  115: {60: (1, 54), 67: (1, 54), 61: (1, 54), 68: (1, 54), 62: (1, 54), 69: (1, 54), 17: (1, 54), 70: (1, 54), 63: (1, 54), 64: (1, 54), 71: (1, 54), 72: (1, 54), 19: (1, 54), 65: (1, 54), 73: (1, 54), 74: (1, 54), 66: (1, 54), 75: (1, 54)},
-  116: {40: (0, 151)},
-  117: {60: (1, 60), 67: (1, 60), 61: (1, 60), 68: (1, 60), 62: (1, 60), 69: (1, 60), 17: (1, 60), 70: (1, 60), 63: (1, 60), 64: (1, 60), 71: (1, 60), 72: (1, 60), 19: (1, 60), 65: (1, 60), 73: (1, 60), 74: (1, 60), 66: (1, 60), 75: (1, 60)},
-  118: {60: (1, 64), 67: (1, 64), 61: (1, 64), 68: (1, 64), 62: (1, 64), 69: (1, 64), 17: (1, 64), 70: (1, 64), 63: (1, 64), 64: (1, 64), 71: (1, 64), 72: (1, 64), 19: (1, 64), 65: (1, 64), 73: (1, 64), 74: (1, 64), 66: (1, 64), 75: (1, 64)},
-  119: {17: (1, 34), 19: (1, 34)},
-  120: {12: (1, 62), 34: (1, 62), 58: (1, 62), 55: (1, 62), 39: (1, 62)},
-  121: {60: (1, 67), 61: (1, 67), 62: (1, 67), 63: (1, 67), 64: (1, 67), 19: (1, 67), 65: (1, 67), 66: (1, 67), 67: (1, 67), 68: (1, 67), 69: (1, 67), 17: (1, 67), 70: (1, 67), 71: (1, 67), 72: (1, 67), 73: (1, 67), 74: (1, 67), 75: (1, 67)},
-  122: {60: (1, 63), 67: (1, 63), 61: (1, 63), 68: (1, 63), 62: (1, 63), 69: (1, 63), 17: (1, 63), 70: (1, 63), 63: (1, 63), 64: (1, 63), 71: (1, 63), 72: (1, 63), 19: (1, 63), 65: (1, 63), 73: (1, 63), 74: (1, 63), 66: (1, 63), 75: (1, 63)},
-  123: {60: (1, 51), 61: (1, 51), 68: (1, 51), 62: (1, 51), 69: (1, 51), 17: (1, 51), 70: (1, 51), 64: (1, 51), 71: (1, 51), 72: (1, 51), 19: (1, 51), 65: (1, 51), 73: (1, 51), 74: (1, 51), 66: (1, 51), 75: (0, 152), 101: (0, 153), 63: (0, 154), 67: (0, 155)},
-  124: {60: (1, 70), 61: (1, 70), 62: (1, 70), 63: (1, 70), 64: (1, 70), 19: (1, 70), 65: (1, 70), 66: (1, 70), 67: (1, 70), 68: (1, 70), 69: (1, 70), 17: (1, 70), 70: (1, 70), 71: (1, 70), 72: (1, 70), 73: (1, 70), 74: (1, 70), 75: (1, 70)},
-  125: {55: (0, 87), 12: (0, 82), 53: (0, 89), 57: (0, 90), 56: (0, 156), 58: (0, 91), 31: (0, 93)},
-  126: {19: (1, 80), 20: (0, 157)},
-  127: {17: (1, 79)},
-  128: {24: (1, 18), 14: (1, 18), 26: (1, 18)},
-  129: {17: (1, 25), 16: (1, 25), 20: (0, 158)},
-  130: {51: (0, 96), 11: (0, 69), 12: (0, 12), 77: (0, 159)},
-  131: {12: (1, 33), 39: (1, 33), 34: (1, 33), 87: (1, 33), 69: (1, 33), 58: (1, 33), 55: (1, 33), 86: (1, 33), 40: (1, 33)},
-  132: {58: (0, 114), 34: (0, 102), 89: (0, 115), 91: (0, 117), 55: (0, 104), 92: (0, 118), 12: (0, 106), 23: (0, 107), 69: (0, 120), 39: (0, 121), 84: (0, 109), 94: (0, 122), 95: (0, 123), 87: (0, 112), 53: (0, 124), 85: (0, 160), 88: (0, 113)},
-  133: {12: (1, 48), 34: (1, 48), 87: (1, 48), 58: (1, 48), 69: (1, 48), 55: (1, 48), 39: (1, 48)},
-  134: {12: (1, 45), 34: (1, 45), 87: (1, 45), 58: (1, 45), 69: (1, 45), 55: (1, 45), 39: (1, 45)},
-  135: {12: (1, 44), 34: (1, 44), 87: (1, 44), 58: (1, 44), 69: (1, 44), 55: (1, 44), 39: (1, 44)},
-  136: {12: (1, 47), 34: (1, 47), 87: (1, 47), 58: (1, 47), 69: (1, 47), 55: (1, 47), 39: (1, 47)},
-  137: {12: (1, 49), 34: (1, 49), 87: (1, 49), 58: (1, 49), 69: (1, 49), 55: (1, 49), 39: (1, 49)},
-  138: {12: (1, 46), 34: (1, 46), 87: (1, 46), 58: (1, 46), 69: (1, 46), 55: (1, 46), 39: (1, 46)},
-  139: {79: (0, 100), 58: (0, 114), 34: (0, 102), 89: (0, 115), 91: (0, 117), 55: (0, 104), 92: (0, 118), 82: (0, 161), 12: (0, 106), 23: (0, 107), 69: (0, 120), 39: (0, 121), 84: (0, 109), 94: (0, 122), 85: (0, 110), 95: (0, 123), 87: (0, 112), 53: (0, 124), 88: (0, 113)},
-  140: {79: (0, 100), 80: (0, 101), 58: (0, 114), 34: (0, 102), 89: (0, 115), 91: (0, 117), 55: (0, 104), 92: (0, 118), 82: (0, 105), 12: (0, 106), 23: (0, 107), 69: (0, 120), 84: (0, 109), 39: (0, 121), 85: (0, 110), 94: (0, 122), 95: (0, 123), 87: (0, 112), 53: (0, 124), 88: (0, 113), 93: (0, 162)},
-  141: {19: (0, 163)},
-  142: {79: (0, 164), 58: (0, 114), 34: (0, 102), 89: (0, 115), 91: (0, 117), 55: (0, 104), 92: (0, 118), 12: (0, 106), 23: (0, 107), 69: (0, 120), 39: (0, 121), 84: (0, 109), 94: (0, 122), 85: (0, 110), 95: (0, 123), 87: (0, 112), 53: (0, 124), 88: (0, 113)},
-  143: {53: (0, 124), 92: (0, 165), 12: (0, 82)},
-  144: {12: (1, 104), 39: (1, 104), 34: (1, 104), 87: (1, 104), 69: (1, 104), 58: (1, 104), 55: (1, 104), 86: (1, 104), 40: (1, 104)},
-  145: {40: (1, 32), 78: (0, 99), 79: (0, 100), 80: (0, 101), 34: (0, 102), 81: (0, 103), 55: (0, 104), 82: (0, 105), 12: (0, 106), 23: (0, 107), 84: (0, 109), 85: (0, 110), 86: (0, 111), 87: (0, 112), 88: (0, 113), 58: (0, 114), 89: (0, 115), 91: (0, 117), 92: (0, 118), 93: (0, 119), 69: (0, 120), 39: (0, 121), 94: (0, 122), 95: (0, 123), 83: (0, 166), 53: (0, 124)},
-  146: {60: (1, 59), 67: (1, 59), 61: (1, 59), 68: (1, 59), 62: (1, 59), 69: (1, 59), 17: (1, 59), 70: (1, 59), 63: (1, 59), 64: (1, 59), 71: (1, 59), 72: (1, 59), 19: (1, 59), 65: (1, 59), 73: (1, 59), 74: (1, 59), 66: (1, 59), 75: (1, 59)},
-  147: {58: (0, 114), 34: (0, 102), 89: (0, 115), 91: (0, 117), 55: (0, 104), 92: (0, 118), 12: (0, 106), 23: (0, 107), 69: (0, 120), 39: (0, 121), 84: (0, 109), 94: (0, 122), 87: (0, 112), 95: (0, 167), 53: (0, 124), 88: (0, 113)},
-  148: {12: (1, 52), 34: (1, 52), 87: (1, 52), 58: (1, 52), 69: (1, 52), 55: (1, 52), 39: (1, 52)},
-  149: {12: (1, 53), 34: (1, 53), 87: (1, 53), 58: (1, 53), 69: (1, 53), 55: (1, 53), 39: (1, 53)},
-  150: {72: (0, 168)},
-  151: {24: (1, 30), 26: (1, 30), 14: (1, 30)},
-  152: {12: (1, 56), 34: (1, 56), 87: (1, 56), 69: (1, 56), 58: (1, 56), 55: (1, 56), 39: (1, 56)},
-  153: {58: (0, 114), 34: (0, 102), 91: (0, 117), 55: (0, 104), 92: (0, 118), 12: (0, 106), 23: (0, 107), 69: (0, 120), 39: (0, 121), 84: (0, 109), 94: (0, 122), 87: (0, 112), 89: (0, 169), 53: (0, 124), 88: (0, 113)},
-  154: {12: (1, 57), 34: (1, 57), 87: (1, 57), 69: (1, 57), 58: (1, 57), 55: (1, 57), 39: (1, 57)},
-  155: {12: (1, 58), 34: (1, 58), 87: (1, 58), 69: (1, 58), 58: (1, 58), 55: (1, 58), 39: (1, 58)},
-  156: {19: (1, 110), 20: (1, 110)},
-  157: {55: (0, 87), 12: (0, 82), 57: (0, 90), 53: (0, 89), 58: (0, 91), 31: (0, 93), 56: (0, 170)},
-  158: {51: (0, 96), 11: (0, 69), 12: (0, 12), 77: (0, 171)},
-  159: {17: (1, 103), 20: (1, 103), 16: (1, 103)},
-  160: {60: (1, 42), 68: (1, 42), 62: (1, 42), 17: (1, 42), 70: (1, 42), 64: (1, 42), 71: (1, 42), 72: (1, 42), 19: (1, 42), 65: (1, 42), 73: (1, 42), 74: (1, 42), 66: (1, 42), 100: (0, 147), 69: (0, 148), 61: (0, 149)},
-  161: {72: (1, 39), 19: (1, 39), 17: (1, 39), 73: (1, 39), 66: (1, 39), 71: (1, 39), 62: (0, 142)},
-  162: {17: (1, 37), 72: (1, 37), 66: (1, 37), 19: (1, 37)},
-  163: {60: (1, 65), 67: (1, 65), 61: (1, 65), 68: (1, 65), 62: (1, 65), 69: (1, 65), 17: (1, 65), 70: (1, 65), 63: (1, 65), 64: (1, 65), 71: (1, 65), 72: (1, 65), 19: (1, 65), 65: (1, 65), 73: (1, 65), 74: (1, 65), 66: (1, 65), 75: (1, 65)},
-  164: {72: (1, 41), 62: (1, 41), 19: (1, 41), 17: (1, 41), 73: (1, 41), 66: (1, 41), 71: (1, 41), 98: (0, 132), 74: (0, 133), 64: (0, 134), 60: (0, 135), 68: (0, 136), 70: (0, 137), 65: (0, 138)},
-  165: {19: (0, 172)},
-  166: {12: (1, 105), 39: (1, 105), 34: (1, 105), 87: (1, 105), 69: (1, 105), 58: (1, 105), 55: (1, 105), 86: (1, 105), 40: (1, 105)},
-  167: {60: (1, 50), 61: (1, 50), 68: (1, 50), 62: (1, 50), 69: (1, 50), 17: (1, 50), 70: (1, 50), 64: (1, 50), 71: (1, 50), 72: (1, 50), 19: (1, 50), 65: (1, 50), 73: (1, 50), 74: (1, 50), 66: (1, 50), 75: (0, 152), 101: (0, 153), 63: (0, 154), 67: (0, 155)},
-  168: {79: (0, 100), 80: (0, 101), 58: (0, 114), 34: (0, 102), 89: (0, 115), 91: (0, 117), 55: (0, 104), 92: (0, 118), 82: (0, 105), 12: (0, 106), 23: (0, 107), 69: (0, 120), 84: (0, 109), 39: (0, 121), 85: (0, 110), 94: (0, 122), 95: (0, 123), 87: (0, 112), 53: (0, 124), 88: (0, 113), 93: (0, 173)},
-  169: {60: (1, 55), 67: (1, 55), 61: (1, 55), 68: (1, 55), 62: (1, 55), 69: (1, 55), 17: (1, 55), 70: (1, 55), 63: (1, 55), 64: (1, 55), 71: (1, 55), 72: (1, 55), 19: (1, 55), 65: (1, 55), 73: (1, 55), 74: (1, 55), 66: (1, 55), 75: (1, 55)},
-  170: {19: (1, 111), 20: (1, 111)},
-  171: {17: (1, 102), 20: (1, 102), 16: (1, 102)},
-  172: {60: (1, 72), 61: (1, 72), 62: (1, 72), 63: (1, 72), 64: (1, 72), 19: (1, 72), 65: (1, 72), 66: (1, 72), 67: (1, 72), 68: (1, 72), 69: (1, 72), 17: (1, 72), 70: (1, 72), 71: (1, 72), 72: (1, 72), 73: (1, 72), 74: (1, 72), 75: (1, 72)},
-  173: {66: (0, 174)},
-  174: {79: (0, 100), 80: (0, 101), 58: (0, 114), 34: (0, 102), 89: (0, 115), 93: (0, 175), 91: (0, 117), 55: (0, 104), 92: (0, 118), 82: (0, 105), 12: (0, 106), 23: (0, 107), 69: (0, 120), 84: (0, 109), 39: (0, 121), 85: (0, 110), 94: (0, 122), 95: (0, 123), 87: (0, 112), 53: (0, 124), 88: (0, 113)},
-  175: {17: (1, 71), 19: (1, 71)},
+  46: {4: (1, 8), 8: (1, 8), 0: (1, 8), 5: (1, 8)},
+  47: {40: (1, 11), 19: (0, 60)},
+  48: {29: (0, 32), 31: (0, 61)},
+  49: {40: (1, 16), 13: (0, 26), 32: (0, 62), 23: (0, 37)},
+  50: {40: (1, 101), 13: (1, 101)},
+  51: {4: (1, 13), 8: (1, 13), 0: (1, 13), 5: (1, 13)},
+  52: {46: (0, 63), 47: (0, 64), 48: (0, 65), 49: (0, 66)},
+  53: {20: (1, 77), 50: (0, 67), 19: (0, 68)},
+  54: {20: (0, 69)},
+  55: {51: (0, 70), 13: (0, 14), 12: (0, 71), 52: (0, 72), 53: (0, 73)},
+  56: {34: (0, 74)},
+  57: {17: (0, 75)},
+  58: {24: (1, 112), 11: (1, 112)},
+  59: {15: (0, 76), 16: (0, 20), 17: (0, 21)},
+  60: {29: (0, 32), 31: (0, 77)},
+  61: {40: (1, 100), 19: (1, 100)},
+  62: {40: (1, 102), 13: (1, 102)},
+  63: {17: (1, 92)},
+  64: {17: (1, 91)},
+  65: {17: (1, 93)},
+  66: {17: (0, 78)},
+  67: {20: (1, 75), 19: (0, 79)},
+  68: {12: (0, 80), 13: (0, 14)},
+  69: {18: (0, 81)},
+  70: {17: (0, 82), 54: (0, 83), 16: (0, 84)},
+  71: {16: (1, 28), 17: (1, 28), 18: (1, 28), 19: (1, 28), 55: (0, 85), 13: (0, 86)},
+  72: {18: (1, 23)},
+  73: {18: (0, 87)},
+  74: {20: (1, 84), 56: (0, 88), 57: (0, 89), 58: (0, 90), 29: (0, 91), 59: (0, 92), 55: (0, 93), 60: (0, 94), 13: (0, 86)},
+  75: {24: (1, 80), 11: (1, 80)},
+  76: {4: (1, 7), 8: (1, 7), 0: (1, 7), 5: (1, 7)},
+  77: {40: (1, 99), 19: (1, 99)},
+  78: {40: (1, 17), 13: (1, 17)},
+  79: {12: (0, 95), 13: (0, 14)},
+  80: {20: (1, 110), 19: (1, 110)},
+  81: {12: (0, 96), 13: (0, 14)},
+  82: {24: (1, 29), 27: (1, 29), 11: (1, 29)},
+  83: {24: (1, 21), 27: (1, 21), 11: (1, 21)},
+  84: {61: (0, 97), 62: (0, 98), 63: (0, 99), 64: (0, 100), 65: (0, 101), 34: (0, 102), 66: (0, 103), 67: (0, 104), 23: (0, 105), 68: (0, 106), 69: (0, 107), 70: (0, 108), 39: (0, 109), 71: (0, 110), 55: (0, 111), 72: (0, 112), 73: (0, 113), 74: (0, 114), 56: (0, 115), 13: (0, 116), 75: (0, 117), 76: (0, 118), 77: (0, 119), 78: (0, 120), 79: (0, 121), 58: (0, 122)},
+  85: {16: (1, 27), 17: (1, 27), 18: (1, 27), 19: (1, 27)},
+  86: {80: (1, 95), 81: (1, 95), 82: (1, 95), 18: (1, 95), 83: (1, 95), 84: (1, 95), 85: (1, 95), 86: (1, 95), 17: (1, 95), 87: (1, 95), 88: (1, 95), 89: (1, 95), 90: (1, 95), 91: (1, 95), 20: (1, 95), 92: (1, 95), 93: (1, 95), 76: (1, 95), 94: (1, 95), 16: (1, 95), 95: (1, 95), 96: (1, 95), 19: (1, 95)},
+  87: {97: (0, 123), 13: (0, 14), 52: (0, 124), 12: (0, 71), 98: (0, 125)},
+  88: {20: (1, 85), 19: (1, 85)},
+  89: {20: (1, 82), 19: (0, 126), 99: (0, 127)},
+  90: {20: (1, 87), 19: (1, 87)},
+  91: {20: (1, 88), 19: (1, 88)},
+  92: {20: (1, 89), 19: (1, 89)},
+  93: {20: (1, 86), 19: (1, 86)},
+  94: {20: (0, 128)},
+  95: {20: (1, 109), 19: (1, 109)},
+  96: {17: (0, 129)},
+  97: {80: (1, 51), 81: (1, 51), 90: (1, 51), 82: (1, 51), 83: (1, 51), 86: (1, 51), 17: (1, 51), 20: (1, 51), 92: (1, 51), 93: (1, 51), 76: (1, 51), 94: (1, 51), 88: (1, 51), 95: (1, 51), 89: (1, 51), 96: (1, 51), 100: (0, 130), 85: (0, 131), 91: (0, 132), 87: (0, 133), 84: (0, 134)},
+  98: {80: (1, 65), 81: (1, 65), 82: (1, 65), 83: (1, 65), 84: (1, 65), 85: (1, 65), 86: (1, 65), 17: (1, 65), 87: (1, 65), 88: (1, 65), 89: (1, 65), 90: (1, 65), 91: (1, 65), 20: (1, 65), 92: (1, 65), 93: (1, 65), 76: (1, 65), 94: (1, 65), 95: (1, 65), 96: (1, 65)},
+  99: {80: (1, 38), 81: (1, 38), 93: (1, 38), 95: (1, 38), 17: (1, 38), 20: (1, 38), 86: (0, 135)},
+  100: {20: (1, 34), 17: (1, 34)},
+  101: {80: (1, 40), 81: (1, 40), 93: (1, 40), 86: (1, 40), 95: (1, 40), 17: (1, 40), 20: (1, 40), 89: (0, 136), 83: (0, 137), 94: (0, 138), 101: (0, 139), 92: (0, 140), 82: (0, 141), 90: (0, 142)},
+  102: {71: (0, 110), 61: (0, 97), 55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 63: (0, 99), 13: (0, 116), 64: (0, 100), 65: (0, 101), 34: (0, 102), 70: (0, 108), 75: (0, 117), 67: (0, 104), 76: (0, 118), 74: (0, 143), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 69: (0, 107), 79: (0, 121), 39: (0, 109), 58: (0, 122)},
+  103: {40: (1, 31), 61: (0, 97), 62: (0, 98), 63: (0, 99), 64: (0, 100), 65: (0, 101), 34: (0, 102), 67: (0, 104), 23: (0, 105), 68: (0, 106), 69: (0, 107), 70: (0, 108), 66: (0, 144), 39: (0, 109), 71: (0, 110), 55: (0, 111), 72: (0, 112), 74: (0, 114), 56: (0, 115), 13: (0, 116), 102: (0, 145), 75: (0, 117), 76: (0, 118), 77: (0, 119), 78: (0, 120), 79: (0, 121), 58: (0, 122)},
+  104: {80: (1, 68), 81: (1, 68), 82: (1, 68), 83: (1, 68), 84: (1, 68), 85: (1, 68), 86: (1, 68), 17: (1, 68), 87: (1, 68), 88: (1, 68), 89: (1, 68), 90: (1, 68), 91: (1, 68), 20: (1, 68), 92: (1, 68), 93: (1, 68), 76: (1, 68), 94: (1, 68), 95: (1, 68), 96: (1, 68)},
+  105: {34: (0, 146)},
+  106: {80: (1, 56), 81: (1, 56), 90: (1, 56), 82: (1, 56), 83: (1, 56), 84: (1, 56), 91: (1, 56), 85: (1, 56), 86: (1, 56), 17: (1, 56), 20: (1, 56), 92: (1, 56), 93: (1, 56), 76: (1, 56), 94: (1, 56), 87: (1, 56), 88: (1, 56), 95: (1, 56), 89: (1, 56), 96: (1, 56)},
+  107: {71: (0, 110), 61: (0, 97), 55: (0, 111), 62: (0, 98), 72: (0, 112), 79: (0, 147), 56: (0, 115), 63: (0, 99), 13: (0, 116), 65: (0, 101), 34: (0, 102), 70: (0, 108), 75: (0, 117), 67: (0, 104), 76: (0, 118), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  108: {95: (1, 37), 93: (1, 37), 17: (1, 37), 20: (1, 37), 81: (0, 148), 80: (0, 149)},
+  109: {80: (1, 71), 81: (1, 71), 82: (1, 71), 83: (1, 71), 84: (1, 71), 85: (1, 71), 86: (1, 71), 17: (1, 71), 87: (1, 71), 88: (1, 71), 89: (1, 71), 90: (1, 71), 91: (1, 71), 20: (1, 71), 92: (1, 71), 93: (1, 71), 76: (1, 71), 94: (1, 71), 95: (1, 71), 96: (1, 71)},
+  110: {80: (1, 43), 81: (1, 43), 90: (1, 43), 82: (1, 43), 83: (1, 43), 86: (1, 43), 17: (1, 43), 20: (1, 43), 92: (1, 43), 93: (1, 43), 94: (1, 43), 95: (1, 43), 89: (1, 43), 103: (0, 150), 88: (0, 151), 96: (0, 152), 76: (0, 153)},
+  111: {80: (1, 72), 81: (1, 72), 82: (1, 72), 83: (1, 72), 84: (1, 72), 85: (1, 72), 86: (1, 72), 17: (1, 72), 87: (1, 72), 88: (1, 72), 89: (1, 72), 90: (1, 72), 91: (1, 72), 20: (1, 72), 92: (1, 72), 93: (1, 72), 76: (1, 72), 94: (1, 72), 95: (1, 72), 96: (1, 72)},
+  112: {67: (0, 104), 55: (0, 111), 62: (0, 98), 75: (0, 117), 56: (0, 115), 23: (0, 105), 13: (0, 116), 77: (0, 154), 34: (0, 102), 39: (0, 109), 58: (0, 122)},
+  113: {40: (0, 155)},
+  114: {17: (0, 156)},
+  115: {80: (1, 69), 81: (1, 69), 82: (1, 69), 83: (1, 69), 84: (1, 69), 85: (1, 69), 86: (1, 69), 17: (1, 69), 87: (1, 69), 88: (1, 69), 89: (1, 69), 90: (1, 69), 91: (1, 69), 20: (1, 69), 92: (1, 69), 93: (1, 69), 76: (1, 69), 94: (1, 69), 95: (1, 69), 96: (1, 69)},
+  116: {35: (1, 96), 34: (1, 96), 80: (1, 95), 81: (1, 95), 82: (1, 95), 18: (1, 95), 83: (1, 95), 84: (1, 95), 85: (1, 95), 86: (1, 95), 17: (1, 95), 87: (1, 95), 88: (1, 95), 89: (1, 95), 90: (1, 95), 91: (1, 95), 20: (1, 95), 92: (1, 95), 93: (1, 95), 76: (1, 95), 94: (1, 95), 16: (1, 95), 95: (1, 95), 96: (1, 95), 19: (1, 95)},
+  117: {80: (1, 67), 81: (1, 67), 82: (1, 67), 83: (1, 67), 84: (1, 67), 85: (1, 67), 86: (1, 67), 17: (1, 67), 87: (1, 67), 88: (1, 67), 89: (1, 67), 90: (1, 67), 91: (1, 67), 20: (1, 67), 92: (1, 67), 93: (1, 67), 76: (1, 67), 94: (1, 67), 95: (1, 67), 96: (1, 67)},
+  118: {39: (1, 63), 58: (1, 63), 13: (1, 63), 34: (1, 63), 56: (1, 63)},
+  119: {80: (1, 62), 81: (1, 62), 82: (1, 62), 83: (1, 62), 84: (1, 62), 85: (1, 62), 86: (1, 62), 17: (1, 62), 87: (1, 62), 88: (1, 62), 89: (1, 62), 90: (1, 62), 91: (1, 62), 20: (1, 62), 92: (1, 62), 93: (1, 62), 76: (1, 62), 94: (1, 62), 95: (1, 62), 96: (1, 62)},
+  120: {39: (1, 64), 58: (1, 64), 13: (1, 64), 34: (1, 64), 56: (1, 64)},
+  121: {20: (1, 35), 17: (1, 35)},
+  122: {80: (1, 70), 81: (1, 70), 82: (1, 70), 83: (1, 70), 84: (1, 70), 85: (1, 70), 86: (1, 70), 17: (1, 70), 87: (1, 70), 88: (1, 70), 89: (1, 70), 90: (1, 70), 91: (1, 70), 20: (1, 70), 92: (1, 70), 93: (1, 70), 76: (1, 70), 94: (1, 70), 95: (1, 70), 96: (1, 70)},
+  123: {16: (1, 24), 17: (1, 24), 104: (0, 157), 19: (0, 158)},
+  124: {16: (1, 26), 17: (1, 26), 19: (1, 26)},
+  125: {16: (1, 22), 17: (1, 22)},
+  126: {56: (0, 88), 58: (0, 90), 29: (0, 91), 59: (0, 92), 55: (0, 93), 57: (0, 159), 13: (0, 86)},
+  127: {20: (1, 83), 19: (0, 160)},
+  128: {17: (1, 81)},
+  129: {24: (1, 18), 27: (1, 18), 11: (1, 18)},
+  130: {55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 13: (0, 116), 34: (0, 102), 68: (0, 161), 75: (0, 117), 67: (0, 104), 76: (0, 118), 77: (0, 119), 23: (0, 105), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  131: {39: (1, 60), 58: (1, 60), 76: (1, 60), 13: (1, 60), 34: (1, 60), 56: (1, 60), 78: (1, 60)},
+  132: {39: (1, 57), 58: (1, 57), 76: (1, 57), 13: (1, 57), 34: (1, 57), 56: (1, 57), 78: (1, 57)},
+  133: {39: (1, 58), 58: (1, 58), 76: (1, 58), 13: (1, 58), 34: (1, 58), 56: (1, 58), 78: (1, 58)},
+  134: {39: (1, 59), 58: (1, 59), 76: (1, 59), 13: (1, 59), 34: (1, 59), 56: (1, 59), 78: (1, 59)},
+  135: {71: (0, 110), 61: (0, 97), 55: (0, 111), 65: (0, 162), 62: (0, 98), 72: (0, 112), 56: (0, 115), 13: (0, 116), 34: (0, 102), 75: (0, 117), 67: (0, 104), 76: (0, 118), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  136: {39: (1, 44), 58: (1, 44), 76: (1, 44), 13: (1, 44), 34: (1, 44), 56: (1, 44), 78: (1, 44)},
+  137: {39: (1, 46), 58: (1, 46), 76: (1, 46), 13: (1, 46), 34: (1, 46), 56: (1, 46), 78: (1, 46)},
+  138: {39: (1, 47), 58: (1, 47), 76: (1, 47), 13: (1, 47), 34: (1, 47), 56: (1, 47), 78: (1, 47)},
+  139: {71: (0, 163), 61: (0, 97), 55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 13: (0, 116), 34: (0, 102), 75: (0, 117), 67: (0, 104), 76: (0, 118), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  140: {39: (1, 49), 58: (1, 49), 76: (1, 49), 13: (1, 49), 34: (1, 49), 56: (1, 49), 78: (1, 49)},
+  141: {39: (1, 45), 58: (1, 45), 76: (1, 45), 13: (1, 45), 34: (1, 45), 56: (1, 45), 78: (1, 45)},
+  142: {39: (1, 48), 58: (1, 48), 76: (1, 48), 13: (1, 48), 34: (1, 48), 56: (1, 48), 78: (1, 48)},
+  143: {20: (0, 164)},
+  144: {39: (1, 108), 40: (1, 108), 58: (1, 108), 76: (1, 108), 69: (1, 108), 13: (1, 108), 34: (1, 108), 56: (1, 108), 78: (1, 108)},
+  145: {40: (1, 32), 61: (0, 97), 62: (0, 98), 63: (0, 99), 64: (0, 100), 65: (0, 101), 34: (0, 102), 67: (0, 104), 66: (0, 165), 23: (0, 105), 68: (0, 106), 69: (0, 107), 70: (0, 108), 39: (0, 109), 71: (0, 110), 55: (0, 111), 72: (0, 112), 74: (0, 114), 56: (0, 115), 13: (0, 116), 75: (0, 117), 76: (0, 118), 77: (0, 119), 78: (0, 120), 79: (0, 121), 58: (0, 122)},
+  146: {55: (0, 111), 13: (0, 86), 62: (0, 166)},
+  147: {93: (0, 167)},
+  148: {71: (0, 110), 61: (0, 97), 55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 63: (0, 168), 13: (0, 116), 65: (0, 101), 34: (0, 102), 75: (0, 117), 67: (0, 104), 76: (0, 118), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  149: {71: (0, 110), 61: (0, 97), 55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 63: (0, 99), 13: (0, 116), 79: (0, 169), 65: (0, 101), 34: (0, 102), 70: (0, 108), 75: (0, 117), 67: (0, 104), 76: (0, 118), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  150: {55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 13: (0, 116), 34: (0, 102), 75: (0, 117), 67: (0, 104), 61: (0, 170), 76: (0, 118), 77: (0, 119), 23: (0, 105), 68: (0, 106), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  151: {39: (1, 53), 58: (1, 53), 76: (1, 53), 13: (1, 53), 34: (1, 53), 56: (1, 53), 78: (1, 53)},
+  152: {39: (1, 52), 58: (1, 52), 76: (1, 52), 13: (1, 52), 34: (1, 52), 56: (1, 52), 78: (1, 52)},
+  153: {39: (1, 54), 58: (1, 54), 76: (1, 54), 13: (1, 54), 34: (1, 54), 56: (1, 54), 78: (1, 54)},
+  154: {80: (1, 61), 81: (1, 61), 82: (1, 61), 83: (1, 61), 84: (1, 61), 85: (1, 61), 86: (1, 61), 17: (1, 61), 87: (1, 61), 88: (1, 61), 89: (1, 61), 90: (1, 61), 91: (1, 61), 20: (1, 61), 92: (1, 61), 93: (1, 61), 76: (1, 61), 94: (1, 61), 95: (1, 61), 96: (1, 61)},
+  155: {24: (1, 30), 27: (1, 30), 11: (1, 30)},
+  156: {39: (1, 33), 40: (1, 33), 58: (1, 33), 76: (1, 33), 69: (1, 33), 13: (1, 33), 34: (1, 33), 56: (1, 33), 78: (1, 33)},
+  157: {16: (1, 25), 17: (1, 25), 19: (0, 171)},
+  158: {13: (0, 14), 52: (0, 124), 12: (0, 71), 97: (0, 172)},
+  159: {20: (1, 114), 19: (1, 114)},
+  160: {58: (0, 90), 29: (0, 91), 59: (0, 92), 55: (0, 93), 56: (0, 88), 57: (0, 173), 13: (0, 86)},
+  161: {80: (1, 55), 81: (1, 55), 90: (1, 55), 82: (1, 55), 83: (1, 55), 84: (1, 55), 91: (1, 55), 85: (1, 55), 86: (1, 55), 17: (1, 55), 20: (1, 55), 92: (1, 55), 93: (1, 55), 76: (1, 55), 94: (1, 55), 87: (1, 55), 88: (1, 55), 95: (1, 55), 89: (1, 55), 96: (1, 55)},
+  162: {80: (1, 41), 81: (1, 41), 93: (1, 41), 86: (1, 41), 95: (1, 41), 17: (1, 41), 20: (1, 41), 89: (0, 136), 83: (0, 137), 94: (0, 138), 101: (0, 139), 92: (0, 140), 82: (0, 141), 90: (0, 142)},
+  163: {80: (1, 42), 81: (1, 42), 90: (1, 42), 82: (1, 42), 83: (1, 42), 86: (1, 42), 17: (1, 42), 20: (1, 42), 92: (1, 42), 93: (1, 42), 94: (1, 42), 95: (1, 42), 89: (1, 42), 103: (0, 150), 88: (0, 151), 96: (0, 152), 76: (0, 153)},
+  164: {80: (1, 66), 81: (1, 66), 82: (1, 66), 83: (1, 66), 84: (1, 66), 85: (1, 66), 86: (1, 66), 17: (1, 66), 87: (1, 66), 88: (1, 66), 89: (1, 66), 90: (1, 66), 91: (1, 66), 20: (1, 66), 92: (1, 66), 93: (1, 66), 76: (1, 66), 94: (1, 66), 95: (1, 66), 96: (1, 66)},
+  165: {39: (1, 107), 40: (1, 107), 58: (1, 107), 76: (1, 107), 69: (1, 107), 13: (1, 107), 34: (1, 107), 56: (1, 107), 78: (1, 107)},
+  166: {20: (0, 174)},
+  167: {71: (0, 110), 61: (0, 97), 55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 63: (0, 99), 13: (0, 116), 65: (0, 101), 34: (0, 102), 70: (0, 108), 75: (0, 117), 67: (0, 104), 76: (0, 118), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 39: (0, 109), 79: (0, 175), 58: (0, 122)},
+  168: {80: (1, 39), 81: (1, 39), 93: (1, 39), 95: (1, 39), 17: (1, 39), 20: (1, 39), 86: (0, 135)},
+  169: {95: (1, 36), 93: (1, 36), 17: (1, 36), 20: (1, 36)},
+  170: {80: (1, 50), 81: (1, 50), 90: (1, 50), 82: (1, 50), 83: (1, 50), 86: (1, 50), 17: (1, 50), 20: (1, 50), 92: (1, 50), 93: (1, 50), 76: (1, 50), 94: (1, 50), 88: (1, 50), 95: (1, 50), 89: (1, 50), 96: (1, 50), 100: (0, 130), 85: (0, 131), 91: (0, 132), 87: (0, 133), 84: (0, 134)},
+  171: {97: (0, 176), 13: (0, 14), 52: (0, 124), 12: (0, 71)},
+  172: {16: (1, 105), 17: (1, 105), 19: (1, 105)},
+  173: {20: (1, 113), 19: (1, 113)},
+  174: {80: (1, 74), 81: (1, 74), 82: (1, 74), 83: (1, 74), 84: (1, 74), 85: (1, 74), 86: (1, 74), 17: (1, 74), 87: (1, 74), 88: (1, 74), 89: (1, 74), 90: (1, 74), 91: (1, 74), 20: (1, 74), 92: (1, 74), 93: (1, 74), 76: (1, 74), 94: (1, 74), 95: (1, 74), 96: (1, 74)},
+  175: {95: (0, 177)},
+  176: {16: (1, 106), 17: (1, 106), 19: (1, 106)},
+  177: {71: (0, 110), 61: (0, 97), 55: (0, 111), 62: (0, 98), 72: (0, 112), 56: (0, 115), 63: (0, 99), 13: (0, 116), 65: (0, 101), 34: (0, 102), 70: (0, 108), 75: (0, 117), 67: (0, 104), 79: (0, 178), 76: (0, 118), 23: (0, 105), 77: (0, 119), 68: (0, 106), 78: (0, 120), 39: (0, 109), 58: (0, 122)},
+  178: {20: (1, 73), 17: (1, 73)},
 }
 TOKEN_TYPES = (
 {0: 'PROGRAM',
- 1: 'type_decl',
- 2: 'enum_decl',
+ 1: 'start',
+ 2: '__anon_star_0',
  3: 'enum_set_decl',
  4: 'ENUM',
  5: 'VALUE',
  6: 'type_decls',
- 7: '__anon_star_0',
+ 7: 'value_decl',
  8: 'ENUMSET',
- 9: 'value_decl',
- 10: 'start',
- 11: 'type_name',
- 12: 'NAME',
- 13: 'program_decl',
- 14: '$END',
+ 9: 'type_decl',
+ 10: 'enum_decl',
+ 11: '$END',
+ 12: 'type_name',
+ 13: 'NAME',
+ 14: 'program_decl',
  15: 'enum_body',
  16: 'LBRACE',
  17: 'SEMICOLON',
  18: '__ANON_0',
- 19: 'RPAR',
- 20: 'COMMA',
+ 19: 'COMMA',
+ 20: 'RPAR',
  21: 'LSQB',
  22: 'value_body',
  23: 'func_name',
  24: 'PREDICATE',
  25: '__anon_star_3',
- 26: 'FUNC',
- 27: 'func_decls',
- 28: 'func_decl',
- 29: 'enum_item',
+ 26: 'func_decl',
+ 27: 'FUNC',
+ 28: 'func_decls',
+ 29: 'STRLIT',
  30: 'enum_items',
- 31: 'STRLIT',
+ 31: 'enum_item',
  32: 'value_item',
  33: 'value_items',
  34: 'LPAR',
  35: 'COLON',
- 36: 'global_pred',
- 37: '__anon_star_7',
+ 36: '__anon_star_7',
+ 37: 'global_pred',
  38: 'global_preds',
  39: 'INT',
  40: 'RBRACE',
@@ -4693,67 +4795,70 @@ TOKEN_TYPES = (
  43: 'type_names',
  44: 'pred_body',
  45: 'RSQB',
- 46: 'expr_type_name',
- 47: '__ANON_8',
- 48: 'BOOL',
- 49: '__anon_star_6',
- 50: 'func_lhs',
- 51: 'opt_arg',
- 52: 'func_body',
- 53: 'var_name',
+ 46: 'SET',
+ 47: 'BOOL',
+ 48: '__ANON_8',
+ 49: 'expr_type_name',
+ 50: '__anon_star_6',
+ 51: 'func_body',
+ 52: 'opt_arg',
+ 53: 'func_lhs',
  54: 'func_constraints',
- 55: 'TRUE',
- 56: 'pred_arg',
- 57: 'SNUMBER',
- 58: 'FALSE',
- 59: 'pred_args',
- 60: 'MORETHAN',
- 61: 'PLUS',
- 62: '__ANON_3',
- 63: 'PERCENT',
- 64: 'LESSTHAN',
- 65: '__ANON_7',
- 66: 'ELSE',
- 67: 'SLASH',
- 68: '__ANON_4',
- 69: 'MINUS',
- 70: '__ANON_5',
- 71: '__ANON_2',
- 72: 'THEN',
- 73: '__ANON_1',
- 74: '__ANON_6',
- 75: 'STAR',
- 76: 'func_rhss',
- 77: 'func_rhs',
- 78: 'expr',
- 79: 'cmp_expr',
- 80: 'or_expr',
- 81: 'cond_expr',
- 82: 'and_expr',
- 83: 'func_constraint_item',
- 84: 'unary_op',
- 85: 'term_expr',
- 86: 'IF',
- 87: 'BANG',
- 88: 'property_expr',
- 89: 'unary_expr',
- 90: 'func_constraint_items',
- 91: 'atom_expr',
- 92: 'var_expr',
- 93: 'imply_expr',
- 94: 'const_expr',
- 95: 'factor_expr',
- 96: '__anon_star_8',
- 97: '__anon_star_4',
- 98: 'cmp_op',
- 99: '__anon_star_5',
- 100: 'term_op',
- 101: 'factor_op'}
+ 55: 'var_name',
+ 56: 'FALSE',
+ 57: 'pred_arg',
+ 58: 'TRUE',
+ 59: 'SNUMBER',
+ 60: 'pred_args',
+ 61: 'factor_expr',
+ 62: 'var_expr',
+ 63: 'and_expr',
+ 64: 'cond_expr',
+ 65: 'cmp_expr',
+ 66: 'func_constraint_item',
+ 67: 'property_expr',
+ 68: 'unary_expr',
+ 69: 'IF',
+ 70: 'or_expr',
+ 71: 'term_expr',
+ 72: 'unary_op',
+ 73: 'func_constraint_items',
+ 74: 'expr',
+ 75: 'const_expr',
+ 76: 'MINUS',
+ 77: 'atom_expr',
+ 78: 'BANG',
+ 79: 'imply_expr',
+ 80: '__ANON_1',
+ 81: '__ANON_2',
+ 82: 'MORETHAN',
+ 83: '__ANON_5',
+ 84: 'SLASH',
+ 85: 'PERCENT',
+ 86: '__ANON_3',
+ 87: 'AMPERSAND',
+ 88: 'VBAR',
+ 89: 'LESSTHAN',
+ 90: '__ANON_7',
+ 91: 'STAR',
+ 92: '__ANON_6',
+ 93: 'THEN',
+ 94: '__ANON_4',
+ 95: 'ELSE',
+ 96: 'PLUS',
+ 97: 'func_rhs',
+ 98: 'func_rhss',
+ 99: '__anon_star_8',
+ 100: 'factor_op',
+ 101: 'cmp_op',
+ 102: '__anon_star_5',
+ 103: 'term_op',
+ 104: '__anon_star_4'}
 )
 parse_table.states = {s: {TOKEN_TYPES[t]: (a, RULES[x] if a is Reduce else x) for t, (a, x) in acts.items()}
                       for s, acts in STATES.items()}
 parse_table.start_state = 0
-parse_table.end_state = 18
+parse_table.end_state = 11
 class Lark_StandAlone:
   def __init__(self, transformer=None, postlex=None):
      callback = parse_tree_builder.create_callback(transformer=transformer)
@@ -287,6 +287,7 @@ class TyrellSpec:
     _prog_spec: ProgramSpec
     _prod_spec: ProductionSpec
     _pred_spec: PredicateSpec
+    _compiled_constraints: Dict[Any, Any]
 
     def __init__(self,
                  type_spec,
@@ -305,6 +306,7 @@ class TyrellSpec:
         self._prog_spec = prog_spec
         self._prod_spec = prod_spec
         self._pred_spec = pred_spec
+        self._compiled_constraints = dict()
 
     @staticmethod
     def _add_enum_productions(prod_spec, enum_tys):
@@ -386,6 +388,11 @@ class TyrellSpec:
     def output(self) -> Type:
         return self._prog_spec.output
 
+    @property
+    def compiled_constraints(self) -> Dict[Any, Any]:
+        '''Cache of the compiled constraints of the productions, filled by the deciders (see `tyrell.decider.constraint_template`)'''
+        return self._compiled_constraints
+
     # Delegate methods for PredicateSpec
     def get_predicates_with_name(self, name: str) -> List[Predicate]:
         return self._pred_spec.get_predicates_with_name(name)
@@ -1,6 +1,19 @@
 import unittest
+import sys
+import threading
 from .type import EnumType, ValueType
 from .spec import TypeSpec, ProductionSpec, PredicateSpec
+from .do_parse import parse
+
+
+def spec_str(num_funcs):
+    return '''
+        enum Const {{ "1", "2" }}
+        value IntExpr;
+        program Foo(IntExpr) -> IntExpr;
+        {}
+        predicate is_not_parent(f0, f0);
+    '''.format('\n'.join('func f{}: IntExpr r -> IntExpr a, Const c;'.format(i) for i in range(num_funcs)))
 
 
 class TestTyrellSpec(unittest.TestCase):
@@ -70,6 +83,28 @@ class TestTyrellSpec(unittest.TestCase):
         h_preds = spec.get_predicates_with_name('h')
         self.assertEqual(len(h_preds), 0)
 
+    def test_parse_threads(self):
+        # the parser is shared by every thread of the process, switch threads often to interleave the parses
+        num_threads, num_parses = 4, 30
+        results = [[] for _ in range(num_threads)]
+        expected = [len(list(parse(spec_str(20 * (i + 1))).productions())) for i in range(num_threads)]
+
+        def parse_specs(i):
+            for _ in range(num_parses):
+                results[i].append(len(list(parse(spec_str(20 * (i + 1))).productions())))
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=parse_specs, args=(i,)) for i in range(num_threads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        for i in range(num_threads):
+            self.assertListEqual(results[i], [expected[i]] * num_parses)
 
 if __name__ == '__main__':
     unittest.main()
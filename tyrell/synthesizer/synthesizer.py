@@ -14,10 +14,12 @@ class Synthesizer(ABC):
 
     _enumerator: Enumerator
     _decider: Decider
+    _num_attempts: int
 
     def __init__(self, enumerator: Enumerator, decider: Decider):
         self._enumerator = enumerator
         self._decider = decider
+        self._num_attempts = 0
 
     @property
     def enumerator(self):
@@ -27,6 +29,13 @@ class Synthesizer(ABC):
     def decider(self):
         return self._decider
 
+    @property
+    def num_attempts(self):
+        '''
+        Number of programs analyzed by the last call to `synthesize`.
+        '''
+        return self._num_attempts
+
     def synthesize(self):
         '''
         A convenient method to enumerate ASTs until the result passes the analysis.
@@ -34,11 +43,12 @@ class Synthesizer(ABC):
         '''
         start_time = time.time()
         num_attempts = 0
+        self._num_attempts = 0
         prog = self._enumerator.next()
         while prog is not None:
             num_attempts += 1
+            self._num_attempts = num_attempts
             if num_attempts % 100 == 0:
-                self._enumerator.closeLattices()
                 logger.debug('Attempts : {}'.format(num_attempts))
             # logger.debug('Attempt : {}. Enumerator generated: {}'.format(num_attempts, prog))
             try:
@@ -59,6 +69,8 @@ class Synthesizer(ABC):
                 # logger.debug('Attempt : {}. Interpreter failed. Reason: {}'.format(num_attempts, info))
                 self._enumerator.update(info)
                 prog = self._enumerator.next()
+            finally:
+                self._decider.release()
         logger.debug(
             'Enumerator is exhausted after {} attempts'.format(num_attempts))
         logger.error('Total Time: {}'.format(time.time()-start_time))
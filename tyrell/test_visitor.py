@@ -0,0 +1,39 @@
+import unittest
+from .visitor import GenericVisitor
+
+
+class FooNode:
+    pass
+
+
+class BarNode:
+    pass
+
+
+class FooVisitor(GenericVisitor):
+    def __init__(self):
+        pass
+
+    def visit_foo_node(self, node):
+        return 'foo'
+
+
+class FooBarVisitor(FooVisitor):
+    def visit_bar_node(self, node):
+        return 'bar'
+
+
+class TestVisitor(unittest.TestCase):
+
+    def test_dispatch(self):
+        self.assertEqual(FooVisitor().visit(FooNode()), 'foo')
+        self.assertEqual(FooBarVisitor().visit(FooNode()), 'foo')
+        self.assertEqual(FooBarVisitor().visit(BarNode()), 'bar')
+        # the dispatch table of a subclass does not leak into its base class
+        with self.assertRaisesRegex(Exception, 'FooVisitor: No visit_bar_node method'):
+            FooVisitor().visit(BarNode())
+        self.assertEqual(FooBarVisitor().visit(BarNode()), 'bar')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Callable, ClassVar, Dict
 import re
 
 first_cap_re = re.compile('(.)([A-Z][a-z]+)')
@@ -11,15 +12,27 @@ def camel_to_snake_case(name: str) -> str:
 
 
 class GenericVisitor(ABC):
+    '''
+    Dispatches `visit(node)` to the `visit_xxx` method of the visitor, where `xxx` is the snake-cased name of the type of the node.
+    Every visitor class keeps its own dispatch table from node types to methods, built lazily on the first visit of each node type.
+    '''
+
+    _dispatch_table: ClassVar[Dict[type, Callable[[Any, Any], Any]]] = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_table = dict()
 
     @abstractmethod
     def __init__(self):
         pass
 
     def visit(self, node):
-        method_name = self._visit_method_name(node)
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        try:
+            visitor = self._dispatch_table[type(node)]
+        except KeyError:
+            visitor = self._dispatch(type(node))
+        return visitor(self, node)
 
     def generic_visit(self, node):
         raise Exception(
@@ -27,6 +40,13 @@ class GenericVisitor(ABC):
                 type(self).__name__,
                 self._visit_method_name(node)))
 
+    @classmethod
+    def _dispatch(cls, node_type: type) -> Callable[[Any, Any], Any]:
+        method_name = 'visit_' + camel_to_snake_case(node_type.__name__)
+        visitor = getattr(cls, method_name, cls.generic_visit)
+        cls._dispatch_table[node_type] = visitor
+        return visitor
+
     @staticmethod
     def _visit_method_name(node) -> str:
         return 'visit_' + camel_to_snake_case(type(node).__name__)